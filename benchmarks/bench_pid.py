@@ -0,0 +1,108 @@
+"""Microbenchmark for PID.calc and BatchPID throughput.
+
+Loads the PID controller standalone (no Home Assistant required) and drives it
+with a synthetic event-driven trace: 60s sensor updates, slowly varying indoor
+and outdoor temperature, wind, and an active transport delay.
+
+Usage:
+    python benchmarks/bench_pid.py [--calls N] [--repeat R] [--batch N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import importlib.util
+import math
+import sys
+import time
+from pathlib import Path
+
+PID_PATH = (
+    Path(__file__).resolve().parent.parent
+    / "custom_components" / "adaptive_thermostat" / "pid_controller" / "__init__.py"
+)
+
+
+def load_pid_package():
+    """Import the pid_controller package directly from its directory."""
+    spec = importlib.util.spec_from_file_location(
+        "pid_controller", PID_PATH, submodule_search_locations=[str(PID_PATH.parent)]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["pid_controller"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_trace(calls: int) -> list[tuple[float, float, float, float, float]]:
+    """Build (input, setpoint, time, ext_temp, wind) samples at 60s spacing."""
+    trace = []
+    for i in range(calls):
+        t = 1_000_000.0 + i * 60.0
+        indoor = 20.0 + 0.6 * math.sin(i / 40.0)
+        outdoor = 5.0 + 3.0 * math.sin(i / 500.0)
+        trace.append((indoor, 21.0, t, outdoor, 2.0))
+    return trace
+
+
+def run_once(pid_cls, trace) -> float:
+    """Run a full trace through a fresh controller, return elapsed seconds."""
+    pid = pid_cls(
+        kp=20.0, ki=1.2, kd=900.0, ke=0.5, out_min=0, out_max=100,
+        sampling_period=0, cold_tolerance=0.3, hot_tolerance=0.3,
+        integral_exp_decay_tau=0.5, heating_type="floor_hydronic",
+    )
+    pid.set_transport_delay(5.0)
+    calc = pid.calc
+    last_time = None
+    start = time.perf_counter()
+    for indoor, setpoint, t, outdoor, wind in trace:
+        calc(indoor, setpoint, t, last_time, outdoor, wind)
+        last_time = t
+    return time.perf_counter() - start
+
+
+def run_batch_once(batch_cls, trace, size: int) -> float:
+    """Run a trace through a batch of controllers with spread gains."""
+    import numpy as np
+
+    batch = batch_cls(
+        kp=np.linspace(5.0, 80.0, size), ki=np.linspace(0.2, 40.0, size)[::-1],
+        kd=900.0, ke=0.5, out_min=0, out_max=100, cold_tolerance=0.3, hot_tolerance=0.3,
+        integral_exp_decay_tau=0.5, heating_type="floor_hydronic",
+    )
+    batch.set_transport_delay(5.0)
+    last_time = None
+    start = time.perf_counter()
+    for indoor, setpoint, t, outdoor, wind in trace:
+        batch.calc(indoor, setpoint, t, last_time, outdoor, wind)
+        last_time = t
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--batch", type=int, default=0,
+                        help="also benchmark BatchPID with this many controllers (needs numpy)")
+    args = parser.parse_args()
+
+    package = load_pid_package()
+    trace = build_trace(args.calls)
+    best = min(run_once(package.PID, trace) for _ in range(args.repeat))
+    print(f"PID.calc: {args.calls / best:,.0f} calls/sec "
+          f"(best of {args.repeat}, {args.calls:,} calls)")
+
+    if args.batch:
+        batch_cls = importlib.import_module("pid_controller.batch").BatchPID
+        steps = max(1, args.calls // 100)
+        batch_trace = trace[:steps]
+        best = min(run_batch_once(batch_cls, batch_trace, args.batch) for _ in range(args.repeat))
+        print(f"BatchPID.calc: {steps * args.batch / best:,.0f} controller-steps/sec "
+              f"({args.batch:,} controllers x {steps:,} steps, best of {args.repeat})")
+
+
+if __name__ == "__main__":
+    main()
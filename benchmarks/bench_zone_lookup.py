@@ -0,0 +1,85 @@
+"""Microbenchmark for coordinator zone lookups at many zones.
+
+Registers N zones with the coordinator and resolves every zone from each of
+its sensors the way an update cycle does (get_zone_by_climate_entity and
+get_adaptive_learner), comparing the indexed lookups with a linear scan over
+the registered zones.
+
+Requires Home Assistant to be importable (the coordinator subclasses
+DataUpdateCoordinator).
+
+Usage:
+    python benchmarks/bench_zone_lookup.py [--zones N] [--sensors S] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.adaptive_thermostat.coordinator import (  # noqa: E402
+    AdaptiveThermostatCoordinator,
+)
+
+
+def build_coordinator(zones: int) -> AdaptiveThermostatCoordinator:
+    """Create a coordinator with N registered zones."""
+    coordinator = AdaptiveThermostatCoordinator(MagicMock())
+    for i in range(zones):
+        coordinator.register_zone(f"zone_{i}", {
+            "climate_entity_id": f"climate.zone_{i}",
+            "adaptive_learner": object(),
+        })
+    return coordinator
+
+
+def scan_lookup(coordinator: AdaptiveThermostatCoordinator, climate_entity_id: str):
+    """Resolve zone and learner by scanning all zones (the unindexed path)."""
+    for zone_id, zone_data in coordinator._zones.items():
+        if zone_data.get("climate_entity_id") == climate_entity_id:
+            return zone_id, zone_data.get("adaptive_learner")
+    return None
+
+
+def indexed_lookup(coordinator: AdaptiveThermostatCoordinator, climate_entity_id: str):
+    """Resolve zone and learner through the coordinator indexes."""
+    zone_id, _ = coordinator.get_zone_by_climate_entity(climate_entity_id)
+    return zone_id, coordinator.get_adaptive_learner(climate_entity_id)
+
+
+def run_cycle(lookup, coordinator, entity_ids: list[str], sensors: int) -> float:
+    """Resolve every zone once per sensor, return elapsed seconds."""
+    start = time.perf_counter()
+    for entity_id in entity_ids:
+        for _ in range(sensors):
+            lookup(coordinator, entity_id)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--zones", type=int, default=100)
+    parser.add_argument("--sensors", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    coordinator = build_coordinator(args.zones)
+    entity_ids = [f"climate.zone_{i}" for i in range(args.zones)]
+    lookups = args.zones * args.sensors
+
+    for name, lookup in (("scan", scan_lookup), ("indexed", indexed_lookup)):
+        best = min(
+            run_cycle(lookup, coordinator, entity_ids, args.sensors)
+            for _ in range(args.repeat)
+        )
+        print(f"{name}: {best * 1000:.3f} ms per update cycle "
+              f"({lookups:,} lookups, {args.zones} zones, best of {args.repeat})")
+
+
+if __name__ == "__main__":
+    main()
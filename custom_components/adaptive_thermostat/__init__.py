@@ -431,7 +431,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         ModeSync,
     )
     from .central_controller import CentralController
+    from .managers.command_queue import HeaterCommandQueue
+    from .managers.pwm_scheduler import PWMPhaseScheduler
     from .adaptive.vacation import VacationMode
+    from .analytics.export import EXPORT_DATASETS, EXPORT_FORMAT_NDJSON, EXPORT_FORMATS
+    from .analytics.telemetry_store import TELEMETRY_TIERS
 
     # Service schemas
     VACATION_MODE_SCHEMA = vol.Schema({
@@ -443,6 +447,15 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         vol.Optional("period", default="weekly"): vol.In(["daily", "weekly", "monthly"]),
     })
 
+    EXPORT_DATA_SCHEMA = vol.Schema({
+        vol.Optional("entity_id"): cv.entity_ids,
+        vol.Optional("datasets"): vol.All(cv.ensure_list, [vol.In(EXPORT_DATASETS)]),
+        vol.Optional("format", default=EXPORT_FORMAT_NDJSON): vol.In(EXPORT_FORMATS),
+        vol.Optional("start_time"): cv.datetime,
+        vol.Optional("end_time"): cv.datetime,
+        vol.Optional("telemetry_tier"): vol.In([tier.name for tier in TELEMETRY_TIERS]),
+    })
+
     # Initialize domain data storage
     hass.data.setdefault(DOMAIN, {})
 
@@ -459,6 +472,12 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     coordinator = AdaptiveThermostatCoordinator(hass)
     hass.data[DOMAIN]["coordinator"] = coordinator
 
+    # Shared queue bounding heater/cooler service calls across all zones
+    hass.data[DOMAIN]["heater_command_queue"] = HeaterCommandQueue()
+
+    # Staggers PWM turn-on of zones sharing a manifold or the main heater
+    hass.data[DOMAIN]["pwm_phase_scheduler"] = PWMPhaseScheduler()
+
     # Create vacation mode handler
     vacation_mode = VacationMode(hass, coordinator)
     hass.data[DOMAIN]["vacation_mode"] = vacation_mode
@@ -671,6 +690,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         cost_report_schema=COST_REPORT_SCHEMA,
         default_vacation_target_temp=DEFAULT_VACATION_TARGET_TEMP,
         debug=domain_config.get(CONF_DEBUG, DEFAULT_DEBUG),
+        export_schema=EXPORT_DATA_SCHEMA,
     )
 
     # Event listener to set integral values (for restoration/debugging)
@@ -736,12 +756,23 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     )
     _LOGGER.debug("Scheduled weekly report on Sundays at 9:00 AM")
 
+    # Save zone telemetry every 15 minutes
+    async def _async_save_telemetry_callback(_now) -> None:
+        """Wrapper for periodic telemetry save."""
+        telemetry_store = hass.data.get(DOMAIN, {}).get("telemetry_store")
+        if telemetry_store is not None:
+            await telemetry_store.async_save()
+
+    unsub_callbacks.append(
+        async_track_time_change(hass, _async_save_telemetry_callback, minute="/15", second=0)
+    )
+
     # Store unsubscribe callbacks for cleanup during unload
     hass.data[DOMAIN]["unsub_callbacks"] = unsub_callbacks
 
-    # Register shutdown handler for manifold state persistence
+    # Register shutdown handler for manifold state and telemetry persistence
     async def _async_save_manifold_state_on_shutdown(event):
-        """Save manifold state on Home Assistant shutdown."""
+        """Save manifold state and telemetry on Home Assistant shutdown."""
         manifold_registry = hass.data.get(DOMAIN, {}).get("manifold_registry")
         learning_store = hass.data.get(DOMAIN, {}).get("learning_store")
 
@@ -753,6 +784,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             except Exception as e:
                 _LOGGER.error("Failed to save manifold state on shutdown: %s", e)
 
+        telemetry_store = hass.data.get(DOMAIN, {}).get("telemetry_store")
+        if telemetry_store is not None:
+            await telemetry_store.async_save()
+
     # Listen for HA stop event
     shutdown_unsub = hass.bus.async_listen_once("homeassistant_stop", _async_save_manifold_state_on_shutdown)
     hass.data[DOMAIN]["shutdown_unsub"] = shutdown_unsub
@@ -830,9 +865,19 @@ async def async_unload(hass: HomeAssistant) -> bool:
         except Exception as e:
             _LOGGER.error("Failed to save manifold state on unload: %s", e)
 
+    # Save zone telemetry on unload
+    telemetry_store = hass.data[DOMAIN].get("telemetry_store")
+    if telemetry_store is not None:
+        await telemetry_store.async_save()
+
     # Unregister all services
     async_unregister_services(hass)
 
+    # Shut down the PID tuning process pool if the tune_pid service started one
+    tuning_executor = hass.data[DOMAIN].pop("tuning_executor", None)
+    if tuning_executor is not None:
+        tuning_executor.shutdown(wait=False, cancel_futures=True)
+
     # Clean up central controller if it exists
     central_controller = hass.data[DOMAIN].get("central_controller")
     if central_controller is not None:
@@ -0,0 +1,144 @@
+"""Running cycle metric statistics for adaptive learning.
+
+Keeps running sums and counts of per-cycle metrics over the retained cycle
+history, plus the same aggregates over the most recent N cycles, so averages
+can be read in O(1) instead of re-scanning the history on every sensor update.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+from .cycle_analysis import CycleMetrics
+from ..const import CYCLE_STATS_WINDOW
+
+# CycleMetrics attributes aggregated by CycleStatsTracker
+TRACKED_METRICS = ("overshoot", "undershoot", "settling_time", "oscillations", "rise_time")
+
+
+@dataclass(frozen=True)
+class MetricStats:
+    """Aggregates of one metric (None values are not counted)."""
+
+    count: int = 0
+    mean: Optional[float] = None
+    recent_count: int = 0
+    recent_mean: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class CycleStats:
+    """Aggregates of all tracked metrics for one cycle history."""
+
+    cycle_count: int
+    window: int
+    overshoot: MetricStats
+    undershoot: MetricStats
+    settling_time: MetricStats
+    oscillations: MetricStats
+    rise_time: MetricStats
+
+
+class _RunningMetric:
+    """Running sum/count of one metric over all cycles and the recent window."""
+
+    def __init__(self, window: int) -> None:
+        self.total = 0.0
+        self.count = 0
+        self.recent: deque[Optional[float]] = deque()
+        self.recent_total = 0.0
+        self.recent_count = 0
+        self._window = window
+
+    def push(self, value: Optional[float]) -> None:
+        """Add the newest cycle's value."""
+        if value is not None:
+            self.total += value
+            self.count += 1
+            self.recent_total += value
+            self.recent_count += 1
+        self.recent.append(value)
+        if len(self.recent) > self._window:
+            self._drop_recent()
+
+    def evict(self, value: Optional[float], in_window: bool) -> None:
+        """Remove the oldest cycle's value."""
+        if value is not None:
+            self.total -= value
+            self.count -= 1
+            if self.count == 0:
+                self.total = 0.0
+        if in_window and self.recent:
+            self._drop_recent()
+
+    def _drop_recent(self) -> None:
+        dropped = self.recent.popleft()
+        if dropped is not None:
+            self.recent_total -= dropped
+            self.recent_count -= 1
+            if self.recent_count == 0:
+                self.recent_total = 0.0
+
+    def stats(self) -> MetricStats:
+        return MetricStats(
+            count=self.count,
+            mean=self.total / self.count if self.count else None,
+            recent_count=self.recent_count,
+            recent_mean=self.recent_total / self.recent_count if self.recent_count else None,
+        )
+
+
+class CycleStatsTracker:
+    """Running aggregates of cycle metrics, kept in step with a cycle history.
+
+    The owner calls add() for every appended cycle and evict() for every cycle
+    dropped from the front of the history. is_in_sync() detects histories that
+    were replaced or edited directly, in which case rebuild() recomputes the
+    aggregates from scratch.
+    """
+
+    def __init__(self, window: int = CYCLE_STATS_WINDOW) -> None:
+        """Initialize the tracker.
+
+        Args:
+            window: Number of most recent cycles covered by the recent aggregates
+        """
+        self._window = window
+        self._cycle_count = 0
+        self._source: Optional[list[CycleMetrics]] = None
+        self._metrics = {name: _RunningMetric(window) for name in TRACKED_METRICS}
+
+    def add(self, metrics: CycleMetrics) -> None:
+        """Add a cycle appended to the end of the history."""
+        self._cycle_count += 1
+        for name, running in self._metrics.items():
+            running.push(getattr(metrics, name, None))
+
+    def evict(self, metrics: CycleMetrics) -> None:
+        """Remove a cycle dropped from the front of the history."""
+        in_window = self._cycle_count <= self._window
+        self._cycle_count -= 1
+        for name, running in self._metrics.items():
+            running.evict(getattr(metrics, name, None), in_window)
+
+    def rebuild(self, history: list[CycleMetrics]) -> None:
+        """Recompute all aggregates from a cycle history."""
+        self._cycle_count = 0
+        self._metrics = {name: _RunningMetric(self._window) for name in TRACKED_METRICS}
+        for metrics in history:
+            self.add(metrics)
+        self._source = history
+
+    def is_in_sync(self, history: list[CycleMetrics]) -> bool:
+        """Return whether the aggregates still describe the given history."""
+        return self._source is history and self._cycle_count == len(history)
+
+    def stats(self) -> CycleStats:
+        """Return the current aggregates."""
+        return CycleStats(
+            cycle_count=self._cycle_count,
+            window=self._window,
+            **{name: running.stats() for name, running in self._metrics.items()},
+        )
@@ -373,6 +373,10 @@ class KeLearner:
         """Get the timestamp of the last Ke adjustment."""
         return self._last_adjustment_time
 
+    def get_observations(self) -> List[KeObservation]:
+        """Get a copy of the stored observations, oldest first."""
+        return list(self._observations)
+
     def get_observations_summary(self) -> Dict[str, Any]:
         """Get a summary of current observations for diagnostics.
 
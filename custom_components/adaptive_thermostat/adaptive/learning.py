@@ -2,6 +2,7 @@
 
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, TYPE_CHECKING
+import copy
 import statistics
 import logging
 
@@ -79,6 +80,9 @@ from .learner_serialization import (
 # Import auto-apply manager for safety gates and threshold management
 from .auto_apply import AutoApplyManager, get_auto_apply_thresholds
 
+# Import running cycle statistics for O(1) metric averages
+from .cycle_stats import CycleStats, CycleStatsTracker
+
 # Import undershoot detector for persistent temperature deficit detection
 from .undershoot_detector import UndershootDetector
 
@@ -106,6 +110,9 @@ class AdaptiveLearner:
         # Mode-specific cycle histories
         self._heating_cycle_history: List[CycleMetrics] = []
         self._cooling_cycle_history: List[CycleMetrics] = []
+        # Running metric aggregates kept in step with the histories above
+        self._heating_cycle_stats = CycleStatsTracker()
+        self._cooling_cycle_stats = CycleStatsTracker()
         self._max_history = max_history
         self._heating_type = heating_type
         self._convergence_thresholds = get_convergence_thresholds(heating_type)
@@ -290,8 +297,10 @@ class AdaptiveLearner:
             cycle_history = self._cooling_cycle_history
         else:
             cycle_history = self._heating_cycle_history
+        cycle_stats = self._get_cycle_stats_tracker(mode)
 
         cycle_history.append(metrics)
+        cycle_stats.add(metrics)
 
         # Log detailed cycle metrics for debugging
         _LOGGER.debug(
@@ -323,6 +332,8 @@ class AdaptiveLearner:
         # FIFO eviction: remove oldest entries when exceeding max history (in-place for efficiency)
         if len(cycle_history) > self._max_history:
             evicted_count = len(cycle_history) - self._max_history
+            for evicted in cycle_history[:evicted_count]:
+                cycle_stats.evict(evicted)
             if mode == get_hvac_cool_mode():
                 del self._cooling_cycle_history[:evicted_count]
             else:
@@ -332,6 +343,36 @@ class AdaptiveLearner:
                 f"evicted {evicted_count} oldest entries"
             )
 
+    def _get_cycle_stats_tracker(self, mode: "HVACMode" = None) -> CycleStatsTracker:
+        """Return the stats tracker for a mode, rebuilt if its history was replaced."""
+        if mode == get_hvac_cool_mode():
+            cycle_history = self._cooling_cycle_history
+            tracker = self._cooling_cycle_stats
+        else:
+            cycle_history = self._heating_cycle_history
+            tracker = self._heating_cycle_stats
+        if not tracker.is_in_sync(cycle_history):
+            tracker.rebuild(cycle_history)
+        return tracker
+
+    def get_cycle_stats(self, mode: "HVACMode" = None) -> CycleStats:
+        """
+        Get running averages of cycle metrics.
+
+        Aggregates are maintained incrementally by add_cycle_metrics, so this
+        is O(1) unless the history was replaced since the last call.
+
+        Args:
+            mode: HVACMode (HEAT or COOL) to get stats for (defaults to HEAT)
+
+        Returns:
+            CycleStats with per-metric means over the full history and over
+            the most recent CYCLE_STATS_WINDOW cycles
+        """
+        if mode is None:
+            mode = get_hvac_heat_mode()
+        return self._get_cycle_stats_tracker(mode).stats()
+
     def get_cycle_count(self, mode: "HVACMode" = None) -> int:
         """
         Get number of stored cycle metrics.
@@ -782,6 +823,39 @@ class AdaptiveLearner:
             "kd": new_kd,
         }
 
+    def create_snapshot(self) -> "AdaptiveLearner":
+        """
+        Create an independent copy for calculating adjustments off the event loop.
+
+        The snapshot shares no mutable state with this learner and is picklable,
+        so calculate_pid_adjustment() can run on it in an executor while cycles
+        keep being recorded here. Call merge_snapshot() afterwards on the loop.
+
+        Returns:
+            Deep copy of this learner
+        """
+        return copy.deepcopy(self)
+
+    def merge_snapshot(
+        self,
+        snapshot: "AdaptiveLearner",
+        recommendation: Optional[Dict[str, float]],
+    ) -> None:
+        """
+        Adopt state changed by calculate_pid_adjustment() on a snapshot.
+
+        Carries over rule hysteresis and, when a recommendation was produced,
+        the rate limiting reset - exactly the state the call mutates.
+
+        Args:
+            snapshot: Learner returned by create_snapshot()
+            recommendation: Result of calculate_pid_adjustment() on the snapshot
+        """
+        self._rule_state_tracker = snapshot._rule_state_tracker
+        if recommendation is not None:
+            self._last_adjustment_time = snapshot._last_adjustment_time
+            self._cycles_since_last_adjustment = 0
+
     def get_last_adjustment_time(self) -> Optional[datetime]:
         """
         Get the timestamp of the last PID adjustment.
@@ -68,6 +68,9 @@ class ManifoldRegistry:
         # Track last active time per manifold name
         self._last_active_time: Dict[str, datetime] = {}
 
+        # Effective pipe volume (liters) calibrated from identified dead times
+        self._measured_pipe_volume: Dict[str, float] = {}
+
     def get_manifold_for_zone(self, zone_id: str) -> Optional[Manifold]:
         """Get the manifold serving a specific zone.
 
@@ -79,6 +82,34 @@ class ManifoldRegistry:
         """
         return self._zone_to_manifold.get(zone_id)
 
+    def set_measured_transport_delay(
+        self,
+        zone_id: str,
+        delay_minutes: float,
+        zone_loops: int = 1,
+    ) -> None:
+        """Calibrate a manifold's transport delay from a measured zone dead time.
+
+        The measurement is assumed to be taken with only this zone flowing and is
+        converted to an effective pipe volume, so delays for other loop counts
+        still scale with total flow.
+
+        Args:
+            zone_id: Zone entity_id the dead time was measured for
+            delay_minutes: Identified dead time in minutes
+            zone_loops: Number of loops for this zone
+        """
+        manifold = self.get_manifold_for_zone(zone_id)
+        if not manifold or delay_minutes <= 0:
+            return
+        self._measured_pipe_volume[manifold.name] = (
+            delay_minutes * zone_loops * manifold.flow_per_loop
+        )
+
+    def _get_pipe_volume(self, manifold: Manifold) -> float:
+        """Get the measured effective pipe volume, falling back to configuration."""
+        return self._measured_pipe_volume.get(manifold.name, manifold.pipe_volume)
+
     def mark_manifold_active(self, zone_id: str) -> None:
         """Mark the manifold serving this zone as active (warm).
 
@@ -137,7 +168,7 @@ class ManifoldRegistry:
 
         # Calculate delay: pipe_volume / (total_loops × flow_per_loop)
         total_flow_rate = total_active_loops * manifold.flow_per_loop
-        delay = manifold.pipe_volume / total_flow_rate
+        delay = self._get_pipe_volume(manifold) / total_flow_rate
 
         return delay
 
@@ -156,7 +187,7 @@ class ManifoldRegistry:
         manifold = self.get_manifold_for_zone(zone_id)
         if not manifold:
             return 0.0
-        return manifold.pipe_volume / (zone_loops * manifold.flow_per_loop)
+        return self._get_pipe_volume(manifold) / (zone_loops * manifold.flow_per_loop)
 
     def get_state_for_persistence(self) -> Dict[str, str]:
         """Return last_active_time as ISO strings for storage.
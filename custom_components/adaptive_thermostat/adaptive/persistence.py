@@ -244,6 +244,7 @@ class LearningDataStore:
         adaptive_data: Optional[Dict[str, Any]] = None,
         ke_data: Optional[Dict[str, Any]] = None,
         preheat_data: Optional[Dict[str, Any]] = None,
+        sysid_data: Optional[Dict[str, Any]] = None,
     ) -> None:
         """
         Update zone data in memory without triggering immediate save.
@@ -256,6 +257,7 @@ class LearningDataStore:
             adaptive_data: AdaptiveLearner data dictionary (optional)
             ke_data: KeLearner data dictionary (optional)
             preheat_data: PreheatLearner data dictionary (optional)
+            sysid_data: SystemIdResult data dictionary (optional)
         """
         # Ensure zone exists in data structure
         if zone_id not in self._data["zones"]:
@@ -275,13 +277,17 @@ class LearningDataStore:
         if preheat_data is not None:
             zone_data["preheat_learner"] = preheat_data
 
+        # Update identified zone model
+        if sysid_data is not None:
+            zone_data["system_identification"] = sysid_data
+
         # Update timestamp
         zone_data["last_updated"] = dt_util.utcnow().isoformat()
 
         _LOGGER.debug(
             f"Updated zone data for '{zone_id}' in memory: "
             f"adaptive={adaptive_data is not None}, ke={ke_data is not None}, "
-            f"preheat={preheat_data is not None}"
+            f"preheat={preheat_data is not None}, sysid={sysid_data is not None}"
         )
 
     def load(self) -> Optional[Dict[str, Any]]:
@@ -58,6 +58,7 @@ def calculate_thermal_time_constant(
     floor_construction: Optional[Dict] = None,
     area_m2: Optional[float] = None,
     heating_type: Optional[str] = None,
+    measured_tau: Optional[float] = None,
 ) -> float:
     """Calculate thermal time constant (tau) in hours.
 
@@ -82,6 +83,9 @@ def calculate_thermal_time_constant(
                            based on floor thermal properties.
         area_m2: Zone area in square meters. Required if floor_construction provided.
         heating_type: Heating system type. Required if floor_construction provided.
+        measured_tau: Time constant in hours identified from recorded zone history
+                      (see adaptive.sysid). When provided it replaces the estimate,
+                      since it already reflects windows and floor construction.
 
     Returns:
         Thermal time constant in hours.
@@ -91,6 +95,9 @@ def calculate_thermal_time_constant(
         ValueError: If floor_construction provided but area_m2 is missing.
         ValueError: If floor_construction provided but heating_type is missing.
     """
+    if measured_tau is not None and measured_tau > 0:
+        return measured_tau
+
     if volume_m3 is not None:
         # Estimate tau based on zone volume
         # Larger spaces have higher thermal mass and respond more slowly
@@ -0,0 +1,404 @@
+"""Offline PID auto-tuner driven by a zone model.
+
+Searches Kp/Ki/Kd/Ke candidates by simulating every candidate against a
+ZoneModel through BatchPID and scoring the closed-loop response:
+
+1. A multiplicative grid around the current gains is evaluated in one batch.
+2. The best grid point is refined with a shrinking coordinate pattern search.
+
+Scores combine overshoot, settling time and excess energy (mean output above
+what holding the setpoint needs), normalised by the heating type's
+convergence thresholds so results are on the same scale the adaptive
+learner uses. Current gains, learner recommendations and physics baselines
+can be scored against the same model for side-by-side comparison.
+
+tune_pid() is a pure function over picklable dataclasses so it can run in a
+process pool; async_tune_pid() dispatches requests there without touching the
+event loop. NumPy is required; import this module lazily.
+"""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+import itertools
+import logging
+import multiprocessing
+import os
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from ..const import (
+    DEFAULT_EXP_DECAY_TAU,
+    DEFAULT_INTEGRAL_DECAY,
+    DOMAIN,
+    HEATING_TYPE_CHARACTERISTICS,
+    HEATING_TYPE_EXP_DECAY_TAU,
+    HEATING_TYPE_INTEGRAL_DECAY,
+    HeatingType,
+    get_convergence_thresholds,
+)
+from ..pid_controller.batch import BatchPID
+from .zone_model import ZoneModel
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from .cycle_analysis import CycleMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+# Multiplicative grid factors applied to current gains
+DEFAULT_GRID_FACTORS = (0.25, 0.5, 1.0, 2.0, 4.0)
+DEFAULT_KE_GRID_FACTORS = (0.5, 1.0, 2.0)
+
+# Pattern search: initial relative step, number of iterations
+DEFAULT_REFINE_STEP = 0.25
+DEFAULT_REFINE_ITERATIONS = 8
+
+# Scenario defaults: setback recovery step and simulated horizon
+DEFAULT_SETPOINT_STEP = 1.5  # °C below setpoint at scenario start
+DEFAULT_HORIZON_HOURS = 8.0
+DEFAULT_STEP_SECONDS = 60.0
+DEFAULT_OUTDOOR_TEMP = 5.0
+MAX_SCENARIOS = 4
+
+# Score weights (each metric is normalised before weighting)
+DEFAULT_SCORE_WEIGHTS = {"overshoot": 1.0, "settling": 1.0, "energy": 0.5}
+
+GAIN_NAMES = ("kp", "ki", "kd", "ke")
+
+# hass.data[DOMAIN] key for the shared process pool
+TUNING_EXECUTOR_KEY = "tuning_executor"
+
+
+@dataclass
+class TuningScenario:
+    """One simulated episode: setpoint and outdoor temperature per step."""
+
+    setpoints: List[float]
+    outdoor_temps: List[float]
+    initial_temp: float
+    step_seconds: float = DEFAULT_STEP_SECONDS
+
+
+@dataclass
+class TuningRequest:
+    """Everything needed to tune one zone, picklable for process pools."""
+
+    zone_id: str
+    model: ZoneModel
+    scenarios: List[TuningScenario]
+    current_gains: Dict[str, float]
+    comparisons: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    controller_options: Dict[str, Any] = field(default_factory=dict)
+    grid_factors: Sequence[float] = DEFAULT_GRID_FACTORS
+    ke_grid_factors: Sequence[float] = DEFAULT_KE_GRID_FACTORS
+    refine_iterations: int = DEFAULT_REFINE_ITERATIONS
+    weights: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_SCORE_WEIGHTS))
+
+
+@dataclass
+class CandidateScore:
+    """Simulated performance of one gain set (metrics averaged over scenarios)."""
+
+    gains: Dict[str, float]
+    score: float
+    overshoot: float
+    settling_time: float
+    rise_time: float
+    energy: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for service responses."""
+        return {
+            "gains": {k: round(v, 6) for k, v in self.gains.items()},
+            "score": round(self.score, 4),
+            "overshoot": round(self.overshoot, 3),
+            "settling_time": round(self.settling_time, 1),
+            "rise_time": round(self.rise_time, 1),
+            "energy": round(self.energy, 2),
+        }
+
+
+@dataclass
+class TuningResult:
+    """Outcome of tune_pid() for one zone."""
+
+    zone_id: str
+    best: CandidateScore
+    current: CandidateScore
+    comparisons: Dict[str, CandidateScore]
+    candidates_evaluated: int
+    model: Dict[str, Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for service responses."""
+        return {
+            "zone_id": self.zone_id,
+            "best": self.best.to_dict(),
+            "current": self.current.to_dict(),
+            "comparisons": {name: c.to_dict() for name, c in self.comparisons.items()},
+            "improvement": round(self.current.score - self.best.score, 4),
+            "candidates_evaluated": self.candidates_evaluated,
+            "model": self.model,
+        }
+
+
+def default_controller_options(heating_type: str, model: ZoneModel) -> Dict[str, Any]:
+    """Controller settings the climate entity would use for this heating type."""
+    characteristics = HEATING_TYPE_CHARACTERISTICS.get(
+        heating_type, HEATING_TYPE_CHARACTERISTICS[HeatingType.RADIATOR]
+    )
+    return {
+        "out_min": 0.0,
+        "out_max": 100.0,
+        "cold_tolerance": characteristics["cold_tolerance"],
+        "hot_tolerance": characteristics["hot_tolerance"],
+        "derivative_filter_alpha": characteristics["derivative_filter_alpha"],
+        # Matches climate entity: outdoor lag tau = 2 * building tau
+        "outdoor_temp_lag_tau": 2.0 * model.time_constant_hours,
+        "integral_decay_multiplier": HEATING_TYPE_INTEGRAL_DECAY.get(heating_type, DEFAULT_INTEGRAL_DECAY),
+        "integral_exp_decay_tau": HEATING_TYPE_EXP_DECAY_TAU.get(heating_type, DEFAULT_EXP_DECAY_TAU),
+        "heating_type": heating_type,
+    }
+
+
+def build_scenarios(
+    cycles: Iterable["CycleMetrics"],
+    setpoint: float,
+    setpoint_step: float = DEFAULT_SETPOINT_STEP,
+    horizon_hours: float = DEFAULT_HORIZON_HOURS,
+    step_seconds: float = DEFAULT_STEP_SECONDS,
+    max_scenarios: int = MAX_SCENARIOS,
+) -> List[TuningScenario]:
+    """Build setback-recovery scenarios at outdoor temperatures seen in recorded cycles.
+
+    Each scenario starts in equilibrium setpoint_step below the setpoint and
+    holds the setpoint for the horizon. Outdoor temperatures are taken as
+    evenly spaced quantiles of the recorded cycles' outdoor averages.
+
+    Args:
+        cycles: Recorded CycleMetrics (outdoor_temp_avg is used)
+        setpoint: Target temperature
+        setpoint_step: Degrees below setpoint at scenario start
+        horizon_hours: Simulated duration
+        step_seconds: Simulation step
+        max_scenarios: Maximum number of outdoor temperature scenarios
+
+    Returns:
+        List of TuningScenario (at least one)
+    """
+    outdoor = sorted(c.outdoor_temp_avg for c in cycles if c.outdoor_temp_avg is not None)
+    if not outdoor:
+        outdoor_points = [DEFAULT_OUTDOOR_TEMP]
+    elif len(outdoor) <= max_scenarios:
+        outdoor_points = sorted(set(round(t, 1) for t in outdoor))
+    else:
+        quantiles = np.linspace(0.0, 1.0, max_scenarios)
+        outdoor_points = sorted(set(round(float(q), 1) for q in np.quantile(outdoor, quantiles)))
+
+    steps = max(1, int(horizon_hours * 3600.0 / step_seconds))
+    return [
+        TuningScenario(
+            setpoints=[setpoint] * steps,
+            outdoor_temps=[t_out] * steps,
+            initial_temp=setpoint - setpoint_step,
+            step_seconds=step_seconds,
+        )
+        for t_out in outdoor_points
+    ]
+
+
+def _gain_matrix(gain_sets: Sequence[Dict[str, float]]) -> np.ndarray:
+    """Stack gain dicts into an (m, 4) array ordered as GAIN_NAMES."""
+    return np.array([[float(g.get(name, 0.0) or 0.0) for name in GAIN_NAMES] for g in gain_sets])
+
+
+def evaluate_gains(request: TuningRequest, gains: np.ndarray) -> Dict[str, np.ndarray]:
+    """Simulate each gain row against every scenario and score it.
+
+    Args:
+        request: Tuning request (model, scenarios, controller options, weights)
+        gains: (m, 4) array of kp, ki, kd, ke
+
+    Returns:
+        Dict of per-candidate arrays: score, overshoot, settling_time (min),
+        rise_time (min), energy (mean output %)
+    """
+    model = request.model
+    options = request.controller_options or default_controller_options(model.heating_type, model)
+    thresholds = get_convergence_thresholds(options.get("heating_type", model.heating_type))
+    band = thresholds["overshoot_max"]
+    weights = request.weights
+    m = len(gains)
+
+    totals = {key: np.zeros(m) for key in ("score", "overshoot", "settling_time", "rise_time", "energy")}
+    for scenario in request.scenarios:
+        steps = len(scenario.setpoints)
+        step_minutes = scenario.step_seconds / 60.0
+        horizon_minutes = steps * step_minutes
+        setpoint0 = scenario.setpoints[0]
+        outdoor0 = scenario.outdoor_temps[0]
+
+        controllers = BatchPID(
+            kp=gains[:, 0], ki=gains[:, 1], kd=gains[:, 2], ke=gains[:, 3], size=m, **options
+        )
+        # Start in equilibrium: integral holds the output that sustains the initial temperature
+        initial_output = model.steady_state_output(scenario.initial_temp, outdoor0)
+        controllers.integral = initial_output - gains[:, 3] * (setpoint0 - outdoor0)
+
+        temps, outputs = model.simulate(
+            controllers,
+            scenario.setpoints,
+            scenario.outdoor_temps,
+            scenario.initial_temp,
+            step_seconds=scenario.step_seconds,
+            initial_output=initial_output,
+        )
+        error = temps - np.asarray(scenario.setpoints)[:, None]
+
+        # Rise: first step at or above setpoint; overshoot measured after it
+        reached = error >= 0
+        crossed = np.maximum.accumulate(reached, axis=0)
+        ever_crossed = crossed[-1]
+        rise = np.where(ever_crossed, np.argmax(reached, axis=0) * step_minutes, horizon_minutes)
+        overshoot = np.max(np.where(crossed, error, 0.0), axis=0)
+
+        # Settling: time after which temperature stays inside the band
+        outside = np.abs(error) > band
+        last_outside = steps - 1 - np.argmax(outside[::-1], axis=0)
+        settling = np.where(outside.any(axis=0), (last_outside + 1) * step_minutes, 0.0)
+        settling = np.where(ever_crossed, settling, horizon_minutes)
+
+        # Energy: only output above what holding the setpoint requires is penalised,
+        # otherwise the search would favour controllers that never reach setpoint
+        energy = outputs.mean(axis=0)
+        required = model.steady_state_output(scenario.setpoints[-1], scenario.outdoor_temps[-1])
+        excess_energy = np.maximum(energy - required, 0.0)
+
+        score = (
+            weights.get("overshoot", 0.0) * overshoot / thresholds["overshoot_max"]
+            + weights.get("settling", 0.0) * settling / thresholds["settling_time_max"]
+            + weights.get("energy", 0.0) * excess_energy / 100.0
+        )
+
+        totals["score"] += score
+        totals["overshoot"] += overshoot
+        totals["settling_time"] += settling
+        totals["rise_time"] += rise
+        totals["energy"] += energy
+
+    count = max(1, len(request.scenarios))
+    return {key: value / count for key, value in totals.items()}
+
+
+def _candidate(gains: np.ndarray, metrics: Dict[str, np.ndarray], index: int) -> CandidateScore:
+    """Build a CandidateScore for row index of evaluated metrics."""
+    return CandidateScore(
+        gains={name: float(gains[index, i]) for i, name in enumerate(GAIN_NAMES)},
+        score=float(metrics["score"][index]),
+        overshoot=float(metrics["overshoot"][index]),
+        settling_time=float(metrics["settling_time"][index]),
+        rise_time=float(metrics["rise_time"][index]),
+        energy=float(metrics["energy"][index]),
+    )
+
+
+def tune_pid(request: TuningRequest) -> TuningResult:
+    """Search for the best gains for one zone (grid + local refinement).
+
+    Pure and CPU-bound; safe to run in a worker process.
+    """
+    base = _gain_matrix([request.current_gains])[0]
+    factors = np.asarray(request.grid_factors, dtype=float)
+    ke_factors = np.asarray(request.ke_grid_factors if base[3] else [1.0], dtype=float)
+
+    grid = np.array([
+        base * np.array(combo)
+        for combo in itertools.product(factors, factors, factors, ke_factors)
+    ])
+    grid = np.unique(grid, axis=0)
+    metrics = evaluate_gains(request, grid)
+    evaluated = len(grid)
+
+    best_index = int(np.argmin(metrics["score"]))
+    best_gains = grid[best_index].copy()
+    best_score = float(metrics["score"][best_index])
+    best = _candidate(grid, metrics, best_index)
+
+    # Coordinate pattern search around the best grid point
+    step = DEFAULT_REFINE_STEP
+    tunable = [i for i in range(len(GAIN_NAMES)) if best_gains[i] != 0]
+    for _ in range(request.refine_iterations):
+        neighbors = []
+        for i in tunable:
+            for scale in (1.0 + step, 1.0 / (1.0 + step)):
+                candidate = best_gains.copy()
+                candidate[i] *= scale
+                neighbors.append(candidate)
+        if not neighbors:
+            break
+        neighbors = np.array(neighbors)
+        neighbor_metrics = evaluate_gains(request, neighbors)
+        evaluated += len(neighbors)
+        index = int(np.argmin(neighbor_metrics["score"]))
+        if neighbor_metrics["score"][index] < best_score:
+            best_gains = neighbors[index].copy()
+            best_score = float(neighbor_metrics["score"][index])
+            best = _candidate(neighbors, neighbor_metrics, index)
+        else:
+            step /= 2.0
+
+    # Score current gains and comparison gain sets against the same model
+    reference_names = ["current", *request.comparisons.keys()]
+    reference_gains = _gain_matrix([request.current_gains, *request.comparisons.values()])
+    reference_metrics = evaluate_gains(request, reference_gains)
+    references = {
+        name: _candidate(reference_gains, reference_metrics, i)
+        for i, name in enumerate(reference_names)
+    }
+    current = references.pop("current")
+
+    return TuningResult(
+        zone_id=request.zone_id,
+        best=best,
+        current=current,
+        comparisons=references,
+        candidates_evaluated=evaluated,
+        model=request.model.to_dict(),
+    )
+
+
+def get_tuning_executor(hass: HomeAssistant) -> Executor:
+    """Return the integration's shared tuning process pool, creating it lazily."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    executor = domain_data.get(TUNING_EXECUTOR_KEY)
+    if executor is None:
+        executor = ProcessPoolExecutor(
+            max_workers=max(1, min(4, (os.cpu_count() or 2) - 1)),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        domain_data[TUNING_EXECUTOR_KEY] = executor
+    return executor
+
+
+async def async_tune_pid(
+    hass: HomeAssistant,
+    requests: Sequence[TuningRequest],
+    executor: Optional[Executor] = None,
+) -> List[TuningResult | BaseException]:
+    """Run tune_pid() for several zones concurrently off the event loop.
+
+    Args:
+        hass: Home Assistant instance
+        requests: One TuningRequest per zone
+        executor: Executor to use (defaults to the shared process pool)
+
+    Returns:
+        One TuningResult per request, or the exception raised for that zone
+    """
+    if executor is None:
+        executor = get_tuning_executor(hass)
+    futures = [hass.loop.run_in_executor(executor, tune_pid, request) for request in requests]
+    return await asyncio.gather(*futures, return_exceptions=True)
@@ -65,6 +65,40 @@ class PreheatLearner:
         # Counter for optimization: expire old observations every 10 calls
         self._add_observation_counter = 0
 
+        # Identified zone model (gain °C, tau hours, offset °C) replacing the
+        # configured fallback rate when a bin has too few observations
+        self._measured_model: Optional[Tuple[float, float, float]] = None
+
+    def set_measured_model(
+        self,
+        gain: float,
+        time_constant_hours: float,
+        offset: float = 0.0,
+    ) -> None:
+        """Use an identified zone model for the fallback heating rate.
+
+        Args:
+            gain: Steady-state rise above outdoor at 100% output in C
+            time_constant_hours: Thermal time constant in hours
+            offset: Steady-state rise from internal/solar gains in C
+        """
+        if gain <= 0 or time_constant_hours <= 0:
+            return
+        self._measured_model = (gain, time_constant_hours, offset)
+
+    def _get_fallback_rate(self, current_temp: float, target_temp: float, outdoor_temp: float) -> float:
+        """Get the heating rate used when a bin lacks observations.
+
+        With a measured model, this is the full-output rate at the midpoint of
+        the recovery, never below a quarter of the configured fallback rate.
+        """
+        if self._measured_model is None:
+            return self.fallback_rate
+        gain, tau, offset = self._measured_model
+        mid_temp = (current_temp + target_temp) / 2.0
+        rate = (gain + offset - (mid_temp - outdoor_temp)) / tau
+        return max(rate, self.fallback_rate * 0.25)
+
     def get_delta_bin(self, delta: float) -> str:
         """Get temperature delta bin.
 
@@ -210,8 +244,8 @@ class PreheatLearner:
             recent_rates = [obs.rate for obs in observations[-10:]]
             base_rate = statistics.median(recent_rates)
         else:
-            # Use fallback rate
-            base_rate = self.fallback_rate
+            # Use fallback rate (measured model when identified)
+            base_rate = self._get_fallback_rate(current_temp, target_temp, outdoor_temp)
 
         # Calculate margin (scales with delta)
         # margin = (1.0 + delta/10 * 0.3) * cold_soak_margin
@@ -243,6 +277,16 @@ class PreheatLearner:
         """
         return sum(len(obs) for obs in self._observations.values())
 
+    def get_observations(self) -> List[HeatingObservation]:
+        """Get all observations across bins, oldest first.
+
+        Returns:
+            List of heating observations sorted by timestamp
+        """
+        observations = [obs for obs_list in self._observations.values() for obs in obs_list]
+        observations.sort(key=lambda obs: obs.timestamp)
+        return observations
+
     def get_learned_rate(
         self,
         delta: float,
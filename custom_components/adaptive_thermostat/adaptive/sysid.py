@@ -0,0 +1,273 @@
+"""System identification of zone thermal dynamics from recorded history.
+
+Fits a first-order-plus-dead-time (FOPDT) model per zone:
+
+    tau * dT/dt = gain * u(t - dead_time) / 100 - (T - T_out) + offset
+
+using the exact zero-order-hold discretisation on a uniform grid
+
+    T[k+1] - T[k] = a * (T_out[k] - T[k]) + b * u[k - d] + c
+
+which is linear in (a, b, c). Every candidate dead time d is solved at once
+with batched normal equations, and the d with the smallest residual wins.
+A week of minute samples fits in a few milliseconds, so all zones can be
+identified nightly.
+
+Fitted values feed back into the integration:
+- time_constant_hours replaces the physics estimate in
+  calculate_thermal_time_constant() on the next start
+- dead_time_minutes calibrates ManifoldRegistry transport delays
+- gain/loss/offset give PreheatLearner a measured fallback heating rate
+
+ThermalHistory (the sample recorder) has no NumPy dependency; fit_fopdt()
+imports NumPy lazily so the live control path never requires it.
+"""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import asdict, dataclass
+import math
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+# Samples kept per zone (about 2 weeks at one sensor update per minute)
+THERMAL_HISTORY_MAX_SAMPLES = 20000
+
+# Resampling grid and dead time search range
+SYSID_STEP_SECONDS = 60.0
+SYSID_MAX_DEAD_TIME_MINUTES = 60.0
+
+# Grid points further than this from a recorded sample are excluded
+SYSID_MAX_GAP_SECONDS = 900.0
+
+# Minimum usable regression rows (6 hours at the default step)
+SYSID_MIN_ROWS = 360
+
+# Minimum output standard deviation (%) - without excitation gain is unidentifiable
+SYSID_MIN_OUTPUT_STD = 5.0
+
+# Plausibility bounds for fitted parameters
+SYSID_TIME_CONSTANT_RANGE = (0.1, 72.0)  # hours
+SYSID_GAIN_RANGE = (1.0, 200.0)  # °C at 100% output
+SYSID_MIN_R_SQUARED = 0.3
+
+
+@dataclass
+class SystemIdResult:
+    """Fitted FOPDT parameters for one zone."""
+
+    gain: float  # Steady-state rise above outdoor at 100% output (°C)
+    time_constant_hours: float
+    dead_time_minutes: float
+    loss_coefficient: float  # °C/h lost per °C of indoor-outdoor difference (1/tau)
+    offset: float  # Steady-state rise from internal/solar gains (°C)
+    r_squared: float
+    samples: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the result to a dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> SystemIdResult:
+        """Restore a result from to_dict() output."""
+        return cls(
+            gain=float(data["gain"]),
+            time_constant_hours=float(data["time_constant_hours"]),
+            dead_time_minutes=float(data["dead_time_minutes"]),
+            loss_coefficient=float(data["loss_coefficient"]),
+            offset=float(data.get("offset", 0.0)),
+            r_squared=float(data.get("r_squared", 0.0)),
+            samples=int(data.get("samples", 0)),
+        )
+
+    def heating_rate(self, indoor_temp: float, outdoor_temp: float, output: float = 100.0) -> float:
+        """Predicted rate of temperature change (°C/hour) at the given conditions."""
+        return (
+            self.gain * output / 100.0 + self.offset - (indoor_temp - outdoor_temp)
+        ) / self.time_constant_hours
+
+    def to_zone_model(self, heating_type: Optional[str]):
+        """Build a ZoneModel for offline simulation (requires NumPy)."""
+        from ..const import HEATING_TYPE_CHARACTERISTICS, HeatingType
+        from .zone_model import ZoneModel
+
+        return ZoneModel(
+            gain=self.gain,
+            time_constant_hours=self.time_constant_hours,
+            dead_time_minutes=self.dead_time_minutes,
+            heating_type=heating_type if heating_type in HEATING_TYPE_CHARACTERISTICS else HeatingType.RADIATOR,
+        )
+
+
+class ThermalHistory:
+    """Bounded recorder of (timestamp, indoor, outdoor, output) samples for one zone."""
+
+    def __init__(self, max_samples: int = THERMAL_HISTORY_MAX_SAMPLES) -> None:
+        """Initialize the recorder.
+
+        Args:
+            max_samples: Oldest samples are dropped beyond this count
+        """
+        self._samples: Deque[Tuple[float, float, float, float]] = deque(maxlen=max_samples)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def append(
+        self,
+        timestamp: float,
+        indoor_temp: float,
+        outdoor_temp: Optional[float],
+        output: float,
+    ) -> None:
+        """Record one sample.
+
+        Args:
+            timestamp: Wall-clock time in seconds
+            indoor_temp: Zone temperature in °C
+            outdoor_temp: Outdoor temperature in °C, or None if unavailable
+            output: Control output applied from this sample on (0-100%)
+        """
+        if self._samples and timestamp <= self._samples[-1][0]:
+            return
+        self._samples.append((
+            timestamp,
+            indoor_temp,
+            math.nan if outdoor_temp is None else outdoor_temp,
+            output,
+        ))
+
+    def as_columns(self) -> Tuple[List[float], List[float], List[float], List[float]]:
+        """Return (timestamps, indoor, outdoor, output) columns."""
+        if not self._samples:
+            return [], [], [], []
+        timestamps, indoor, outdoor, output = zip(*self._samples)
+        return list(timestamps), list(indoor), list(outdoor), list(output)
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        self._samples.clear()
+
+
+def fit_fopdt(
+    timestamps: Sequence[float],
+    indoor_temps: Sequence[float],
+    outdoor_temps: Sequence[float],
+    outputs: Sequence[float],
+    step_seconds: float = SYSID_STEP_SECONDS,
+    max_dead_time_minutes: float = SYSID_MAX_DEAD_TIME_MINUTES,
+) -> Optional[SystemIdResult]:
+    """Fit an FOPDT model to recorded zone history.
+
+    Args:
+        timestamps: Sample times in seconds (ascending)
+        indoor_temps: Zone temperature per sample (°C)
+        outdoor_temps: Outdoor temperature per sample (°C, NaN if unknown)
+        outputs: Control output per sample (%), held until the next sample
+        step_seconds: Resampling grid step
+        max_dead_time_minutes: Largest dead time considered
+
+    Returns:
+        SystemIdResult, or None if the data is insufficient or the fit implausible
+    """
+    import numpy as np
+
+    t = np.asarray(timestamps, dtype=float)
+    indoor = np.asarray(indoor_temps, dtype=float)
+    outdoor = np.asarray(outdoor_temps, dtype=float)
+    u = np.asarray(outputs, dtype=float)
+    if len(t) < 2:
+        return None
+
+    # Outdoor readings are sparse; interpolate over the finite ones only
+    has_outdoor = np.isfinite(outdoor)
+    if not has_outdoor.any():
+        return None
+
+    grid = np.arange(t[0], t[-1], step_seconds)
+    if len(grid) < 2:
+        return None
+    indoor_g = np.interp(grid, t, indoor)
+    outdoor_g = np.interp(grid, t[has_outdoor], outdoor[has_outdoor])
+    # Zero-order hold for the output
+    idx = np.searchsorted(t, grid, side="right") - 1
+    u_g = u[idx]
+    # Grid points inside long recording gaps are unusable
+    next_idx = np.minimum(idx + 1, len(t) - 1)
+    valid = (t[next_idx] - t[idx]) <= SYSID_MAX_GAP_SECONDS
+
+    max_delay = int(max_dead_time_minutes * 60.0 / step_seconds)
+    rows = len(grid) - 1 - max_delay
+    if rows < SYSID_MIN_ROWS:
+        return None
+
+    # Regression rows k = max_delay .. len-2; every dead time shares the same rows
+    k = np.arange(max_delay, len(grid) - 1)
+    # Row must be valid for T[k], T[k+1] and every lagged output it may use
+    window_valid = np.lib.stride_tricks.sliding_window_view(valid, max_delay + 1)
+    mask = window_valid.all(axis=1)[: len(k)] & valid[k + 1]
+    if mask.sum() < SYSID_MIN_ROWS:
+        return None
+    k = k[mask]
+
+    y = indoor_g[k + 1] - indoor_g[k]
+    x_loss = outdoor_g[k] - indoor_g[k]
+    # lagged[d, j] = u[k_j - d] for every candidate dead time d
+    lagged = u_g[k[None, :] - np.arange(max_delay + 1)[:, None]]
+    if lagged[0].std() < SYSID_MIN_OUTPUT_STD:
+        return None
+
+    n = float(len(k))
+    sum_x = x_loss.sum()
+    sum_xx = x_loss @ x_loss
+    sum_u = lagged.sum(axis=1)
+    sum_uu = np.einsum("dj,dj->d", lagged, lagged)
+    sum_xu = lagged @ x_loss
+
+    # Batched normal equations: one 3x3 system per dead time candidate
+    xtx = np.empty((max_delay + 1, 3, 3))
+    xtx[:, 0, 0] = sum_xx
+    xtx[:, 0, 1] = xtx[:, 1, 0] = sum_xu
+    xtx[:, 0, 2] = xtx[:, 2, 0] = sum_x
+    xtx[:, 1, 1] = sum_uu
+    xtx[:, 1, 2] = xtx[:, 2, 1] = sum_u
+    xtx[:, 2, 2] = n
+    xty = np.stack([
+        np.full(max_delay + 1, x_loss @ y),
+        lagged @ y,
+        np.full(max_delay + 1, y.sum()),
+    ], axis=1)
+
+    try:
+        theta = np.linalg.solve(xtx, xty[..., None])[..., 0]
+    except np.linalg.LinAlgError:
+        return None
+
+    sse = y @ y - 2.0 * np.einsum("di,di->d", theta, xty) + np.einsum("di,dij,dj->d", theta, xtx, theta)
+    best = int(np.argmin(sse))
+    a, b, c = theta[best]
+    if not (0.0 < a < 1.0) or b <= 0.0:
+        return None
+
+    sst = float(((y - y.mean()) ** 2).sum())
+    r_squared = 1.0 - float(sse[best]) / sst if sst > 0 else 0.0
+
+    step_hours = step_seconds / 3600.0
+    time_constant = -step_hours / math.log(1.0 - a)
+    gain = 100.0 * b / a
+    if not (SYSID_TIME_CONSTANT_RANGE[0] <= time_constant <= SYSID_TIME_CONSTANT_RANGE[1]):
+        return None
+    if not (SYSID_GAIN_RANGE[0] <= gain <= SYSID_GAIN_RANGE[1]):
+        return None
+    if r_squared < SYSID_MIN_R_SQUARED:
+        return None
+
+    return SystemIdResult(
+        gain=float(gain),
+        time_constant_hours=float(time_constant),
+        dead_time_minutes=best * step_seconds / 60.0,
+        loss_coefficient=float(1.0 / time_constant),
+        offset=float(c / a),
+        r_squared=float(r_squared),
+        samples=len(k),
+    )
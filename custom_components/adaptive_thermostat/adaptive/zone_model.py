@@ -0,0 +1,169 @@
+"""First-order-plus-dead-time zone model for offline PID simulation.
+
+The model describes indoor temperature T driven by heater output u (0-100%)
+and outdoor temperature T_out:
+
+    tau * dT/dt = gain * u(t - dead_time) / 100 - (T - T_out)
+
+gain is the steady-state rise above outdoor temperature at 100% output (°C),
+tau is the thermal time constant (hours) and dead_time the transport delay
+(minutes). Simulation uses the exact zero-order-hold discretisation so it is
+stable for any step size, and advances many candidate controllers at once
+through BatchPID.
+
+NumPy is required; import this module lazily from Home Assistant code paths.
+"""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+import math
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+from ..const import HEATING_TYPE_CHARACTERISTICS, HeatingType
+from ..pid_controller.batch import BatchPID
+
+# Steady-state temperature rise above outdoor at 100% output (°C).
+# A heating system sized to hold 20°C at -10°C outdoor with margin gives ~40°C.
+DEFAULT_ZONE_GAIN = 40.0
+
+# Typical transport delay (minutes) when no measured dead time is available
+DEFAULT_DEAD_TIME_MINUTES = {
+    HeatingType.FLOOR_HYDRONIC: 20.0,
+    HeatingType.RADIATOR: 8.0,
+    HeatingType.CONVECTOR: 4.0,
+    HeatingType.FORCED_AIR: 2.0,
+}
+
+# Fallback thermal time constant (hours) when zone physics are not configured
+DEFAULT_TIME_CONSTANT_HOURS = {
+    HeatingType.FLOOR_HYDRONIC: 6.0,
+    HeatingType.RADIATOR: 3.0,
+    HeatingType.CONVECTOR: 2.0,
+    HeatingType.FORCED_AIR: 1.0,
+}
+
+
+@dataclass
+class ZoneModel:
+    """FOPDT thermal model of a single zone."""
+
+    gain: float
+    time_constant_hours: float
+    dead_time_minutes: float = 0.0
+    heating_type: str = HeatingType.RADIATOR
+
+    def __post_init__(self) -> None:
+        if self.gain <= 0:
+            raise ValueError(f"gain must be positive, got {self.gain}")
+        if self.time_constant_hours <= 0:
+            raise ValueError(f"time_constant_hours must be positive, got {self.time_constant_hours}")
+        if self.dead_time_minutes < 0:
+            raise ValueError(f"dead_time_minutes must be >= 0, got {self.dead_time_minutes}")
+
+    @classmethod
+    def from_physics(
+        cls,
+        heating_type: str,
+        thermal_time_constant: Optional[float] = None,
+        dead_time_minutes: Optional[float] = None,
+        gain: float = DEFAULT_ZONE_GAIN,
+    ) -> ZoneModel:
+        """Build a model from physics estimates when no fitted model exists.
+
+        Args:
+            heating_type: Heating system type
+            thermal_time_constant: Tau in hours from calculate_thermal_time_constant()
+            dead_time_minutes: Measured transport delay, if known
+            gain: Steady-state rise at 100% output (°C)
+
+        Returns:
+            ZoneModel with heating-type defaults for missing values
+        """
+        if not thermal_time_constant:
+            thermal_time_constant = DEFAULT_TIME_CONSTANT_HOURS.get(heating_type, 3.0)
+        if dead_time_minutes is None:
+            dead_time_minutes = DEFAULT_DEAD_TIME_MINUTES.get(heating_type, 5.0)
+        return cls(
+            gain=gain,
+            time_constant_hours=thermal_time_constant,
+            dead_time_minutes=dead_time_minutes,
+            heating_type=heating_type if heating_type in HEATING_TYPE_CHARACTERISTICS else HeatingType.RADIATOR,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the model to a dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> ZoneModel:
+        """Restore a model from to_dict() output."""
+        return cls(
+            gain=float(data["gain"]),
+            time_constant_hours=float(data["time_constant_hours"]),
+            dead_time_minutes=float(data.get("dead_time_minutes", 0.0)),
+            heating_type=data.get("heating_type", HeatingType.RADIATOR),
+        )
+
+    def steady_state_output(self, indoor_temp: float, outdoor_temp: float) -> float:
+        """Output (%) needed to hold indoor_temp at the given outdoor temperature."""
+        return max(0.0, min(100.0, 100.0 * (indoor_temp - outdoor_temp) / self.gain))
+
+    def simulate(
+        self,
+        controllers: BatchPID,
+        setpoints: Sequence[float],
+        outdoor_temps: Sequence[float],
+        initial_temp: float,
+        step_seconds: float = 60.0,
+        start_time: float = 0.0,
+        initial_output: float = 0.0,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Simulate closed-loop response for every controller in the batch.
+
+        Output is treated as a continuous duty (PWM averaged over the step).
+
+        Args:
+            controllers: BatchPID with one controller per candidate
+            setpoints: Setpoint per step
+            outdoor_temps: Outdoor temperature per step
+            initial_temp: Indoor temperature at the start
+            step_seconds: Simulation step in seconds
+            start_time: Timestamp of the first step in seconds
+            initial_output: Output (%) applied before the start, still in transit
+                through the dead time during the first steps
+
+        Returns:
+            Tuple of (temperatures, outputs), each shaped (steps, controllers).
+            temperatures[k] is the temperature measured at step k.
+        """
+        steps = len(setpoints)
+        if len(outdoor_temps) != steps:
+            raise ValueError("setpoints and outdoor_temps must have the same length")
+
+        n = controllers.size
+        decay = math.exp(-step_seconds / (self.time_constant_hours * 3600.0))
+        delay_steps = int(round(self.dead_time_minutes * 60.0 / step_seconds))
+
+        temps = np.empty((steps, n))
+        outputs = np.empty((steps, n))
+        # Ring buffer of outputs still travelling through the dead time
+        pending = np.full((delay_steps + 1, n), float(initial_output))
+        temp = np.full(n, float(initial_temp))
+        last_time = None
+
+        for k in range(steps):
+            t = start_time + k * step_seconds
+            outdoor = outdoor_temps[k]
+            output, _ = controllers.calc(temp, setpoints[k], t, last_time, outdoor)
+            last_time = t
+            temps[k] = temp
+            outputs[k] = output
+
+            pending[k % (delay_steps + 1)] = output
+            effective = pending[(k + 1) % (delay_steps + 1)] if delay_steps else output
+            steady = outdoor + self.gain * np.clip(effective, 0.0, 100.0) / 100.0
+            temp = steady + (temp - steady) * decay
+
+        return temps, outputs
@@ -1,21 +1,38 @@
 """Chart generation for weekly reports using Pillow.
 
-Generates PNG chart images for attachment to notifications.
+Generates PNG chart images for attachment to notifications. Rendering and
+file operations are blocking, so the async helpers in this module run them
+in the executor.
+
+Charts are content-addressed: the file name is a hash of the chart type, its
+inputs and the image size, so a chart whose data has not changed is served
+from the existing PNG instead of being rendered again. The chart directory
+is capped at CHART_CACHE_MAX_FILES, evicting the least recently used files.
 """
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass
+import hashlib
 from io import BytesIO
+import json
 import logging
+import os
 from pathlib import Path
-from typing import TYPE_CHECKING
+import threading
+from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
-from homeassistant.util import dt as dt_util
-
 _LOGGER = logging.getLogger(__name__)
 
+# Chart cache: bump the version when chart rendering changes so cached
+# images are not reused, and cap the number of cached chart files
+CHART_CACHE_VERSION = 1
+CHART_CACHE_MAX_FILES = 50
+CHART_URL_PREFIX = "/local/adaptive_thermostat"
+
 # Chart dimensions
 DEFAULT_WIDTH = 600
 DEFAULT_HEIGHT = 300
@@ -29,11 +46,47 @@ COLOR_BAR_SUCCESS = (15, 157, 88)  # Google green
 COLOR_BAR_WARNING = (244, 180, 0)  # Google yellow
 COLOR_GRID = (224, 224, 224)  # Light gray
 
+# Fonts (fall back to Pillow's default font when missing)
+FONT_REGULAR = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+FONT_BOLD = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+
 # Comfort score color thresholds
 COMFORT_GOOD = 80  # Green if >= 80
 COMFORT_OK = 60  # Yellow if >= 60, else red
 
 
+# Loaded TrueType fonts per (path, size), kept per thread because FreeType
+# faces must not be used from several threads at once
+_font_cache = threading.local()
+
+
+def _get_font(path: str, size: int) -> Any:
+    """Get a TrueType font, loading it once per thread.
+
+    Args:
+        path: Font file path
+        size: Font size in points
+
+    Returns:
+        Pillow font object (default font if the file cannot be loaded)
+    """
+    from PIL import ImageFont
+
+    fonts = getattr(_font_cache, "fonts", None)
+    if fonts is None:
+        fonts = _font_cache.fonts = {}
+
+    key = (path, size)
+    if key not in fonts:
+        try:
+            fonts[key] = ImageFont.truetype(path, size)
+        except (OSError, IOError):
+            fonts[key] = None
+
+    font = fonts[key]
+    return font if font is not None else ImageFont.load_default()
+
+
 def _get_comfort_color(score: float) -> tuple[int, int, int]:
     """Get color for comfort score.
 
@@ -51,9 +104,29 @@ def _get_comfort_color(score: float) -> tuple[int, int, int]:
         return COLOR_BAR_SECONDARY
 
 
+@dataclass(frozen=True)
+class ChartRequest:
+    """A chart to render, identified by a hash of its inputs."""
+
+    key: str
+    render: Callable[[], bytes | None]
+
+    @property
+    def filename(self) -> str:
+        """File name of the cached chart image."""
+        return f"chart_{self.key}.png"
+
+
 class ChartGenerator:
     """Generate PNG charts using Pillow."""
 
+    # Chart types accepted by request() and the method rendering each
+    CHART_TYPES = {
+        "bar": "create_bar_chart",
+        "comfort": "create_comfort_chart",
+        "comparison": "create_comparison_chart",
+    }
+
     def __init__(
         self,
         width: int = DEFAULT_WIDTH,
@@ -87,6 +160,27 @@ class ChartGenerator:
         """Check if chart generation is available."""
         return self._pillow_available
 
+    def request(self, chart_type: str, *args: Any, **kwargs: Any) -> ChartRequest:
+        """Describe a chart without rendering it.
+
+        Args:
+            chart_type: One of CHART_TYPES ("bar", "comfort", "comparison")
+            *args: Positional arguments for the chart method
+            **kwargs: Keyword arguments for the chart method
+
+        Returns:
+            ChartRequest keyed by a hash of type, inputs and dimensions
+        """
+        method = getattr(self, self.CHART_TYPES[chart_type])
+        # Dicts keep insertion order in JSON, which matches the bar order drawn
+        payload = json.dumps(
+            [CHART_CACHE_VERSION, chart_type, self.width, self.height,
+             list(args), sorted(kwargs.items())],
+            default=str,
+        )
+        key = hashlib.sha256(payload.encode()).hexdigest()[:16]
+        return ChartRequest(key=key, render=lambda: method(*args, **kwargs))
+
     def create_bar_chart(
         self,
         data: dict[str, float],
@@ -109,7 +203,7 @@ class ChartGenerator:
             return None
 
         try:
-            from PIL import Image, ImageDraw, ImageFont
+            from PIL import Image, ImageDraw
         except ImportError:
             return None
 
@@ -120,13 +214,8 @@ class ChartGenerator:
         img = Image.new("RGB", (self.width, self.height), COLOR_BACKGROUND)
         draw = ImageDraw.Draw(img)
 
-        # Try to load a font, fall back to default
-        try:
-            font_title = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 16)
-            font_label = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 12)
-        except (OSError, IOError):
-            font_title = ImageFont.load_default()
-            font_label = ImageFont.load_default()
+        font_title = _get_font(FONT_BOLD, 16)
+        font_label = _get_font(FONT_REGULAR, 12)
 
         # Layout
         margin = 20
@@ -204,7 +293,7 @@ class ChartGenerator:
             return None
 
         try:
-            from PIL import Image, ImageDraw, ImageFont
+            from PIL import Image, ImageDraw
         except ImportError:
             return None
 
@@ -215,13 +304,8 @@ class ChartGenerator:
         img = Image.new("RGB", (self.width, self.height), COLOR_BACKGROUND)
         draw = ImageDraw.Draw(img)
 
-        # Try to load a font
-        try:
-            font_title = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 16)
-            font_label = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 12)
-        except (OSError, IOError):
-            font_title = ImageFont.load_default()
-            font_label = ImageFont.load_default()
+        font_title = _get_font(FONT_BOLD, 16)
+        font_label = _get_font(FONT_REGULAR, 12)
 
         # Layout
         margin = 20
@@ -298,7 +382,7 @@ class ChartGenerator:
             return None
 
         try:
-            from PIL import Image, ImageDraw, ImageFont
+            from PIL import Image, ImageDraw
         except ImportError:
             return None
 
@@ -309,15 +393,9 @@ class ChartGenerator:
         img = Image.new("RGB", (self.width, self.height), COLOR_BACKGROUND)
         draw = ImageDraw.Draw(img)
 
-        # Try to load a font
-        try:
-            font_title = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 16)
-            font_label = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 12)
-            font_small = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 10)
-        except (OSError, IOError):
-            font_title = ImageFont.load_default()
-            font_label = ImageFont.load_default()
-            font_small = ImageFont.load_default()
+        font_title = _get_font(FONT_BOLD, 16)
+        font_label = _get_font(FONT_REGULAR, 12)
+        font_small = _get_font(FONT_REGULAR, 10)
 
         # Layout
         margin = 20
@@ -395,70 +473,112 @@ class ChartGenerator:
         return buffer.getvalue()
 
 
-async def save_chart_to_www(
-    hass: HomeAssistant,
-    chart_bytes: bytes,
-    filename: str,
-) -> str | None:
-    """Save chart image to www directory.
+def _get_www_dir(hass: HomeAssistant) -> Path:
+    """Return the directory charts are served from."""
+    return Path(hass.config.path("www")) / "adaptive_thermostat"
 
-    Args:
-        hass: Home Assistant instance
-        chart_bytes: PNG image bytes
-        filename: Filename (without path)
 
-    Returns:
-        URL path for the image (/local/adaptive_thermostat/filename), or None on error
+def _write_chart(www_dir: Path, chart_bytes: bytes, filename: str) -> Path:
+    """Atomically write chart bytes to the www directory (blocking).
+
+    The bytes go to a per-thread temp file that replaces the chart in one
+    step, so an interrupted write never leaves a truncated PNG that would
+    count as a cache hit.
     """
+    www_dir.mkdir(parents=True, exist_ok=True)
+    file_path = www_dir / filename
+    tmp_path = www_dir / f".{filename}.{threading.get_ident()}.tmp"
     try:
-        # Get www directory path
-        www_dir = Path(hass.config.path("www")) / "adaptive_thermostat"
-
-        # Create directory if needed
-        www_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(chart_bytes)
+        os.replace(tmp_path, file_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return file_path
 
-        # Write file
-        file_path = www_dir / filename
-        file_path.write_bytes(chart_bytes)
 
-        _LOGGER.debug("Chart saved to %s", file_path)
+def _load_or_render_chart(www_dir: Path, request: ChartRequest) -> bool:
+    """Reuse the cached chart file or render and write it (blocking).
 
-        # Return URL path
-        return f"/local/adaptive_thermostat/{filename}"
+    Returns:
+        True if the chart file exists afterwards
+    """
+    file_path = www_dir / request.filename
+    if file_path.exists():
+        # Mark as recently used for LRU eviction
+        os.utime(file_path)
+        _LOGGER.debug("Chart cache hit: %s", file_path)
+        return True
+
+    chart_bytes = request.render()
+    if not chart_bytes:
+        return False
+    _write_chart(www_dir, chart_bytes, request.filename)
+    _LOGGER.debug("Chart rendered to %s", file_path)
+    return True
+
+
+def _evict_charts(www_dir: Path, max_files: int) -> None:
+    """Remove least recently used chart files beyond max_files (blocking)."""
+    if not www_dir.exists():
+        return
+
+    entries = []
+    # weekly_*.png are charts written before the cache was content-addressed
+    for pattern in ("chart_*.png", "weekly_*.png"):
+        for file_path in www_dir.glob(pattern):
+            try:
+                entries.append((file_path.stat().st_mtime, file_path))
+            except (OSError, IOError):
+                continue
 
-    except (OSError, IOError) as e:
-        _LOGGER.error("Failed to save chart: %s", e)
-        return None
+    entries.sort(key=lambda entry: entry[0], reverse=True)
+    for _, file_path in entries[max_files:]:
+        try:
+            file_path.unlink()
+            _LOGGER.debug("Evicted chart: %s", file_path)
+        except (OSError, IOError) as e:
+            _LOGGER.warning("Failed to remove chart %s: %s", file_path, e)
 
 
-async def cleanup_old_charts(
+async def async_get_charts(
     hass: HomeAssistant,
-    keep_weeks: int = 4,
-) -> None:
-    """Remove chart images older than keep_weeks.
+    requests: dict[str, ChartRequest],
+    max_files: int = CHART_CACHE_MAX_FILES,
+) -> dict[str, str | None]:
+    """Get chart URLs, rendering only charts that are not cached.
+
+    Charts are looked up and rendered concurrently in the executor, then the
+    chart directory is trimmed to max_files.
 
     Args:
         hass: Home Assistant instance
-        keep_weeks: Number of weeks of charts to keep
-    """
-    try:
-        from datetime import datetime, timedelta
+        requests: Mapping of chart name to ChartRequest
+        max_files: Number of chart files to keep
 
-        www_dir = Path(hass.config.path("www")) / "adaptive_thermostat"
-        if not www_dir.exists():
-            return
-
-        cutoff = dt_util.utcnow() - timedelta(weeks=keep_weeks)
-
-        for file_path in www_dir.glob("weekly_*.png"):
-            try:
-                # Get file modification time
-                mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                if mtime < cutoff:
-                    file_path.unlink()
-                    _LOGGER.debug("Removed old chart: %s", file_path)
-            except (OSError, IOError) as e:
-                _LOGGER.warning("Failed to remove old chart %s: %s", file_path, e)
+    Returns:
+        Mapping of chart name to URL path, or None if the chart failed
+    """
+    www_dir = _get_www_dir(hass)
+    names = list(requests)
+    outcomes = await asyncio.gather(
+        *(
+            hass.async_add_executor_job(_load_or_render_chart, www_dir, requests[name])
+            for name in names
+        ),
+        return_exceptions=True,
+    )
+
+    urls: dict[str, str | None] = {}
+    for name, outcome in zip(names, outcomes):
+        if isinstance(outcome, Exception):
+            _LOGGER.error("Failed to create chart %s: %s", name, outcome)
+            outcome = False
+        urls[name] = f"{CHART_URL_PREFIX}/{requests[name].filename}" if outcome else None
 
+    try:
+        await hass.async_add_executor_job(_evict_charts, www_dir, max_files)
     except Exception as e:
-        _LOGGER.error("Failed to cleanup old charts: %s", e)
+        _LOGGER.error("Failed to evict old charts: %s", e)
+
+    return urls
@@ -0,0 +1,226 @@
+"""Per-zone ring of temperature samples for comfort metrics.
+
+The thermostat appends a sample on every temperature sensor update and on
+every setpoint change. Home Assistant fires nothing while a value holds, so
+each sample stands for the time until the next one, and the newest sample is
+held open until the moment of the query. Time at target and mean deviation
+are time-weighted over the measurement window: a room held on setpoint for an
+hour reads 100% from a single update, and a burst of updates while the
+temperature moves does not outweigh the quiet period before it.
+
+Samples are kept in fixed-size array.array buffers (timestamp and absolute
+deviation from the setpoint). Running sums over the closed intervals inside
+the window track covered, in-band and deviation-weighted seconds; the oldest
+interval is clipped to the window start and the open interval added at query
+time, so reads are O(1) and intervals leaving the window are subtracted as
+they expire.
+"""
+from __future__ import annotations
+
+from array import array
+
+# Temperature tolerance band for "at target" (± this value)
+DEFAULT_TARGET_TOLERANCE = 0.5  # °C
+
+# Measurement window for time-at-target and deviation
+DEFAULT_COMFORT_WINDOW_SECONDS = 3600
+
+# Samples kept per zone (2 hours at one sensor update every 10 seconds)
+COMFORT_SAMPLES_CAPACITY = 720
+
+
+class ComfortSamples:
+    """Ring buffer of (timestamp, deviation) samples with time-weighted sums."""
+
+    def __init__(
+        self,
+        capacity: int = COMFORT_SAMPLES_CAPACITY,
+        window_seconds: float = DEFAULT_COMFORT_WINDOW_SECONDS,
+        tolerance: float = DEFAULT_TARGET_TOLERANCE,
+    ) -> None:
+        """Initialize an empty ring.
+
+        Args:
+            capacity: Maximum number of samples kept (oldest are overwritten)
+            window_seconds: Measurement window for the running sums
+            tolerance: Temperature tolerance band (±°C)
+        """
+        self._capacity = capacity
+        self._window_seconds = window_seconds
+        self._tolerance = tolerance
+        self._times = array("d", bytes(8 * capacity))
+        self._deviations = array("d", bytes(8 * capacity))
+        # Stored samples and the next slot to write
+        self._count = 0
+        self._end = 0
+        # Newest samples whose intervals reach into the window, and running
+        # sums over the closed intervals among them (all but the newest)
+        self._window_count = 0
+        self._covered_seconds = 0.0
+        self._in_band_seconds = 0.0
+        self._deviation_seconds = 0.0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def tolerance(self) -> float:
+        """Temperature tolerance band (±°C)."""
+        return self._tolerance
+
+    @property
+    def window_seconds(self) -> float:
+        """Measurement window in seconds."""
+        return self._window_seconds
+
+    @property
+    def last_timestamp(self) -> float | None:
+        """Timestamp of the newest sample, or None when empty."""
+        if not self._count:
+            return None
+        return self._times[(self._end - 1) % self._capacity]
+
+    def configure(self, window_seconds: float, tolerance: float) -> None:
+        """Change the window or tolerance, recounting the stored samples."""
+        if window_seconds == self._window_seconds and tolerance == self._tolerance:
+            return
+        self._window_seconds = window_seconds
+        self._tolerance = tolerance
+        # Count every stored interval; the next query expires the old ones
+        self._window_count = self._count
+        self._covered_seconds = 0.0
+        self._in_band_seconds = 0.0
+        self._deviation_seconds = 0.0
+        start = (self._end - self._count) % self._capacity
+        for offset in range(self._count - 1):
+            self._add_interval((start + offset) % self._capacity)
+
+    def append(self, timestamp: float, temperature: float, setpoint: float) -> None:
+        """Record a temperature sample.
+
+        Args:
+            timestamp: Sample time in seconds since the epoch
+            temperature: Current temperature
+            setpoint: Current setpoint
+        """
+        last = self.last_timestamp
+        if last is not None and timestamp < last:
+            return
+
+        if self._count == self._capacity:
+            # Overwriting the oldest sample; drop its interval from the sums
+            # if it is still inside the window
+            if self._window_count == self._count:
+                self._remove_oldest()
+        else:
+            self._count += 1
+
+        self._times[self._end] = timestamp
+        self._deviations[self._end] = abs(temperature - setpoint)
+        self._end = (self._end + 1) % self._capacity
+        self._window_count += 1
+        if self._window_count > 1:
+            # The previous newest sample now holds until this one
+            self._add_interval((self._end - 2) % self._capacity)
+
+    def time_at_target(self, now: float) -> float:
+        """Return the percentage (0-100) of window time within tolerance."""
+        covered, in_band, _ = self._window_totals(now)
+        if covered is None:
+            return 0.0
+        return (in_band / covered) * 100.0
+
+    def mean_deviation(self, now: float) -> float | None:
+        """Return the time-weighted mean absolute deviation in the window."""
+        covered, _, deviation = self._window_totals(now)
+        if covered is None:
+            return None
+        return deviation / covered
+
+    def window_count(self, now: float) -> int:
+        """Return the number of samples holding at some point of the window."""
+        self._expire(now)
+        return self._window_count
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        self._count = 0
+        self._end = 0
+        self._window_count = 0
+        self._covered_seconds = 0.0
+        self._in_band_seconds = 0.0
+        self._deviation_seconds = 0.0
+
+    def _window_totals(self, now: float) -> tuple[float | None, float, float]:
+        """Return (covered, in-band, deviation-weighted) seconds in the window.
+
+        Covered is None when no sample holds in the window. A sample recorded
+        at ``now`` with nothing before it counts as an instant reading.
+        """
+        self._expire(now)
+        if not self._window_count:
+            return None, 0.0, 0.0
+
+        capacity = self._capacity
+        cutoff = now - self._window_seconds
+        newest = (self._end - 1) % capacity
+        newest_deviation = self._deviations[newest]
+        newest_in_band = newest_deviation <= self._tolerance
+
+        # Newest sample holds until now
+        held = max(0.0, now - max(self._times[newest], cutoff))
+        covered = self._covered_seconds + held
+        in_band = self._in_band_seconds + (held if newest_in_band else 0.0)
+        deviation = self._deviation_seconds + held * newest_deviation
+
+        # Oldest closed interval may start before the window
+        if self._window_count > 1:
+            oldest = (self._end - self._window_count) % capacity
+            clipped = cutoff - self._times[oldest]
+            if clipped > 0:
+                oldest_deviation = self._deviations[oldest]
+                covered -= clipped
+                deviation -= clipped * oldest_deviation
+                if oldest_deviation <= self._tolerance:
+                    in_band -= clipped
+
+        if covered <= 0:
+            return 1.0, (1.0 if newest_in_band else 0.0), newest_deviation
+        return covered, in_band, deviation
+
+    def _add_interval(self, index: int) -> None:
+        """Add the interval from sample ``index`` to the next one to the sums."""
+        seconds = self._times[(index + 1) % self._capacity] - self._times[index]
+        deviation = self._deviations[index]
+        self._covered_seconds += seconds
+        self._deviation_seconds += seconds * deviation
+        if deviation <= self._tolerance:
+            self._in_band_seconds += seconds
+
+    def _remove_oldest(self) -> None:
+        """Drop the oldest counted sample and its interval from the sums."""
+        self._window_count -= 1
+        if self._window_count <= 1:
+            # No closed interval left; reset instead of subtracting so
+            # rounding errors do not build up
+            self._covered_seconds = 0.0
+            self._in_band_seconds = 0.0
+            self._deviation_seconds = 0.0
+            return
+        index = (self._end - self._window_count - 1) % self._capacity
+        seconds = self._times[(index + 1) % self._capacity] - self._times[index]
+        deviation = self._deviations[index]
+        self._covered_seconds -= seconds
+        self._deviation_seconds -= seconds * deviation
+        if deviation <= self._tolerance:
+            self._in_band_seconds -= seconds
+
+    def _expire(self, now: float) -> None:
+        """Drop intervals that ended before the window from the sums."""
+        cutoff = now - self._window_seconds
+        capacity = self._capacity
+        while self._window_count > 1:
+            second_oldest = (self._end - self._window_count + 1) % capacity
+            if self._times[second_oldest] > cutoff:
+                break
+            self._remove_oldest()
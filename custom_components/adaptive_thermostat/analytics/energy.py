@@ -1,6 +1,8 @@
 """Energy consumption and cost tracking for adaptive thermostat."""
 from __future__ import annotations
 
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -13,13 +15,156 @@ UNIT_CONVERSIONS = {
     "WH": 0.001,    # 1 Wh = 0.001 kWh
 }
 
+# Width of one meter aggregation bucket
+METER_BUCKET_SECONDS = 3600
+
+# Buckets retained per meter: 8 days covers a full week plus margin
+DEFAULT_METER_BUCKETS = 8 * 24
+
+
+@dataclass
+class _MeterBucket:
+    """Meter readings aggregated over one bucket."""
+
+    start: float        # Bucket start (epoch seconds, aligned to the width)
+    first: float        # First reading in the bucket
+    last: float         # Last reading in the bucket
+    count: int          # Number of readings in the bucket
+    consumed: float     # Consumption between readings inside the bucket
+    carried_in: float   # Consumption from the previous bucket's last reading
+
+
+class MeterBuckets:
+    """
+    Streaming aggregation of cumulative meter readings into time buckets.
+
+    Readings are folded into fixed-width buckets kept in a bounded ring, so
+    memory stays constant and consumption over any retained window is a sum
+    over buckets instead of a sort of every reading. A reading lower than the
+    previous one is treated as a meter reset or replacement: it becomes the
+    new baseline and contributes no consumption.
+    """
+
+    def __init__(
+        self,
+        max_buckets: int = DEFAULT_METER_BUCKETS,
+        bucket_seconds: int = METER_BUCKET_SECONDS,
+    ):
+        """
+        Initialize an empty ring.
+
+        Args:
+            max_buckets: Number of buckets retained (oldest dropped first)
+            bucket_seconds: Width of one bucket in seconds
+        """
+        self._bucket_seconds = bucket_seconds
+        self._buckets: deque[_MeterBucket] = deque(maxlen=max_buckets)
+        self._last_timestamp: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        """Return the number of retained buckets."""
+        return len(self._buckets)
+
+    @property
+    def last_value(self) -> Optional[float]:
+        """Most recent reading, or None when empty."""
+        return self._buckets[-1].last if self._buckets else None
+
+    @property
+    def last_timestamp(self) -> Optional[datetime]:
+        """Timestamp of the most recent reading, or None when empty."""
+        return self._last_timestamp
+
+    def add_reading(self, timestamp: datetime, value: float) -> float:
+        """
+        Fold a meter reading into its bucket.
+
+        Readings falling into a bucket older than the newest one are ignored.
+
+        Args:
+            timestamp: When the reading was taken
+            value: Cumulative meter value
+
+        Returns:
+            Consumption since the previous reading (0.0 for the first reading,
+            a reset, or an ignored reading)
+        """
+        t = timestamp.timestamp()
+        start = t - t % self._bucket_seconds
+
+        if not self._buckets:
+            self._buckets.append(_MeterBucket(start, value, value, 1, 0.0, 0.0))
+            self._last_timestamp = timestamp
+            return 0.0
+
+        bucket = self._buckets[-1]
+        if start < bucket.start:
+            return 0.0
+
+        delta = max(value - bucket.last, 0.0)
+        if start == bucket.start:
+            bucket.last = value
+            bucket.count += 1
+            bucket.consumed += delta
+        else:
+            self._buckets.append(_MeterBucket(start, value, value, 1, 0.0, delta))
+        self._last_timestamp = timestamp
+        return delta
+
+    def consumption(
+        self,
+        start: datetime,
+        end: Optional[datetime] = None,
+    ) -> Optional[float]:
+        """
+        Return consumption between the readings of buckets within a window.
+
+        Buckets are included when they start inside [start, end], with start
+        rounded down to a bucket boundary. Consumption carried into the first
+        included bucket belongs to the time before the window and is excluded.
+
+        Args:
+            start: Window start
+            end: Window end (default: no upper bound)
+
+        Returns:
+            Consumption in meter units, or None if the window holds fewer
+            than two readings
+        """
+        t_start = start.timestamp()
+        t_start -= t_start % self._bucket_seconds
+        t_end = end.timestamp() if end is not None else None
+
+        total = 0.0
+        readings = 0
+        for bucket in self._buckets:
+            if bucket.start < t_start:
+                continue
+            if t_end is not None and bucket.start > t_end:
+                break
+            if readings:
+                total += bucket.carried_in
+            total += bucket.consumed
+            readings += bucket.count
+
+        if readings < 2:
+            return None
+        return total
+
+    def clear(self) -> None:
+        """Drop all buckets."""
+        self._buckets.clear()
+        self._last_timestamp = None
+
 
 class EnergyTracker:
     """
     Track energy consumption from a meter entity supporting any unit.
 
     Converts all units to kWh for internal calculations and supports
-    cost tracking when a price entity is provided.
+    cost tracking when a price entity is provided. Readings are aggregated
+    into hourly MeterBuckets, so consumption over the last day, week or any
+    retained window is computed without keeping every reading.
     """
 
     def __init__(
@@ -46,8 +191,7 @@ class EnergyTracker:
                 f"Supported units: {', '.join(UNIT_CONVERSIONS.keys())}"
             )
 
-        self._daily_readings: list[tuple[datetime, float]] = []
-        self._weekly_readings: list[tuple[datetime, float]] = []
+        self._buckets = MeterBuckets()
 
     def to_kwh(self, value: float) -> float:
         """
@@ -81,68 +225,65 @@ class EnergyTracker:
 
         return energy_kwh * price_per_kwh
 
-    def add_reading(
-        self,
-        timestamp: datetime,
-        meter_value: float,
-        period: str = "daily",
-    ) -> None:
+    def add_reading(self, timestamp: datetime, meter_value: float) -> None:
         """
         Add a meter reading for aggregation.
 
         Args:
             timestamp: When the reading was taken
             meter_value: Raw meter value in native unit
-            period: 'daily' or 'weekly'
         """
-        if period == "daily":
-            self._daily_readings.append((timestamp, meter_value))
-        elif period == "weekly":
-            self._weekly_readings.append((timestamp, meter_value))
-        else:
-            raise ValueError(f"Invalid period: {period}")
+        self._buckets.add_reading(timestamp, meter_value)
 
-    def get_daily_consumption(self) -> Optional[float]:
+    def get_consumption(
+        self,
+        start: datetime,
+        end: Optional[datetime] = None,
+    ) -> Optional[float]:
         """
-        Calculate daily energy consumption in kWh.
+        Calculate energy consumption in kWh within a window.
+
+        The window is resolved to hourly buckets; meter resets do not count
+        as negative consumption.
+
+        Args:
+            start: Window start
+            end: Window end (default: latest reading)
 
         Returns:
-            Daily consumption in kWh, or None if insufficient data
+            Consumption in kWh, or None if insufficient data
         """
-        if len(self._daily_readings) < 2:
+        consumption_native = self._buckets.consumption(start, end)
+        if consumption_native is None:
             return None
 
-        # Sort by timestamp
-        readings = sorted(self._daily_readings, key=lambda x: x[0])
+        return self.to_kwh(consumption_native)
 
-        # Calculate difference between latest and earliest reading
-        latest_value = readings[-1][1]
-        earliest_value = readings[0][1]
+    def get_daily_consumption(self) -> Optional[float]:
+        """
+        Calculate energy consumption in kWh over the day up to the latest reading.
 
-        consumption_native = latest_value - earliest_value
+        Returns:
+            Daily consumption in kWh, or None if insufficient data
+        """
+        latest = self._buckets.last_timestamp
+        if latest is None:
+            return None
 
-        return self.to_kwh(consumption_native)
+        return self.get_consumption(latest - timedelta(days=1))
 
     def get_weekly_consumption(self) -> Optional[float]:
         """
-        Calculate weekly energy consumption in kWh.
+        Calculate energy consumption in kWh over the week up to the latest reading.
 
         Returns:
             Weekly consumption in kWh, or None if insufficient data
         """
-        if len(self._weekly_readings) < 2:
+        latest = self._buckets.last_timestamp
+        if latest is None:
             return None
 
-        # Sort by timestamp
-        readings = sorted(self._weekly_readings, key=lambda x: x[0])
-
-        # Calculate difference between latest and earliest reading
-        latest_value = readings[-1][1]
-        earliest_value = readings[0][1]
-
-        consumption_native = latest_value - earliest_value
-
-        return self.to_kwh(consumption_native)
+        return self.get_consumption(latest - timedelta(days=7))
 
     def get_daily_cost(self, price_per_kwh: Optional[float] = None) -> Optional[float]:
         """
@@ -176,17 +317,9 @@ class EnergyTracker:
 
         return self.calculate_cost(consumption, price_per_kwh)
 
-    def clear_readings(self, period: str = "all") -> None:
-        """
-        Clear stored readings.
-
-        Args:
-            period: 'daily', 'weekly', or 'all'
-        """
-        if period in ("daily", "all"):
-            self._daily_readings.clear()
-        if period in ("weekly", "all"):
-            self._weekly_readings.clear()
+    def clear_readings(self) -> None:
+        """Clear stored readings."""
+        self._buckets.clear()
 
 
 class EnergyEstimator:
@@ -0,0 +1,266 @@
+"""Streaming export of learning data and telemetry.
+
+Exports a zone's cycle history, PID history, Ke observations, preheat
+observations and telemetry to NDJSON or CSV files for offline analysis.
+Datasets are snapshotted on the event loop and written in fixed-size chunks
+through the executor, so large histories never block the event loop and are
+never serialized into one document.
+"""
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import partial
+import json
+import logging
+import math
+from pathlib import Path
+from typing import Any, Iterable, Sequence, TYPE_CHECKING
+
+from homeassistant.util import dt as dt_util
+
+from .telemetry_store import TELEMETRY_CHANNELS
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+# Export directory below the Home Assistant config directory
+EXPORT_DIR = "adaptive_thermostat_exports"
+
+# Rows written per executor job
+EXPORT_CHUNK_SIZE = 1000
+
+EXPORT_FORMAT_NDJSON = "ndjson"
+EXPORT_FORMAT_CSV = "csv"
+EXPORT_FORMATS = (EXPORT_FORMAT_NDJSON, EXPORT_FORMAT_CSV)
+
+DATASET_CYCLES = "cycles"
+DATASET_PID_HISTORY = "pid_history"
+DATASET_KE_OBSERVATIONS = "ke_observations"
+DATASET_PREHEAT_OBSERVATIONS = "preheat_observations"
+DATASET_TELEMETRY = "telemetry"
+EXPORT_DATASETS = (
+    DATASET_CYCLES,
+    DATASET_PID_HISTORY,
+    DATASET_KE_OBSERVATIONS,
+    DATASET_PREHEAT_OBSERVATIONS,
+    DATASET_TELEMETRY,
+)
+
+# CycleMetrics attributes exported per cycle (cycles carry no timestamp, so
+# time filters do not apply to them)
+CYCLE_FIELDS = (
+    "mode",
+    "overshoot",
+    "undershoot",
+    "settling_time",
+    "oscillations",
+    "rise_time",
+    "heater_cycles",
+    "outdoor_temp_avg",
+    "integral_at_tolerance_entry",
+    "integral_at_setpoint_cross",
+    "decay_contribution",
+    "was_clamped",
+    "end_temp",
+    "settling_mae",
+    "inter_cycle_drift",
+    "dead_time",
+    "disturbances",
+)
+PID_HISTORY_FIELDS = ("timestamp", "kp", "ki", "kd", "reason", "metrics")
+KE_OBSERVATION_FIELDS = ("timestamp", "outdoor_temp", "pid_output", "indoor_temp", "target_temp")
+PREHEAT_OBSERVATION_FIELDS = (
+    "timestamp",
+    "start_temp",
+    "end_temp",
+    "outdoor_temp",
+    "duration_minutes",
+    "rate",
+)
+TELEMETRY_FIELDS = ("timestamp",) + TELEMETRY_CHANNELS
+
+
+@dataclass(frozen=True)
+class ExportTable:
+    """Rows of one dataset, snapshotted for writing."""
+
+    name: str
+    fields: tuple[str, ...]
+    rows: Sequence[tuple[Any, ...]]
+
+
+class _TimeRange:
+    """Inclusive time filter on datetimes, ISO strings or epoch seconds."""
+
+    def __init__(self, start: datetime | None, end: datetime | None) -> None:
+        self.start = start.timestamp() if start is not None else -math.inf
+        self.end = end.timestamp() if end is not None else math.inf
+
+    def __contains__(self, value: Any) -> bool:
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if isinstance(value, datetime):
+            value = value.timestamp()
+        return self.start <= value <= self.end
+
+
+def build_zone_tables(
+    zone_data: dict[str, Any],
+    thermostat: Any = None,
+    datasets: Iterable[str] = EXPORT_DATASETS,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    telemetry_tier: str | None = None,
+) -> list[ExportTable]:
+    """Snapshot a zone's datasets as export tables (call on the event loop).
+
+    Datasets whose source is not available for the zone are skipped.
+
+    Args:
+        zone_data: Zone data dict as registered with the coordinator
+        thermostat: The zone's climate entity (source of Ke and preheat data)
+        datasets: Names of the datasets to export
+        start: Only include records at or after this time
+        end: Only include records at or before this time
+        telemetry_tier: Telemetry tier, or None for the finest covering start
+
+    Returns:
+        List of tables in the order of datasets
+    """
+    window = _TimeRange(start, end)
+    learner = zone_data.get("adaptive_learner")
+    ke_learner = getattr(thermostat, "_ke_learner", None)
+    preheat_learner = getattr(thermostat, "_preheat_learner", None)
+    telemetry = zone_data.get("telemetry")
+
+    tables = []
+    for name in datasets:
+        if name == DATASET_CYCLES and learner is not None:
+            rows = [
+                tuple(getattr(cycle, field, None) for field in CYCLE_FIELDS)
+                for cycle in learner.cycle_history
+            ]
+            tables.append(ExportTable(name, CYCLE_FIELDS, rows))
+        elif name == DATASET_PID_HISTORY and learner is not None:
+            rows = [
+                tuple(entry.get(field) for field in PID_HISTORY_FIELDS)
+                for entry in learner.get_pid_history()
+                if entry.get("timestamp") is None or entry["timestamp"] in window
+            ]
+            tables.append(ExportTable(name, PID_HISTORY_FIELDS, rows))
+        elif name == DATASET_KE_OBSERVATIONS and ke_learner is not None:
+            rows = [
+                tuple(getattr(obs, field) for field in KE_OBSERVATION_FIELDS)
+                for obs in ke_learner.get_observations()
+                if obs.timestamp in window
+            ]
+            tables.append(ExportTable(name, KE_OBSERVATION_FIELDS, rows))
+        elif name == DATASET_PREHEAT_OBSERVATIONS and preheat_learner is not None:
+            rows = [
+                tuple(getattr(obs, field) for field in PREHEAT_OBSERVATION_FIELDS)
+                for obs in preheat_learner.get_observations()
+                if obs.timestamp in window
+            ]
+            tables.append(ExportTable(name, PREHEAT_OBSERVATION_FIELDS, rows))
+        elif name == DATASET_TELEMETRY and telemetry is not None:
+            timestamps, values = telemetry.columns(window.start, window.end, telemetry_tier)
+            rows = list(zip(timestamps, *(values[channel] for channel in TELEMETRY_CHANNELS)))
+            tables.append(ExportTable(name, TELEMETRY_FIELDS, rows))
+
+    return tables
+
+
+def _json_value(value: Any) -> Any:
+    """Convert a value to something json.dumps accepts (NaN becomes null)."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, dict):
+        return {key: _json_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_value(item) for item in value]
+    return value
+
+
+def _csv_value(value: Any) -> Any:
+    """Convert a value to a CSV cell (nested values become JSON)."""
+    value = _json_value(value)
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+
+def _write_chunk(
+    path: Path,
+    table: ExportTable,
+    offset: int,
+    chunk_size: int,
+    export_format: str,
+) -> None:
+    """Write one chunk of rows (the first chunk creates the file)."""
+    rows = table.rows[offset:offset + chunk_size]
+    if table.name == DATASET_TELEMETRY:
+        # Telemetry timestamps are epoch seconds
+        rows = [(datetime.fromtimestamp(row[0], timezone.utc),) + row[1:] for row in rows]
+
+    with path.open("w" if offset == 0 else "a", newline="", encoding="utf-8") as file:
+        if export_format == EXPORT_FORMAT_CSV:
+            writer = csv.writer(file)
+            if offset == 0:
+                writer.writerow(table.fields)
+            writer.writerows([_csv_value(value) for value in row] for row in rows)
+        else:
+            file.writelines(
+                json.dumps(dict(zip(table.fields, _json_value(row)))) + "\n"
+                for row in rows
+            )
+
+
+async def async_export_tables(
+    hass: HomeAssistant,
+    zone_id: str,
+    tables: list[ExportTable],
+    export_format: str = EXPORT_FORMAT_NDJSON,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> dict[str, dict[str, Any]]:
+    """Write export tables to files in chunks through the executor.
+
+    Files are named {zone_id}_{dataset}_{UTC timestamp}.{format} in the
+    export directory below the config directory.
+
+    Args:
+        hass: Home Assistant instance
+        zone_id: Zone the tables belong to
+        tables: Tables from build_zone_tables()
+        export_format: "ndjson" or "csv"
+        chunk_size: Rows written per executor job
+
+    Returns:
+        Dict mapping dataset name to {"path", "rows"}
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {export_format}")
+
+    directory = Path(hass.config.path(EXPORT_DIR))
+    await hass.async_add_executor_job(partial(directory.mkdir, parents=True, exist_ok=True))
+    stamp = dt_util.utcnow().strftime("%Y%m%dT%H%M%SZ")
+
+    written = {}
+    for table in tables:
+        path = directory / f"{zone_id}_{table.name}_{stamp}.{export_format}"
+        # Always run the first chunk so empty datasets still produce a file
+        for offset in range(0, max(len(table.rows), 1), chunk_size):
+            await hass.async_add_executor_job(
+                _write_chunk, path, table, offset, chunk_size, export_format
+            )
+        written[table.name] = {"path": str(path), "rows": len(table.rows)}
+        _LOGGER.debug("Exported %d %s rows for zone %s to %s", len(table.rows), table.name, zone_id, path)
+
+    return written
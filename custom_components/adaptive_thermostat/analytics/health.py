@@ -1,6 +1,6 @@
 """Health monitoring with alerts for adaptive thermostat system."""
 from enum import Enum
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 
 
 class HealthStatus(Enum):
@@ -29,13 +29,23 @@ class HealthIssue:
 
 
 class HealthMonitor:
-    """Monitors health of individual zones."""
+    """Monitors health of individual zones.
+
+    The issues of the last evaluation are cached together with the inputs
+    they were computed from. Checks are only re-run when an input changes by
+    more than its tolerance or crosses a threshold, so repeated checks with
+    steady metrics reuse the cached verdict.
+    """
 
     # Thresholds
     CRITICAL_CYCLE_TIME_MIN = 10  # Minutes
     WARNING_CYCLE_TIME_MIN = 15   # Minutes
     HIGH_POWER_W_M2 = 20.0        # W/m²
 
+    # Input changes below these are ignored (messages show one decimal)
+    CYCLE_TIME_TOLERANCE_MIN = 0.05
+    POWER_TOLERANCE_W_M2 = 0.05
+
     def __init__(self, zone_name: str, exception_zones: Optional[List[str]] = None):
         """Initialize health monitor for a zone.
 
@@ -45,6 +55,67 @@ class HealthMonitor:
         """
         self.zone_name = zone_name
         self.exception_zones = exception_zones or []
+        # Inputs and result of the last evaluation (None until first update)
+        self._inputs: Optional[Tuple[Optional[float], Optional[float], bool]] = None
+        self._issues: List[HealthIssue] = []
+
+    @property
+    def issues(self) -> List[HealthIssue]:
+        """Issues found by the last evaluation."""
+        return self._issues
+
+    @staticmethod
+    def _value_changed(
+        previous: Optional[float],
+        current: Optional[float],
+        tolerance: float,
+        thresholds: Tuple[float, ...],
+    ) -> bool:
+        """Check whether a metric moved enough to affect the verdict."""
+        if previous is None or current is None:
+            return previous is not current
+        if abs(current - previous) > tolerance:
+            return True
+        # A small move across a threshold still changes the severity
+        return any(
+            (previous < t) != (current < t) or (previous > t) != (current > t)
+            for t in thresholds
+        )
+
+    def update(
+        self,
+        cycle_time_min: Optional[float],
+        power_w_m2: Optional[float],
+        sensor_available: bool
+    ) -> bool:
+        """Re-run the checks if the inputs changed significantly.
+
+        Args:
+            cycle_time_min: Average cycle time in minutes
+            power_w_m2: Power consumption in W/m²
+            sensor_available: Whether temperature sensor is available
+
+        Returns:
+            True if the checks were re-run, False if the cached issues still apply
+        """
+        if self._inputs is not None:
+            last_cycle_time, last_power, last_available = self._inputs
+            if (
+                sensor_available == last_available
+                and not self._value_changed(
+                    last_cycle_time, cycle_time_min, self.CYCLE_TIME_TOLERANCE_MIN,
+                    (self.CRITICAL_CYCLE_TIME_MIN, self.WARNING_CYCLE_TIME_MIN),
+                )
+                and not self._value_changed(
+                    last_power, power_w_m2, self.POWER_TOLERANCE_W_M2,
+                    (self.HIGH_POWER_W_M2,),
+                )
+            ):
+                return False
+
+        self._inputs = (cycle_time_min, power_w_m2, sensor_available)
+        self._issues = self._evaluate(cycle_time_min, power_w_m2, sensor_available)
+        return True
 
     def check_cycle_time(self, cycle_time_min: Optional[float]) -> Optional[HealthIssue]:
         """Check if cycle time is too short.
@@ -141,6 +212,16 @@ class HealthMonitor:
         Returns:
             List of health issues (empty if all healthy)
         """
+        self.update(cycle_time_min, power_w_m2, sensor_available)
+        return list(self._issues)
+
+    def _evaluate(
+        self,
+        cycle_time_min: Optional[float],
+        power_w_m2: Optional[float],
+        sensor_available: bool
+    ) -> List[HealthIssue]:
+        """Run all health checks unconditionally."""
         issues = []
 
         # Check sensor first (most critical)
@@ -162,7 +243,12 @@ class HealthMonitor:
 
 
 class SystemHealthMonitor:
-    """Monitors aggregate health across all zones."""
+    """Monitors aggregate health across all zones.
+
+    Keeps one HealthMonitor per zone between calls and maintains the
+    critical/warning counts from the per-zone results, so a check only
+    re-evaluates zones whose metrics changed.
+    """
 
     def __init__(self, exception_zones: Optional[List[str]] = None):
         """Initialize system health monitor.
@@ -171,6 +257,11 @@ class SystemHealthMonitor:
             exception_zones: List of zone names that are exceptions to high power rule
         """
         self.exception_zones = exception_zones or []
+        self._monitors: Dict[str, HealthMonitor] = {}
+        # (critical, warning) issue counts per zone and in total
+        self._zone_counts: Dict[str, Tuple[int, int]] = {}
+        self._critical_count = 0
+        self._warning_count = 0
 
     def aggregate_health(self, zone_issues: Dict[str, List[HealthIssue]]) -> HealthStatus:
         """Determine overall system health from zone issues.
@@ -191,6 +282,11 @@ class SystemHealthMonitor:
                 elif issue.severity == HealthStatus.WARNING:
                     has_warning = True
 
+        return self._status(has_critical, has_warning)
+
+    @staticmethod
+    def _status(has_critical: bool, has_warning: bool) -> HealthStatus:
+        """Map the presence of critical/warning issues to a status."""
         if has_critical:
             return HealthStatus.CRITICAL
         elif has_warning:
@@ -198,12 +294,41 @@ class SystemHealthMonitor:
         else:
             return HealthStatus.HEALTHY
 
+    def remove_zone(self, zone_name: str) -> None:
+        """Forget a zone's cached verdict."""
+        self._monitors.pop(zone_name, None)
+        critical, warning = self._zone_counts.pop(zone_name, (0, 0))
+        self._critical_count -= critical
+        self._warning_count -= warning
+
+    def _update_zone(self, zone_name: str, data: Dict[str, Any]) -> None:
+        """Re-evaluate one zone and adjust the totals if its issues changed."""
+        monitor = self._monitors.get(zone_name)
+        if monitor is None:
+            monitor = self._monitors[zone_name] = HealthMonitor(zone_name, self.exception_zones)
+
+        if not monitor.update(
+            cycle_time_min=data.get("cycle_time_min"),
+            power_w_m2=data.get("power_w_m2"),
+            sensor_available=data.get("sensor_available", True)
+        ):
+            return
+
+        critical = sum(1 for issue in monitor.issues if issue.severity == HealthStatus.CRITICAL)
+        warning = sum(1 for issue in monitor.issues if issue.severity == HealthStatus.WARNING)
+        old_critical, old_warning = self._zone_counts.get(zone_name, (0, 0))
+        self._zone_counts[zone_name] = (critical, warning)
+        self._critical_count += critical - old_critical
+        self._warning_count += warning - old_warning
+
     def check_all_zones(
         self,
         zones_data: Dict[str, Dict[str, Any]]
     ) -> Dict[str, Any]:
         """Check health of all zones.
 
+        Zones missing from zones_data are dropped from the cache.
+
         Args:
             zones_data: Dictionary mapping zone names to their data:
                 {
@@ -222,31 +347,21 @@ class SystemHealthMonitor:
                     "summary": str
                 }
         """
-        zone_issues = {}
+        for zone_name in self._monitors.keys() - zones_data.keys():
+            self.remove_zone(zone_name)
 
         for zone_name, data in zones_data.items():
-            monitor = HealthMonitor(zone_name, self.exception_zones)
-            issues = monitor.check_all(
-                cycle_time_min=data.get("cycle_time_min"),
-                power_w_m2=data.get("power_w_m2"),
-                sensor_available=data.get("sensor_available", True)
-            )
-            zone_issues[zone_name] = issues
+            self._update_zone(zone_name, data)
 
-        overall_status = self.aggregate_health(zone_issues)
+        zone_issues = {
+            zone_name: list(self._monitors[zone_name].issues) for zone_name in zones_data
+        }
+        critical_count = self._critical_count
+        warning_count = self._warning_count
+        overall_status = self._status(critical_count > 0, warning_count > 0)
 
         # Generate summary
         total_issues = sum(len(issues) for issues in zone_issues.values())
-        critical_count = sum(
-            1 for issues in zone_issues.values()
-            for issue in issues
-            if issue.severity == HealthStatus.CRITICAL
-        )
-        warning_count = sum(
-            1 for issues in zone_issues.values()
-            for issue in issues
-            if issue.severity == HealthStatus.WARNING
-        )
 
         if overall_status == HealthStatus.HEALTHY:
             summary = "All zones healthy"
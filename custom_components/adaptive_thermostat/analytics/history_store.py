@@ -1,10 +1,11 @@
 """Historical data storage for weekly reports.
 
-Stores weekly snapshots for week-over-week comparisons.
+Stores weekly snapshots for week-over-week and seasonal comparisons.
 Uses Home Assistant's storage helper for persistence.
 """
 from __future__ import annotations
 
+from bisect import insort
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from typing import Any, TYPE_CHECKING
@@ -19,7 +20,8 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "adaptive_thermostat_history"
 STORAGE_VERSION = 1
-MAX_WEEKS_TO_KEEP = 12
+# Default retention: three years of weekly snapshots
+MAX_WEEKS_TO_KEEP = 156
 
 
 @dataclass
@@ -90,18 +92,72 @@ class WeeklySnapshot:
 class HistoryStore:
     """Manages persistent storage of weekly report history.
 
-    Stores up to MAX_WEEKS_TO_KEEP weeks of data for comparisons.
+    Snapshots are indexed by (year, week_number), so lookups do not scan the
+    history. Retention is enforced when a snapshot is inserted, and each
+    snapshot is serialized once, so saving a new week only converts that
+    snapshot before handing the history to the storage helper.
     """
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    def __init__(self, hass: HomeAssistant, max_weeks: int = MAX_WEEKS_TO_KEEP) -> None:
         """Initialize the history store.
 
         Args:
             hass: Home Assistant instance
+            max_weeks: Number of most recent weeks to keep
         """
         self.hass = hass
         self._store = None
-        self._data: list[WeeklySnapshot] = []
+        self._max_weeks = max_weeks
+        self._loaded = False
+        # Snapshots and their stored form by (year, week_number)
+        self._index: dict[tuple[int, int], WeeklySnapshot] = {}
+        self._serialized: dict[tuple[int, int], dict[str, Any]] = {}
+        # Index keys in ascending order
+        self._keys: list[tuple[int, int]] = []
+
+    @property
+    def _data(self) -> list[WeeklySnapshot]:
+        """Stored snapshots, newest first."""
+        return [self._index[key] for key in reversed(self._keys)]
+
+    @_data.setter
+    def _data(self, snapshots: list[WeeklySnapshot]) -> None:
+        """Replace the stored snapshots."""
+        self._clear()
+        for snapshot in snapshots:
+            self._insert(snapshot)
+
+    def _get_store(self):
+        """Return the storage helper, creating it on first use."""
+        from homeassistant.helpers.storage import Store
+
+        if self._store is None:
+            self._store = Store(self.hass, STORAGE_VERSION, STORAGE_KEY)
+        return self._store
+
+    def _clear(self) -> None:
+        self._index.clear()
+        self._serialized.clear()
+        self._keys.clear()
+
+    def _insert(
+        self,
+        snapshot: WeeklySnapshot,
+        serialized: dict[str, Any] | None = None,
+    ) -> None:
+        """Add or replace a snapshot and drop weeks beyond the retention."""
+        key = (snapshot.year, snapshot.week_number)
+        if key not in self._index:
+            insort(self._keys, key)
+        self._index[key] = snapshot
+        self._serialized[key] = serialized if serialized is not None else snapshot.to_dict()
+
+        excess = len(self._keys) - self._max_weeks
+        if excess > 0:
+            for old_key in self._keys[:excess]:
+                del self._index[old_key]
+                del self._serialized[old_key]
+            del self._keys[:excess]
 
     async def async_load(self) -> list[WeeklySnapshot]:
         """Load history from storage.
@@ -109,69 +165,47 @@ class HistoryStore:
         Returns:
             List of weekly snapshots, newest first
         """
-        from homeassistant.helpers.storage import Store
-
-        if self._store is None:
-            self._store = Store(self.hass, STORAGE_VERSION, STORAGE_KEY)
-
-        data = await self._store.async_load()
+        data = await self._get_store().async_load()
+        self._clear()
+        self._loaded = True
         if data is None:
-            self._data = []
             return []
 
-        snapshots = []
         for item in data.get("snapshots", []):
             try:
-                snapshots.append(WeeklySnapshot.from_dict(item))
+                self._insert(WeeklySnapshot.from_dict(item), item)
             except (KeyError, TypeError) as e:
                 _LOGGER.warning("Failed to load snapshot: %s", e)
 
-        # Sort by year/week descending (newest first)
-        snapshots.sort(key=lambda s: (s.year, s.week_number), reverse=True)
-        self._data = snapshots
-        return snapshots
+        return self._data
 
     async def async_save_snapshot(self, snapshot: WeeklySnapshot) -> None:
         """Save a weekly snapshot.
 
-        Adds the snapshot and prunes old data beyond MAX_WEEKS_TO_KEEP.
+        Adds or replaces the snapshot for its week, prunes weeks beyond the
+        retention and writes the history.
 
         Args:
             snapshot: The weekly snapshot to save
         """
-        from homeassistant.helpers.storage import Store
-
-        if self._store is None:
-            self._store = Store(self.hass, STORAGE_VERSION, STORAGE_KEY)
+        store = self._get_store()
 
         # Load existing if not already loaded
-        if not self._data:
+        if not self._loaded:
             await self.async_load()
 
-        # Remove any existing snapshot for the same week
-        self._data = [
-            s
-            for s in self._data
-            if not (s.year == snapshot.year and s.week_number == snapshot.week_number)
-        ]
-
-        # Add new snapshot
-        self._data.append(snapshot)
+        self._insert(snapshot)
 
-        # Sort and prune
-        self._data.sort(key=lambda s: (s.year, s.week_number), reverse=True)
-        self._data = self._data[:MAX_WEEKS_TO_KEEP]
-
-        # Save to storage
-        await self._store.async_save(
-            {"snapshots": [s.to_dict() for s in self._data]}
+        # Save to storage, newest first
+        await store.async_save(
+            {"snapshots": [self._serialized[key] for key in reversed(self._keys)]}
         )
 
         _LOGGER.debug(
             "Saved weekly snapshot for %d-W%02d, total stored: %d",
             snapshot.year,
             snapshot.week_number,
-            len(self._data),
+            len(self._keys),
         )
 
     def get_previous_week(self) -> WeeklySnapshot | None:
@@ -183,12 +217,10 @@ class HistoryStore:
         now = dt_util.utcnow()
         current_year, current_week, _ = now.isocalendar()
 
-        # Find the snapshot that's not the current week
-        for snapshot in self._data:
-            if snapshot.year == current_year and snapshot.week_number == current_week:
-                continue
-            # Return the first one that's not current week (they're sorted newest first)
-            return snapshot
+        # Newest stored week that's not the current week
+        for key in reversed(self._keys):
+            if key != (current_year, current_week):
+                return self._index[key]
 
         return None
 
@@ -204,10 +236,7 @@ class HistoryStore:
         Returns:
             Snapshot for that week or None
         """
-        for snapshot in self._data:
-            if snapshot.year == year and snapshot.week_number == week_number:
-                return snapshot
-        return None
+        return self._index.get((year, week_number))
 
     def calculate_week_over_week(
         self, current: WeeklySnapshot
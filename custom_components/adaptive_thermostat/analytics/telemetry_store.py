@@ -0,0 +1,472 @@
+"""Tiered local time-series store for zone telemetry.
+
+Keeps per-zone samples of temperature, setpoint, control output, heater duty
+and outdoor temperature in three tiers:
+
+- raw: every recorded sample, kept for 2 days
+- 5min: 5-minute means, kept for 30 days
+- hourly: hourly means, kept for 400 days
+
+Samples are downsampled as they arrive: each raw sample is added to the open
+5-minute and hourly buckets, and a bucket's mean is appended to its tier when
+the first sample of the next bucket arrives. Retention is applied whenever a
+5-minute bucket closes.
+
+Each tier is stored columnar in array.array buffers (float64 timestamps,
+float32 values, NaN for missing values) and persisted as a compact
+little-endian binary file in .storage, so weekly reports, offline replay and
+system identification can read history without querying the recorder.
+"""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+import logging
+import math
+import os
+from pathlib import Path
+import struct
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+TELEMETRY_FILENAME = "adaptive_thermostat_telemetry.bin"
+TELEMETRY_MAGIC = b"ATTS"
+TELEMETRY_FORMAT_VERSION = 1
+
+# Values recorded per sample, in storage order
+TELEMETRY_CHANNELS = ("temperature", "setpoint", "control_output", "duty", "outdoor_temp")
+
+# File header: magic, format version, channel count, zone count
+_HEADER = struct.Struct("<4sHHI")
+_ZONE_NAME_LEN = struct.Struct("<H")
+_LENGTH = struct.Struct("<I")
+
+
+@dataclass(frozen=True)
+class TelemetryTier:
+    """Resolution and retention of one storage tier."""
+
+    name: str
+    step_seconds: int  # 0 for raw samples
+    retention_seconds: int
+
+
+# Ordered from finest to coarsest
+TELEMETRY_TIERS = (
+    TelemetryTier("raw", 0, 2 * 86400),
+    TelemetryTier("5min", 300, 30 * 86400),
+    TelemetryTier("hourly", 3600, 400 * 86400),
+)
+
+
+def _to_le_bytes(values: array) -> bytes:
+    """Serialize an array as little-endian bytes."""
+    if sys.byteorder == "little":
+        return values.tobytes()
+    swapped = array(values.typecode, values)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def _from_le_bytes(typecode: str, data: bytes) -> array:
+    """Deserialize little-endian bytes into an array."""
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+class _Series:
+    """Time-ordered rows of one tier (timestamps plus row-major values)."""
+
+    __slots__ = ("timestamps", "values", "width")
+
+    def __init__(self, width: int) -> None:
+        self.timestamps = array("d")
+        self.values = array("f")
+        self.width = width
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def append(self, timestamp: float, row: list[float]) -> None:
+        self.timestamps.append(timestamp)
+        self.values.extend(row)
+
+    def prune(self, cutoff: float) -> None:
+        """Drop rows older than cutoff."""
+        index = bisect_left(self.timestamps, cutoff)
+        if index:
+            del self.timestamps[:index]
+            del self.values[: index * self.width]
+
+    def columns(self, start: float, end: float) -> tuple[list[float], list[list[float]]]:
+        """Return timestamps and per-channel values within [start, end]."""
+        lo = bisect_left(self.timestamps, start)
+        hi = bisect_right(self.timestamps, end)
+        block = self.values[lo * self.width: hi * self.width]
+        return (
+            self.timestamps[lo:hi].tolist(),
+            [block[i:: self.width].tolist() for i in range(self.width)],
+        )
+
+
+class _Bucket:
+    """Running sums of the samples falling into one downsampling interval."""
+
+    __slots__ = ("start", "sums", "counts")
+
+    def __init__(self, start: float, width: int) -> None:
+        self.start = start
+        self.sums = [0.0] * width
+        self.counts = [0] * width
+
+    def add(self, row: list[float]) -> None:
+        for i, value in enumerate(row):
+            if not math.isnan(value):
+                self.sums[i] += value
+                self.counts[i] += 1
+
+    def mean(self) -> list[float]:
+        return [
+            total / count if count else math.nan
+            for total, count in zip(self.sums, self.counts)
+        ]
+
+
+class ZoneTelemetry:
+    """Tiered telemetry of one zone."""
+
+    def __init__(self) -> None:
+        """Initialize empty tiers."""
+        width = len(TELEMETRY_CHANNELS)
+        self._series = {tier.name: _Series(width) for tier in TELEMETRY_TIERS}
+        self._buckets: dict[str, _Bucket | None] = {
+            tier.name: None for tier in TELEMETRY_TIERS if tier.step_seconds
+        }
+
+    def __len__(self) -> int:
+        """Number of retained raw samples."""
+        return len(self._series["raw"])
+
+    @property
+    def last_timestamp(self) -> float | None:
+        """Time of the newest raw sample."""
+        raw = self._series["raw"]
+        return raw.timestamps[-1] if len(raw) else None
+
+    def sample_count(self, tier: str) -> int:
+        """Number of rows stored in a tier (open buckets not included)."""
+        return len(self._series[tier])
+
+    def append(
+        self,
+        timestamp: float,
+        *,
+        temperature: float | None = None,
+        setpoint: float | None = None,
+        control_output: float | None = None,
+        duty: float | None = None,
+        outdoor_temp: float | None = None,
+    ) -> None:
+        """Record one sample.
+
+        Samples not newer than the last recorded one are ignored.
+
+        Args:
+            timestamp: Wall-clock time in seconds
+            temperature: Zone temperature (°C)
+            setpoint: Effective target temperature (°C)
+            control_output: PID control output (%)
+            duty: Heater state as a percentage (100 on, 0 off)
+            outdoor_temp: Outdoor temperature (°C)
+        """
+        row = [
+            math.nan if value is None else float(value)
+            for value in (temperature, setpoint, control_output, duty, outdoor_temp)
+        ]
+        last = self.last_timestamp
+        if last is not None and timestamp <= last:
+            return
+        self._series["raw"].append(timestamp, row)
+        self._accumulate(timestamp, row, prune=True)
+
+    def _accumulate(self, timestamp: float, row: list[float], prune: bool) -> None:
+        """Add a raw sample to the open buckets, closing finished ones."""
+        width = len(row)
+        for tier in TELEMETRY_TIERS:
+            if not tier.step_seconds:
+                continue
+            series = self._series[tier.name]
+            if len(series) and timestamp < series.timestamps[-1] + tier.step_seconds:
+                # Already covered by a closed bucket (only when rebuilding)
+                continue
+            start = timestamp - timestamp % tier.step_seconds
+            bucket = self._buckets[tier.name]
+            if bucket is not None and bucket.start != start:
+                series.append(bucket.start, bucket.mean())
+                bucket = None
+                if prune and tier is TELEMETRY_TIERS[1]:
+                    self._prune(timestamp)
+            if bucket is None:
+                bucket = self._buckets[tier.name] = _Bucket(start, width)
+            bucket.add(row)
+
+    def _prune(self, now: float) -> None:
+        """Apply tier retention."""
+        for tier in TELEMETRY_TIERS:
+            self._series[tier.name].prune(now - tier.retention_seconds)
+
+    def select_tier(self, start: float) -> str:
+        """Return the finest tier whose retention reaches back to start."""
+        last = self.last_timestamp
+        age = 0.0 if last is None else last - start
+        for tier in TELEMETRY_TIERS:
+            if age <= tier.retention_seconds:
+                return tier.name
+        return TELEMETRY_TIERS[-1].name
+
+    def columns(
+        self,
+        start: float = -math.inf,
+        end: float = math.inf,
+        tier: str | None = None,
+    ) -> tuple[list[float], dict[str, list[float]]]:
+        """Return timestamps and per-channel values within [start, end].
+
+        Aggregated tiers include the still-open bucket with its running mean.
+        Values are NaN where a channel was not recorded.
+
+        Args:
+            start: Start time in seconds
+            end: End time in seconds
+            tier: Tier name, or None to pick the finest tier covering start
+
+        Returns:
+            (timestamps, {channel: values})
+        """
+        if tier is None:
+            tier = self.select_tier(start)
+        timestamps, values = self._series[tier].columns(start, end)
+
+        bucket = self._buckets.get(tier)
+        if bucket is not None and start <= bucket.start <= end:
+            timestamps.append(bucket.start)
+            for column, value in zip(values, bucket.mean()):
+                column.append(value)
+
+        return timestamps, dict(zip(TELEMETRY_CHANNELS, values))
+
+    def mean(
+        self,
+        channel: str,
+        start: float = -math.inf,
+        end: float = math.inf,
+        tier: str | None = None,
+    ) -> float | None:
+        """Return the time-weighted mean of a channel within [start, end].
+
+        Each recorded value holds until the channel's next sample; the last
+        one holds until end or the newest sample. Bursts of closely spaced
+        samples therefore do not outweigh long quiet intervals.
+
+        Returns:
+            The mean, or None without data
+        """
+        timestamps, values = self.columns(start, end, tier)
+        recorded = [
+            (timestamp, value)
+            for timestamp, value in zip(timestamps, values[channel])
+            if not math.isnan(value)
+        ]
+        if not recorded:
+            return None
+        until = min(end, max(self.last_timestamp or -math.inf, recorded[-1][0]))
+        bounds = [timestamp for timestamp, _ in recorded[1:]] + [until]
+        total = weight = 0.0
+        for (timestamp, value), bound in zip(recorded, bounds):
+            total += value * (bound - timestamp)
+            weight += bound - timestamp
+        if weight <= 0:
+            return sum(value for _, value in recorded) / len(recorded)
+        return total / weight
+
+    def to_bytes(self) -> bytes:
+        """Serialize all tiers (open buckets are rebuilt from raw on load)."""
+        parts = []
+        for tier in TELEMETRY_TIERS:
+            series = self._series[tier.name]
+            parts.append(_LENGTH.pack(len(series)))
+            parts.append(_to_le_bytes(series.timestamps))
+            parts.append(_to_le_bytes(series.values))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> ZoneTelemetry:
+        """Restore a zone serialized with to_bytes().
+
+        Raises:
+            ValueError: If the data is truncated or malformed
+        """
+        zone = cls()
+        width = len(TELEMETRY_CHANNELS)
+        offset = 0
+        for tier in TELEMETRY_TIERS:
+            if offset + _LENGTH.size > len(data):
+                raise ValueError("truncated telemetry data")
+            (rows,) = _LENGTH.unpack_from(data, offset)
+            offset += _LENGTH.size
+            ts_end = offset + rows * 8
+            values_end = ts_end + rows * width * 4
+            if values_end > len(data):
+                raise ValueError("truncated telemetry data")
+            series = zone._series[tier.name]
+            series.timestamps = _from_le_bytes("d", data[offset:ts_end])
+            series.values = _from_le_bytes("f", data[ts_end:values_end])
+            offset = values_end
+
+        zone._rebuild_buckets()
+        return zone
+
+    def _rebuild_buckets(self) -> None:
+        """Recreate open buckets from raw samples after the last closed bucket."""
+        raw = self._series["raw"]
+        if not len(raw):
+            return
+        # Raw samples newer than the oldest closed-bucket end of any tier
+        resume = math.inf
+        for tier in TELEMETRY_TIERS:
+            if not tier.step_seconds:
+                continue
+            series = self._series[tier.name]
+            end = series.timestamps[-1] + tier.step_seconds if len(series) else -math.inf
+            resume = min(resume, end)
+
+        width = raw.width
+        for index in range(bisect_left(raw.timestamps, resume), len(raw)):
+            row = raw.values[index * width: (index + 1) * width].tolist()
+            self._accumulate(raw.timestamps[index], row, prune=False)
+
+
+def _read_file(path: Path) -> bytes | None:
+    """Read the telemetry file (blocking)."""
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _write_file(path: Path, payload: bytes) -> None:
+    """Atomically replace the telemetry file (blocking)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
+
+
+class TelemetryStore:
+    """Per-zone tiered telemetry with binary persistence in .storage."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the telemetry store.
+
+        Args:
+            hass: Home Assistant instance
+        """
+        self.hass = hass
+        self._zones: dict[str, ZoneTelemetry] = {}
+
+    @property
+    def path(self) -> Path:
+        """Location of the telemetry file."""
+        return Path(self.hass.config.path(".storage", TELEMETRY_FILENAME))
+
+    def get_zone(self, zone_id: str) -> ZoneTelemetry:
+        """Return a zone's telemetry, creating it if needed."""
+        zone = self._zones.get(zone_id)
+        if zone is None:
+            zone = self._zones[zone_id] = ZoneTelemetry()
+        return zone
+
+    def get_zone_ids(self) -> list[str]:
+        """Return the IDs of all zones with telemetry."""
+        return list(self._zones)
+
+    def to_bytes(self) -> bytes:
+        """Serialize all zones."""
+        parts = [
+            _HEADER.pack(
+                TELEMETRY_MAGIC,
+                TELEMETRY_FORMAT_VERSION,
+                len(TELEMETRY_CHANNELS),
+                len(self._zones),
+            )
+        ]
+        for zone_id, zone in self._zones.items():
+            name = zone_id.encode("utf-8")
+            payload = zone.to_bytes()
+            parts.append(_ZONE_NAME_LEN.pack(len(name)))
+            parts.append(name)
+            parts.append(_LENGTH.pack(len(payload)))
+            parts.append(payload)
+        return b"".join(parts)
+
+    def load_bytes(self, data: bytes) -> None:
+        """Restore zones serialized with to_bytes().
+
+        Zones that already exist in the store are kept as they are.
+
+        Raises:
+            ValueError: If the data is malformed or from another format version
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("truncated telemetry header")
+        magic, version, channels, zone_count = _HEADER.unpack_from(data, 0)
+        if magic != TELEMETRY_MAGIC:
+            raise ValueError("not a telemetry file")
+        if version != TELEMETRY_FORMAT_VERSION or channels != len(TELEMETRY_CHANNELS):
+            raise ValueError(f"unsupported telemetry format {version}/{channels}")
+
+        offset = _HEADER.size
+        for _ in range(zone_count):
+            try:
+                (name_len,) = _ZONE_NAME_LEN.unpack_from(data, offset)
+                offset += _ZONE_NAME_LEN.size
+                zone_id = data[offset:offset + name_len].decode("utf-8")
+                offset += name_len
+                (payload_len,) = _LENGTH.unpack_from(data, offset)
+                offset += _LENGTH.size
+            except (struct.error, UnicodeDecodeError) as e:
+                raise ValueError(f"corrupt telemetry zone header: {e}") from e
+            zone = ZoneTelemetry.from_bytes(data[offset:offset + payload_len])
+            offset += payload_len
+            self._zones.setdefault(zone_id, zone)
+
+    async def async_load(self) -> None:
+        """Load telemetry from disk (file I/O runs in the executor)."""
+        data = await self.hass.async_add_executor_job(_read_file, self.path)
+        if not data:
+            return
+        try:
+            self.load_bytes(data)
+        except ValueError as e:
+            _LOGGER.warning("Discarding unreadable telemetry file: %s", e)
+            return
+        _LOGGER.debug("Loaded telemetry for %d zones", len(self._zones))
+
+    async def async_save(self) -> None:
+        """Save telemetry to disk (file I/O runs in the executor)."""
+        payload = self.to_bytes()
+        try:
+            await self.hass.async_add_executor_job(_write_file, self.path, payload)
+        except OSError as e:
+            _LOGGER.error("Failed to save telemetry: %s", e)
+            return
+        _LOGGER.debug("Saved telemetry: %d zones, %d bytes", len(self._zones), len(payload))
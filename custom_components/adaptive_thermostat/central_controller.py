@@ -24,6 +24,12 @@ CONSECUTIVE_FAILURE_WARNING_THRESHOLD = 3
 TURN_OFF_DEBOUNCE_SECONDS = 10
 
 
+def _get_service_domain(entity_id: str) -> str:
+    """Return the service domain for an entity ID (switch if it has none)."""
+    domain, sep, _ = entity_id.partition(".")
+    return domain if sep else "switch"
+
+
 class CentralController:
     """Central controller for managing main heater/cooler based on zone demand.
 
@@ -93,6 +99,35 @@ class CentralController:
             return set()
         return set(self.main_heater_switch) & set(self.main_cooler_switch)
 
+    def has_unmet_demand(self) -> bool:
+        """Check whether a mode has demand but not all its main switches are on.
+
+        This catches a switch that failed every retry or was turned off
+        externally while aggregate demand stayed the same. A pending startup
+        delay does not count as unmet.
+
+        Returns:
+            True if update() should run to turn the switches back on
+        """
+        demand = self.coordinator.get_aggregate_demand()
+        return self._is_demand_unmet(
+            demand["heating"], self.main_heater_switch, self._heater_waiting_for_startup
+        ) or self._is_demand_unmet(
+            demand["cooling"], self.main_cooler_switch, self._cooler_waiting_for_startup
+        )
+
+    def _is_demand_unmet(
+        self, has_demand: bool, entity_ids: list[str] | None, waiting_for_startup: bool
+    ) -> bool:
+        """Check one mode for demand with any of its main switches not on."""
+        if not has_demand or not entity_ids or waiting_for_startup:
+            return False
+        for entity_id in entity_ids:
+            state = self.hass.states.get(entity_id)
+            if state is None or state.state != "on":
+                return True
+        return False
+
     async def update(self) -> None:
         """Update central controller state based on zone demand.
 
@@ -402,31 +437,6 @@ class CentralController:
                 return False
         return True
 
-    async def _turn_on_switch(self, entity_id: str) -> bool:
-        """Turn on a switch with retry logic.
-
-        Args:
-            entity_id: Entity ID of the switch
-
-        Returns:
-            True if switch was turned on successfully, False otherwise
-        """
-        return await self._call_switch_service(entity_id, "turn_on")
-
-    async def _turn_off_switch(self, entity_id: str) -> bool:
-        """Turn off a switch with retry logic.
-
-        Args:
-            entity_id: Entity ID of the switch
-
-        Returns:
-            True if switch was turned off successfully, False otherwise
-        """
-        # Only turn off if currently on
-        if await self._is_switch_on(entity_id):
-            return await self._call_switch_service(entity_id, "turn_off")
-        return True
-
     async def _turn_on_switches(self, entity_ids: list[str]) -> bool:
         """Turn on all switches in the list.
 
@@ -436,11 +446,7 @@ class CentralController:
         Returns:
             True if all switches were turned on successfully, False if any failed
         """
-        success = True
-        for entity_id in entity_ids:
-            if not await self._turn_on_switch(entity_id):
-                success = False
-        return success
+        return await self._call_switch_services(entity_ids, "turn_on")
 
     async def _turn_off_switches(self, entity_ids: list[str]) -> bool:
         """Turn off all switches in the list.
@@ -451,11 +457,12 @@ class CentralController:
         Returns:
             True if all switches were turned off successfully, False if any failed
         """
-        success = True
-        for entity_id in entity_ids:
-            if not await self._turn_off_switch(entity_id):
-                success = False
-        return success
+        # Only turn off switches that are currently on
+        to_turn_off = [
+            entity_id for entity_id in entity_ids
+            if await self._is_switch_on(entity_id)
+        ]
+        return await self._call_switch_services(to_turn_off, "turn_off")
 
     async def _turn_off_switches_smart(
         self,
@@ -472,7 +479,7 @@ class CentralController:
             True if all operations succeeded
         """
         shared = self._get_shared_switches()
-        success = True
+        to_turn_off = []
 
         for entity_id in entity_ids:
             # Skip shared switches if other mode has demand
@@ -482,17 +489,102 @@ class CentralController:
                     entity_id,
                 )
                 continue
+            to_turn_off.append(entity_id)
+
+        # State check happens inside _turn_off_switches
+        return await self._turn_off_switches(to_turn_off)
+
+    async def _call_switch_services(
+        self,
+        entity_ids: list[str],
+        service: str,
+    ) -> bool:
+        """Call a service on several switches with one call per domain.
+
+        Domains are called concurrently. If a batched call fails, only its
+        entities are retried, individually and concurrently, so failure
+        accounting stays per entity.
+
+        Args:
+            entity_ids: Entity IDs of the switches
+            service: Service to call ("turn_on" or "turn_off")
 
-            # Turn off this switch (already has state check inside _turn_off_switch)
-            if not await self._turn_off_switch(entity_id):
-                success = False
+        Returns:
+            True if the service succeeded for every entity, False otherwise
+        """
+        by_domain: dict[str, list[str]] = {}
+        for entity_id in dict.fromkeys(entity_ids):
+            by_domain.setdefault(_get_service_domain(entity_id), []).append(entity_id)
+
+        results = await asyncio.gather(*(
+            self._call_domain_service(domain, domain_entity_ids, service)
+            for domain, domain_entity_ids in by_domain.items()
+        ))
+        return all(results)
+
+    async def _call_domain_service(
+        self,
+        domain: str,
+        entity_ids: list[str],
+        service: str,
+    ) -> bool:
+        """Call a service once for all entities of one domain.
+
+        Args:
+            domain: Service domain shared by the entities
+            entity_ids: Entity IDs in that domain
+            service: Service to call ("turn_on" or "turn_off")
+
+        Returns:
+            True if the service succeeded for every entity, False otherwise
+        """
+        if len(entity_ids) == 1:
+            return await self._call_switch_service(entity_ids[0], service)
+
+        try:
+            await self.hass.services.async_call(
+                domain,
+                service,
+                {"entity_id": entity_ids},
+                blocking=True,
+            )
+        except ServiceNotFound as e:
+            # Service doesn't exist - no point retrying
+            _LOGGER.error(
+                "Service '%s.%s' not found for %s: %s",
+                domain,
+                service,
+                ", ".join(entity_ids),
+                e,
+            )
+            for entity_id in entity_ids:
+                self._record_failure(entity_id)
+            return False
+        except Exception as e:
+            # Batched call failed - retry each entity on its own
+            _LOGGER.warning(
+                "Error calling %s on %s (attempt 1/%d), retrying individually: %s",
+                service,
+                ", ".join(entity_ids),
+                MAX_SERVICE_CALL_RETRIES,
+                e,
+            )
+            results = await asyncio.gather(*(
+                self._call_switch_service(entity_id, service, first_attempt=1)
+                for entity_id in entity_ids
+            ))
+            return all(results)
 
-        return success
+        _LOGGER.debug("Successfully called %s on switches: %s", service, ", ".join(entity_ids))
+        for entity_id in entity_ids:
+            self._consecutive_failures[entity_id] = 0
+        return True
 
     async def _call_switch_service(
         self,
         entity_id: str,
         service: str,
+        first_attempt: int = 0,
     ) -> bool:
         """Call a switch service with retry logic and error handling.
 
@@ -502,16 +594,30 @@ class CentralController:
         Args:
             entity_id: Entity ID of the switch
             service: Service to call ("turn_on" or "turn_off")
+            first_attempt: Attempts already made elsewhere (e.g. a failed batched
+                call); retrying starts with the matching backoff delay
 
         Returns:
             True if service call succeeded, False otherwise
         """
+        domain = _get_service_domain(entity_id)
         last_exception: Exception | None = None
 
-        for attempt in range(MAX_SERVICE_CALL_RETRIES):
+        for attempt in range(first_attempt, MAX_SERVICE_CALL_RETRIES):
+            # Wait before retrying with exponential backoff
+            if attempt > 0:
+                delay = BASE_RETRY_DELAY_SECONDS * (2 ** (attempt - 1))
+                _LOGGER.debug(
+                    "Retrying %s on %s in %.1f seconds",
+                    service,
+                    entity_id,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+
             try:
                 await self.hass.services.async_call(
-                    "switch",
+                    domain,
                     service,
                     {"entity_id": entity_id},
                     blocking=True,
@@ -525,7 +631,8 @@ class CentralController:
             except ServiceNotFound as e:
                 # Service doesn't exist - no point retrying
                 _LOGGER.error(
-                    "Service 'switch.%s' not found for %s: %s",
+                    "Service '%s.%s' not found for %s: %s",
+                    domain,
                     service,
                     entity_id,
                     e,
@@ -557,17 +664,6 @@ class CentralController:
                     e,
                 )
 
-            # Wait before retrying with exponential backoff
-            if attempt < MAX_SERVICE_CALL_RETRIES - 1:
-                delay = BASE_RETRY_DELAY_SECONDS * (2 ** attempt)
-                _LOGGER.debug(
-                    "Retrying %s on %s in %.1f seconds",
-                    service,
-                    entity_id,
-                    delay,
-                )
-                await asyncio.sleep(delay)
-
         # All retries exhausted
         _LOGGER.error(
             "Failed to call %s on %s after %d attempts: %s",
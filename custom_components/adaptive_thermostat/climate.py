@@ -35,6 +35,8 @@ from .adaptive.contact_sensors import ContactSensorHandler, ContactAction
 from .adaptive.humidity_detector import HumidityDetector
 from .adaptive.ke_learning import KeLearner
 from .adaptive.preheat import PreheatLearner
+from .adaptive.sysid import SystemIdResult
+from .analytics.comfort_samples import ComfortSamples
 
 from homeassistant.components.climate import ClimateEntity, ClimateEntityFeature
 from homeassistant.components.climate import (
@@ -170,6 +172,7 @@ class AdaptiveThermostat(ClimateControlMixin, ClimateHandlersMixin, ClimateEntit
         self._area_m2 = kwargs.get('area_m2')
         self._max_power_w = kwargs.get('max_power_w')
         self._supply_temperature = kwargs.get('supply_temperature')
+        self._measured_time_constant = kwargs.get('measured_time_constant')
         self._ceiling_height = kwargs.get('ceiling_height', 2.5)
         self._window_area_m2 = kwargs.get('window_area_m2')
         self._window_rating = kwargs.get('window_rating', 'hr++')
@@ -312,6 +315,9 @@ class AdaptiveThermostat(ClimateControlMixin, ClimateHandlersMixin, ClimateEntit
         # Control output manager (initialized in async_added_to_hass when hass is available)
         self._control_output_manager: ControlOutputManager | None = None
 
+        # Zone comfort sample ring shared with the comfort sensors (set in async_added_to_hass)
+        self._comfort_samples: ComfortSamples | None = None
+
         # Setpoint boost manager (initialized in async_added_to_hass when hass is available)
         self._setpoint_boost_manager: SetpointBoostManager | None = None
 
@@ -337,6 +343,7 @@ class AdaptiveThermostat(ClimateControlMixin, ClimateHandlersMixin, ClimateEntit
                 floor_construction=self._floor_construction,
                 area_m2=self._area_m2,
                 heating_type=self._heating_type,
+                measured_tau=self._measured_time_constant,
             )
             self._kp, self._ki, self._kd = calculate_initial_pid(
                 self._thermal_time_constant, self._heating_type, self._area_m2, self._max_power_w, self._supply_temperature
@@ -378,6 +385,10 @@ class AdaptiveThermostat(ClimateControlMixin, ClimateHandlersMixin, ClimateEntit
         # Initialize PreheatLearner (will be configured properly in async_added_to_hass)
         self._preheat_learner: Optional[PreheatLearner] = None
         self._preheat_cycle_unsub = None  # H7 fix - store unsub handle
+        self._coordinator_cycle_unsub = None
+
+        # Zone model identified from recorded history (restored or fitted nightly)
+        self._system_identification: Optional[SystemIdResult] = None
 
         self._pwm = kwargs.get('pwm').seconds
         self._p = self._i = self._d = self._e = self._dt = 0
@@ -556,6 +567,9 @@ class AdaptiveThermostat(ClimateControlMixin, ClimateHandlersMixin, ClimateEntit
         if self._preheat_cycle_unsub:
             self._preheat_cycle_unsub()
             self._preheat_cycle_unsub = None
+        if self._coordinator_cycle_unsub:
+            self._coordinator_cycle_unsub()
+            self._coordinator_cycle_unsub = None
 
         # Clean up cycle tracker subscriptions and timers
         if self._cycle_tracker:
@@ -565,6 +579,11 @@ class AdaptiveThermostat(ClimateControlMixin, ClimateHandlersMixin, ClimateEntit
         if hasattr(self, "_setpoint_boost_manager") and self._setpoint_boost_manager:
             self._setpoint_boost_manager.cancel()
 
+        # Release this zone's PWM phase slot
+        phase_scheduler = self.hass.data.get(DOMAIN, {}).get("pwm_phase_scheduler")
+        if phase_scheduler:
+            phase_scheduler.remove(self.entity_id)
+
         # Save learning data before removal
         if self._zone_id:
             learning_store = self.hass.data.get(DOMAIN, {}).get("learning_store")
@@ -1280,6 +1299,45 @@ class AdaptiveThermostat(ClimateControlMixin, ClimateHandlersMixin, ClimateEntit
                         )
                         learning_store.schedule_zone_save()
 
+    def apply_system_identification(self, result: SystemIdResult, persist: bool = True) -> None:
+        """Apply an identified zone model to the learners that use measured dynamics.
+
+        The time constant is persisted and replaces the physics estimate on the
+        next start; the dead time calibrates the manifold transport delay and
+        gain/tau give the preheat learner a measured fallback rate.
+
+        Args:
+            result: Fitted zone model
+            persist: Whether to store the result with the zone's learning data
+        """
+        self._system_identification = result
+
+        if self._preheat_learner:
+            self._preheat_learner.set_measured_model(
+                result.gain, result.time_constant_hours, result.offset
+            )
+
+        manifold_registry = self.hass.data.get(DOMAIN, {}).get("manifold_registry")
+        if manifold_registry:
+            manifold_registry.set_measured_transport_delay(
+                self.entity_id, result.dead_time_minutes, self._loops
+            )
+
+        _LOGGER.info(
+            "%s: Applied identified zone model (tau=%.2fh, gain=%.1f°C, dead_time=%.0fmin, r2=%.2f)",
+            self.entity_id,
+            result.time_constant_hours,
+            result.gain,
+            result.dead_time_minutes,
+            result.r_squared,
+        )
+
+        if persist and self._zone_id:
+            learning_store = self.hass.data.get(DOMAIN, {}).get("learning_store")
+            if learning_store:
+                learning_store.update_zone_data(self._zone_id, sysid_data=result.to_dict())
+                learning_store.schedule_zone_save()
+
     async def _handle_validation_failure(self) -> None:
         """Handle validation failure by rolling back PID values.
 
@@ -1462,6 +1520,10 @@ class AdaptiveThermostat(ClimateControlMixin, ClimateHandlersMixin, ClimateEntit
         # Update target temperature
         self._target_temp = value
 
+        # Close the comfort interval held at the old setpoint
+        if old_temp != value:
+            self._record_comfort_sample()
+
         # Emit setpoint changed event
         if old_temp is not None and old_temp != value:
             # Reset duty accumulator if setpoint changes by more than 0.5°C
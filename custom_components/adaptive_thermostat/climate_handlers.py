@@ -33,6 +33,7 @@ class ClimateHandlersMixin:
         self._previous_temp_time = self._cur_temp_time
         self._cur_temp_time = time.monotonic()
         self._async_update_temp(new_state)
+        self._record_comfort_sample()
         self._trigger_source = 'sensor'
         _LOGGER.debug("%s: Received new temperature: %s", self.entity_id, self._current_temp)
         await self._async_control_heating(calc_pid=True, is_temp_sensor_update=True)
@@ -225,6 +226,17 @@ class ClimateHandlersMixin:
         # Update target temperature
         await self._temperature_manager.async_set_temperature(leader_temp)
 
+    @callback
+    def _record_comfort_sample(self):
+        """Feed the current temperature and setpoint to the zone's comfort samples."""
+        if (
+            self._comfort_samples is None
+            or self._current_temp is None
+            or self._target_temp is None
+        ):
+            return
+        self._comfort_samples.append(time.time(), self._current_temp, self._target_temp)
+
     @callback
     def _async_update_temp(self, state):
         """Update thermostat with latest state from sensor."""
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING
 from .adaptive.physics import calculate_initial_ke
 from .adaptive.ke_learning import KeLearner
 from .adaptive.preheat import PreheatLearner
+from .adaptive.sysid import SystemIdResult
 from .managers import (
     ControlOutputManager,
     HeaterController,
@@ -30,10 +31,41 @@ from . import DOMAIN
 
 if TYPE_CHECKING:
     from .climate import AdaptiveThermostat
+    from .managers.pwm_scheduler import PWMPhaseScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _assign_pwm_phase_group(thermostat: AdaptiveThermostat) -> PWMPhaseScheduler | None:
+    """Register a PWM zone with the shared phase scheduler.
+
+    Zones are staggered against others on the same manifold, or otherwise
+    against all zones behind the main heater switch.
+
+    Returns:
+        The PWMPhaseScheduler, or None if the zone is not staggered
+    """
+    domain_data = thermostat.hass.data.get(DOMAIN, {})
+    phase_scheduler = domain_data.get("pwm_phase_scheduler")
+    if phase_scheduler is None or not thermostat._pwm:
+        return None
+
+    manifold_registry = domain_data.get("manifold_registry")
+    manifold = (
+        manifold_registry.get_manifold_for_zone(thermostat.entity_id)
+        if manifold_registry else None
+    )
+    if manifold is not None:
+        group = f"manifold:{manifold.name}"
+    elif domain_data.get("main_heater_switch"):
+        group = "main_heater"
+    else:
+        return None
+
+    phase_scheduler.assign(thermostat.entity_id, group)
+    return phase_scheduler
+
+
 def _has_recovery_deadline(night_setback_config: dict | None) -> bool:
     """Check if night setback config has a recovery_deadline set.
 
@@ -70,6 +102,12 @@ async def async_setup_managers(thermostat: "AdaptiveThermostat") -> None:
     """
     # Create cycle event dispatcher for decoupled event communication
     thermostat._cycle_dispatcher = CycleEventDispatcher()
+    if thermostat._coordinator:
+        # Republishes the snapshot for the zone sensors when a cycle ends
+        thermostat._coordinator_cycle_unsub = thermostat._cycle_dispatcher.subscribe(
+            CycleEventType.CYCLE_ENDED,
+            thermostat._coordinator.handle_cycle_ended,
+        )
 
     # Initialize heater controller now that hass is available
     thermostat._heater_controller = HeaterController(
@@ -84,6 +122,8 @@ async def async_setup_managers(thermostat: "AdaptiveThermostat") -> None:
         min_on_cycle_duration=thermostat._min_on_cycle_duration.seconds,
         min_off_cycle_duration=thermostat._min_off_cycle_duration.seconds,
         dispatcher=thermostat._cycle_dispatcher,
+        command_queue=thermostat.hass.data.get(DOMAIN, {}).get("heater_command_queue"),
+        phase_scheduler=_assign_pwm_phase_group(thermostat),
     )
 
     # Initialize PreheatLearner if preheat is enabled
@@ -295,6 +335,17 @@ async def async_setup_managers(thermostat: "AdaptiveThermostat") -> None:
     )
 
     # Initialize control output manager
+    thermal_history = None
+    telemetry = None
+    if coordinator and thermostat._zone_id:
+        zone_data = coordinator.get_zone_data(thermostat._zone_id)
+        if zone_data:
+            thermal_history = zone_data.get("thermal_history")
+            telemetry = zone_data.get("telemetry")
+            thermostat._comfort_samples = zone_data.get("comfort_samples")
+            # Weekly report reads valve zones' duty from the duty cycle sensor
+            zone_data["valve_mode"] = not thermostat._pwm
+
     thermostat._control_output_manager = ControlOutputManager(
         thermostat_state=thermostat,
         pid_controller=thermostat._pid_controller,
@@ -307,6 +358,8 @@ async def async_setup_managers(thermostat: "AdaptiveThermostat") -> None:
         set_d=thermostat._set_d,
         set_e=thermostat._set_e,
         set_dt=thermostat._set_dt,
+        thermal_history=thermal_history,
+        telemetry=telemetry,
     )
     _LOGGER.info(
         "%s: Control output manager initialized",
@@ -366,6 +419,21 @@ async def async_setup_managers(thermostat: "AdaptiveThermostat") -> None:
                     thermostat.entity_id
                 )
 
+    # Restore identified zone model (feeds preheat fallback rate and manifold delay)
+    if coordinator and thermostat._zone_id:
+        zone_data = coordinator.get_zone_data(thermostat._zone_id)
+        stored_sysid_data = zone_data.get("stored_sysid_data") if zone_data else None
+        if stored_sysid_data:
+            try:
+                thermostat.apply_system_identification(
+                    SystemIdResult.from_dict(stored_sysid_data), persist=False
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                _LOGGER.warning(
+                    "%s: Failed to restore identified zone model: %s",
+                    thermostat.entity_id, e
+                )
+
     # Subscribe to CYCLE_ENDED events for preheat learning (H7 fix - store unsub handle)
     if thermostat._preheat_learner and thermostat._cycle_dispatcher:
         thermostat._preheat_cycle_unsub = thermostat._cycle_dispatcher.subscribe(
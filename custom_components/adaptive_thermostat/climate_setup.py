@@ -23,6 +23,9 @@ from . import DOMAIN
 from . import const
 from .adaptive.learning import AdaptiveLearner
 from .adaptive.persistence import LearningDataStore
+from .adaptive.sysid import ThermalHistory
+from .analytics.comfort_samples import ComfortSamples
+from .analytics.telemetry_store import TelemetryStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -205,6 +208,15 @@ async def async_setup_platform(hass: HomeAssistant, config: ConfigType, async_ad
     else:
         learning_store = hass.data[DOMAIN]["learning_store"]
 
+    # Create TelemetryStore singleton (zone time series, saved periodically)
+    if "telemetry_store" not in hass.data[DOMAIN]:
+        telemetry_store = TelemetryStore(hass)
+        await telemetry_store.async_load()
+        hass.data[DOMAIN]["telemetry_store"] = telemetry_store
+        _LOGGER.info("Created TelemetryStore singleton")
+    else:
+        telemetry_store = hass.data[DOMAIN]["telemetry_store"]
+
     # Validate that at least one output entity is configured
     heater = config.get(const.CONF_HEATER)
     cooler = config.get(const.CONF_COOLER)
@@ -301,6 +313,12 @@ async def async_setup_platform(hass: HomeAssistant, config: ConfigType, async_ad
         'setpoint_boost': config.get(const.CONF_SETPOINT_BOOST),
         'setpoint_boost_factor': config.get(const.CONF_SETPOINT_BOOST_FACTOR),
         'setpoint_debounce': config.get(const.CONF_SETPOINT_DEBOUNCE),
+        # Time constant identified from recorded history replaces the physics estimate
+        'measured_time_constant': (
+            (learning_store.get_zone_data(zone_id) or {})
+            .get("system_identification", {})
+            .get("time_constant_hours")
+        ),
     }
 
     thermostat = AdaptiveThermostat(**parameters)
@@ -329,6 +347,9 @@ async def async_setup_platform(hass: HomeAssistant, config: ConfigType, async_ad
             "adaptive_learner": adaptive_learner,
             "pwm_seconds": config.get(const.CONF_PWM).seconds if config.get(const.CONF_PWM) else 0,
             "window_orientation": config.get(const.CONF_WINDOW_ORIENTATION),
+            "thermal_history": ThermalHistory(),
+            "telemetry": telemetry_store.get_zone(zone_id),
+            "comfort_samples": ComfortSamples(),
         }
 
         # Store ke_learner data for async_added_to_hass to use
@@ -341,6 +362,10 @@ async def async_setup_platform(hass: HomeAssistant, config: ConfigType, async_ad
             zone_data["stored_preheat_data"] = stored_zone_data["preheat_learner"]
             _LOGGER.info("Stored preheat_learner data for zone %s for later restoration", zone_id)
 
+        # Store identified zone model for async_added_to_hass to apply
+        if stored_zone_data and "system_identification" in stored_zone_data:
+            zone_data["stored_sysid_data"] = stored_zone_data["system_identification"]
+
         coordinator.register_zone(zone_id, zone_data)
         _LOGGER.info("Registered zone %s with coordinator", zone_id)
 
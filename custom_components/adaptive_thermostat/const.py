@@ -438,6 +438,9 @@ MIN_CYCLES_FOR_LEARNING = 6
 # Maximum number of cycles to retain in history (FIFO eviction when exceeded)
 MAX_CYCLE_HISTORY = 100
 
+# Number of most recent cycles covered by windowed cycle statistics
+CYCLE_STATS_WINDOW = 10
+
 # Slow response rule diagnostic thresholds
 MIN_OUTDOOR_TEMP_RANGE = 3.0  # Minimum outdoor temp variation needed for correlation analysis (°C)
 SLOW_RESPONSE_CORRELATION_THRESHOLD = 0.6  # Correlation threshold for diagnosing Ki vs Kp issues
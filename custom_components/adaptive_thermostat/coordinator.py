@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 import logging
+from types import MappingProxyType
 from typing import Any, TYPE_CHECKING
 
 from homeassistant.core import HomeAssistant
@@ -12,12 +13,17 @@ from homeassistant.util import dt as dt_util
 try:
     from .const import DOMAIN
     from .adaptive.sun_position import SunPositionCalculator, ORIENTATION_AZIMUTH
+    from .snapshot import CoordinatorSnapshot, build_zone_snapshot
+    from .metrics import MetricsRegistry
 except ImportError:
     from const import DOMAIN
     from adaptive.sun_position import SunPositionCalculator, ORIENTATION_AZIMUTH
+    from snapshot import CoordinatorSnapshot, build_zone_snapshot
+    from metrics import MetricsRegistry
 
 if TYPE_CHECKING:
     from .adaptive.manifold_registry import ManifoldRegistry
+    from .managers.events import CycleEvent
     from .central_controller import CentralController as CentralControllerType
 
 _LOGGER = logging.getLogger(__name__)
@@ -35,13 +41,30 @@ class AdaptiveThermostatCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=30),
         )
         self._zones: dict[str, dict[str, Any]] = {}
-        self._demand_states: dict[str, bool] = {}
+        self._demand_states: dict[str, dict[str, Any]] = {}
+        # Zones with demand per mode, kept in step with _demand_states
+        self._heating_demand_count: int = 0
+        self._cooling_demand_count: int = 0
+        # Secondary indexes kept in step with _zones by register/unregister
+        self._zone_by_climate_entity: dict[str, str] = {}
+        self._learners: dict[str, Any] = {}
+        # Last published snapshot; stale when zones were (un)registered since
+        self._snapshot: CoordinatorSnapshot | None = None
+        self._snapshot_stale: bool = True
+        # Numeric zone metrics published by the zone sensors
+        self._metrics = MetricsRegistry()
         self._central_controller: "CentralController | None" = None
         self._sun_position_calculator = SunPositionCalculator.from_hass(hass)
         self._thermal_group_manager: Any = None  # ThermalGroupManager or None
         self._manifold_registry: "ManifoldRegistry | None" = None
         self._zone_loops: dict[str, int] = {}
         self._update_pending: bool = False
+        self._update_requested: bool = False
+
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Return the registry of numeric zone metrics."""
+        return self._metrics
 
     def set_central_controller(self, controller: "CentralController") -> None:
         """Set the central controller reference for push-based updates."""
@@ -173,10 +196,32 @@ class AdaptiveThermostatCoordinator(DataUpdateCoordinator):
                 "Zone %s is already registered, overwriting existing registration",
                 zone_id,
             )
+            self._unindex_zone(zone_id)
         self._zones[zone_id] = zone_data
+        self._index_zone(zone_id, zone_data)
+        self._snapshot_stale = True
+        old_state = self._demand_states.get(zone_id)
+        if old_state is not None:
+            self._count_demand(old_state, -1)
         self._demand_states[zone_id] = {"demand": False, "mode": None}
         _LOGGER.debug("Registered zone: %s", zone_id)
 
+    def _index_zone(self, zone_id: str, zone_data: dict[str, Any]) -> None:
+        """Add a zone to the climate entity and learner lookup indexes."""
+        climate_entity_id = zone_data.get("climate_entity_id")
+        if climate_entity_id is not None:
+            self._zone_by_climate_entity[climate_entity_id] = zone_id
+        learner = zone_data.get("adaptive_learner")
+        if learner is not None:
+            self._learners[zone_id] = learner
+
+    def _unindex_zone(self, zone_id: str) -> None:
+        """Remove a zone from the climate entity and learner lookup indexes."""
+        climate_entity_id = self._zones[zone_id].get("climate_entity_id")
+        if self._zone_by_climate_entity.get(climate_entity_id) == zone_id:
+            del self._zone_by_climate_entity[climate_entity_id]
+        self._learners.pop(zone_id, None)
+
     def unregister_zone(self, zone_id: str) -> None:
         """Unregister a zone from the coordinator.
 
@@ -194,12 +239,19 @@ class AdaptiveThermostatCoordinator(DataUpdateCoordinator):
             )
             return
 
-        # Remove from zones dict
+        # Remove from zones dict and lookup indexes
+        self._unindex_zone(zone_id)
         del self._zones[zone_id]
+        self._snapshot_stale = True
 
         # Remove from demand states dict
         if zone_id in self._demand_states:
-            del self._demand_states[zone_id]
+            old_aggregate = self.get_aggregate_demand()
+            self._count_demand(self._demand_states.pop(zone_id), -1)
+            if self.get_aggregate_demand() != old_aggregate:
+                self._request_central_update()
+
+        self._metrics.remove_zone(zone_id)
 
         # Remove from zone loops dict
         if zone_id in self._zone_loops:
@@ -234,11 +286,44 @@ class AdaptiveThermostatCoordinator(DataUpdateCoordinator):
                     has_demand, hvac_mode
                 )
 
-                # Trigger central controller with single-flight guard
-                if self._central_controller and not self._update_pending:
-                    _LOGGER.info("Triggering CentralController update")
-                    self._update_pending = True
-                    self.hass.async_create_task(self._update_with_guard())
+                old_aggregate = self.get_aggregate_demand()
+                self._count_demand(old_state, -1)
+                self._count_demand(new_state, 1)
+
+                # The central controller only acts on aggregate demand, so
+                # zone changes that leave it unchanged need no update
+                if self.get_aggregate_demand() != old_aggregate:
+                    self._request_central_update()
+
+    def _count_demand(self, state: dict[str, Any], delta: int) -> None:
+        """Add or remove a zone demand state from the per-mode demand counters.
+
+        Args:
+            state: Demand state dict with "demand" and "mode" keys
+            delta: 1 to add the state, -1 to remove it
+        """
+        if not state.get("demand"):
+            return
+        mode = state.get("mode")
+        if mode == "heat":
+            self._heating_demand_count += delta
+        elif mode == "cool":
+            self._cooling_demand_count += delta
+
+    def _request_central_update(self) -> None:
+        """Trigger a CentralController update with a single-flight guard.
+
+        A request arriving while an update is running is remembered and
+        re-run afterwards, so the final aggregate transition is never lost.
+        """
+        if self._central_controller is None:
+            return
+        if self._update_pending:
+            self._update_requested = True
+            return
+        _LOGGER.info("Triggering CentralController update")
+        self._update_pending = True
+        self.hass.async_create_task(self._update_with_guard())
 
     def _is_high_solar_gain(self, check_time: datetime | None = None) -> bool:
         """Check if high solar gain is currently detected.
@@ -304,17 +389,9 @@ class AdaptiveThermostatCoordinator(DataUpdateCoordinator):
             Dictionary with 'heating' and 'cooling' boolean values indicating
             if any zone has demand for that mode.
         """
-        has_heating_demand = any(
-            state.get("demand") and state.get("mode") == "heat"
-            for state in self._demand_states.values()
-        )
-        has_cooling_demand = any(
-            state.get("demand") and state.get("mode") == "cool"
-            for state in self._demand_states.values()
-        )
         return {
-            "heating": has_heating_demand,
-            "cooling": has_cooling_demand,
+            "heating": self._heating_demand_count > 0,
+            "cooling": self._cooling_demand_count > 0,
         }
 
     def get_all_zones(self) -> dict[str, dict[str, Any]]:
@@ -389,10 +466,10 @@ class AdaptiveThermostatCoordinator(DataUpdateCoordinator):
         Returns:
             Tuple of (zone_id, zone_data) if found, None otherwise.
         """
-        for zone_id, zone_data in self._zones.items():
-            if zone_data.get("climate_entity_id") == climate_entity_id:
-                return zone_id, zone_data
-        return None
+        zone_id = self._zone_by_climate_entity.get(climate_entity_id)
+        if zone_id is None:
+            return None
+        return zone_id, self._zones[zone_id]
 
     def get_adaptive_learner(self, climate_entity_id: str) -> Any | None:
         """Get the adaptive learner for a climate entity.
@@ -403,11 +480,10 @@ class AdaptiveThermostatCoordinator(DataUpdateCoordinator):
         Returns:
             AdaptiveLearner instance or None if not found.
         """
-        zone_info = self.get_zone_by_climate_entity(climate_entity_id)
-        if zone_info is None:
+        zone_id = self._zone_by_climate_entity.get(climate_entity_id)
+        if zone_id is None:
             return None
-        _, zone_data = zone_info
-        return zone_data.get("adaptive_learner")
+        return self._learners.get(zone_id)
 
     def get_zone_count(self) -> int:
         """Get the number of registered zones.
@@ -430,27 +506,92 @@ class AdaptiveThermostatCoordinator(DataUpdateCoordinator):
     async def _update_with_guard(self) -> None:
         """Update central controller with guard to prevent duplicate tasks."""
         try:
-            if self._central_controller:
+            while self._central_controller:
+                self._update_requested = False
                 await self._central_controller.update()
+                if not self._update_requested:
+                    break
         finally:
             self._update_pending = False
+            self._update_requested = False
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from all zones.
+    @property
+    def snapshot(self) -> CoordinatorSnapshot:
+        """Return the latest published snapshot.
+
+        A new snapshot is published first if zones were registered or
+        unregistered since the last one, so every registered zone is present.
+        """
+        if self._snapshot is None or self._snapshot_stale:
+            return self.publish_snapshot()
+        return self._snapshot
+
+    def publish_snapshot(self) -> CoordinatorSnapshot:
+        """Build a snapshot of all zones and publish it if anything changed.
+
+        The version is only bumped when the content differs from the previous
+        snapshot; otherwise the previous snapshot object is kept.
+
+        Returns:
+            The current CoordinatorSnapshot
+        """
+        zones = MappingProxyType({
+            zone_id: build_zone_snapshot(
+                zone_id, zone_data, self._demand_states.get(zone_id)
+            )
+            for zone_id, zone_data in self._zones.items()
+        })
+        aggregate_demand = MappingProxyType(self.get_aggregate_demand())
+        self._snapshot_stale = False
+
+        previous = self._snapshot
+        if (
+            previous is not None
+            and previous.zones == zones
+            and previous.aggregate_demand == aggregate_demand
+        ):
+            return previous
+
+        self._snapshot = CoordinatorSnapshot(
+            version=(previous.version + 1) if previous else 1,
+            zones=zones,
+            aggregate_demand=aggregate_demand,
+        )
+        return self._snapshot
+
+    def handle_cycle_ended(self, event: "CycleEvent") -> None:
+        """Republish the snapshot after a zone finished a cycle.
+
+        Subscribed to each zone's CYCLE_ENDED. The learner records the cycle
+        before the event is emitted, so the new snapshot already contains it.
+        Listeners are notified once per cycle end, and only if the snapshot
+        changed, instead of each zone sensor republishing on its own.
+
+        Args:
+            event: The CYCLE_ENDED event
+        """
+        previous = self._snapshot
+        snapshot = self.publish_snapshot()
+        if snapshot is not previous:
+            self.async_set_updated_data(snapshot)
+
+    async def _async_update_data(self) -> CoordinatorSnapshot:
+        """Publish a snapshot of all zones.
 
         This method is called automatically by the coordinator at the
-        configured update interval.
+        configured update interval. It also wakes the central controller when
+        a mode has demand but its main switches are not all on, since demand
+        changes alone no longer trigger an update.
 
         Returns:
-            Dictionary containing current state of all zones.
+            Versioned read-only snapshot of all zones.
         """
-        # For now, we just return the current state
-        # In the future, this could fetch additional data or perform calculations
-        return {
-            "zones": self._zones,
-            "demand": self._demand_states,
-            "aggregate_demand": self.get_aggregate_demand(),
-        }
+        if (
+            self._central_controller is not None
+            and self._central_controller.has_unmet_demand()
+        ):
+            self._request_central_update()
+        return self.publish_snapshot()
 
 
 class ModeSync:
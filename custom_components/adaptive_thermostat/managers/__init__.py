@@ -1,6 +1,7 @@
 """Manager classes for Adaptive Thermostat integration."""
 from __future__ import annotations
 
+from .command_queue import HeaterCommandQueue
 from .control_output import ControlOutputManager
 from .cycle_tracker import CycleState, CycleTrackerManager
 from .events import (
@@ -39,6 +40,7 @@ __all__ = [
     "CycleStartedEvent",
     "CycleState",
     "CycleTrackerManager",
+    "HeaterCommandQueue",
     "HeaterController",
     "HeatingEndedEvent",
     "HeatingStartedEvent",
@@ -0,0 +1,129 @@
+"""Latest-wins heater command queue for Adaptive Thermostat integration.
+
+Control updates can arrive faster than a slow actuator (battery TRV, cloud
+relay) confirms a service call. Without coordination every update adds another
+outstanding call. HeaterCommandQueue keeps at most one in-flight and one
+pending command per entity: a newer command replaces a pending one that has
+not been sent yet, and a semaphore shared by all zones bounds the number of
+service calls in flight during bursts such as mode sync or vacation mode.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+# Service calls allowed in flight at once across all zones
+MAX_CONCURRENT_HEATER_COMMANDS = 4
+
+CommandFactory = Callable[[], Awaitable[bool]]
+
+
+class HeaterCommandQueue:
+    """Per-entity latest-wins command queue with a global concurrency limit."""
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_HEATER_COMMANDS) -> None:
+        """Initialize the queue.
+
+        Args:
+            max_concurrent: Maximum service calls in flight across all entities
+        """
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be >= 1, got {max_concurrent}")
+        self._max_concurrent = max_concurrent
+        # Created lazily so the queue can be built outside the event loop
+        self._semaphore: asyncio.Semaphore | None = None
+        self._pending: dict[str, tuple[CommandFactory, asyncio.Future]] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+        self._in_flight = 0
+
+        # Metrics
+        self._submitted = 0
+        self._superseded = 0
+        self._max_queue_depth = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Return commands currently pending or in flight."""
+        return len(self._pending) + self._in_flight
+
+    @property
+    def max_queue_depth(self) -> int:
+        """Return the highest queue depth observed."""
+        return self._max_queue_depth
+
+    @property
+    def submitted_count(self) -> int:
+        """Return the number of commands submitted."""
+        return self._submitted
+
+    @property
+    def superseded_count(self) -> int:
+        """Return the number of commands replaced before they were sent."""
+        return self._superseded
+
+    def get_metrics(self) -> dict[str, int]:
+        """Return queue metrics for diagnostics."""
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self._max_queue_depth,
+            "submitted": self._submitted,
+            "superseded": self._superseded,
+        }
+
+    async def submit(self, entity_id: str, command: CommandFactory) -> bool | None:
+        """Queue a command for an entity and wait for its outcome.
+
+        Args:
+            entity_id: Entity the command targets
+            command: Zero-argument coroutine function performing the service call
+
+        Returns:
+            The command's result, or None if a newer command for the same
+            entity superseded it before it was sent
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._submitted += 1
+
+        previous = self._pending.get(entity_id)
+        if previous is not None:
+            self._superseded += 1
+            if not previous[1].done():
+                previous[1].set_result(None)
+            _LOGGER.debug("Superseded unsent command for %s", entity_id)
+        self._pending[entity_id] = (command, future)
+        self._max_queue_depth = max(self._max_queue_depth, self.queue_depth)
+
+        if entity_id not in self._workers:
+            self._workers[entity_id] = loop.create_task(self._async_drain(entity_id))
+
+        return await asyncio.shield(future)
+
+    async def _async_drain(self, entity_id: str) -> None:
+        """Send commands for one entity in order until none are pending."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrent)
+        try:
+            while entity_id in self._pending:
+                async with self._semaphore:
+                    # Take the latest command only once a slot is free
+                    pending = self._pending.pop(entity_id, None)
+                    if pending is None:
+                        break
+                    command, future = pending
+                    self._in_flight += 1
+                    try:
+                        result = await command()
+                    except Exception as e:
+                        if not future.done():
+                            future.set_exception(e)
+                        continue
+                    finally:
+                        self._in_flight -= 1
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            del self._workers[entity_id]
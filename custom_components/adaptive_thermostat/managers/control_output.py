@@ -9,6 +9,8 @@ if TYPE_CHECKING:
     from homeassistant.components.climate import HVACMode
     from ..protocols import ThermostatState
     from ..pid_controller import PIDController
+    from ..adaptive.sysid import ThermalHistory
+    from ..analytics.telemetry_store import ZoneTelemetry
     from .heater_controller import HeaterController
 
 _LOGGER = logging.getLogger(__name__)
@@ -46,6 +48,8 @@ class ControlOutputManager:
         set_d: Callable[[float], None],
         set_e: Callable[[float], None],
         set_dt: Callable[[float], None],
+        thermal_history: ThermalHistory | None = None,
+        telemetry: ZoneTelemetry | None = None,
     ):
         """Initialize the ControlOutputManager.
 
@@ -61,6 +65,8 @@ class ControlOutputManager:
             set_d: Callback to set derivative component
             set_e: Callback to set external component
             set_dt: Callback to set delta time
+            thermal_history: Recorder for system identification samples (optional)
+            telemetry: Zone time series in the telemetry store (optional)
         """
         self._thermostat_state = thermostat_state
         self._pid_controller = pid_controller
@@ -75,6 +81,8 @@ class ControlOutputManager:
         self._set_d = set_d
         self._set_e = set_e
         self._set_dt = set_dt
+        self._thermal_history = thermal_history
+        self._telemetry = telemetry
 
         # Store last calculated output for access
         self._last_control_output: float = 0
@@ -247,6 +255,21 @@ class ControlOutputManager:
         self._set_control_output(control_output)
         self._last_control_output = control_output
 
+        # Record real sensor samples with the output applied from now on
+        if is_temp_sensor_update and current_temp is not None:
+            now = time.time()
+            if self._thermal_history is not None:
+                self._thermal_history.append(now, current_temp, ext_temp, control_output)
+            if self._telemetry is not None:
+                self._telemetry.append(
+                    now,
+                    temperature=current_temp,
+                    setpoint=effective_target,
+                    control_output=control_output,
+                    duty=self._telemetry_duty(control_output),
+                    outdoor_temp=ext_temp,
+                )
+
         # Get error for logging; use actual_dt (not PID's dt) for state attribute
         # This ensures the pid_dt attribute reflects actual calc interval, not sensor interval
         error = self._pid_controller.error
@@ -419,6 +442,19 @@ class ControlOutputManager:
             set_force_off=set_force_off,
         )
 
+    def _telemetry_duty(self, control_output: float) -> float | None:
+        """Return the heater duty (%) to record with a telemetry sample.
+
+        PWM zones record whether the heater is on; valve zones record the
+        output sent to the valve. None while there is no heater controller.
+        """
+        heater_controller = self._heater_controller
+        if heater_controller is None:
+            return None
+        if not heater_controller.uses_pwm:
+            return max(0.0, min(100.0, float(control_output)))
+        return 100.0 if heater_controller.is_active(self._thermostat_state._hvac_mode) else 0.0
+
     def _record_heat_output_for_thermal_groups(self) -> None:
         """Record current heat output for thermal groups transfer history."""
         from ..const import DOMAIN
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 import time
+from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Callable, List, Optional
 
@@ -68,13 +69,32 @@ from .events import (
     HeatingStartedEvent,
     HeatingEndedEvent,
 )
+from .command_queue import HeaterCommandQueue
 from .pwm_controller import PWMController
 
 if TYPE_CHECKING:
     from ..climate import AdaptiveThermostat
+    from .pwm_scheduler import PWMPhaseScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
+# Valve commands within this many % of the last commanded value are not resent
+VALVE_COMMAND_DEADBAND = 0.5
+# Unchanged valve commands are resent after this long, so a lost command self-heals
+VALVE_COMMAND_KEEPALIVE_SECONDS = 1800.0
+# Reported position within this many % of the command counts as confirmed
+# (covers light brightness and integer valve position rounding)
+VALVE_CONFIRM_TOLERANCE = 1.0
+
+
+@dataclass
+class _ValveCommand:
+    """Last value commanded to a valve-type entity."""
+
+    value: float
+    sent_at: float  # time.monotonic() of the service call
+    confirmed: bool = False  # Device has reported the commanded value
+
 
 class HeaterController:
     """Controller for heater/cooler device operations.
@@ -97,6 +117,8 @@ class HeaterController:
         min_off_cycle_duration: float,  # in seconds
         dispatcher: Optional[CycleEventDispatcher] = None,
         cooling_type: Optional[str] = None,
+        command_queue: Optional[HeaterCommandQueue] = None,
+        phase_scheduler: Optional[PWMPhaseScheduler] = None,
     ):
         """Initialize the HeaterController.
 
@@ -113,6 +135,10 @@ class HeaterController:
             min_off_cycle_duration: Minimum off cycle duration in seconds
             dispatcher: Optional event dispatcher for cycle events
             cooling_type: Type of cooling system for compressor protection (forced_air, mini_split, chilled_water)
+            command_queue: Command queue shared by all zones (a private one is
+                created if not given)
+            phase_scheduler: Scheduler staggering PWM turn-on across zones
+                sharing a heat source
         """
         self._hass = hass
         self._thermostat = thermostat
@@ -126,6 +152,7 @@ class HeaterController:
         self._min_off_cycle_duration = min_off_cycle_duration
         self._dispatcher = dispatcher
         self._cooling_type = cooling_type
+        self._command_queue = command_queue or HeaterCommandQueue()
 
         # State tracking (owned by thermostat, but accessed here)
         self._heater_control_failed = False
@@ -137,6 +164,11 @@ class HeaterController:
         self._last_heater_state: bool = False
         self._last_cooler_state: bool = False
 
+        # Valve command cache for suppressing redundant writes (valve mode)
+        self._valve_commands: dict[str, _ValveCommand] = {}
+        self._valve_commands_sent: int = 0
+        self._valve_commands_suppressed: int = 0
+
         # Cycle tracking for event emission
         self._cycle_active: bool = False  # Heater has turned on in current demand period
         self._has_demand: bool = False    # control_output > 0
@@ -148,6 +180,7 @@ class HeaterController:
             difference=difference,
             min_on_cycle_duration=min_on_cycle_duration,
             min_off_cycle_duration=min_off_cycle_duration,
+            phase_scheduler=phase_scheduler,
         ) if pwm else None
 
     def _get_pid_was_clamped(self) -> bool:
@@ -225,6 +258,26 @@ class HeaterController:
         """Return the total number of cooler on→off cycles."""
         return self._cooler_cycle_count
 
+    @property
+    def uses_pwm(self) -> bool:
+        """Return True for on/off devices driven by PWM, False for valves."""
+        return bool(self._pwm)
+
+    @property
+    def command_queue(self) -> HeaterCommandQueue:
+        """Return the command queue used for service calls."""
+        return self._command_queue
+
+    @property
+    def valve_commands_sent(self) -> int:
+        """Return the number of valve commands sent to devices."""
+        return self._valve_commands_sent
+
+    @property
+    def valve_commands_suppressed(self) -> int:
+        """Return the number of redundant valve commands suppressed."""
+        return self._valve_commands_suppressed
+
     @property
     def _max_accumulator(self) -> float:
         """Return maximum accumulator value (2x min_on_cycle_duration)."""
@@ -442,6 +495,42 @@ class HeaterController:
         domain: str,
         service: str,
         data: dict,
+    ) -> bool:
+        """Call a heater/cooler service through the shared command queue.
+
+        A command still waiting for the entity's previous call to finish is
+        dropped if a newer command for the same entity arrives.
+
+        Args:
+            entity_id: Entity ID being controlled
+            domain: Service domain (homeassistant, light, valve, number, etc.)
+            service: Service name (turn_on, turn_off, set_value, etc.)
+            data: Service call data
+
+        Returns:
+            True if successful, False if it failed or was superseded
+        """
+        result = await self._command_queue.submit(
+            entity_id,
+            lambda: self._async_send_heater_service(entity_id, domain, service, data),
+        )
+        if result is None:
+            _LOGGER.debug(
+                "%s: %s.%s on %s superseded by a newer command",
+                self._thermostat.entity_id,
+                domain,
+                service,
+                entity_id,
+            )
+            return False
+        return result
+
+    async def _async_send_heater_service(
+        self,
+        entity_id: str,
+        domain: str,
+        service: str,
+        data: dict,
     ) -> bool:
         """Call a heater/cooler service with error handling.
 
@@ -682,6 +771,68 @@ class HeaterController:
                 entity, HA_DOMAIN, service, data
             )
 
+    def _get_reported_valve_value(self, entity_id: str) -> float | None:
+        """Get the value (0-100) a valve-type entity currently reports.
+
+        Args:
+            entity_id: Entity ID to read
+
+        Returns:
+            Reported value, or None if the state is unavailable or unparseable
+        """
+        state = self._hass.states.get(entity_id)
+        if state is None:
+            return None
+        domain, _ = split_entity_id(entity_id)
+        try:
+            if domain == 'light':
+                if state.state == STATE_OFF:
+                    return 0.0
+                brightness = state.attributes.get("brightness")
+                return None if brightness is None else float(brightness) * 100.0 / 255.0
+            if domain == 'valve':
+                position = state.attributes.get("current_position")
+                return None if position is None else float(position)
+            return float(state.state)
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+    def _should_send_valve_command(self, entity_id: str, value: float) -> bool:
+        """Decide whether a valve command differs enough from the cached one.
+
+        A command is sent when nothing was commanded yet, the change exceeds
+        the deadband, the valve must close fully, the keep-alive interval has
+        passed, or the device drifted away from a value it had confirmed.
+
+        Args:
+            entity_id: Entity ID of the valve
+            value: Value about to be commanded
+
+        Returns:
+            True if the service call should be made
+        """
+        last = self._valve_commands.get(entity_id)
+        if last is None:
+            return True
+        if abs(value - last.value) > VALVE_COMMAND_DEADBAND:
+            return True
+        # Always honour a full close exactly
+        if value <= 0 < last.value:
+            return True
+        if time.monotonic() - last.sent_at >= VALVE_COMMAND_KEEPALIVE_SECONDS:
+            return True
+
+        reported = self._get_reported_valve_value(entity_id)
+        if reported is None:
+            return False
+        matches = abs(reported - last.value) <= VALVE_CONFIRM_TOLERANCE
+        if matches:
+            last.confirmed = True
+            return False
+        # Slow devices report late: only resend once the command was confirmed
+        # and the device has since moved (manual change, lost state)
+        return last.confirmed
+
     async def async_set_valve_value(
         self,
         value: float,
@@ -702,18 +853,32 @@ class HeaterController:
         # Track demand state for cycle tracking (valve mode)
         self._has_demand = value > 0
 
-        _LOGGER.info(
-            "%s: Change state of %s to %s",
-            thermostat_entity_id,
-            ", ".join(entities),
-            value
-        )
+        to_send = [
+            entity for entity in entities
+            if self._should_send_valve_command(entity, value)
+        ]
+        self._valve_commands_suppressed += len(entities) - len(to_send)
 
-        for entity in entities:
+        if to_send:
+            _LOGGER.info(
+                "%s: Change state of %s to %s",
+                thermostat_entity_id,
+                ", ".join(to_send),
+                value
+            )
+        else:
+            _LOGGER.debug(
+                "%s: %s already at %s, command suppressed",
+                thermostat_entity_id,
+                ", ".join(entities),
+                value
+            )
+
+        for entity in to_send:
             domain, _ = split_entity_id(entity)
             if domain == 'light':
                 data = {ATTR_ENTITY_ID: entity, ATTR_BRIGHTNESS_PCT: value}
-                await self._async_call_heater_service(
+                success = await self._async_call_heater_service(
                     entity,
                     LIGHT_DOMAIN,
                     SERVICE_TURN_LIGHT_ON,
@@ -721,7 +886,7 @@ class HeaterController:
                 )
             elif domain == 'valve':
                 data = {ATTR_ENTITY_ID: entity, ATTR_POSITION: value}
-                await self._async_call_heater_service(
+                success = await self._async_call_heater_service(
                     entity,
                     VALVE_DOMAIN,
                     SERVICE_SET_VALVE_POSITION,
@@ -729,13 +894,20 @@ class HeaterController:
                 )
             else:
                 data = {ATTR_ENTITY_ID: entity, ATTR_VALUE: value}
-                await self._async_call_heater_service(
+                success = await self._async_call_heater_service(
                     entity,
                     self._get_number_entity_domain(entity),
                     SERVICE_SET_VALUE,
                     data,
                 )
 
+            self._valve_commands_sent += 1
+            if success:
+                self._valve_commands[entity] = _ValveCommand(value, time.monotonic())
+            else:
+                # Unknown device state after a failure - always resend next time
+                self._valve_commands.pop(entity, None)
+
         # Track new active state after valve change for cycle counting
         new_active = value > 0
 
@@ -18,6 +18,7 @@ except ImportError:
 
 if TYPE_CHECKING:
     from ..climate import AdaptiveThermostat
+    from .pwm_scheduler import PWMPhaseScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,6 +38,7 @@ class PWMController:
         difference: float,
         min_on_cycle_duration: float,
         min_off_cycle_duration: float,
+        phase_scheduler: PWMPhaseScheduler | None = None,
     ):
         """Initialize the PWMController.
 
@@ -46,12 +48,15 @@ class PWMController:
             difference: Output range (max - min)
             min_on_cycle_duration: Minimum on cycle duration in seconds
             min_off_cycle_duration: Minimum off cycle duration in seconds
+            phase_scheduler: Optional scheduler staggering turn-on across zones
+                sharing a heat source
         """
         self._thermostat = thermostat
         self._pwm = pwm_duration
         self._difference = difference
         self._min_on_cycle_duration = min_on_cycle_duration
         self._min_off_cycle_duration = min_off_cycle_duration
+        self._phase_scheduler = phase_scheduler
 
         # Duty accumulator for sub-threshold outputs
         self._duty_accumulator_seconds: float = 0.0
@@ -108,6 +113,11 @@ class PWMController:
         self._duty_accumulator_seconds = 0.0
         self._last_accumulator_calc_time = None
 
+    def _report_phase_duty(self, on_seconds: float, period: float) -> None:
+        """Report the current on-time to the phase scheduler, if any."""
+        if self._phase_scheduler:
+            self._phase_scheduler.update(self._thermostat.entity_id, on_seconds, period)
+
     async def async_pwm_switch(
         self,
         control_output: float,
@@ -146,6 +156,7 @@ class PWMController:
 
         # Handle zero/negative output - reset accumulator and turn off
         if control_output <= 0:
+            self._report_phase_duty(0.0, self._pwm)
             self._duty_accumulator_seconds = 0.0
             self._last_accumulator_calc_time = None
             await heater_controller.async_turn_off(
@@ -164,6 +175,9 @@ class PWMController:
 
         # If calculated on-time < min_on_cycle_duration, accumulate duty
         if 0 < time_on < self._min_on_cycle_duration:
+            # Occasional minimum pulses are not staggered
+            self._report_phase_duty(0.0, self._pwm)
+
             # If heater is already ON (e.g., during minimum pulse), don't accumulate
             # but DO try to turn off (respects min_cycle protection internally)
             if heater_controller.is_active(hvac_mode):
@@ -301,6 +315,8 @@ class PWMController:
             time_on *= self._min_off_cycle_duration / time_off
             time_off = self._min_off_cycle_duration
 
+        self._report_phase_duty(time_on, time_on + time_off)
+
         is_device_active = heater_controller.is_active(hvac_mode)
 
         if is_device_active:
@@ -331,7 +347,16 @@ class PWMController:
                     set_last_heat_cycle_time=set_last_heat_cycle_time,
                 )
         else:
-            if time_off <= time_passed or force_on:
+            off_remaining = max(0.0, time_off - time_passed)
+            start_delay = off_remaining
+            if not force_on and self._phase_scheduler:
+                start_delay = self._phase_scheduler.get_start_delay(
+                    thermostat_entity_id, time.monotonic(), off_remaining
+                )
+                # An early start for the phase slot still honours the minimum off-time
+                start_delay = max(start_delay, self._min_off_cycle_duration - time_passed)
+
+            if start_delay <= 0 or force_on:
                 _LOGGER.info(
                     "%s: OFF time passed. Request turning ON %s",
                     thermostat_entity_id,
@@ -344,12 +369,25 @@ class PWMController:
                     set_last_heat_cycle_time=set_last_heat_cycle_time,
                 )
                 set_time_changed(time.monotonic())
+            elif off_remaining <= 0:
+                _LOGGER.info(
+                    "%s: OFF time passed. Waiting %s sec for phase slot of %s",
+                    thermostat_entity_id,
+                    int(start_delay),
+                    ", ".join(entities)
+                )
+                await heater_controller.async_turn_off(
+                    hvac_mode=hvac_mode,
+                    get_cycle_start_time=get_cycle_start_time,
+                    set_is_heating=set_is_heating,
+                    set_last_heat_cycle_time=set_last_heat_cycle_time,
+                )
             else:
                 _LOGGER.info(
                     "%s: Time until %s turns ON: %s sec",
                     thermostat_entity_id,
                     ", ".join(entities),
-                    int(time_off - time_passed)
+                    int(start_delay)
                 )
                 await heater_controller.async_turn_off(
                     hvac_mode=hvac_mode,
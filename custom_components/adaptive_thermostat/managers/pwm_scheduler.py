@@ -0,0 +1,175 @@
+"""PWM phase scheduling across zones for Adaptive Thermostat integration.
+
+Each zone's PWMController times its on/off periods independently, so zones
+sharing a heat source tend to switch on together after a restart, a setpoint
+change or a mode sync, and the boiler sees large demand steps. The
+PWMPhaseScheduler gives every zone in a group (zones on the same manifold, or
+all zones behind the main heater switch) a phase slot within its PWM period.
+
+Slots are packed by cumulative duty: each zone's on-window starts where the
+previous zone's ends. With equal periods this gives the minimum possible
+overlap - no overlap while the summed duty stays below 100%, and the excess
+spread evenly otherwise.
+
+A zone whose off-time has elapsed waits for its slot before turning on on its
+first start after the layout was (re)packed. From then on the PWM timer, which
+runs relative to the zone's own last switch, keeps it in step with its slot;
+holding every start to the absolute slot would let the tick-quantised turn-on
+drift out of the tolerance and skip whole periods. Quantisation only ever
+delays a start, so an aligned zone may start at its slot up to the slot
+tolerance before its off-time ends, which keeps that lag from accumulating.
+A zone whose start has still drifted from its slot by more than the drift
+tolerance (e.g. after a period change) waits for its slot again.
+On-time and min_on_cycle_duration are never touched, so the steady-state
+duty cycle is unchanged.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+# Re-pack slots when a zone's duty moves this far from the duty last laid out
+PHASE_REBALANCE_DUTY_DELTA = 0.1
+# A zone reaching its slot up to this fraction of the period late starts at once
+PHASE_SLOT_TOLERANCE = 0.1
+# Re-align an aligned zone whose start is this fraction of the period off its slot
+PHASE_DRIFT_TOLERANCE = 0.25
+
+
+@dataclass
+class _PhaseMember:
+    """Scheduling state of one zone."""
+
+    group: str
+    duty: float = 0.0  # Current on fraction of the period (0-1)
+    period: float = 0.0  # Current PWM period in seconds
+    phase: float = 0.0  # Slot start as a fraction of the period (0-1)
+    laid_out_duty: float = 0.0  # Duty used when the slot was assigned
+    aligned: bool = False  # Started in its slot since the last layout
+
+
+class PWMPhaseScheduler:
+    """Assign staggered PWM phase slots to zones sharing a heat source."""
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        self._members: dict[str, _PhaseMember] = {}
+
+    def assign(self, zone_id: str, group: str) -> None:
+        """Add a zone to a scheduling group.
+
+        Args:
+            zone_id: Climate entity ID of the zone
+            group: Group key (e.g. "manifold:2nd Floor" or "main_heater")
+        """
+        self._members[zone_id] = _PhaseMember(group=group)
+        self._rebalance(group)
+
+    def remove(self, zone_id: str) -> None:
+        """Remove a zone from scheduling.
+
+        Args:
+            zone_id: Climate entity ID of the zone
+        """
+        member = self._members.pop(zone_id, None)
+        if member is not None:
+            self._rebalance(member.group)
+
+    def get_group(self, zone_id: str) -> str | None:
+        """Return the group a zone is scheduled in, or None."""
+        member = self._members.get(zone_id)
+        return member.group if member else None
+
+    def get_phase(self, zone_id: str) -> float | None:
+        """Return a zone's slot start as a fraction of its period, or None."""
+        member = self._members.get(zone_id)
+        return member.phase if member else None
+
+    def update(self, zone_id: str, on_seconds: float, period: float) -> None:
+        """Report a zone's current on-time and PWM period.
+
+        Args:
+            zone_id: Climate entity ID of the zone
+            on_seconds: On-time per period in seconds (0 when not pulsing)
+            period: PWM period in seconds
+        """
+        member = self._members.get(zone_id)
+        if member is None or period <= 0:
+            return
+        member.period = period
+        member.duty = max(0.0, min(1.0, on_seconds / period))
+        if abs(member.duty - member.laid_out_duty) > PHASE_REBALANCE_DUTY_DELTA:
+            self._rebalance(member.group)
+
+    def get_start_delay(self, zone_id: str, now: float, off_remaining: float = 0.0) -> float:
+        """Return how long a zone should wait before turning on.
+
+        The first start after a layout change waits for the slot. Aligned
+        zones then follow their PWM timer, starting early once their slot
+        has begun and re-aligning when they drift beyond PHASE_DRIFT_TOLERANCE.
+        Returning 0 marks the zone as aligned, as the caller turns it on.
+
+        Args:
+            zone_id: Climate entity ID of the zone
+            now: Current time.monotonic()
+            off_remaining: Seconds until the zone's off-time ends (0 once elapsed)
+
+        Returns:
+            Seconds until the zone should turn on, or 0 to turn on now
+        """
+        member = self._members.get(zone_id)
+        if member is None or member.period <= 0:
+            return off_remaining
+        # Wait for the slot only when active group members share the source
+        if not any(
+            other is not member and other.group == member.group and other.duty > 0
+            for other in self._members.values()
+        ):
+            if off_remaining <= 0:
+                member.aligned = True
+            return off_remaining
+
+        period = member.period
+        tolerance = PHASE_SLOT_TOLERANCE * period
+        since_slot = (now - member.phase * period) % period
+        if member.aligned:
+            if since_slot <= tolerance and off_remaining <= tolerance:
+                return 0.0
+            if off_remaining > 0:
+                return off_remaining
+            drift = since_slot if since_slot < period / 2 else since_slot - period
+            if abs(drift) <= PHASE_DRIFT_TOLERANCE * period:
+                return 0.0
+            _LOGGER.debug(
+                "PWM start of %s drifted %.0fs from its slot, re-aligning",
+                zone_id,
+                drift,
+            )
+            member.aligned = False
+
+        if off_remaining > 0:
+            return off_remaining
+        if since_slot > tolerance:
+            return period - since_slot
+        member.aligned = True
+        return 0.0
+
+    def _rebalance(self, group: str) -> None:
+        """Pack slots of a group back to back by cumulative duty."""
+        offset = 0.0
+        for zone_id, member in self._members.items():
+            if member.group != group:
+                continue
+            member.phase = offset
+            member.laid_out_duty = member.duty
+            member.aligned = False
+            offset = (offset + member.duty) % 1.0
+            _LOGGER.debug(
+                "PWM phase for %s in %s: %.2f (duty %.2f)",
+                zone_id,
+                group,
+                member.phase,
+                member.duty,
+            )
@@ -66,6 +66,9 @@ def build_state_attributes(thermostat: SmartThermostat) -> dict[str, Any]:
     # Humidity detection status
     _add_humidity_detection_attributes(thermostat, attrs)
 
+    # Redundant valve write suppression
+    _add_valve_command_attributes(thermostat, attrs)
+
     return attrs
 
 
@@ -310,6 +313,23 @@ def _add_humidity_detection_attributes(
     attrs["humidity_resume_in"] = detector.get_time_until_resume()
 
 
+def _add_valve_command_attributes(
+    thermostat: SmartThermostat, attrs: dict[str, Any]
+) -> None:
+    """Add valve command counters (valve mode only).
+
+    Args:
+        thermostat: The SmartThermostat instance.
+        attrs: Dictionary to update with valve command attributes.
+    """
+    controller = thermostat._heater_controller
+    if not controller or thermostat._pwm:
+        return
+
+    attrs["valve_commands_sent"] = controller.valve_commands_sent
+    attrs["valve_commands_suppressed"] = controller.valve_commands_suppressed
+
+
 def _build_status_attribute(thermostat: SmartThermostat) -> dict[str, Any]:
     """Build consolidated status attribute using StatusManager.
 
@@ -0,0 +1,123 @@
+"""In-process registry of numeric zone metrics for Adaptive Thermostat.
+
+Zone sensors publish their numeric value here whenever they update, keyed by
+zone and metric name rather than by entity ID. Reports and health checks read
+all zones' metrics in one pass from the registry instead of fetching and
+parsing sensor states one entity at a time, so renamed entities do not lose
+data. Sensors derived from another zone metric subscribe to its changes.
+"""
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Callable, Iterable, Mapping
+
+# Metric names published by zone sensors
+METRIC_DUTY_CYCLE = "duty_cycle"
+METRIC_CYCLE_TIME = "cycle_time"
+METRIC_COMFORT_SCORE = "comfort_score"
+METRIC_TIME_AT_TARGET = "time_at_target"
+METRIC_POWER_M2 = "power_m2"
+
+
+class MetricsRegistry:
+    """Latest numeric metric values per zone."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._zones: dict[str, dict[str, float]] = {}
+        self._listeners: dict[tuple[str, str], list[Callable[[float | None], None]]] = {}
+
+    def subscribe(
+        self,
+        zone_id: str,
+        metric: str,
+        callback: Callable[[float | None], None],
+    ) -> Callable[[], None]:
+        """Call back with the new value whenever a zone metric changes.
+
+        Args:
+            zone_id: Unique identifier for the zone
+            metric: Metric name (one of the METRIC_* constants)
+            callback: Called with the new value, or None when withdrawn
+
+        Returns:
+            A callable that unsubscribes the listener when called.
+        """
+        key = (zone_id, metric)
+        self._listeners.setdefault(key, []).append(callback)
+
+        def unsubscribe() -> None:
+            """Remove this callback from the listeners."""
+            listeners = self._listeners.get(key)
+            if listeners and callback in listeners:
+                listeners.remove(callback)
+                if not listeners:
+                    del self._listeners[key]
+
+        return unsubscribe
+
+    def _notify(self, zone_id: str, metric: str, value: float | None) -> None:
+        """Call the listeners of a zone metric."""
+        for callback in list(self._listeners.get((zone_id, metric), ())):
+            callback(value)
+
+    def publish(self, zone_id: str, metric: str, value: float | None) -> None:
+        """Record the latest value of a zone metric.
+
+        Args:
+            zone_id: Unique identifier for the zone
+            metric: Metric name (one of the METRIC_* constants)
+            value: Numeric value, or None to withdraw the metric
+        """
+        if value is None:
+            self.withdraw(zone_id, metric)
+            return
+        metrics = self._zones.setdefault(zone_id, {})
+        previous = metrics.get(metric)
+        metrics[metric] = float(value)
+        if previous != metrics[metric]:
+            self._notify(zone_id, metric, metrics[metric])
+
+    def withdraw(self, zone_id: str, metric: str) -> None:
+        """Remove a zone metric, e.g. when its sensor is removed."""
+        metrics = self._zones.get(zone_id)
+        if metrics is None or metric not in metrics:
+            return
+        del metrics[metric]
+        if not metrics:
+            del self._zones[zone_id]
+        self._notify(zone_id, metric, None)
+
+    def remove_zone(self, zone_id: str) -> None:
+        """Remove all metrics of a zone."""
+        for metric in self._zones.pop(zone_id, {}):
+            self._notify(zone_id, metric, None)
+
+    def get(self, zone_id: str, metric: str) -> float | None:
+        """Return the latest value of a zone metric, or None if unpublished."""
+        return self._zones.get(zone_id, {}).get(metric)
+
+    def get_zone(self, zone_id: str) -> Mapping[str, float]:
+        """Return a read-only view of one zone's metrics."""
+        return MappingProxyType(self._zones.get(zone_id, {}))
+
+    def collect(
+        self,
+        zone_ids: Iterable[str],
+        metrics: Iterable[str],
+    ) -> dict[str, dict[str, float | None]]:
+        """Return the requested metrics for all requested zones in one pass.
+
+        Args:
+            zone_ids: Zones to include (zones without metrics map to None values)
+            metrics: Metric names to include
+
+        Returns:
+            Dict mapping zone_id to a dict of metric name to value or None
+        """
+        metrics = tuple(metrics)
+        collected: dict[str, dict[str, float | None]] = {}
+        for zone_id in zone_ids:
+            zone_metrics = self._zones.get(zone_id, {})
+            collected[zone_id] = {metric: zone_metrics.get(metric) for metric in metrics}
+        return collected
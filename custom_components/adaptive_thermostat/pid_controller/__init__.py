@@ -28,12 +28,34 @@ except (ImportError, ValueError):
 # Balances responsiveness with noise rejection for fast sensor update rates
 MIN_DT_FOR_DERIVATIVE = 5.0
 
+# Default integral decay threshold for heating types missing from INTEGRAL_DECAY_THRESHOLDS
+DEFAULT_INTEGRAL_DECAY_THRESHOLD = 50.0
+
+_isfinite = math.isfinite
+
 
 # Based on Arduino PID Library
 # See https://github.com/br3ttb/Arduino-PID-Library
 class PID:
     error: float
 
+    # calc() runs on every sensor update for every zone and for every offline
+    # replay step, so instances are slot-based to keep attribute access cheap.
+    __slots__ = (
+        "_Kp", "_Ki", "_Kd", "_Ke", "_Ke_wind", "_out_min", "_out_max",
+        "_proportional", "_integral", "_derivative", "_derivative_filtered",
+        "_derivative_filter_alpha", "_last_set_point", "_set_point",
+        "_input", "_input_time", "_last_input", "_last_input_time",
+        "_error", "_input_diff", "_dext", "_dt", "_last_output", "_output",
+        "_external", "_feedforward", "_mode", "_sampling_period",
+        "_cold_tolerance", "_hot_tolerance", "_outdoor_temp_lag_tau",
+        "_outdoor_temp_lagged", "_last_output_before_off", "_wind_speed",
+        "_integral_decay_multiplier", "_integral_exp_decay_tau", "_heating_type",
+        "_auto_apply_count", "_was_clamped", "_clamp_reason",
+        "_transport_delay", "_dead_time_start",
+        "_decay_exponent", "_decay_threshold",
+    )
+
     def __init__(self, kp, ki, kd, ke=0, ke_wind=0.02, out_min=float('-inf'), out_max=float('+inf'),
                  sampling_period=0, cold_tolerance=0.3, hot_tolerance=0.3, derivative_filter_alpha=0.15,
                  outdoor_temp_lag_tau=4.0, integral_decay_multiplier=1.5, integral_exp_decay_tau=None,
@@ -129,6 +151,19 @@ class PID:
         # Dead time (transport delay) tracking
         self._transport_delay: float | None = None  # Transport delay in minutes
         self._dead_time_start: float | None = None  # Start time of dead time period (input_time)
+        # Heating-type constants resolved once instead of on every calc()
+        self._decay_exponent = 1.0
+        self._decay_threshold = DEFAULT_INTEGRAL_DECAY_THRESHOLD
+        self._resolve_heating_type_constants()
+
+    def _resolve_heating_type_constants(self):
+        """Cache heating-type lookups used by the integral decay safety net."""
+        self._decay_exponent = HEATING_TYPE_CHARACTERISTICS.get(
+            self._heating_type, {}
+        ).get("decay_exponent", 1.0)
+        self._decay_threshold = INTEGRAL_DECAY_THRESHOLDS.get(
+            self._heating_type, DEFAULT_INTEGRAL_DECAY_THRESHOLD
+        )
 
     @property
     def mode(self):
@@ -385,6 +420,7 @@ class PID:
             self._Kd = kd
         if ke is not None and isinstance(ke, (int, float)):
             self._Ke = ke
+        self._resolve_heating_type_constants()
 
     def clear_samples(self):
         """Clear the samples values and timestamp to restart PID from clean state after
@@ -422,11 +458,8 @@ class PID:
         if self._auto_apply_count > 0:
             return False
 
-        # Get threshold for this heating type
-        threshold = INTEGRAL_DECAY_THRESHOLDS.get(self._heating_type, 50.0)
-
-        # Check if integral is excessive
-        if abs(self._integral) <= threshold:
+        # Check if integral is excessive (threshold cached per heating type)
+        if abs(self._integral) <= self._decay_threshold:
             return False
 
         # Check if temperature is within tolerance zone
@@ -459,44 +492,46 @@ class PID:
             A value between `out_min` and `out_max`.
         """
         # Validate inputs for NaN and Inf values
-        if math.isnan(input_val) or math.isinf(input_val):
+        if not _isfinite(input_val):
             _LOGGER.warning("Invalid input_val received: %s. Returning cached output.", input_val)
             return self._output, False
-        if math.isnan(set_point) or math.isinf(set_point):
+        if not _isfinite(set_point):
             _LOGGER.warning("Invalid set_point received: %s. Returning cached output.", set_point)
             return self._output, False
-        if ext_temp is not None and (math.isnan(ext_temp) or math.isinf(ext_temp)):
+        if ext_temp is not None and not _isfinite(ext_temp):
             _LOGGER.warning("Invalid ext_temp received: %s. Returning cached output.", ext_temp)
             return self._output, False
 
-        if self._sampling_period != 0 and self._last_input_time is not None and \
-                time() - self._last_input_time < self._sampling_period:
+        sampling_period = self._sampling_period
+        if sampling_period != 0 and self._last_input_time is not None and \
+                time() - self._last_input_time < sampling_period:
             return self._output, False  # If last sample is too young, keep last output value
 
-        self._last_input = self._input
-        if self._sampling_period == 0:
+        last_input = self._input
+        self._last_input = last_input
+        if sampling_period == 0:
             self._last_input_time = last_input_time
         else:
             self._last_input_time = self._input_time
-        self._last_output = self._output
+        last_output = self._output
+        self._last_output = last_output
 
         # Refresh with actual values
         self._input = input_val
-        if self._sampling_period == 0:
+        if sampling_period == 0:
             if input_time is None:
                 _LOGGER.warning(
                     "PID controller in event-driven mode (sampling_period=0) but no "
                     "input_time provided. Using current time as fallback."
                 )
-                self._input_time = time()
-            else:
-                self._input_time = input_time
+                input_time = time()
         else:
-            self._input_time = time()
+            input_time = time()
+        self._input_time = input_time
         self._last_set_point = self._set_point
         self._set_point = set_point
 
-        if self.mode == 'OFF':  # If PID is off, simply switch between min and max output
+        if self._mode == 'OFF':  # If PID is off, simply switch between min and max output
             if input_val <= set_point - self._cold_tolerance:
                 self._output = self._out_max
                 _LOGGER.debug("PID is off and input lower than set point: heater ON")
@@ -509,15 +544,18 @@ class PID:
                 return self._output, False
 
         # Compute all the working error variables
-        self._error = set_point - input_val
-        if self._last_input is not None:
-            self._input_diff = self._input - self._last_input
+        error = set_point - input_val
+        self._error = error
+        if last_input is not None:
+            input_diff = input_val - last_input
         else:
-            self._input_diff = 0
+            input_diff = 0
+        self._input_diff = input_diff
         if self._last_input_time is not None:
-            self._dt = self._input_time - self._last_input_time
+            dt = input_time - self._last_input_time
         else:
-            self._dt = 0
+            dt = 0
+        self._dt = dt
 
         # Apply EMA filter to outdoor temperature to model thermal lag
         if ext_temp is not None:
@@ -527,67 +565,71 @@ class PID:
             else:
                 # Apply EMA filter: alpha = dt / (tau * 3600)
                 # tau is in hours, dt is in seconds, so convert tau to seconds
-                alpha = self._dt / (self._outdoor_temp_lag_tau * 3600.0)
+                alpha = dt / (self._outdoor_temp_lag_tau * 3600.0)
                 # Clamp alpha to [0, 1] for numerical stability
                 alpha = max(0.0, min(1.0, alpha))
                 self._outdoor_temp_lagged = alpha * ext_temp + (1.0 - alpha) * self._outdoor_temp_lagged
 
-            self._dext = set_point - self._outdoor_temp_lagged
+            dext = set_point - self._outdoor_temp_lagged
         else:
-            self._dext = 0
+            dext = 0
+        self._dext = dext
 
         # Update wind speed (treat None as 0)
-        if wind_speed is not None:
-            self._wind_speed = wind_speed
-        else:
-            self._wind_speed = 0.0
+        if wind_speed is None:
+            wind_speed = 0.0
+        self._wind_speed = wind_speed
 
         # Compensate losses due to external temperature and wind
         # Formula: external = Ke * dext + Ke_wind * wind_speed * dext
         # Wind increases heat loss proportionally to temperature difference
-        self._external = self._Ke * self._dext + self._Ke_wind * self._wind_speed * self._dext
+        external = self._Ke * dext + self._Ke_wind * wind_speed * dext
+        self._external = external
 
         # Calculate proportional term using P-on-M (proportional-on-measurement)
         # P-on-M: proportional term based on negative derivative of measurement
         # This eliminates output spikes when setpoint changes
-        if self._last_input is not None and self._dt != 0:
-            self._proportional = -self._Kp * self._input_diff
+        if last_input is not None and dt != 0:
+            self._proportional = -self._Kp * input_diff
         else:
             self._proportional = 0.0
 
         # Apply bumpless transfer if transitioning from OFF to AUTO
         # This must be done after P and E terms are calculated but before integral updates
-        if self.has_transfer_state:
+        if self._last_output_before_off is not None:
             self.prepare_bumpless_transfer()
 
         # Apply timing threshold to prevent derivative spikes from rapid non-sensor calls
         # Only update integral and derivative if dt >= MIN_DT_FOR_DERIVATIVE
-        if self._dt >= MIN_DT_FOR_DERIVATIVE:
+        if dt >= MIN_DT_FOR_DERIVATIVE:
+            out_max = self._out_max
+            out_min = self._out_min
+            integral = self._integral
+            # Convert dt from seconds to hours for dimensional correctness
+            # Ki and Kd are per hour, so dt must be in hours
+            dt_hours = dt / 3600.0
+
             # Back-calculation anti-windup: prevent windup when saturated AND error drives further saturation
             # Allow wind-down when error opposes saturation (e.g., saturated high but error negative)
             # P-on-M: integrate continuously, no reset on setpoint change
             # Directional saturation check: only block integration when saturated AND error drives further saturation
-            saturated_high = self._last_output >= self._out_max and self._error > 0
-            saturated_low = self._last_output <= self._out_min and self._error < 0
+            saturated_high = last_output >= out_max and error > 0
+            saturated_low = last_output <= out_min and error < 0
             if not (saturated_high or saturated_low):
-                # Convert dt from seconds to hours for dimensional correctness
-                # Ki has units of %/(°C·hour), so dt must be in hours
-                dt_hours = self._dt / 3600.0
-
                 # Asymmetric integral decay: apply multiplier when error opposes integral sign
                 # This accelerates integral wind-down during thermal overhang (e.g., floor heating
                 # where temperature overshoots setpoint due to thermal mass)
                 # Overhang conditions:
                 # - Positive integral (was heating) + negative error (temp above setpoint)
                 # - Negative integral (was cooling) + positive error (temp below setpoint)
-                is_overhang = (self._integral > 0 and self._error < 0) or \
-                              (self._integral < 0 and self._error > 0)
+                is_overhang = (integral > 0 and error < 0) or \
+                              (integral < 0 and error > 0)
                 decay_multiplier = self._integral_decay_multiplier if is_overhang else 1.0
 
                 # Progressive tolerance-based integral decay (safety net for untuned systems)
                 # When should_apply_decay() returns True (untuned + excessive integral + within tolerance),
                 # apply progressive decay that ramps from 1.0 at tolerance edge to full decay_multiplier at setpoint
-                if self.should_apply_decay():
+                if self._auto_apply_count == 0 and self.should_apply_decay():
                     # Track safety net activation for learning feedback
                     self._was_clamped = True
                     self._clamp_reason = 'safety_net'
@@ -595,8 +637,8 @@ class PID:
                     # Calculate progress through tolerance zone (0 at edge, 1 at setpoint)
                     # For heating (positive integral), use cold_tolerance
                     # For cooling (negative integral), use hot_tolerance
-                    tolerance = self._cold_tolerance if self._integral > 0 else self._hot_tolerance
-                    error_abs = abs(self._error)
+                    tolerance = self._cold_tolerance if integral > 0 else self._hot_tolerance
+                    error_abs = abs(error)
 
                     # progress = (tolerance - error) / tolerance
                     # At tolerance edge: error = tolerance, progress = 0
@@ -604,11 +646,8 @@ class PID:
                     progress = (tolerance - error_abs) / tolerance
                     progress = max(0.0, min(1.0, progress))  # Clamp to [0, 1]
 
-                    # Apply heating-type specific decay curve
-                    decay_exponent = HEATING_TYPE_CHARACTERISTICS.get(
-                        self._heating_type, {}
-                    ).get("decay_exponent", 1.0)
-                    shaped_progress = progress ** decay_exponent
+                    # Apply heating-type specific decay curve (exponent cached per heating type)
+                    shaped_progress = progress ** self._decay_exponent
 
                     # Calculate effective decay: ramps from 1.0 to decay_multiplier
                     # effective_decay = 1 + shaped_progress * (decay_multiplier - 1)
@@ -617,46 +656,49 @@ class PID:
                 # Dead time handling: reduce integral accumulation during transport delay
                 # When transport delay is active, split time interval if it spans both
                 # dead time (25% rate) and normal (100% rate) periods
-                if self._transport_delay and self._transport_delay > 0:
+                ki_error = self._Ki * error
+                transport_delay = self._transport_delay
+                if transport_delay and transport_delay > 0:
                     # Capture start time on first calc() after set_transport_delay()
                     if self._dead_time_start == -1.0:
-                        self._dead_time_start = self._input_time
+                        self._dead_time_start = input_time
+                    dead_time_start = self._dead_time_start
 
-                    if self._dead_time_start is not None and self._dead_time_start >= 0:
+                    if dead_time_start is not None and dead_time_start >= 0:
                         # Calculate elapsed time since dead time started (in seconds)
-                        elapsed_seconds = self._input_time - self._dead_time_start
-                        transport_delay_seconds = self._transport_delay * 60.0
+                        elapsed_seconds = input_time - dead_time_start
+                        transport_delay_seconds = transport_delay * 60.0
 
                         if elapsed_seconds < transport_delay_seconds:
                             # Entirely within dead time - use 25% rate
-                            self._integral += self._Ki * self._error * dt_hours * decay_multiplier * 0.25
-                        elif elapsed_seconds - self._dt < transport_delay_seconds:
+                            integral += ki_error * dt_hours * decay_multiplier * 0.25
+                        elif elapsed_seconds - dt < transport_delay_seconds:
                             # Interval spans both dead time and normal periods - split it
                             # Time remaining in dead time at start of interval
-                            time_in_dead = transport_delay_seconds - (elapsed_seconds - self._dt)
-                            time_normal = self._dt - time_in_dead
+                            time_in_dead = transport_delay_seconds - (elapsed_seconds - dt)
+                            time_normal = dt - time_in_dead
 
                             # Accumulate at 25% rate for dead time portion
                             dt_dead_hours = time_in_dead / 3600.0
-                            self._integral += self._Ki * self._error * dt_dead_hours * decay_multiplier * 0.25
+                            integral += ki_error * dt_dead_hours * decay_multiplier * 0.25
 
                             # Accumulate at 100% rate for normal portion
                             dt_normal_hours = time_normal / 3600.0
-                            self._integral += self._Ki * self._error * dt_normal_hours * decay_multiplier
+                            integral += ki_error * dt_normal_hours * decay_multiplier
                         else:
                             # Entirely after dead time - use normal rate
-                            self._integral += self._Ki * self._error * dt_hours * decay_multiplier
+                            integral += ki_error * dt_hours * decay_multiplier
                     else:
                         # No start time yet - use normal rate
-                        self._integral += self._Ki * self._error * dt_hours * decay_multiplier
+                        integral += ki_error * dt_hours * decay_multiplier
                 else:
                     # No dead time - use normal rate
-                    self._integral += self._Ki * self._error * dt_hours * decay_multiplier
+                    integral += ki_error * dt_hours * decay_multiplier
 
                 # Exponential integral decay during overhang
                 # Provides aggressive decay that naturally slows as integral approaches zero
                 if is_overhang and self._integral_exp_decay_tau:
-                    self._integral *= math.exp(-dt_hours / self._integral_exp_decay_tau)
+                    integral *= math.exp(-dt_hours / self._integral_exp_decay_tau)
 
             # Integral clamping accounts for external and feedforward terms to ensure total output respects bounds
             # Formula: I_max = out_max - E - F, I_min = out_min - E - F
@@ -664,35 +706,36 @@ class PID:
             # After v0.7.0 Ke reduction (100x), E typically <1%, leaving >99% headroom for integral
             # Feedforward (F) reduces available headroom when thermal coupling is active
             # Note: Clamping always runs (not just when accumulating) to handle feedforward changes
+            feedforward = self._feedforward
             self._integral = max(
-                min(self._integral, self._out_max - self._external - self._feedforward),
-                self._out_min - self._external - self._feedforward
+                min(integral, out_max - external - feedforward),
+                out_min - external - feedforward
             )
 
             # Calculate derivative
-            # Convert dt to hours for dimensional correctness
             # Kd has units of %/(°C/hour), so dt must be in hours
-            dt_hours = self._dt / 3600.0
-            raw_derivative = -(self._Kd * self._input_diff) / dt_hours
+            raw_derivative = -(self._Kd * input_diff) / dt_hours
 
             # Apply EMA filter to reduce sensor noise amplification
             # Formula: filtered = alpha * raw + (1 - alpha) * prev_filtered
             # alpha = 1.0 disables filter (no filtering)
             # alpha = 0.0 gives maximum filtering (derivative becomes constant)
+            alpha = self._derivative_filter_alpha
             self._derivative_filtered = (
-                self._derivative_filter_alpha * raw_derivative +
-                (1.0 - self._derivative_filter_alpha) * self._derivative_filtered
+                alpha * raw_derivative +
+                (1.0 - alpha) * self._derivative_filtered
             )
             self._derivative = self._derivative_filtered
 
-        elif self._dt > 0:
+        elif dt > 0:
             # dt is positive but below threshold - freeze I and D at last values
             # This prevents derivative spikes from rapid non-sensor calls (external sensor, contact sensor, periodic loop)
             # Integral and derivative remain unchanged from previous calculation
-            _LOGGER.debug(
-                "PID: dt=%.3fs < %.1fs threshold, freeze I=%.2f D=%.2f (rapid non-sensor call)",
-                self._dt, MIN_DT_FOR_DERIVATIVE, self._integral, self._derivative_filtered
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "PID: dt=%.3fs < %.1fs threshold, freeze I=%.2f D=%.2f (rapid non-sensor call)",
+                    dt, MIN_DT_FOR_DERIVATIVE, self._integral, self._derivative_filtered
+                )
         else:
             # First call (dt=0) - initialize D to zero, preserve restored I
             # Note: Don't reset integral - it may have been restored from previous session
@@ -702,19 +745,20 @@ class PID:
         # Compute PID Output
         # Formula: output = P + I + D + E - F
         # Feedforward (F) is subtracted to reduce output when thermal coupling provides heat
-        output = self._proportional + self._integral + self._derivative + self._external - self._feedforward
+        integral = self._integral
+        output = self._proportional + integral + self._derivative + external - self._feedforward
 
         # Clamp output to 0 when beyond tolerance threshold
         # Uses integral sign to detect mode (positive = heating history, negative = cooling history)
         # Heating: temp beyond cold_tolerance above setpoint (error < -cold_tolerance) → no heating
         # Cooling: temp beyond hot_tolerance below setpoint (error > hot_tolerance) → no cooling
         # This allows gentle coasting through the tolerance band without abrupt cutoff
-        if self._integral > 0 and self._error < -self._cold_tolerance:  # Was heating, now beyond tolerance above setpoint
+        if integral > 0 and error < -self._cold_tolerance:  # Was heating, now beyond tolerance above setpoint
             output = min(output, 0)
             # Track tolerance clamping for learning feedback
             self._was_clamped = True
             self._clamp_reason = 'tolerance'
-        elif self._integral < 0 and self._error > self._hot_tolerance:  # Was cooling, now beyond tolerance below setpoint
+        elif integral < 0 and error > self._hot_tolerance:  # Was cooling, now beyond tolerance below setpoint
             output = max(output, 0)
             # Track tolerance clamping for learning feedback
             self._was_clamped = True
@@ -0,0 +1,482 @@
+"""Vectorized PID engine advancing many controllers in lockstep.
+
+BatchPID holds the state of N controllers in NumPy arrays and advances all of
+them with a single vectorized step that follows the same semantics as
+PID.calc() in event-driven AUTO mode (sampling_period=0):
+
+- P-on-M proportional term
+- directional back-calculation anti-windup
+- asymmetric and exponential integral decay during overhang
+- tolerance-based integral decay safety net for untuned controllers
+- dead time (transport delay) split of integral accumulation
+- EMA-lagged outdoor temperature and wind compensation
+- EMA-filtered derivative with the MIN_DT_FOR_DERIVATIVE freeze
+- tolerance clamping of output and feedforward subtraction
+
+It is intended for offline simulation and what-if evaluation (e.g. scoring
+thousands of candidate gain sets against one recorded trace). Mode OFF,
+sampled mode and bumpless transfer are live-control concerns and are not
+modelled.
+
+NumPy is imported here only, so the integration itself does not depend on it.
+"""
+from __future__ import annotations
+
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from . import (
+    DEFAULT_INTEGRAL_DECAY_THRESHOLD,
+    HEATING_TYPE_CHARACTERISTICS,
+    INTEGRAL_DECAY_THRESHOLDS,
+    MIN_DT_FOR_DERIVATIVE,
+    PID,
+)
+
+# Clamp reason codes stored in BatchPID.clamp_reason
+CLAMP_NONE = 0
+CLAMP_TOLERANCE = 1
+CLAMP_SAFETY_NET = 2
+
+_CLAMP_REASON_CODES = {None: CLAMP_NONE, "tolerance": CLAMP_TOLERANCE, "safety_net": CLAMP_SAFETY_NET}
+
+# Sentinel used by PID.set_transport_delay() before the first input time is known
+_DEAD_TIME_PENDING = -1.0
+
+
+def _heating_type_constants(heating_type: str | Sequence[str], size: int) -> tuple[np.ndarray, np.ndarray]:
+    """Resolve decay exponent and integral decay threshold arrays for heating type(s)."""
+    if isinstance(heating_type, str):
+        heating_types = [heating_type] * size
+    else:
+        heating_types = list(heating_type)
+        if len(heating_types) != size:
+            raise ValueError(f"heating_type must have {size} entries, got {len(heating_types)}")
+    exponents = np.array(
+        [HEATING_TYPE_CHARACTERISTICS.get(h, {}).get("decay_exponent", 1.0) for h in heating_types],
+        dtype=float,
+    )
+    thresholds = np.array(
+        [INTEGRAL_DECAY_THRESHOLDS.get(h, DEFAULT_INTEGRAL_DECAY_THRESHOLD) for h in heating_types],
+        dtype=float,
+    )
+    return exponents, thresholds
+
+
+class BatchPID:
+    """N PID controllers with array state and a single vectorized calc()."""
+
+    def __init__(self, kp, ki, kd, ke=0.0, ke_wind=0.02, out_min=float('-inf'), out_max=float('+inf'),
+                 cold_tolerance=0.3, hot_tolerance=0.3, derivative_filter_alpha=0.15,
+                 outdoor_temp_lag_tau=4.0, integral_decay_multiplier=1.5, integral_exp_decay_tau=None,
+                 heating_type="radiator", size: int | None = None):
+        """Create a batch of controllers.
+
+        Every numeric parameter accepts a scalar (shared by all controllers) or a
+        1-D array with one value per controller; parameters match PID.__init__.
+
+        Args:
+            kp, ki, kd, ke: Gains (see PID).
+            ke_wind: Wind compensation coefficient per m/s.
+            out_min, out_max: Output limits.
+            cold_tolerance, hot_tolerance: Tolerance band around setpoint (°C).
+            derivative_filter_alpha: EMA alpha for the derivative term.
+            outdoor_temp_lag_tau: Outdoor temperature EMA time constant in hours.
+            integral_decay_multiplier: Overhang integral decay multiplier (min 1.0).
+            integral_exp_decay_tau: Exponential overhang decay tau in hours (None disables).
+            heating_type: Heating type name, or a sequence with one name per controller.
+            size: Number of controllers; inferred from array parameters when omitted.
+        """
+        if integral_exp_decay_tau is None:
+            integral_exp_decay_tau = 0.0
+        params = {
+            "kp": kp, "ki": ki, "kd": kd, "ke": ke, "ke_wind": ke_wind,
+            "out_min": out_min, "out_max": out_max,
+            "cold_tolerance": cold_tolerance, "hot_tolerance": hot_tolerance,
+            "derivative_filter_alpha": derivative_filter_alpha,
+            "outdoor_temp_lag_tau": outdoor_temp_lag_tau,
+            "integral_decay_multiplier": integral_decay_multiplier,
+            "integral_exp_decay_tau": integral_exp_decay_tau,
+        }
+        for name in ("kp", "ki", "kd"):
+            if params[name] is None:
+                raise ValueError(f'{name} must be specified')
+
+        shape = np.broadcast_shapes(*(np.shape(v) for v in params.values()))
+        if size is None:
+            size = int(np.prod(shape)) if shape else 1
+        if len(shape) > 1 or (shape and shape[0] not in (1, size)):
+            raise ValueError(f"Parameters must be scalars or 1-D arrays of length {size}")
+        self._size = size
+
+        arrays = {k: np.broadcast_to(np.asarray(v, dtype=float), (size,)).copy() for k, v in params.items()}
+        if np.any(arrays["out_min"] >= arrays["out_max"]):
+            raise ValueError('out_min must be less than out_max')
+
+        self._kp = arrays["kp"]
+        self._ki = arrays["ki"]
+        self._kd = arrays["kd"]
+        self._ke = arrays["ke"]
+        self._ke_wind = arrays["ke_wind"]
+        self._out_min = arrays["out_min"]
+        self._out_max = arrays["out_max"]
+        self._cold_tolerance = arrays["cold_tolerance"]
+        self._hot_tolerance = arrays["hot_tolerance"]
+        self._derivative_filter_alpha = arrays["derivative_filter_alpha"]
+        self._outdoor_temp_lag_tau = arrays["outdoor_temp_lag_tau"]
+        self._integral_decay_multiplier = np.maximum(1.0, arrays["integral_decay_multiplier"])
+        self._integral_exp_decay_tau = arrays["integral_exp_decay_tau"]
+        self._decay_exponent, self._decay_threshold = _heating_type_constants(heating_type, size)
+
+        zeros = np.zeros(size)
+        nans = np.full(size, np.nan)
+        self._proportional = zeros.copy()
+        self._integral = zeros.copy()
+        self._derivative = zeros.copy()
+        self._derivative_filtered = zeros.copy()
+        self._external = zeros.copy()
+        self._feedforward = zeros.copy()
+        self._output = zeros.copy()
+        self._error = zeros.copy()
+        self._dt = zeros.copy()
+        # NaN marks "no value yet" where PID uses None
+        self._input = nans.copy()
+        self._input_time = nans.copy()
+        self._outdoor_temp_lagged = nans.copy()
+        self._dead_time_start = nans.copy()
+        self._transport_delay = zeros.copy()  # minutes, 0 disables dead time
+        self._auto_apply_count = np.zeros(size, dtype=int)
+        self._was_clamped = np.zeros(size, dtype=bool)
+        self._clamp_reason = np.zeros(size, dtype=np.int8)
+
+    @classmethod
+    def from_controllers(cls, controllers: Iterable[PID]) -> BatchPID:
+        """Build a batch whose parameters and state mirror existing PID controllers.
+
+        Only AUTO-mode state is copied; pending bumpless transfer state is ignored.
+        """
+        pids = list(controllers)
+        if not pids:
+            raise ValueError("At least one controller is required")
+
+        def gather(attr):
+            return np.array([getattr(p, attr) for p in pids], dtype=float)
+
+        batch = cls(
+            kp=gather("_Kp"), ki=gather("_Ki"), kd=gather("_Kd"), ke=gather("_Ke"),
+            ke_wind=gather("_Ke_wind"), out_min=gather("_out_min"), out_max=gather("_out_max"),
+            cold_tolerance=gather("_cold_tolerance"), hot_tolerance=gather("_hot_tolerance"),
+            derivative_filter_alpha=gather("_derivative_filter_alpha"),
+            outdoor_temp_lag_tau=gather("_outdoor_temp_lag_tau"),
+            integral_decay_multiplier=gather("_integral_decay_multiplier"),
+            integral_exp_decay_tau=[p._integral_exp_decay_tau or 0.0 for p in pids],
+            heating_type=[p._heating_type for p in pids],
+            size=len(pids),
+        )
+
+        def optional(attr):
+            return np.array([np.nan if getattr(p, attr) is None else getattr(p, attr) for p in pids], dtype=float)
+
+        batch._proportional = gather("_proportional")
+        batch._integral = gather("_integral")
+        batch._derivative = gather("_derivative")
+        batch._derivative_filtered = gather("_derivative_filtered")
+        batch._external = gather("_external")
+        batch._feedforward = gather("_feedforward")
+        batch._output = gather("_output")
+        batch._error = gather("_error")
+        batch._dt = gather("_dt")
+        batch._input = optional("_input")
+        batch._input_time = optional("_input_time")
+        batch._outdoor_temp_lagged = optional("_outdoor_temp_lagged")
+        batch._dead_time_start = optional("_dead_time_start")
+        batch._transport_delay = np.array([p._transport_delay or 0.0 for p in pids], dtype=float)
+        batch._auto_apply_count = np.array([p._auto_apply_count for p in pids], dtype=int)
+        batch._was_clamped = np.array([p._was_clamped for p in pids], dtype=bool)
+        batch._clamp_reason = np.array([_CLAMP_REASON_CODES[p._clamp_reason] for p in pids], dtype=np.int8)
+        return batch
+
+    @property
+    def size(self) -> int:
+        """Number of controllers in the batch."""
+        return self._size
+
+    @property
+    def output(self) -> np.ndarray:
+        return self._output
+
+    @property
+    def proportional(self) -> np.ndarray:
+        return self._proportional
+
+    @property
+    def integral(self) -> np.ndarray:
+        return self._integral
+
+    @integral.setter
+    def integral(self, values):
+        self._integral = np.broadcast_to(np.asarray(values, dtype=float), (self._size,)).copy()
+
+    @property
+    def derivative(self) -> np.ndarray:
+        return self._derivative
+
+    @property
+    def external(self) -> np.ndarray:
+        return self._external
+
+    @property
+    def feedforward(self) -> np.ndarray:
+        return self._feedforward
+
+    @property
+    def error(self) -> np.ndarray:
+        return self._error
+
+    @property
+    def dt(self) -> np.ndarray:
+        return self._dt
+
+    @property
+    def outdoor_temp_lagged(self) -> np.ndarray:
+        """Lagged outdoor temperature (NaN where no reading has been seen)."""
+        return self._outdoor_temp_lagged
+
+    @property
+    def was_clamped(self) -> np.ndarray:
+        return self._was_clamped
+
+    @property
+    def clamp_reason(self) -> np.ndarray:
+        """Clamp reason codes (CLAMP_NONE, CLAMP_TOLERANCE or CLAMP_SAFETY_NET)."""
+        return self._clamp_reason
+
+    def set_pid_param(self, kp=None, ki=None, kd=None, ke=None):
+        """Set gains for all controllers (scalar or per-controller arrays)."""
+        for name, value in (("_kp", kp), ("_ki", ki), ("_kd", kd), ("_ke", ke)):
+            if value is not None:
+                setattr(self, name, np.broadcast_to(np.asarray(value, dtype=float), (self._size,)).copy())
+
+    def set_feedforward(self, ff):
+        """Set the feedforward term (scalar or per-controller array)."""
+        self._feedforward = np.broadcast_to(np.asarray(ff, dtype=float), (self._size,)).copy()
+
+    def set_auto_apply_count(self, count):
+        """Set the auto-apply count (scalar or per-controller array)."""
+        self._auto_apply_count = np.broadcast_to(np.asarray(count, dtype=int), (self._size,)).copy()
+
+    def set_transport_delay(self, minutes):
+        """Set transport delay in minutes (scalar or array); 0 disables dead time.
+
+        Mirrors PID.set_transport_delay(): the dead time period starts at the
+        last known input time, or at the next calc() if none is known yet.
+        """
+        minutes = np.broadcast_to(np.asarray(minutes, dtype=float), (self._size,))
+        minutes = np.nan_to_num(minutes, nan=0.0)
+        enabled = minutes != 0
+        start = np.where(np.isnan(self._input_time), _DEAD_TIME_PENDING, self._input_time)
+        self._transport_delay = np.where(enabled, minutes, 0.0)
+        self._dead_time_start = np.where(enabled, start, np.nan)
+
+    def reset_dead_time(self):
+        """Clear dead time state for all controllers."""
+        self._transport_delay = np.zeros(self._size)
+        self._dead_time_start = np.full(self._size, np.nan)
+
+    def reset_clamp_state(self):
+        """Reset clamping state for all controllers."""
+        self._was_clamped = np.zeros(self._size, dtype=bool)
+        self._clamp_reason = np.zeros(self._size, dtype=np.int8)
+
+    def clear_samples(self):
+        """Clear sample history so the next calc() starts from a clean state."""
+        self._input = np.full(self._size, np.nan)
+        self._input_time = np.full(self._size, np.nan)
+        self._derivative_filtered = np.zeros(self._size)
+        self._outdoor_temp_lagged = np.full(self._size, np.nan)
+
+    def calc(self, input_val, set_point, input_time, last_input_time=None, ext_temp=None, wind_speed=None):
+        """Advance every controller by one sample.
+
+        Args:
+            input_val: Current temperature (scalar or per-controller array).
+            set_point: Target temperature (scalar or per-controller array).
+            input_time: Timestamp in seconds of this sample.
+            last_input_time: Timestamp of the previous sample. Defaults to each
+                controller's previous input_time (dt=0 on the first call).
+            ext_temp: Outdoor temperature, or None for no outdoor compensation.
+            wind_speed: Wind speed in m/s, or None for 0.
+
+        Returns:
+            Tuple of (output array, updated bool array). Controllers receiving a
+            non-finite input, setpoint or outdoor temperature keep their previous
+            state and output and report updated=False, like PID.calc().
+        """
+        n = self._size
+        input_val = np.broadcast_to(np.asarray(input_val, dtype=float), (n,))
+        set_point = np.broadcast_to(np.asarray(set_point, dtype=float), (n,))
+        input_time = np.broadcast_to(np.asarray(input_time, dtype=float), (n,))
+        if last_input_time is None:
+            last_time = self._input_time
+        else:
+            last_time = np.broadcast_to(np.asarray(last_input_time, dtype=float), (n,))
+
+        valid = np.isfinite(input_val) & np.isfinite(set_point)
+        if ext_temp is not None:
+            ext_temp = np.broadcast_to(np.asarray(ext_temp, dtype=float), (n,))
+            valid &= np.isfinite(ext_temp)
+        if wind_speed is None:
+            wind = np.zeros(n)
+        else:
+            wind = np.broadcast_to(np.asarray(wind_speed, dtype=float), (n,))
+
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            self._step(valid, input_val, set_point, input_time, last_time, ext_temp, wind)
+        return self._output, valid
+
+    def _step(self, valid, input_val, set_point, input_time, last_time, ext_temp, wind):
+        """Vectorized body of calc(); only rows where valid is True are committed."""
+        last_output = self._output
+        last_input = self._input
+        has_last_input = ~np.isnan(last_input)
+
+        error = set_point - input_val
+        input_diff = np.where(has_last_input, input_val - last_input, 0.0)
+        dt = np.where(np.isnan(last_time), 0.0, input_time - last_time)
+
+        # Outdoor temperature EMA and external term
+        outdoor_lagged = self._outdoor_temp_lagged
+        if ext_temp is not None:
+            alpha = np.clip(dt / (self._outdoor_temp_lag_tau * 3600.0), 0.0, 1.0)
+            outdoor_lagged = np.where(
+                np.isnan(outdoor_lagged),
+                ext_temp,
+                alpha * ext_temp + (1.0 - alpha) * outdoor_lagged,
+            )
+            dext = set_point - outdoor_lagged
+        else:
+            dext = np.zeros(self._size)
+        external = self._ke * dext + self._ke_wind * wind * dext
+
+        # P-on-M
+        proportional = np.where(has_last_input & (dt != 0), -self._kp * input_diff, 0.0)
+
+        integral = self._integral
+        derivative = self._derivative
+        derivative_filtered = self._derivative_filtered
+        dead_time_start = self._dead_time_start
+        was_clamped = self._was_clamped
+        clamp_reason = self._clamp_reason
+        feedforward = self._feedforward
+        out_min = self._out_min
+        out_max = self._out_max
+
+        update = dt >= MIN_DT_FOR_DERIVATIVE
+        dt_hours = dt / 3600.0
+
+        # Directional anti-windup
+        saturated = ((last_output >= out_max) & (error > 0)) | ((last_output <= out_min) & (error < 0))
+        accumulate = update & ~saturated
+
+        # Asymmetric decay during overhang
+        is_overhang = ((integral > 0) & (error < 0)) | ((integral < 0) & (error > 0))
+        decay_multiplier = np.where(is_overhang, self._integral_decay_multiplier, 1.0)
+
+        # Tolerance-based decay safety net (see PID.should_apply_decay)
+        error_abs = np.abs(error)
+        tolerance = np.where(integral > 0, self._cold_tolerance, self._hot_tolerance)
+        safety_net = (
+            accumulate
+            & (self._auto_apply_count == 0)
+            & (np.abs(integral) > self._decay_threshold)
+            & (error_abs < tolerance)
+        )
+        progress = np.clip((tolerance - error_abs) / tolerance, 0.0, 1.0)
+        decay_multiplier = np.where(
+            safety_net,
+            1.0 + progress ** self._decay_exponent * (self._integral_decay_multiplier - 1.0),
+            decay_multiplier,
+        )
+        was_clamped = np.where(safety_net, True, was_clamped)
+        clamp_reason = np.where(safety_net, CLAMP_SAFETY_NET, clamp_reason)
+
+        # Dead time: 25% accumulation rate, splitting intervals that straddle its end
+        ki_error = self._ki * error
+        dead_time_active = self._transport_delay > 0
+        dead_time_start = np.where(
+            accumulate & dead_time_active & (dead_time_start == _DEAD_TIME_PENDING),
+            input_time,
+            dead_time_start,
+        )
+        started = dead_time_active & (dead_time_start >= 0)
+        elapsed = input_time - dead_time_start
+        delay_seconds = self._transport_delay * 60.0
+        in_dead = started & (elapsed < delay_seconds)
+        spans = started & ~in_dead & (elapsed - dt < delay_seconds)
+        time_in_dead = delay_seconds - (elapsed - dt)
+        time_normal = dt - time_in_dead
+
+        increment = np.where(
+            in_dead,
+            ki_error * dt_hours * decay_multiplier * 0.25,
+            ki_error * dt_hours * decay_multiplier,
+        )
+        accumulated = integral + increment
+        split = (integral + ki_error * (time_in_dead / 3600.0) * decay_multiplier * 0.25) \
+            + ki_error * (time_normal / 3600.0) * decay_multiplier
+        accumulated = np.where(spans, split, accumulated)
+
+        # Exponential decay during overhang
+        exp_tau = self._integral_exp_decay_tau
+        accumulated = np.where(
+            is_overhang & (exp_tau != 0),
+            accumulated * np.exp(-dt_hours / np.where(exp_tau != 0, exp_tau, 1.0)),
+            accumulated,
+        )
+        integral = np.where(accumulate, accumulated, integral)
+
+        # Integral clamp (runs whenever I/D update, even if saturated)
+        clamped_integral = np.maximum(
+            np.minimum(integral, out_max - external - feedforward),
+            out_min - external - feedforward,
+        )
+        integral = np.where(update, clamped_integral, integral)
+
+        # Filtered derivative; frozen for 0 < dt < MIN_DT, reset when dt <= 0
+        alpha = self._derivative_filter_alpha
+        raw_derivative = -(self._kd * input_diff) / dt_hours
+        new_filtered = alpha * raw_derivative + (1.0 - alpha) * derivative_filtered
+        first = dt <= 0
+        derivative_filtered = np.where(update, new_filtered, np.where(first, 0.0, derivative_filtered))
+        derivative = np.where(update, new_filtered, np.where(first, 0.0, derivative))
+
+        # Output with tolerance clamping
+        output = proportional + integral + derivative + external - feedforward
+        clamp_heating = (integral > 0) & (error < -self._cold_tolerance)
+        clamp_cooling = ~clamp_heating & (integral < 0) & (error > self._hot_tolerance)
+        output = np.where(clamp_heating, np.minimum(output, 0.0), output)
+        output = np.where(clamp_cooling, np.maximum(output, 0.0), output)
+        tolerance_clamped = clamp_heating | clamp_cooling
+        was_clamped = np.where(tolerance_clamped, True, was_clamped)
+        clamp_reason = np.where(tolerance_clamped, CLAMP_TOLERANCE, clamp_reason)
+        output = np.maximum(np.minimum(output, out_max), out_min)
+
+        # Commit only rows with valid inputs
+        def commit(new, old):
+            return np.where(valid, new, old)
+
+        self._input = commit(input_val, self._input)
+        self._input_time = commit(input_time, self._input_time)
+        self._error = commit(error, self._error)
+        self._dt = commit(dt, self._dt)
+        self._outdoor_temp_lagged = commit(outdoor_lagged, self._outdoor_temp_lagged)
+        self._external = commit(external, self._external)
+        self._proportional = commit(proportional, self._proportional)
+        self._integral = commit(integral, self._integral)
+        self._derivative = commit(derivative, self._derivative)
+        self._derivative_filtered = commit(derivative_filtered, self._derivative_filtered)
+        self._dead_time_start = commit(dead_time_start, self._dead_time_start)
+        self._was_clamped = commit(was_clamped, self._was_clamped)
+        self._clamp_reason = commit(clamp_reason, self._clamp_reason).astype(np.int8)
+        self._output = commit(output, last_output)
@@ -31,7 +31,7 @@ from .sensors.energy import (
     TotalPowerSensor,
     WeeklyCostSensor,
 )
-from .sensors.health import SystemHealthSensor
+from .sensors.health import HeaterCommandQueueSensor, SystemHealthSensor
 from .sensors.comfort import (
     TimeAtTargetSensor,
     ComfortScoreSensor,
@@ -115,7 +115,10 @@ async def async_setup_platform(
     # Create system-wide sensors on first zone setup
     from .const import DOMAIN
     if not hass.data[DOMAIN].get("system_sensors_created"):
-        _LOGGER.info("Creating system-wide sensors (TotalPowerSensor, WeeklyCostSensor)")
+        _LOGGER.info(
+            "Creating system-wide sensors (TotalPowerSensor, WeeklyCostSensor, "
+            "HeaterCommandQueueSensor)"
+        )
 
         # Get energy configuration from domain data
         energy_meter = hass.data[DOMAIN].get("energy_meter_entity")
@@ -125,6 +128,9 @@ async def async_setup_platform(
         total_power_sensor = TotalPowerSensor(hass)
         sensors.append(total_power_sensor)
 
+        # Create HeaterCommandQueueSensor (the queue is shared by all zones)
+        sensors.append(HeaterCommandQueueSensor(hass))
+
         # Create WeeklyCostSensor if energy meter configured
         if energy_meter:
             weekly_cost_sensor = WeeklyCostSensor(
@@ -148,10 +154,15 @@ async def async_setup_platform(
 
     async_add_entities(sensors, True)
 
+    # Push sensors update themselves from snapshots, source entities or timers
+    polled_sensors = [
+        sensor for sensor in sensors if not getattr(sensor, "_push_updates", False)
+    ]
+
     # Schedule updates every 5 minutes
     async def async_update_sensors(now):
-        """Update all sensors."""
-        for sensor in sensors:
+        """Update all polled sensors."""
+        for sensor in polled_sensors:
             await sensor.async_update()
             sensor.async_write_ha_state()
 
@@ -8,6 +8,7 @@ from .performance import (
     OscillationsSensor,
     HeaterStateChange,
     DEFAULT_DUTY_CYCLE_WINDOW,
+    DUTY_CYCLE_HORIZONS,
     DEFAULT_ROLLING_AVERAGE_SIZE,
 )
 from .energy import (
@@ -16,7 +17,7 @@ from .energy import (
     TotalPowerSensor,
     WeeklyCostSensor,
 )
-from .health import SystemHealthSensor
+from .health import HeaterCommandQueueSensor, SystemHealthSensor
 
 __all__ = [
     # Performance sensors
@@ -28,6 +29,7 @@ __all__ = [
     "OscillationsSensor",
     "HeaterStateChange",
     "DEFAULT_DUTY_CYCLE_WINDOW",
+    "DUTY_CYCLE_HORIZONS",
     "DEFAULT_ROLLING_AVERAGE_SIZE",
     # Energy sensors
     "PowerPerM2Sensor",
@@ -36,4 +38,5 @@ __all__ = [
     "WeeklyCostSensor",
     # Health sensors
     "SystemHealthSensor",
+    "HeaterCommandQueueSensor",
 ]
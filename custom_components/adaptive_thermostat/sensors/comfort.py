@@ -3,12 +3,13 @@
 This module contains sensors that track comfort metrics:
 - TimeAtTargetSensor: Tracks percentage of time temperature is within target band
 - ComfortScoreSensor: Composite comfort score (0-100)
+
+Both read the zone's shared ComfortSamples ring, which the thermostat feeds on
+every temperature sensor update and setpoint change.
 """
 from __future__ import annotations
 
-from collections import deque
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import timedelta
 import logging
 from typing import Any
 
@@ -20,37 +21,43 @@ from homeassistant.const import PERCENTAGE
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 
-from ..const import DOMAIN
+from ..analytics.comfort_samples import (
+    DEFAULT_COMFORT_WINDOW_SECONDS,
+    DEFAULT_TARGET_TOLERANCE,
+    ComfortSamples,
+)
+from ..metrics import METRIC_COMFORT_SCORE, METRIC_TIME_AT_TARGET
 from .performance import AdaptiveThermostatSensor
 
 _LOGGER = logging.getLogger(__name__)
 
-# Temperature tolerance band for "at target" (± this value)
-DEFAULT_TARGET_TOLERANCE = 0.5  # °C
-
 # Measurement window for time-at-target calculation
-DEFAULT_COMFORT_WINDOW = timedelta(hours=1)
-
-# Maximum samples to keep (1 per minute for 2 hours)
-MAX_COMFORT_SAMPLES = 120
+DEFAULT_COMFORT_WINDOW = timedelta(seconds=DEFAULT_COMFORT_WINDOW_SECONDS)
 
 
-@dataclass
-class TemperatureSample:
-    """A temperature sample with timestamp."""
+class ComfortSensor(AdaptiveThermostatSensor):
+    """Base class for sensors computed from the zone's comfort samples."""
 
-    timestamp: datetime
-    temperature: float
-    setpoint: float
+    @property
+    def _samples(self) -> ComfortSamples | None:
+        """Return the zone's comfort sample ring, if the zone is registered."""
+        coordinator = self._coordinator
+        if coordinator is None:
+            return None
+        zone_data = coordinator.get_zone_data(self._zone_id)
+        return zone_data.get("comfort_samples") if zone_data else None
 
 
-class TimeAtTargetSensor(AdaptiveThermostatSensor):
+class TimeAtTargetSensor(ComfortSensor):
     """Sensor for percentage of time at target temperature.
 
-    Tracks temperature samples and calculates what percentage of time
-    the actual temperature was within the tolerance band of the setpoint.
+    Reports what percentage of the measurement window the temperature was
+    within the tolerance band of the setpoint, each sample holding until the
+    next one.
     """
 
+    _metric = METRIC_TIME_AT_TARGET
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -80,7 +87,6 @@ class TimeAtTargetSensor(AdaptiveThermostatSensor):
 
         self._tolerance = tolerance
         self._measurement_window = measurement_window or DEFAULT_COMFORT_WINDOW
-        self._samples: deque[TemperatureSample] = deque(maxlen=MAX_COMFORT_SAMPLES)
 
     @property
     def native_value(self) -> float | None:
@@ -93,53 +99,21 @@ class TimeAtTargetSensor(AdaptiveThermostatSensor):
         return {
             "tolerance_c": self._tolerance,
             "measurement_window_minutes": self._measurement_window.total_seconds() / 60,
-            "samples_tracked": len(self._samples),
+            "samples_tracked": len(self._samples or ()),
         }
 
-    def record_sample(self, temperature: float, setpoint: float) -> None:
-        """Record a temperature sample.
-
-        Args:
-            temperature: Current temperature
-            setpoint: Current setpoint
-        """
-        self._samples.append(
-            TemperatureSample(
-                timestamp=dt_util.utcnow(),
-                temperature=temperature,
-                setpoint=setpoint,
-            )
-        )
+    async def async_added_to_hass(self) -> None:
+        """Apply this sensor's window and tolerance to the zone's samples."""
+        await super().async_added_to_hass()
+        samples = self._samples
+        if samples is not None:
+            samples.configure(self._measurement_window.total_seconds(), self._tolerance)
 
     async def async_update(self) -> None:
         """Update the sensor state."""
-        # First, try to record a new sample from climate entity
-        await self._record_current_sample()
-
-        # Then calculate time at target
         time_at_target = self._calculate_time_at_target()
         self._state = round(time_at_target, 1)
-
-    async def _record_current_sample(self) -> None:
-        """Record current temperature and setpoint from climate entity."""
-        climate_state = self.hass.states.get(self._climate_entity_id)
-        if not climate_state:
-            return
-
-        # Get current temperature
-        current_temp = climate_state.attributes.get("current_temperature")
-        if current_temp is None:
-            return
-
-        # Get setpoint
-        setpoint = climate_state.attributes.get("temperature")
-        if setpoint is None:
-            return
-
-        try:
-            self.record_sample(float(current_temp), float(setpoint))
-        except (ValueError, TypeError):
-            pass
+        self._publish_metric(self._state)
 
     def _calculate_time_at_target(self) -> float:
         """Calculate percentage of time within target band.
@@ -147,28 +121,13 @@ class TimeAtTargetSensor(AdaptiveThermostatSensor):
         Returns:
             Percentage (0-100) of time at target
         """
-        now = dt_util.utcnow()
-        window_start = now - self._measurement_window
-
-        # Filter samples within window
-        samples_in_window = [
-            s for s in self._samples if s.timestamp >= window_start
-        ]
-
-        if not samples_in_window:
+        samples = self._samples
+        if samples is None:
             return 0.0
-
-        # Count samples within tolerance
-        at_target = sum(
-            1
-            for s in samples_in_window
-            if abs(s.temperature - s.setpoint) <= self._tolerance
-        )
-
-        return (at_target / len(samples_in_window)) * 100.0
+        return samples.time_at_target(dt_util.utcnow().timestamp())
 
 
-class ComfortScoreSensor(AdaptiveThermostatSensor):
+class ComfortScoreSensor(ComfortSensor):
     """Composite comfort score sensor (0-100).
 
     Combines multiple comfort metrics into a single score:
@@ -177,6 +136,8 @@ class ComfortScoreSensor(AdaptiveThermostatSensor):
     - Low oscillations: 15% weight
     """
 
+    _metric = METRIC_COMFORT_SCORE
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -222,6 +183,7 @@ class ComfortScoreSensor(AdaptiveThermostatSensor):
         """Update the sensor state."""
         comfort_score = await self._calculate_comfort_score()
         self._state = round(comfort_score, 0)
+        self._publish_metric(self._state)
 
     async def _calculate_comfort_score(self) -> float:
         """Calculate composite comfort score.
@@ -253,56 +215,35 @@ class ComfortScoreSensor(AdaptiveThermostatSensor):
         return min(100.0, max(0.0, score))
 
     async def _get_time_at_target(self) -> float:
-        """Get time at target percentage from corresponding sensor.
+        """Get time at target percentage from the zone's comfort samples.
 
         Returns:
-            Time at target percentage (0-100)
+            Time at target percentage (0-100), rounded like the sensor state
         """
-        sensor_id = f"sensor.{self._zone_id}_time_at_target"
-        state = self.hass.states.get(sensor_id)
-
-        if state and state.state not in ("unknown", "unavailable"):
-            try:
-                return float(state.state)
-            except (ValueError, TypeError):
-                pass
-
-        return 0.0
+        samples = self._samples
+        if samples is None:
+            return 0.0
+        return round(samples.time_at_target(dt_util.utcnow().timestamp()), 1)
 
     async def _get_average_deviation(self) -> float:
         """Calculate average temperature deviation from setpoint.
 
         Returns:
-            Average deviation in °C
+            Mean absolute deviation in °C over the measurement window
         """
-        climate_state = self.hass.states.get(self._climate_entity_id)
-        if not climate_state:
-            return 0.0
-
-        current_temp = climate_state.attributes.get("current_temperature")
-        setpoint = climate_state.attributes.get("temperature")
-
-        if current_temp is None or setpoint is None:
-            return 0.0
-
-        try:
-            return abs(float(current_temp) - float(setpoint))
-        except (ValueError, TypeError):
+        samples = self._samples
+        if samples is None:
             return 0.0
+        deviation = samples.mean_deviation(dt_util.utcnow().timestamp())
+        return deviation if deviation is not None else 0.0
 
     async def _get_oscillations(self) -> float:
-        """Get oscillation count from corresponding sensor.
+        """Get oscillation count from the coordinator snapshot.
 
         Returns:
-            Oscillation count
+            Oscillation count (as shown by the oscillations sensor)
         """
-        sensor_id = f"sensor.{self._zone_id}_oscillations"
-        state = self.hass.states.get(sensor_id)
-
-        if state and state.state not in ("unknown", "unavailable"):
-            try:
-                return float(state.state)
-            except (ValueError, TypeError):
-                pass
-
-        return 0.0
+        zone = self._get_zone_snapshot()
+        if zone is None or zone.avg_oscillations is None:
+            return 0.0
+        return float(int(zone.avg_oscillations))
@@ -8,7 +8,7 @@ This module contains sensors that track energy consumption and costs:
 """
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 from typing import Any
 
@@ -30,14 +30,23 @@ from ..const import (
     DOMAIN,
     DEFAULT_FALLBACK_FLOW_RATE,
 )
+from ..analytics.energy import MeterBuckets
 from ..analytics.heat_output import HeatOutputCalculator
+from ..metrics import METRIC_DUTY_CYCLE, METRIC_POWER_M2
 from .performance import AdaptiveThermostatSensor
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class PowerPerM2Sensor(AdaptiveThermostatSensor):
-    """Sensor for power consumption per square meter."""
+    """Sensor for power consumption per square meter.
+
+    Derived from the duty cycle the zone publishes to the metrics registry,
+    so it only recomputes when that value changes.
+    """
+
+    _push_updates = True
+    _metric = METRIC_POWER_M2
 
     def __init__(
         self,
@@ -62,11 +71,16 @@ class PowerPerM2Sensor(AdaptiveThermostatSensor):
         """Return the state of the sensor."""
         return self._state
 
+    def _source_metrics(self) -> list[str]:
+        """Recompute when the zone's duty cycle changes."""
+        return [METRIC_DUTY_CYCLE]
+
     async def async_update(self) -> None:
         """Update the sensor state."""
         # Calculate power per m2 from duty cycle and zone area
         power_m2 = await self._calculate_power_m2()
         self._state = round(power_m2, 1) if power_m2 is not None else 0.0
+        self._publish_metric(self._state)
 
     async def _calculate_power_m2(self) -> float | None:
         """Calculate power consumption per square meter.
@@ -89,15 +103,8 @@ class PowerPerM2Sensor(AdaptiveThermostatSensor):
         if not area_m2 or area_m2 <= 0:
             return None
 
-        # Get duty cycle sensor
-        duty_cycle_sensor_id = f"sensor.{self._zone_id}_duty_cycle"
-        duty_cycle_state = self.hass.states.get(duty_cycle_sensor_id)
-        duty_cycle = 0.0
-        if duty_cycle_state and duty_cycle_state.state not in ("unknown", "unavailable"):
-            try:
-                duty_cycle = float(duty_cycle_state.state)
-            except (ValueError, TypeError):
-                duty_cycle = 0.0
+        # Get duty cycle published by the zone's duty cycle sensor
+        duty_cycle = coordinator.metrics.get(self._zone_id, METRIC_DUTY_CYCLE) or 0.0
 
         # Get heating power rating (assume 100 W/m² maximum for floor heating)
         max_power_w_m2 = zone_data.get("max_power_w_m2", 100.0)
@@ -120,8 +127,11 @@ class HeatOutputSensor(AdaptiveThermostatSensor):
 
     Requires supply temperature and return temperature sensors.
     Flow rate can be from a sensor or use a configured fallback value.
+    Recomputes when one of these sensors changes state.
     """
 
+    _push_updates = True
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -190,6 +200,18 @@ class HeatOutputSensor(AdaptiveThermostatSensor):
             "delta_t_c": self._delta_t,
         }
 
+    def _source_entity_ids(self) -> list[str]:
+        """Recompute when the supply, return or flow rate sensor changes."""
+        return [
+            entity_id
+            for entity_id in (
+                self._supply_temp_sensor,
+                self._return_temp_sensor,
+                self._flow_rate_sensor,
+            )
+            if entity_id
+        ]
+
     async def async_update(self) -> None:
         """Update the sensor state."""
         heat_output = await self._calculate_heat_output()
@@ -360,9 +382,12 @@ class TotalPowerSensor(SensorEntity):
 class WeeklyCostSensor(SensorEntity, RestoreEntity):
     """Sensor for weekly heating energy cost.
 
-    Tracks weekly energy consumption by storing the meter reading at the start
-    of each week and calculating the delta. Persists state across HA restarts
-    and handles meter reset/replacement scenarios.
+    Tracks weekly energy consumption by accumulating meter deltas since the
+    start of each week. Readings are also folded into hourly MeterBuckets,
+    which provide the consumption since the week boundary when a new week
+    starts. week_start_reading is the meter value the week's energy is
+    measured from; a meter reset/replacement moves it so energy recorded
+    before the reset is kept. Persists state across HA restarts.
     """
 
     def __init__(
@@ -391,6 +416,8 @@ class WeeklyCostSensor(SensorEntity, RestoreEntity):
         self._week_start_reading: float | None = None
         self._week_start_timestamp: datetime | None = None
         self._last_meter_reading: float | None = None
+        # Hourly meter buckets (kWh), rebuilt from live readings after restart
+        self._meter = MeterBuckets()
 
     async def async_added_to_hass(self) -> None:
         """Restore state when added to hass."""
@@ -446,17 +473,20 @@ class WeeklyCostSensor(SensorEntity, RestoreEntity):
                 self._weekly_energy_kwh,
             )
 
-    def _check_week_boundary(self, current_reading: float) -> None:
+    def _check_week_boundary(self, current_reading: float) -> bool:
         """Check if we've crossed into a new week and reset if needed.
 
         Resets on Sunday midnight (start of new week).
+
+        Returns:
+            True if a new week was started
         """
         now = dt_util.utcnow()
 
         if self._week_start_timestamp is None:
             # First run or no previous data - initialize
             self._start_new_week(current_reading, now)
-            return
+            return True
 
         # Check if we're in a new week (ISO week-based)
         # Week number changed means new week
@@ -477,18 +507,40 @@ class WeeklyCostSensor(SensorEntity, RestoreEntity):
                 self._value,
             )
             self._start_new_week(current_reading, now)
+            return True
+
+        return False
 
     def _start_new_week(self, current_reading: float, now: datetime) -> None:
-        """Reset week tracking with new start reading."""
-        self._week_start_reading = current_reading
+        """Reset week tracking, keeping energy metered since the week boundary."""
+        week_start = (now - timedelta(days=now.weekday())).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        self._weekly_energy_kwh = self._meter.consumption(week_start, now) or 0.0
+        self._week_start_reading = current_reading - self._weekly_energy_kwh
         self._week_start_timestamp = now
-        self._weekly_energy_kwh = 0.0
         _LOGGER.debug(
             "Started new week at %s with reading %.2f kWh",
             now.isoformat(),
             current_reading,
         )
 
+    def _seed_meter(self, now: datetime) -> None:
+        """Seed empty meter buckets with the last reading known before a restart."""
+        if self._last_meter_reading is not None:
+            baseline = self._last_meter_reading
+        elif self._week_start_reading is not None:
+            baseline = self._week_start_reading + self._weekly_energy_kwh
+        else:
+            return
+        # The restored reading predates this update; place it at the week
+        # start so a restart across a week boundary does not count
+        # consumption from before the boundary in the new week
+        timestamp = self._week_start_timestamp
+        if timestamp is None or timestamp > now:
+            timestamp = now
+        self._meter.add_reading(timestamp, baseline)
+
     @property
     def native_value(self) -> float | None:
         """Return the weekly cost."""
@@ -554,29 +606,25 @@ class WeeklyCostSensor(SensorEntity, RestoreEntity):
             conversion = UNIT_CONVERSIONS.get(unit, 1.0)
             current_kwh = current_reading * conversion
 
-            # Check for week boundary reset
-            self._check_week_boundary(current_kwh)
-
-            # Handle meter reset scenarios (current reading less than week start)
-            if self._week_start_reading is not None:
-                if current_kwh < self._week_start_reading:
-                    # Meter reset detected - likely replacement or rollover
-                    _LOGGER.warning(
-                        "Meter reset detected: week_start=%.2f kWh, current=%.2f kWh. "
-                        "Resetting week start to current reading.",
-                        self._week_start_reading,
-                        current_kwh,
-                    )
-                    self._week_start_reading = current_kwh
-                    self._weekly_energy_kwh = 0.0
-                else:
-                    # Normal case: calculate delta
-                    self._weekly_energy_kwh = current_kwh - self._week_start_reading
-            else:
-                # First reading - initialize
-                self._week_start_reading = current_kwh
-                self._week_start_timestamp = dt_util.utcnow()
-                self._weekly_energy_kwh = 0.0
+            now = dt_util.utcnow()
+            if self._meter.last_value is None:
+                self._seed_meter(now)
+            previous_kwh = self._meter.last_value
+            consumed_kwh = self._meter.add_reading(now, current_kwh)
+
+            if previous_kwh is not None and current_kwh < previous_kwh:
+                # Meter reset detected - likely replacement or rollover
+                _LOGGER.warning(
+                    "Meter reset detected: previous=%.2f kWh, current=%.2f kWh. "
+                    "Continuing weekly energy from current reading.",
+                    previous_kwh,
+                    current_kwh,
+                )
+
+            # Check for week boundary reset, otherwise accumulate the delta
+            if not self._check_week_boundary(current_kwh):
+                self._weekly_energy_kwh += consumed_kwh
+                self._week_start_reading = current_kwh - self._weekly_energy_kwh
 
             self._last_meter_reading = current_kwh
 
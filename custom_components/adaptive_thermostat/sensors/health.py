@@ -2,6 +2,7 @@
 
 This module contains sensors that track overall system health:
 - SystemHealthSensor: Monitors health status across all heating zones
+- HeaterCommandQueueSensor: Reports the heater command queue shared by all zones
 """
 from __future__ import annotations
 
@@ -13,6 +14,7 @@ from homeassistant.core import HomeAssistant
 
 from ..const import DOMAIN
 from ..analytics.health import SystemHealthMonitor
+from ..metrics import METRIC_CYCLE_TIME, METRIC_POWER_M2
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -102,30 +104,12 @@ class SystemHealthSensor(SensorEntity):
         if not coordinator:
             return zones_data
 
-        # Get all zones from coordinator
-        all_zones = coordinator.get_all_zones()
-
-        for zone_id in all_zones:
-            # Get cycle time sensor
-            cycle_time_sensor_id = f"sensor.{zone_id}_cycle_time"
-            cycle_time_state = self.hass.states.get(cycle_time_sensor_id)
-            cycle_time_min = None
-            if cycle_time_state and cycle_time_state.state not in ("unknown", "unavailable"):
-                try:
-                    cycle_time_min = float(cycle_time_state.state)
-                except (ValueError, TypeError):
-                    pass
-
-            # Get power/m2 sensor
-            power_m2_sensor_id = f"sensor.{zone_id}_power_m2"
-            power_m2_state = self.hass.states.get(power_m2_sensor_id)
-            power_w_m2 = None
-            if power_m2_state and power_m2_state.state not in ("unknown", "unavailable"):
-                try:
-                    power_w_m2 = float(power_m2_state.state)
-                except (ValueError, TypeError):
-                    pass
+        # Cycle time and power per m² for all zones in one registry pass
+        zone_metrics = coordinator.metrics.collect(
+            coordinator.get_all_zones(), (METRIC_CYCLE_TIME, METRIC_POWER_M2)
+        )
 
+        for zone_id, metrics in zone_metrics.items():
             # Get temperature sensor availability from zone data
             zone_data = coordinator.get_zone_data(zone_id)
             climate_entity_id = zone_data.get("climate_entity_id") if zone_data else None
@@ -136,9 +120,47 @@ class SystemHealthSensor(SensorEntity):
                     sensor_available = False
 
             zones_data[zone_id] = {
-                "cycle_time_min": cycle_time_min,
-                "power_w_m2": power_w_m2,
+                "cycle_time_min": metrics[METRIC_CYCLE_TIME],
+                "power_w_m2": metrics[METRIC_POWER_M2],
                 "sensor_available": sensor_available,
             }
 
         return zones_data
+
+
+class HeaterCommandQueueSensor(SensorEntity):
+    """Sensor for the heater command queue shared by all zones.
+
+    The state is the number of commands currently queued; totals since
+    startup are exposed as attributes.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the heater command queue sensor."""
+        self.hass = hass
+        self._attr_name = "Heater Command Queue"
+        self._attr_unique_id = "heater_command_queue"
+        self._attr_icon = "mdi:tray-full"
+        self._attr_should_poll = False
+        self._attr_available = True
+        self._attr_entity_registry_visible_default = False
+        self._metrics: dict[str, int] = {}
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the current queue depth."""
+        return self._metrics.get("queue_depth")
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return additional state attributes."""
+        return {
+            "max_queue_depth": self._metrics.get("max_queue_depth"),
+            "commands_submitted": self._metrics.get("submitted"),
+            "commands_superseded": self._metrics.get("superseded"),
+        }
+
+    async def async_update(self) -> None:
+        """Update the sensor state."""
+        queue = self.hass.data.get(DOMAIN, {}).get("heater_command_queue")
+        self._metrics = queue.get_metrics() if queue is not None else {}
@@ -0,0 +1,149 @@
+"""Ordered heater on/off timeline with prefix on-time sums.
+
+Stores heater transitions in time order together with the cumulative on-time
+at each transition, so the on-time over any window is the difference of two
+binary searches instead of a scan over every state change. Several windows
+(1 hour, 24 hours, 7 days) can therefore be answered from the same data.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Iterable, Iterator
+
+# Compact the backing lists once this many pruned entries have accumulated
+_COMPACT_THRESHOLD = 256
+
+
+class HeaterTimeline:
+    """Time-ordered heater transitions with a running on-time total.
+
+    Each stored entry is a transition to a new state; consecutive records of
+    the same state are collapsed. Time before the first transition counts as
+    off. prune() drops transitions older than a cutoff but keeps the last one
+    before it, so the state at the cutoff is still known.
+    """
+
+    def __init__(self, max_transitions: int | None = None) -> None:
+        """Initialize an empty timeline.
+
+        Args:
+            max_transitions: Optional cap on retained transitions (oldest
+                transitions are dropped first)
+        """
+        self._max_transitions = max_transitions
+        self._clear()
+
+    @classmethod
+    def from_changes(
+        cls,
+        changes: Iterable[tuple[datetime, bool]],
+        max_transitions: int | None = None,
+    ) -> HeaterTimeline:
+        """Build a timeline from (timestamp, is_on) pairs in any order."""
+        timeline = cls(max_transitions)
+        timeline._load(changes)
+        return timeline
+
+    def __len__(self) -> int:
+        return len(self._times) - self._head
+
+    def __iter__(self) -> Iterator[tuple[datetime, bool]]:
+        for i in range(self._head, len(self._times)):
+            yield self._stamps[i], self._states[i]
+
+    @property
+    def first_timestamp(self) -> datetime | None:
+        """Timestamp of the oldest retained transition."""
+        return self._stamps[self._head] if len(self) else None
+
+    @property
+    def current_state(self) -> bool | None:
+        """State after the newest transition, or None when empty."""
+        return self._states[-1] if len(self) else None
+
+    def append(self, timestamp: datetime, is_on: bool) -> None:
+        """Record the heater state at a point in time.
+
+        Args:
+            timestamp: When the state was observed
+            is_on: Whether the heater was on
+        """
+        t = timestamp.timestamp()
+        if len(self) and t < self._times[-1]:
+            # Out-of-order record: rebuild in order (never happens for live
+            # state events, which arrive in time order)
+            changes = list(self)
+            changes.append((timestamp, is_on))
+            self._load(changes)
+            return
+
+        if len(self) and self._states[-1] == is_on:
+            return
+
+        if len(self):
+            previous = self._cumulative[-1]
+            if self._states[-1]:
+                previous += t - self._times[-1]
+        else:
+            previous = 0.0
+
+        self._stamps.append(timestamp)
+        self._times.append(t)
+        self._states.append(is_on)
+        self._cumulative.append(previous)
+
+        if self._max_transitions is not None and len(self) > self._max_transitions:
+            self._head += 1
+            self._maybe_compact()
+
+    def on_time_until(self, timestamp: datetime) -> float:
+        """Return cumulative on-time in seconds from the first transition to timestamp."""
+        t = timestamp.timestamp()
+        i = bisect_right(self._times, t, lo=self._head) - 1
+        if i < self._head:
+            return 0.0
+        on_time = self._cumulative[i]
+        if self._states[i]:
+            on_time += t - self._times[i]
+        return on_time
+
+    def on_time(self, start: datetime, end: datetime) -> float:
+        """Return on-time in seconds within [start, end]."""
+        if end <= start:
+            return 0.0
+        return self.on_time_until(end) - self.on_time_until(start)
+
+    def prune(self, cutoff: datetime) -> None:
+        """Drop transitions before cutoff, keeping the most recent one before it."""
+        i = bisect_left(self._times, cutoff.timestamp(), lo=self._head) - 1
+        if i > self._head:
+            self._head = i
+            self._maybe_compact()
+
+    def _clear(self) -> None:
+        self._stamps: list[datetime] = []
+        self._times: list[float] = []
+        self._states: list[bool] = []
+        # On-time accumulated from the first stored transition up to _times[i]
+        self._cumulative: list[float] = []
+        # Index of the first live entry; entries before it are pruned lazily
+        self._head = 0
+
+    def _load(self, changes: Iterable[tuple[datetime, bool]]) -> None:
+        """Replace the contents with (timestamp, is_on) pairs in any order."""
+        self._clear()
+        for timestamp, is_on in sorted(changes, key=lambda change: change[0]):
+            self.append(timestamp, is_on)
+
+    def _maybe_compact(self) -> None:
+        """Release pruned entries once they outweigh the live ones."""
+        if self._head < _COMPACT_THRESHOLD or self._head * 2 < len(self._times):
+            return
+        head = self._head
+        base = self._cumulative[head]
+        self._stamps = self._stamps[head:]
+        self._times = self._times[head:]
+        self._states = self._states[head:]
+        self._cumulative = [value - base for value in self._cumulative[head:]]
+        self._head = 0
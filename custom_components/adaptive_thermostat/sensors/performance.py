@@ -10,6 +10,7 @@ This module contains sensors that track heating system performance metrics:
 from __future__ import annotations
 
 from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
@@ -27,16 +28,36 @@ from homeassistant.const import (
     STATE_ON,
 )
 from homeassistant.core import HomeAssistant, callback, Event
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_interval,
+)
 from homeassistant.util import dt as dt_util
 
 from ..const import DOMAIN
+from ..metrics import METRIC_CYCLE_TIME, METRIC_DUTY_CYCLE
+from ..snapshot import ZoneSnapshot
+from .heater_timeline import HeaterTimeline
 
 _LOGGER = logging.getLogger(__name__)
 
 # Default measurement window for duty cycle calculation (1 hour)
 DEFAULT_DUTY_CYCLE_WINDOW = timedelta(hours=1)
 
+# Additional windows exposed as duty cycle attributes (label -> window)
+DUTY_CYCLE_HORIZONS: dict[str, timedelta] = {
+    "1h": timedelta(hours=1),
+    "24h": timedelta(hours=24),
+    "7d": timedelta(days=7),
+}
+
+# Refresh interval for the duty cycle between heater transitions; the
+# measurement window slides continuously, so this bounds how stale it gets
+DUTY_CYCLE_REFRESH_INTERVAL = timedelta(minutes=5)
+
+# Upper bound on retained heater transitions per duty cycle sensor
+MAX_HEATER_TRANSITIONS = 50000
+
 # Default number of cycles to average for CycleTimeSensor
 DEFAULT_ROLLING_AVERAGE_SIZE = 10
 
@@ -50,7 +71,24 @@ class HeaterStateChange:
 
 
 class AdaptiveThermostatSensor(SensorEntity):
-    """Base class for Adaptive Thermostat sensors."""
+    """Base class for Adaptive Thermostat sensors.
+
+    Sensors with _push_updates set are not refreshed by the platform's update
+    timer; they recompute from their own triggers and only write state when
+    their value changed. Sensors with _snapshot_driven set only depend on
+    snapshot content and recompute when the coordinator publishes a new
+    snapshot version (including the one it publishes when the zone ends a
+    cycle). Sensors returning entity IDs from _source_entity_ids recompute
+    when one of those entities changes state, and sensors returning metric
+    names from _source_metrics recompute when the zone publishes a new value
+    for one of those metrics.
+    Sensors with _metric set publish their numeric value to the coordinator's
+    metrics registry on every update.
+    """
+
+    _push_updates: bool = False
+    _snapshot_driven: bool = False
+    _metric: str | None = None
 
     def __init__(
         self,
@@ -67,6 +105,12 @@ class AdaptiveThermostatSensor(SensorEntity):
         self._attr_should_poll = False
         self._attr_available = True
         self._attr_entity_registry_visible_default = False
+        # Version of the coordinator snapshot this sensor last rendered
+        self._snapshot_version: int | None = None
+        # Push update subscriptions
+        self._coordinator_unsub: Any = None
+        self._source_unsub: Any = None
+        self._metric_unsubs: list[Any] = []
 
     @property
     def _coordinator(self):
@@ -74,6 +118,122 @@ class AdaptiveThermostatSensor(SensorEntity):
         from ..const import DOMAIN
         return self.hass.data.get(DOMAIN, {}).get("coordinator")
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to push updates when added to hass."""
+        await super().async_added_to_hass()
+        if self._push_updates:
+            self._subscribe_push_updates()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop push update subscriptions when removed from hass."""
+        self._unsubscribe_push_updates()
+        self._publish_metric(None)
+        await super().async_will_remove_from_hass()
+
+    def _publish_metric(self, value: float | None) -> None:
+        """Publish the sensor's value to the coordinator's metrics registry."""
+        if self._metric is None:
+            return
+        coordinator = self._coordinator
+        if coordinator is not None:
+            coordinator.metrics.publish(self._zone_id, self._metric, value)
+
+    def _source_entity_ids(self) -> list[str]:
+        """Return entities whose state changes may change this sensor's value."""
+        return []
+
+    def _source_metrics(self) -> list[str]:
+        """Return zone metrics whose changes may change this sensor's value."""
+        return []
+
+    def _subscribe_push_updates(self) -> None:
+        """Listen for coordinator snapshots and source entity state changes."""
+        coordinator = self._coordinator
+        if (
+            self._snapshot_driven
+            and coordinator is not None
+            and self._coordinator_unsub is None
+        ):
+            self._coordinator_unsub = coordinator.async_add_listener(
+                self._handle_snapshot_update
+            )
+        sources = self._source_entity_ids()
+        if sources and self._source_unsub is None:
+            self._source_unsub = async_track_state_change_event(
+                self.hass, sources, self._handle_source_changed
+            )
+        if coordinator is not None and not self._metric_unsubs:
+            self._metric_unsubs = [
+                coordinator.metrics.subscribe(
+                    self._zone_id, metric, self._handle_metric_changed
+                )
+                for metric in self._source_metrics()
+            ]
+
+    def _unsubscribe_push_updates(self) -> None:
+        """Remove coordinator and source entity listeners."""
+        if self._coordinator_unsub is not None:
+            self._coordinator_unsub()
+            self._coordinator_unsub = None
+        if self._source_unsub is not None:
+            self._source_unsub()
+            self._source_unsub = None
+        for unsub in self._metric_unsubs:
+            unsub()
+        self._metric_unsubs = []
+
+    def _handle_snapshot_update(self) -> None:
+        """Recompute after the coordinator published a new snapshot version."""
+        if self._snapshot_is_new():
+            self.hass.async_create_task(self._async_push_state())
+
+    @callback
+    def _handle_source_changed(self, event: Event) -> None:
+        """Recompute after a source entity changed state."""
+        self.hass.async_create_task(self._async_push_state())
+
+    @callback
+    def _handle_metric_changed(self, value: float | None) -> None:
+        """Recompute after a source metric of the zone changed."""
+        self.hass.async_create_task(self._async_push_state())
+
+    async def _async_push_state(self) -> None:
+        """Recompute the value and write state only if it changed."""
+        previous = self.native_value
+        await self.async_update()
+        if self.native_value != previous:
+            self.async_write_ha_state()
+
+    def _snapshot_is_new(self) -> bool:
+        """Return whether the latest snapshot has not been rendered yet."""
+        coordinator = self._coordinator
+        if not coordinator:
+            return True
+        return coordinator.snapshot.version != self._snapshot_version
+
+    def _snapshot_changed(self) -> bool:
+        """Check whether the coordinator published a new snapshot.
+
+        Marks the current snapshot as seen, so the next call returns False
+        until the coordinator publishes a new version.
+
+        Returns:
+            True if the sensor should recompute, False if nothing changed
+        """
+        if not self._snapshot_is_new():
+            return False
+        coordinator = self._coordinator
+        if coordinator:
+            self._snapshot_version = coordinator.snapshot.version
+        return True
+
+    def _get_zone_snapshot(self) -> ZoneSnapshot | None:
+        """Return this sensor's zone from the latest coordinator snapshot."""
+        coordinator = self._coordinator
+        if not coordinator:
+            return None
+        return coordinator.snapshot.get_zone(self._zone_id)
+
 
 class DutyCycleSensor(AdaptiveThermostatSensor):
     """Sensor for heating duty cycle percentage.
@@ -83,10 +243,20 @@ class DutyCycleSensor(AdaptiveThermostatSensor):
 
     The duty cycle is calculated as: (on_time / total_time) * 100
 
+    Transitions are kept in a HeaterTimeline covering the longest of the
+    measurement window and DUTY_CYCLE_HORIZONS, so the state and every
+    horizon attribute are computed with binary searches on one structure.
+
     Alternatively, can use the PID controller's control_output as the duty cycle
     when no heater state tracking is available.
+
+    The value is recomputed on heater transitions and every
+    DUTY_CYCLE_REFRESH_INTERVAL, not on coordinator refreshes.
     """
 
+    _push_updates = True
+    _metric = METRIC_DUTY_CYCLE
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -115,15 +285,16 @@ class DutyCycleSensor(AdaptiveThermostatSensor):
         # Measurement window for duty cycle calculation
         self._measurement_window = measurement_window or DEFAULT_DUTY_CYCLE_WINDOW
 
-        # State change tracking - use deque with maxlen to limit memory
-        # Store enough changes to cover the measurement window
-        # Assuming max 1 change per second, 1 hour = 3600 changes max
-        self._state_changes: deque[HeaterStateChange] = deque(maxlen=7200)
+        # Heater transitions, retained for the longest window we report on
+        self._timeline = HeaterTimeline(MAX_HEATER_TRANSITIONS)
+        self._retention = max(self._measurement_window, *DUTY_CYCLE_HORIZONS.values())
+        self._horizon_duty_cycles: dict[str, float | None] = {}
 
         # Track current heater state
         self._heater_entity_id: str | None = None
         self._current_heater_state: bool = False
         self._state_listener_unsub: Any = None
+        self._refresh_unsub: Any = None
 
     @property
     def native_value(self) -> float | None:
@@ -135,10 +306,26 @@ class DutyCycleSensor(AdaptiveThermostatSensor):
         """Return additional state attributes."""
         return {
             "measurement_window_minutes": self._measurement_window.total_seconds() / 60,
-            "state_changes_tracked": len(self._state_changes),
+            "state_changes_tracked": len(self._timeline),
             "heater_entity_id": self._heater_entity_id,
+            "duty_cycle_windows": dict(self._horizon_duty_cycles),
         }
 
+    @property
+    def _state_changes(self) -> list[HeaterStateChange]:
+        """Tracked state changes in time order."""
+        return [
+            HeaterStateChange(timestamp=timestamp, is_on=is_on)
+            for timestamp, is_on in self._timeline
+        ]
+
+    @_state_changes.setter
+    def _state_changes(self, changes: Iterable[HeaterStateChange]) -> None:
+        self._timeline = HeaterTimeline.from_changes(
+            ((change.timestamp, change.is_on) for change in changes),
+            MAX_HEATER_TRANSITIONS,
+        )
+
     async def async_added_to_hass(self) -> None:
         """Set up state change tracking when added to hass."""
         await super().async_added_to_hass()
@@ -170,11 +357,23 @@ class DutyCycleSensor(AdaptiveThermostatSensor):
                 self._async_heater_state_changed,
             )
 
+        self._refresh_unsub = async_track_time_interval(
+            self.hass, self._async_scheduled_refresh, DUTY_CYCLE_REFRESH_INTERVAL
+        )
+
     async def async_will_remove_from_hass(self) -> None:
         """Clean up when removed from hass."""
         if self._state_listener_unsub:
             self._state_listener_unsub()
             self._state_listener_unsub = None
+        if self._refresh_unsub:
+            self._refresh_unsub()
+            self._refresh_unsub = None
+        await super().async_will_remove_from_hass()
+
+    async def _async_scheduled_refresh(self, now: datetime) -> None:
+        """Recompute as the measurement window slides between transitions."""
+        await self._async_push_state()
 
     @callback
     def _async_heater_state_changed(self, event: Event) -> None:
@@ -194,6 +393,7 @@ class DutyCycleSensor(AdaptiveThermostatSensor):
                 self._attr_unique_id,
                 "ON" if is_on else "OFF",
             )
+            self.hass.async_create_task(self._async_push_state())
 
     def _record_state_change(self, is_on: bool) -> None:
         """Record a state change with timestamp.
@@ -201,14 +401,14 @@ class DutyCycleSensor(AdaptiveThermostatSensor):
         Args:
             is_on: Whether the heater is now on
         """
-        self._state_changes.append(
-            HeaterStateChange(timestamp=dt_util.utcnow(), is_on=is_on)
-        )
+        self._timeline.append(dt_util.utcnow(), is_on)
 
     async def async_update(self) -> None:
         """Update the sensor state."""
         duty_cycle = self._calculate_duty_cycle()
         self._state = round(duty_cycle, 1)
+        self._horizon_duty_cycles = self._calculate_horizon_duty_cycles()
+        self._publish_metric(self._state)
 
     def _calculate_duty_cycle(self) -> float:
         """Calculate duty cycle from tracked state changes.
@@ -220,16 +420,12 @@ class DutyCycleSensor(AdaptiveThermostatSensor):
         window_start = now - self._measurement_window
 
         # If no state changes tracked, try to use control_output from climate entity
-        if not self._state_changes:
+        if not self._timeline:
             return self._get_control_output_duty_cycle()
 
-        # Prune old state changes outside measurement window
-        # Keep one state before window_start to know initial state
-        self._prune_old_state_changes(window_start)
-
-        # If still no data after pruning, use control_output
-        if not self._state_changes:
-            return self._get_control_output_duty_cycle()
+        # Drop transitions older than the longest reported window
+        # (one state before the cutoff is kept to know the initial state)
+        self._prune_old_state_changes(now - self._retention)
 
         # Calculate on_time within the measurement window
         on_time_seconds = self._calculate_on_time(window_start, now)
@@ -255,23 +451,9 @@ class DutyCycleSensor(AdaptiveThermostatSensor):
         """Remove state changes older than window_start, keeping the most recent one before it.
 
         Args:
-            window_start: Start of the measurement window
+            window_start: Start of the oldest window still needed
         """
-        # Single-pass approach: find last_before and collect changes_in_window in one loop
-        last_before = None
-        changes_in_window = []
-
-        for sc in self._state_changes:
-            if sc.timestamp >= window_start:
-                changes_in_window.append(sc)
-            elif last_before is None or sc.timestamp > last_before.timestamp:
-                last_before = sc
-
-        # Replace with pruned list
-        self._state_changes.clear()
-        if last_before is not None:
-            self._state_changes.append(last_before)
-        self._state_changes.extend(changes_in_window)
+        self._timeline.prune(window_start)
 
     def _calculate_on_time(self, window_start: datetime, window_end: datetime) -> float:
         """Calculate total on-time within the measurement window.
@@ -283,34 +465,32 @@ class DutyCycleSensor(AdaptiveThermostatSensor):
         Returns:
             Total on-time in seconds
         """
-        if not self._state_changes:
-            return 0.0
-
-        # Sort changes by timestamp
-        sorted_changes = sorted(self._state_changes, key=lambda sc: sc.timestamp)
-
-        on_time = 0.0
-        current_state = False
-        last_timestamp = window_start
+        return self._timeline.on_time(window_start, window_end)
 
-        for change in sorted_changes:
-            # Clamp timestamp to window bounds
-            change_time = max(change.timestamp, window_start)
-            change_time = min(change_time, window_end)
+    def _calculate_horizon_duty_cycles(self) -> dict[str, float | None]:
+        """Calculate duty cycle over each of DUTY_CYCLE_HORIZONS.
 
-            # If we were ON during this period, add the time
-            if current_state and change_time > last_timestamp:
-                on_time += (change_time - last_timestamp).total_seconds()
+        Each horizon only counts time since tracking began, so a sensor that
+        has been running for two hours reports a meaningful 24h value.
 
-            # Update state
-            current_state = change.is_on
-            last_timestamp = change_time
-
-        # Handle the final period from last change to window_end
-        if current_state and window_end > last_timestamp:
-            on_time += (window_end - last_timestamp).total_seconds()
+        Returns:
+            Duty cycle percentage per horizon label (None without data)
+        """
+        first = self._timeline.first_timestamp
+        if first is None:
+            return {label: None for label in DUTY_CYCLE_HORIZONS}
 
-        return on_time
+        now = dt_util.utcnow()
+        result: dict[str, float | None] = {}
+        for label, window in DUTY_CYCLE_HORIZONS.items():
+            start = max(now - window, first)
+            covered = (now - start).total_seconds()
+            if covered <= 0:
+                result[label] = None
+                continue
+            on_time = self._timeline.on_time(start, now)
+            result[label] = round(on_time / covered * 100.0, 1)
+        return result
 
     def _get_control_output_duty_cycle(self) -> float:
         """Get duty cycle from climate entity's control_output attribute.
@@ -353,6 +533,8 @@ class CycleTimeSensor(AdaptiveThermostatSensor):
     Maintains a rolling average of recent cycle times.
     """
 
+    _metric = METRIC_CYCLE_TIME
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -443,6 +625,7 @@ class CycleTimeSensor(AdaptiveThermostatSensor):
         if self._state_listener_unsub:
             self._state_listener_unsub()
             self._state_listener_unsub = None
+        await super().async_will_remove_from_hass()
 
     @callback
     def _async_heater_state_changed(self, event: Event) -> None:
@@ -502,6 +685,7 @@ class CycleTimeSensor(AdaptiveThermostatSensor):
             self._state = round(avg_cycle_time, 1)
         else:
             self._state = None
+        self._publish_metric(self._state)
 
     def _calculate_average_cycle_time(self) -> float | None:
         """Calculate average heating cycle time.
@@ -518,6 +702,9 @@ class CycleTimeSensor(AdaptiveThermostatSensor):
 class OvershootSensor(AdaptiveThermostatSensor):
     """Sensor for temperature overshoot from adaptive learning."""
 
+    _push_updates = True
+    _snapshot_driven = True
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -542,6 +729,8 @@ class OvershootSensor(AdaptiveThermostatSensor):
 
     async def async_update(self) -> None:
         """Update the sensor state."""
+        if not self._snapshot_changed():
+            return
         # Get overshoot from adaptive learner
         overshoot = await self._get_overshoot()
         self._state = round(overshoot, 2) if overshoot is not None else 0.0
@@ -552,41 +741,20 @@ class OvershootSensor(AdaptiveThermostatSensor):
         Returns:
             Overshoot in degrees C, or None if no data available
         """
-        # Get coordinator data
-        coordinator = self._coordinator
-        if not coordinator:
+        # Get zone summary from the coordinator snapshot
+        zone = self._get_zone_snapshot()
+        if zone is None:
             return None
 
-        # Get zone data
-        zone_data = coordinator.get_zone_data(self._zone_id)
-        if not zone_data:
-            return None
-
-        # Get adaptive learner from zone data
-        adaptive_learner = zone_data.get("adaptive_learner")
-        if not adaptive_learner:
-            return None
-
-        # Get cycle history
-        if not hasattr(adaptive_learner, "cycle_history") or not adaptive_learner.cycle_history:
-            return 0.0
-
-        # Calculate average overshoot from recent cycles
-        overshoots = [
-            cycle.overshoot
-            for cycle in adaptive_learner.cycle_history
-            if cycle.overshoot is not None
-        ]
-
-        if not overshoots:
-            return 0.0
-
-        return sum(overshoots) / len(overshoots)
+        return zone.avg_overshoot
 
 
 class SettlingTimeSensor(AdaptiveThermostatSensor):
     """Sensor for settling time from adaptive learning."""
 
+    _push_updates = True
+    _snapshot_driven = True
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -611,6 +779,8 @@ class SettlingTimeSensor(AdaptiveThermostatSensor):
 
     async def async_update(self) -> None:
         """Update the sensor state."""
+        if not self._snapshot_changed():
+            return
         # Get settling time from adaptive learner
         settling_time = await self._get_settling_time()
         self._state = round(settling_time, 1) if settling_time is not None else 0.0
@@ -621,41 +791,20 @@ class SettlingTimeSensor(AdaptiveThermostatSensor):
         Returns:
             Settling time in minutes, or None if no data available
         """
-        # Get coordinator data
-        coordinator = self._coordinator
-        if not coordinator:
-            return None
-
-        # Get zone data
-        zone_data = coordinator.get_zone_data(self._zone_id)
-        if not zone_data:
-            return None
-
-        # Get adaptive learner from zone data
-        adaptive_learner = zone_data.get("adaptive_learner")
-        if not adaptive_learner:
+        # Get zone summary from the coordinator snapshot
+        zone = self._get_zone_snapshot()
+        if zone is None:
             return None
 
-        # Get cycle history
-        if not hasattr(adaptive_learner, "cycle_history") or not adaptive_learner.cycle_history:
-            return 0.0
-
-        # Calculate average settling time from recent cycles
-        settling_times = [
-            cycle.settling_time
-            for cycle in adaptive_learner.cycle_history
-            if cycle.settling_time is not None
-        ]
-
-        if not settling_times:
-            return 0.0
-
-        return sum(settling_times) / len(settling_times)
+        return zone.avg_settling_time
 
 
 class OscillationsSensor(AdaptiveThermostatSensor):
     """Sensor for oscillation count from adaptive learning."""
 
+    _push_updates = True
+    _snapshot_driven = True
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -678,6 +827,8 @@ class OscillationsSensor(AdaptiveThermostatSensor):
 
     async def async_update(self) -> None:
         """Update the sensor state."""
+        if not self._snapshot_changed():
+            return
         # Get oscillations from adaptive learner
         oscillations = await self._get_oscillations()
         self._state = int(oscillations) if oscillations is not None else 0
@@ -688,33 +839,9 @@ class OscillationsSensor(AdaptiveThermostatSensor):
         Returns:
             Average oscillation count, or None if no data available
         """
-        # Get coordinator data
-        coordinator = self._coordinator
-        if not coordinator:
-            return None
-
-        # Get zone data
-        zone_data = coordinator.get_zone_data(self._zone_id)
-        if not zone_data:
+        # Get zone summary from the coordinator snapshot
+        zone = self._get_zone_snapshot()
+        if zone is None or zone.avg_oscillations is None:
             return None
 
-        # Get adaptive learner from zone data
-        adaptive_learner = zone_data.get("adaptive_learner")
-        if not adaptive_learner:
-            return None
-
-        # Get cycle history
-        if not hasattr(adaptive_learner, "cycle_history") or not adaptive_learner.cycle_history:
-            return 0
-
-        # Calculate average oscillations from recent cycles
-        oscillations = [
-            cycle.oscillations
-            for cycle in adaptive_learner.cycle_history
-            if cycle.oscillations is not None
-        ]
-
-        if not oscillations:
-            return 0
-
-        return int(sum(oscillations) / len(oscillations))
+        return int(zone.avg_oscillations)
@@ -20,6 +20,7 @@ from .scheduled import (
     async_scheduled_health_check,
     async_scheduled_weekly_report,
     async_daily_learning,
+    async_calculate_pid_adjustments,
     _run_health_check_core,
     _run_weekly_report_core,
     _collect_zones_health_data,
@@ -38,6 +39,11 @@ SERVICE_WEEKLY_REPORT = "weekly_report"
 SERVICE_COST_REPORT = "cost_report"
 SERVICE_SET_VACATION_MODE = "set_vacation_mode"
 SERVICE_PID_RECOMMENDATIONS = "pid_recommendations"
+SERVICE_TUNE_PID = "tune_pid"
+SERVICE_EXPORT_DATA = "export_data"
+
+# Setpoint used for tuning scenarios when the zone has no target temperature
+DEFAULT_TUNING_SETPOINT = 20.0
 
 
 # =============================================================================
@@ -65,6 +71,8 @@ async def async_handle_run_learning(
         "zone_results": {},
     }
 
+    requests: dict[str, tuple[Any, dict[str, Any]]] = {}
+
     for zone_id, zone_data in all_zones.items():
         adaptive_learner = zone_data.get("adaptive_learner")
         climate_entity_id = zone_data.get("climate_entity_id")
@@ -89,63 +97,68 @@ async def async_handle_run_learning(
             }
             continue
 
-        current_kp = state.attributes.get("kp", 100.0)
-        current_ki = state.attributes.get("ki", 0.01)
-        current_kd = state.attributes.get("kd", 0.0)
-        pwm_seconds = zone_data.get("pwm_seconds", 0)
-
-        try:
-            # Get cycle count for reporting
-            cycle_count = adaptive_learner.get_cycle_count()
-
-            # Trigger learning analysis with current PID values
-            recommendation = adaptive_learner.calculate_pid_adjustment(
-                current_kp=current_kp,
-                current_ki=current_ki,
-                current_kd=current_kd,
-                pwm_seconds=pwm_seconds,
-            )
+        requests[zone_id] = (adaptive_learner, {
+            "current_kp": state.attributes.get("kp", 100.0),
+            "current_ki": state.attributes.get("ki", 0.01),
+            "current_kd": state.attributes.get("kd", 0.0),
+            "pwm_seconds": zone_data.get("pwm_seconds", 0),
+        })
+        # Reserve the slot so zone_results keeps zone order
+        results["zone_results"][zone_id] = None
+
+    # Trigger learning analysis with current PID values, off the event loop
+    outcomes = await async_calculate_pid_adjustments(hass, requests)
+
+    for zone_id, recommendation in outcomes.items():
+        if isinstance(recommendation, Exception):
+            _LOGGER.error("Learning failed for zone %s: %s", zone_id, recommendation)
+            results["zone_results"][zone_id] = {
+                "status": "error",
+                "error": str(recommendation),
+            }
+            continue
 
-            results["zones_analyzed"] += 1
+        adaptive_learner, params = requests[zone_id]
+        current_kp = params["current_kp"]
+        current_ki = params["current_ki"]
+        current_kd = params["current_kd"]
+        # Get cycle count for reporting
+        cycle_count = adaptive_learner.get_cycle_count()
 
-            if recommendation is None:
-                _LOGGER.info(
-                    "Zone %s: insufficient data for recommendations (cycles: %d)",
-                    zone_id,
-                    cycle_count,
-                )
-                results["zone_results"][zone_id] = {
-                    "status": "insufficient_data",
-                    "cycle_count": cycle_count,
-                    "current_pid": {"kp": current_kp, "ki": current_ki, "kd": current_kd},
-                }
-            else:
-                # Calculate percentage changes for logging
-                kp_change = ((recommendation["kp"] - current_kp) / current_kp * 100) if current_kp != 0 else 0
-                ki_change = ((recommendation["ki"] - current_ki) / current_ki * 100) if current_ki != 0 else 0
-                kd_change = ((recommendation["kd"] - current_kd) / current_kd * 100) if current_kd != 0 else 0
+        results["zones_analyzed"] += 1
 
-                _LOGGER.info(
-                    "Zone %s PID recommendation: Kp=%.2f (%.1f%%), Ki=%.4f (%.1f%%), Kd=%.2f (%.1f%%)",
-                    zone_id,
-                    recommendation["kp"], kp_change,
-                    recommendation["ki"], ki_change,
-                    recommendation["kd"], kd_change,
-                )
+        if recommendation is None:
+            _LOGGER.info(
+                "Zone %s: insufficient data for recommendations (cycles: %d)",
+                zone_id,
+                cycle_count,
+            )
+            results["zone_results"][zone_id] = {
+                "status": "insufficient_data",
+                "cycle_count": cycle_count,
+                "current_pid": {"kp": current_kp, "ki": current_ki, "kd": current_kd},
+            }
+        else:
+            # Calculate percentage changes for logging
+            kp_change = ((recommendation["kp"] - current_kp) / current_kp * 100) if current_kp != 0 else 0
+            ki_change = ((recommendation["ki"] - current_ki) / current_ki * 100) if current_ki != 0 else 0
+            kd_change = ((recommendation["kd"] - current_kd) / current_kd * 100) if current_kd != 0 else 0
+
+            _LOGGER.info(
+                "Zone %s PID recommendation: Kp=%.2f (%.1f%%), Ki=%.4f (%.1f%%), Kd=%.2f (%.1f%%)",
+                zone_id,
+                recommendation["kp"], kp_change,
+                recommendation["ki"], ki_change,
+                recommendation["kd"], kd_change,
+            )
 
-                results["zones_with_recommendations"] += 1
-                results["zone_results"][zone_id] = {
-                    "status": "recommendation_available",
-                    "cycle_count": cycle_count,
-                    "current_pid": {"kp": current_kp, "ki": current_ki, "kd": current_kd},
-                    "recommended_pid": recommendation,
-                    "changes_percent": {"kp": kp_change, "ki": ki_change, "kd": kd_change},
-                }
-        except Exception as e:
-            _LOGGER.error("Learning failed for zone %s: %s", zone_id, e)
+            results["zones_with_recommendations"] += 1
             results["zone_results"][zone_id] = {
-                "status": "error",
-                "error": str(e),
+                "status": "recommendation_available",
+                "cycle_count": cycle_count,
+                "current_pid": {"kp": current_kp, "ki": current_ki, "kd": current_kd},
+                "recommended_pid": recommendation,
+                "changes_percent": {"kp": kp_change, "ki": ki_change, "kd": kd_change},
             }
 
     _LOGGER.info(
@@ -450,6 +463,183 @@ async def async_handle_pid_recommendations(
     return result
 
 
+async def async_handle_tune_pid(
+    hass: HomeAssistant,
+    coordinator: AdaptiveThermostatCoordinator,
+    call: ServiceCall,
+) -> dict:
+    """Handle the tune_pid service call.
+
+    Simulates candidate gains for every zone against its identified zone
+    model (or a physics estimate before the first fit) and returns the best
+    set alongside the current, learner and physics gains. Nothing is applied;
+    tuning runs in a process pool so the event loop is not blocked.
+
+    Returns dictionary with:
+    - zones: Dict of zone tuning results or skip reasons
+    - zones_tuned: Count
+    - zones_error: Count
+    """
+    try:
+        from ..adaptive.pid_autotune import (
+            TuningRequest,
+            async_tune_pid,
+            build_scenarios,
+            default_controller_options,
+        )
+        from ..adaptive.zone_model import ZoneModel
+        from ..adaptive.physics import calculate_initial_pid
+    except ImportError as e:
+        _LOGGER.error("PID tuning unavailable (numpy required): %s", e)
+        return {"error": "numpy_not_available", "zones": {}}
+
+    _LOGGER.info("Running offline PID tuning for all zones")
+
+    entity_component = hass.data.get("climate")
+    result = {"zones": {}, "zones_tuned": 0, "zones_error": 0}
+    requests = []
+
+    for zone_id, zone_data in coordinator.get_all_zones().items():
+        climate_entity_id = zone_data.get("climate_entity_id")
+        state = hass.states.get(climate_entity_id) if climate_entity_id else None
+        if not state:
+            result["zones"][zone_id] = {"status": "entity_not_found"}
+            result["zones_error"] += 1
+            continue
+
+        thermostat = entity_component.get_entity(climate_entity_id) if entity_component else None
+        heating_type = zone_data.get("heating_type") or getattr(thermostat, "_heating_type", None)
+        tau = getattr(thermostat, "_thermal_time_constant", None)
+        area_m2 = zone_data.get("area_m2") or None
+
+        current_gains = {
+            "kp": state.attributes.get("kp", 100.0),
+            "ki": state.attributes.get("ki", 0.01),
+            "kd": state.attributes.get("kd", 0.0),
+            "ke": state.attributes.get("ke", 0.0),
+        }
+        comparisons = {}
+        cycles = []
+        adaptive_learner = zone_data.get("adaptive_learner")
+        if adaptive_learner:
+            cycles = list(adaptive_learner.cycle_history)
+            recommendation = adaptive_learner.calculate_pid_adjustment(
+                current_kp=current_gains["kp"],
+                current_ki=current_gains["ki"],
+                current_kd=current_gains["kd"],
+                pwm_seconds=zone_data.get("pwm_seconds", 0),
+            )
+            if recommendation is not None:
+                comparisons["learner"] = {**recommendation, "ke": current_gains["ke"]}
+        if tau:
+            kp, ki, kd = calculate_initial_pid(tau, heating_type, area_m2)
+            comparisons["physics"] = {"kp": kp, "ki": ki, "kd": kd, "ke": current_gains["ke"]}
+
+        # Simulate against the zone's identified model when one was fitted
+        identified = getattr(thermostat, "_system_identification", None)
+        if identified is not None:
+            model = identified.to_zone_model(heating_type)
+        else:
+            dead_times = sorted(c.dead_time for c in cycles if c.dead_time is not None)
+            model = ZoneModel.from_physics(
+                heating_type,
+                tau,
+                dead_times[len(dead_times) // 2] if dead_times else None,
+            )
+        setpoint = state.attributes.get("temperature") or DEFAULT_TUNING_SETPOINT
+        requests.append(
+            TuningRequest(
+                zone_id=zone_id,
+                model=model,
+                scenarios=build_scenarios(cycles, setpoint),
+                current_gains=current_gains,
+                comparisons=comparisons,
+                controller_options=default_controller_options(model.heating_type, model),
+            )
+        )
+
+    tuning_results = await async_tune_pid(hass, requests)
+    for request, tuning in zip(requests, tuning_results):
+        if isinstance(tuning, BaseException):
+            _LOGGER.error("PID tuning failed for zone %s: %s", request.zone_id, tuning)
+            result["zones"][request.zone_id] = {"status": "error", "error": str(tuning)}
+            result["zones_error"] += 1
+            continue
+        result["zones"][request.zone_id] = {"status": "tuned", **tuning.to_dict()}
+        result["zones_tuned"] += 1
+
+    _LOGGER.info(
+        "PID tuning complete: %d zones tuned, %d errors",
+        result["zones_tuned"],
+        result["zones_error"],
+    )
+
+    return result
+
+
+async def async_handle_export_data(
+    hass: HomeAssistant,
+    coordinator: AdaptiveThermostatCoordinator,
+    call: ServiceCall,
+) -> dict:
+    """Handle the export_data service call.
+
+    Streams the selected datasets of each zone (or the zones of the given
+    climate entities) to NDJSON or CSV files in the export directory. Rows
+    are written in chunks through the executor.
+
+    Returns dictionary with:
+    - zones: Dict of zone_id to {dataset: {"path", "rows"}}
+    - files_written: Count
+    """
+    from ..analytics.export import (
+        EXPORT_DATASETS,
+        EXPORT_FORMAT_NDJSON,
+        async_export_tables,
+        build_zone_tables,
+    )
+    from homeassistant.util import dt as dt_util
+
+    entity_ids = call.data.get("entity_id") or []
+    datasets = call.data.get("datasets") or EXPORT_DATASETS
+    export_format = call.data.get("format", EXPORT_FORMAT_NDJSON)
+    start = call.data.get("start_time")
+    end = call.data.get("end_time")
+    start = dt_util.as_utc(start) if start is not None else None
+    end = dt_util.as_utc(end) if end is not None else None
+
+    entity_component = hass.data.get("climate")
+    result = {"zones": {}, "files_written": 0}
+
+    for zone_id, zone_data in coordinator.get_all_zones().items():
+        climate_entity_id = zone_data.get("climate_entity_id")
+        if entity_ids and climate_entity_id not in entity_ids:
+            continue
+
+        thermostat = (
+            entity_component.get_entity(climate_entity_id)
+            if entity_component and climate_entity_id
+            else None
+        )
+        tables = build_zone_tables(
+            zone_data,
+            thermostat,
+            datasets,
+            start,
+            end,
+            call.data.get("telemetry_tier"),
+        )
+        files = await async_export_tables(hass, zone_id, tables, export_format)
+        result["zones"][zone_id] = files
+        result["files_written"] += len(files)
+
+    _LOGGER.info(
+        "Exported %d files for %d zones", result["files_written"], len(result["zones"])
+    )
+
+    return result
+
+
 # =============================================================================
 # Service Registration
 # =============================================================================
@@ -467,6 +657,7 @@ def async_register_services(
     cost_report_schema,
     default_vacation_target_temp: float,
     debug: bool = False,
+    export_schema=None,
 ) -> None:
     """Register all services for the Adaptive Thermostat integration.
 
@@ -482,6 +673,7 @@ def async_register_services(
         cost_report_schema: Schema for cost report service
         default_vacation_target_temp: Default target temp for vacation mode
         debug: Debug mode flag
+        export_schema: Schema for export data service
     """
 
     # Create service handler wrappers that capture the context
@@ -514,6 +706,12 @@ def async_register_services(
     async def _pid_recommendations_handler(call: ServiceCall) -> dict:
         return await async_handle_pid_recommendations(hass, coordinator, call)
 
+    async def _tune_pid_handler(call: ServiceCall) -> dict:
+        return await async_handle_tune_pid(hass, coordinator, call)
+
+    async def _export_data_handler(call: ServiceCall) -> dict:
+        return await async_handle_export_data(hass, coordinator, call)
+
     # Register public services (always available)
     hass.services.async_register(
         DOMAIN, SERVICE_SET_VACATION_MODE, _vacation_mode_handler,
@@ -526,8 +724,12 @@ def async_register_services(
     hass.services.async_register(
         DOMAIN, SERVICE_WEEKLY_REPORT, _weekly_report_handler
     )
+    hass.services.async_register(
+        DOMAIN, SERVICE_EXPORT_DATA, _export_data_handler,
+        schema=export_schema,
+    )
 
-    services_count = 3
+    services_count = 4
 
     # Register debug-only services
     if debug:
@@ -537,7 +739,10 @@ def async_register_services(
         hass.services.async_register(
             DOMAIN, SERVICE_PID_RECOMMENDATIONS, _pid_recommendations_handler
         )
-        services_count += 2
+        hass.services.async_register(
+            DOMAIN, SERVICE_TUNE_PID, _tune_pid_handler
+        )
+        services_count += 3
 
     _LOGGER.debug("Registered %d services for %s domain (debug=%s)", services_count, DOMAIN, debug)
 
@@ -553,12 +758,14 @@ def async_unregister_services(hass: HomeAssistant) -> None:
         SERVICE_SET_VACATION_MODE,
         SERVICE_COST_REPORT,
         SERVICE_WEEKLY_REPORT,
+        SERVICE_EXPORT_DATA,
     ]
 
     # Debug-only services (conditionally registered)
     debug_services = [
         SERVICE_RUN_LEARNING,
         SERVICE_PID_RECOMMENDATIONS,
+        SERVICE_TUNE_PID,
     ]
 
     services_removed = 0
@@ -585,6 +792,8 @@ __all__ = [
     "SERVICE_COST_REPORT",
     "SERVICE_SET_VACATION_MODE",
     "SERVICE_PID_RECOMMENDATIONS",
+    "SERVICE_TUNE_PID",
+    "SERVICE_EXPORT_DATA",
     # Service handlers
     "async_handle_run_learning",
     "async_handle_health_check",
@@ -592,6 +801,8 @@ __all__ = [
     "async_handle_cost_report",
     "async_handle_set_vacation_mode",
     "async_handle_pid_recommendations",
+    "async_handle_tune_pid",
+    "async_handle_export_data",
     # Registration functions
     "async_register_services",
     "async_unregister_services",
@@ -599,6 +810,7 @@ __all__ = [
     "async_scheduled_health_check",
     "async_scheduled_weekly_report",
     "async_daily_learning",
+    "async_calculate_pid_adjustments",
     # Helper functions (for internal use)
     "_run_health_check_core",
     "_run_weekly_report_core",
@@ -1,8 +1,10 @@
 """Scheduled task handlers for Adaptive Thermostat integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
+from functools import partial
 from typing import Any, TYPE_CHECKING
 
 # These imports are only needed when running in Home Assistant
@@ -16,6 +18,13 @@ except ImportError:
     dt_util = None
 
 from ..const import DOMAIN
+from ..metrics import (
+    METRIC_COMFORT_SCORE,
+    METRIC_CYCLE_TIME,
+    METRIC_DUTY_CYCLE,
+    METRIC_POWER_M2,
+    METRIC_TIME_AT_TARGET,
+)
 
 if TYPE_CHECKING:
     from ..coordinator import AdaptiveThermostatCoordinator
@@ -28,46 +37,66 @@ _LOGGER = logging.getLogger(__name__)
 # =============================================================================
 
 
+async def async_calculate_pid_adjustments(
+    hass: HomeAssistant,
+    requests: dict[str, tuple[Any, dict[str, Any]]],
+) -> dict[str, Any]:
+    """Calculate PID adjustments for several zones concurrently in the executor.
+
+    Each learner is snapshotted on the event loop, the snapshots are analysed
+    in parallel off the loop, and the rule hysteresis and rate limiting state
+    they changed is merged back on the loop.
+
+    Args:
+        requests: Mapping of zone_id to (adaptive_learner, kwargs for
+            calculate_pid_adjustment)
+
+    Returns:
+        Mapping of zone_id to the recommendation, None, or the raised exception
+    """
+    zone_ids = list(requests)
+    snapshots = [requests[zone_id][0].create_snapshot() for zone_id in zone_ids]
+    outcomes = await asyncio.gather(
+        *(
+            hass.async_add_executor_job(
+                partial(snapshot.calculate_pid_adjustment, **requests[zone_id][1])
+            )
+            for zone_id, snapshot in zip(zone_ids, snapshots)
+        ),
+        return_exceptions=True,
+    )
+
+    results: dict[str, Any] = {}
+    for zone_id, snapshot, outcome in zip(zone_ids, snapshots, outcomes):
+        if not isinstance(outcome, BaseException):
+            requests[zone_id][0].merge_snapshot(snapshot, outcome)
+        results[zone_id] = outcome
+    return results
+
+
 def _collect_zones_health_data(
     hass: HomeAssistant,
     coordinator: AdaptiveThermostatCoordinator,
 ) -> dict:
     """Collect health check data for all zones.
 
+    Cycle time and power per m² are read for all zones in one pass from the
+    coordinator's metrics registry, which the zone sensors publish into.
+
     Returns:
         Dictionary mapping zone_id to zone health data
     """
-    all_zones = coordinator.get_all_zones()
-    zones_data = {}
-
-    for zone_id in all_zones:
-        # Get cycle time sensor
-        cycle_time_sensor_id = f"sensor.{zone_id}_cycle_time"
-        cycle_time_state = hass.states.get(cycle_time_sensor_id)
-        cycle_time_min = None
-        if cycle_time_state and cycle_time_state.state not in ("unknown", "unavailable"):
-            try:
-                cycle_time_min = float(cycle_time_state.state)
-            except (ValueError, TypeError):
-                pass
-
-        # Get power/m2 sensor
-        power_m2_sensor_id = f"sensor.{zone_id}_power_m2"
-        power_m2_state = hass.states.get(power_m2_sensor_id)
-        power_w_m2 = None
-        if power_m2_state and power_m2_state.state not in ("unknown", "unavailable"):
-            try:
-                power_w_m2 = float(power_m2_state.state)
-            except (ValueError, TypeError):
-                pass
-
-        zones_data[zone_id] = {
-            "cycle_time_min": cycle_time_min,
-            "power_w_m2": power_w_m2,
+    zone_metrics = coordinator.metrics.collect(
+        coordinator.get_all_zones(), (METRIC_CYCLE_TIME, METRIC_POWER_M2)
+    )
+    return {
+        zone_id: {
+            "cycle_time_min": metrics[METRIC_CYCLE_TIME],
+            "power_w_m2": metrics[METRIC_POWER_M2],
             "sensor_available": True,
         }
-
-    return zones_data
+        for zone_id, metrics in zone_metrics.items()
+    }
 
 
 async def _run_health_check_core(
@@ -101,8 +130,11 @@ async def _run_health_check_core(
     # Collect zones data using shared helper
     zones_data = _collect_zones_health_data(hass, coordinator)
 
-    # Run health check
-    health_monitor = SystemHealthMonitor()
+    # Run health check (the monitor is kept so unchanged zones reuse their verdict)
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    health_monitor = domain_data.get("health_monitor")
+    if health_monitor is None:
+        health_monitor = domain_data["health_monitor"] = SystemHealthMonitor()
     health_result = health_monitor.check_all_zones(zones_data)
 
     status = health_result["status"]
@@ -182,7 +214,7 @@ async def _run_weekly_report_core(
     """
     from ..analytics.reports import WeeklyReport
     from ..analytics.history_store import HistoryStore, WeeklySnapshot, ZoneSnapshot
-    from ..analytics.charts import ChartGenerator, save_chart_to_www, cleanup_old_charts
+    from ..analytics.charts import ChartGenerator, async_get_charts
 
     _LOGGER.info("Generating weekly report with charts")
 
@@ -196,44 +228,30 @@ async def _run_weekly_report_core(
     history_store = HistoryStore(hass)
     await history_store.async_load()
 
-    # Collect data for each zone
+    # Collect data for each zone; sensor metrics for all zones in one pass
     all_zones = coordinator.get_all_zones()
+    zone_metrics = coordinator.metrics.collect(
+        all_zones, (METRIC_DUTY_CYCLE, METRIC_COMFORT_SCORE, METRIC_TIME_AT_TARGET)
+    )
     total_cost = 0.0
     has_energy_data = False
     zone_snapshots: dict[str, ZoneSnapshot] = {}
 
-    for zone_id in all_zones:
+    for zone_id, metrics in zone_metrics.items():
         zone_data = coordinator.get_zone_data(zone_id)
 
-        # Get duty cycle
-        duty_sensor_id = f"sensor.{zone_id}_duty_cycle"
-        duty_state = hass.states.get(duty_sensor_id)
-        duty_cycle = 0.0
-        if duty_state and duty_state.state not in ("unknown", "unavailable"):
-            try:
-                duty_cycle = float(duty_state.state)
-            except (ValueError, TypeError):
-                pass
-
-        # Get comfort score
-        comfort_sensor_id = f"sensor.{zone_id}_comfort_score"
-        comfort_state = hass.states.get(comfort_sensor_id)
-        comfort_score = None
-        if comfort_state and comfort_state.state not in ("unknown", "unavailable"):
-            try:
-                comfort_score = float(comfort_state.state)
-            except (ValueError, TypeError):
-                pass
-
-        # Get time at target
-        time_at_target_sensor_id = f"sensor.{zone_id}_time_at_target"
-        time_at_target_state = hass.states.get(time_at_target_sensor_id)
-        time_at_target = None
-        if time_at_target_state and time_at_target_state.state not in ("unknown", "unavailable"):
-            try:
-                time_at_target = float(time_at_target_state.state)
-            except (ValueError, TypeError):
-                pass
+        # Get duty cycle: time-weighted mean of the PWM heater state over the
+        # week from the telemetry store, or the duty cycle sensor (last
+        # measurement window) for valve zones and zones without heater state
+        telemetry = zone_data.get("telemetry") if zone_data else None
+        duty_cycle = None
+        if telemetry is not None and not zone_data.get("valve_mode"):
+            duty_cycle = telemetry.mean("duty", start_date.timestamp(), end_date.timestamp())
+        if duty_cycle is None:
+            duty_cycle = metrics[METRIC_DUTY_CYCLE] or 0.0
+
+        comfort_score = metrics[METRIC_COMFORT_SCORE]
+        time_at_target = metrics[METRIC_TIME_AT_TARGET]
 
         # Get zone area
         area_m2 = zone_data.get("area_m2") if zone_data else None
@@ -296,9 +314,9 @@ async def _run_weekly_report_core(
     # Save snapshot to history
     await history_store.async_save_snapshot(current_snapshot)
 
-    # Generate charts
+    # Generate charts (Pillow import, rendering and file I/O run in the executor)
     chart_url = None
-    chart_gen = ChartGenerator()
+    chart_gen = await hass.async_add_executor_job(ChartGenerator)
 
     if chart_gen.available:
         # Generate zone duty cycle chart
@@ -307,20 +325,18 @@ async def _run_weekly_report_core(
             for zone_id, data in report.zones.items()
         }
 
-        chart_bytes = chart_gen.create_bar_chart(
-            zone_duty_cycles,
-            title="Zone Activity This Week",
-            unit="%",
-            max_value=100,
-        )
-
-        if chart_bytes:
-            filename = f"weekly_{year}_{week_number:02d}_duty.png"
-            chart_url = await save_chart_to_www(hass, chart_bytes, filename)
-            _LOGGER.debug("Chart saved to %s", chart_url)
-
-        # Cleanup old charts
-        await cleanup_old_charts(hass)
+        # Unchanged charts are served from the cache without re-rendering
+        chart_urls = await async_get_charts(hass, {
+            "duty": chart_gen.request(
+                "bar",
+                zone_duty_cycles,
+                title="Zone Activity This Week",
+                unit="%",
+                max_value=100,
+            ),
+        })
+        chart_url = chart_urls["duty"]
+        _LOGGER.debug("Chart available at %s", chart_url)
 
     # Format and send report
     report_text = report.format_report()
@@ -428,6 +444,7 @@ async def async_daily_learning(
     all_zones = coordinator.get_all_zones()
     zones_analyzed = 0
     zones_with_adjustments = 0
+    requests: dict[str, tuple[Any, dict[str, Any]]] = {}
 
     for zone_id, zone_data in all_zones.items():
         adaptive_learner = zone_data.get("adaptive_learner")
@@ -443,53 +460,131 @@ async def async_daily_learning(
             _LOGGER.debug("Cannot get state for zone %s (%s)", zone_id, climate_entity_id)
             continue
 
-        current_kp = state.attributes.get("kp", 100.0)
-        current_ki = state.attributes.get("ki", 0.01)
-        current_kd = state.attributes.get("kd", 0.0)
-        pwm_seconds = zone_data.get("pwm_seconds", 0)
+        requests[zone_id] = (adaptive_learner, {
+            "current_kp": state.attributes.get("kp", 100.0),
+            "current_ki": state.attributes.get("ki", 0.01),
+            "current_kd": state.attributes.get("kd", 0.0),
+            "pwm_seconds": zone_data.get("pwm_seconds", 0),
+        })
 
-        try:
-            # Trigger learning analysis with current PID values
-            recommendation = adaptive_learner.calculate_pid_adjustment(
-                current_kp=current_kp,
-                current_ki=current_ki,
-                current_kd=current_kd,
-                pwm_seconds=pwm_seconds,
+    # Trigger learning analysis with current PID values, off the event loop
+    outcomes = await async_calculate_pid_adjustments(hass, requests)
+
+    for zone_id, recommendation in outcomes.items():
+        if isinstance(recommendation, Exception):
+            _LOGGER.error("Daily learning failed for zone %s: %s", zone_id, recommendation)
+            continue
+
+        zones_analyzed += 1
+        if recommendation is None:
+            _LOGGER.debug(
+                "Zone %s: insufficient data for recommendations",
+                zone_id,
+            )
+            continue
+
+        params = requests[zone_id][1]
+        current_kp = params["current_kp"]
+        current_ki = params["current_ki"]
+        current_kd = params["current_kd"]
+
+        # Calculate percentage changes
+        kp_change = ((recommendation["kp"] - current_kp) / current_kp * 100) if current_kp != 0 else 0
+        ki_change = ((recommendation["ki"] - current_ki) / current_ki * 100) if current_ki != 0 else 0
+        kd_change = ((recommendation["kd"] - current_kd) / current_kd * 100) if current_kd != 0 else 0
+
+        # Check if any significant adjustments were recommended (>1% change)
+        if abs(kp_change) > 1 or abs(ki_change) > 1 or abs(kd_change) > 1:
+            zones_with_adjustments += 1
+            _LOGGER.info(
+                "Zone %s PID recommendation: Kp=%.2f (%.1f%%), Ki=%.4f (%.1f%%), Kd=%.2f (%.1f%%)",
+                zone_id,
+                recommendation["kp"], kp_change,
+                recommendation["ki"], ki_change,
+                recommendation["kd"], kd_change,
+            )
+        else:
+            _LOGGER.debug(
+                "Zone %s: no significant PID adjustments needed",
+                zone_id,
             )
-            zones_analyzed += 1
-
-            if recommendation is None:
-                _LOGGER.debug(
-                    "Zone %s: insufficient data for recommendations",
-                    zone_id,
-                )
-                continue
-
-            # Calculate percentage changes
-            kp_change = ((recommendation["kp"] - current_kp) / current_kp * 100) if current_kp != 0 else 0
-            ki_change = ((recommendation["ki"] - current_ki) / current_ki * 100) if current_ki != 0 else 0
-            kd_change = ((recommendation["kd"] - current_kd) / current_kd * 100) if current_kd != 0 else 0
-
-            # Check if any significant adjustments were recommended (>1% change)
-            if abs(kp_change) > 1 or abs(ki_change) > 1 or abs(kd_change) > 1:
-                zones_with_adjustments += 1
-                _LOGGER.info(
-                    "Zone %s PID recommendation: Kp=%.2f (%.1f%%), Ki=%.4f (%.1f%%), Kd=%.2f (%.1f%%)",
-                    zone_id,
-                    recommendation["kp"], kp_change,
-                    recommendation["ki"], ki_change,
-                    recommendation["kd"], kd_change,
-                )
-            else:
-                _LOGGER.debug(
-                    "Zone %s: no significant PID adjustments needed",
-                    zone_id,
-                )
-        except Exception as e:
-            _LOGGER.error("Daily learning failed for zone %s: %s", zone_id, e)
 
     _LOGGER.info(
         "Daily learning complete: %d zones analyzed, %d with recommended adjustments",
         zones_analyzed,
         zones_with_adjustments,
     )
+
+    await async_identify_zone_models(hass, coordinator)
+
+
+def _get_sysid_columns(
+    zone_data: dict[str, Any],
+) -> tuple[list[float], list[float], list[float], list[float]] | None:
+    """Return (timestamps, indoor, outdoor, output) columns for system identification.
+
+    Uses the in-memory ThermalHistory, or the persisted raw telemetry tier when
+    it holds more samples (e.g. shortly after a restart).
+    """
+    history = zone_data.get("thermal_history")
+    telemetry = zone_data.get("telemetry")
+    history_len = len(history) if history is not None else 0
+
+    if telemetry is not None and telemetry.sample_count("raw") > history_len:
+        timestamps, values = telemetry.columns(tier="raw")
+        return timestamps, values["temperature"], values["outdoor_temp"], values["control_output"]
+    if history is not None:
+        return history.as_columns()
+    return None
+
+
+async def async_identify_zone_models(
+    hass: HomeAssistant,
+    coordinator: AdaptiveThermostatCoordinator,
+) -> int:
+    """Fit zone thermal models from recorded history and apply them.
+
+    Each fit runs in the executor; results are applied on the event loop to
+    the zone's climate entity (preheat fallback rate, manifold transport delay,
+    persisted time constant).
+
+    Returns:
+        Number of zones with an applied model
+    """
+    try:
+        from ..adaptive.sysid import SYSID_MIN_ROWS, fit_fopdt
+    except ImportError:
+        return 0
+
+    entity_component = hass.data.get("climate")
+    zones_identified = 0
+
+    for zone_id, zone_data in coordinator.get_all_zones().items():
+        columns = _get_sysid_columns(zone_data)
+        if columns is None or len(columns[0]) < SYSID_MIN_ROWS:
+            continue
+
+        try:
+            result = await hass.async_add_executor_job(fit_fopdt, *columns)
+        except ImportError:
+            _LOGGER.debug("System identification unavailable (numpy required)")
+            return zones_identified
+        except Exception as e:
+            _LOGGER.error("System identification failed for zone %s: %s", zone_id, e)
+            continue
+
+        if result is None:
+            _LOGGER.debug("Zone %s: recorded history insufficient for system identification", zone_id)
+            continue
+
+        climate_entity_id = zone_data.get("climate_entity_id")
+        thermostat = entity_component.get_entity(climate_entity_id) if entity_component else None
+        if thermostat is None:
+            continue
+
+        thermostat.apply_system_identification(result)
+        zones_identified += 1
+
+    if zones_identified:
+        _LOGGER.info("System identification complete: %d zones updated", zones_identified)
+    return zones_identified
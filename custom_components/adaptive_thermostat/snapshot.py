@@ -0,0 +1,84 @@
+"""Read-only coordinator snapshots for Adaptive Thermostat.
+
+The coordinator publishes a CoordinatorSnapshot on every update. Each snapshot
+carries a version that only increases when its content changes, so sensors can
+remember the version they last rendered and skip recomputation when nothing
+new has been published. Snapshots are immutable and never share the live zone
+dicts, so they are safe to hold across updates.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping
+
+
+@dataclass(frozen=True)
+class ZoneSnapshot:
+    """Precomputed state of one zone at the time a snapshot was taken."""
+
+    zone_id: str
+    climate_entity_id: str | None = None
+    current_temp: float | None = None
+    demand: bool = False
+    mode: str | None = None
+    # Learner summary over the heating cycle history (None without data)
+    cycle_count: int = 0
+    avg_overshoot: float | None = None
+    avg_settling_time: float | None = None
+    avg_oscillations: float | None = None
+
+
+@dataclass(frozen=True)
+class CoordinatorSnapshot:
+    """Versioned, read-only view of all zones."""
+
+    version: int
+    zones: Mapping[str, ZoneSnapshot] = field(default_factory=lambda: MappingProxyType({}))
+    aggregate_demand: Mapping[str, bool] = field(
+        default_factory=lambda: MappingProxyType({"heating": False, "cooling": False})
+    )
+
+    def get_zone(self, zone_id: str) -> ZoneSnapshot | None:
+        """Return the snapshot of a zone, or None if it was not registered."""
+        return self.zones.get(zone_id)
+
+
+def build_zone_snapshot(
+    zone_id: str,
+    zone_data: dict[str, Any],
+    demand_state: dict[str, Any] | None = None,
+) -> ZoneSnapshot:
+    """Build a zone snapshot from coordinator zone data.
+
+    Args:
+        zone_id: Unique identifier for the zone
+        zone_data: Zone data dict as registered with the coordinator
+        demand_state: Demand state dict with "demand" and "mode" keys
+
+    Returns:
+        ZoneSnapshot with learner summary statistics
+    """
+    demand_state = demand_state or {}
+    cycle_count = 0
+    avg_overshoot = avg_settling_time = avg_oscillations = None
+
+    learner = zone_data.get("adaptive_learner")
+    if learner is not None:
+        stats = learner.get_cycle_stats()
+        cycle_count = stats.cycle_count
+        avg_overshoot = stats.overshoot.mean
+        avg_settling_time = stats.settling_time.mean
+        avg_oscillations = stats.oscillations.mean
+
+    return ZoneSnapshot(
+        zone_id=zone_id,
+        climate_entity_id=zone_data.get("climate_entity_id"),
+        current_temp=zone_data.get("current_temp"),
+        demand=bool(demand_state.get("demand")),
+        mode=demand_state.get("mode"),
+        cycle_count=cycle_count,
+        avg_overshoot=avg_overshoot,
+        avg_settling_time=avg_settling_time,
+        avg_oscillations=avg_oscillations,
+    )
@@ -0,0 +1,201 @@
+"""Tests for the vectorized BatchPID engine."""
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+# Add parent directory to path to import pid_controller
+sys.path.insert(0, str(Path(__file__).parent.parent / "custom_components" / "adaptive_thermostat"))
+
+from pid_controller import PID
+from pid_controller.batch import (
+    BatchPID,
+    CLAMP_NONE,
+    CLAMP_SAFETY_NET,
+    CLAMP_TOLERANCE,
+)
+
+_REASON_CODES = {None: CLAMP_NONE, "tolerance": CLAMP_TOLERANCE, "safety_net": CLAMP_SAFETY_NET}
+
+
+def _random_controllers(count, seed=1234):
+    """Build scalar controllers with varied gains, heating types and options."""
+    rng = random.Random(seed)
+    heating_types = ["floor_hydronic", "radiator", "convector", "forced_air"]
+    pids = []
+    for i in range(count):
+        pid = PID(
+            kp=rng.uniform(5, 80),
+            ki=rng.uniform(0.1, 40),
+            kd=rng.uniform(0, 3000),
+            ke=rng.uniform(0, 1.5),
+            ke_wind=rng.uniform(0, 0.05),
+            out_min=0 if i % 3 else -100,
+            out_max=100,
+            cold_tolerance=rng.uniform(0.1, 0.5),
+            hot_tolerance=rng.uniform(0.1, 0.5),
+            derivative_filter_alpha=rng.uniform(0.05, 1.0),
+            outdoor_temp_lag_tau=rng.uniform(1, 6),
+            integral_decay_multiplier=rng.uniform(1.0, 3.0),
+            integral_exp_decay_tau=rng.choice([None, 0.5, 2.0]),
+            heating_type=heating_types[i % len(heating_types)],
+        )
+        if i % 4 == 0:
+            pid.set_transport_delay(rng.uniform(2, 20))
+        if i % 5 == 0:
+            pid.set_auto_apply_count(1)
+        pids.append(pid)
+    return pids
+
+
+def _build_trace(steps, seed=99):
+    """Build a trace with mixed sensor intervals including rapid non-sensor calls."""
+    rng = random.Random(seed)
+    t = 1_000_000.0
+    trace = []
+    temp = 19.0
+    for i in range(steps):
+        t += rng.choice([60.0, 60.0, 120.0, 3.0, 300.0])
+        temp += rng.uniform(-0.15, 0.2)
+        setpoint = 21.0 if (i // 80) % 2 == 0 else 18.5
+        ext = 5.0 + 4.0 * np.sin(i / 50.0)
+        wind = rng.choice([None, rng.uniform(0, 8)])
+        trace.append((temp, setpoint, t, ext, wind))
+    return trace
+
+
+class TestBatchPIDConformance:
+    """Compare BatchPID step-by-step against scalar PID."""
+
+    def test_matches_scalar_pid_over_trace(self):
+        """Test that every controller output and internal term matches scalar PID."""
+        pids = _random_controllers(40)
+        batch = BatchPID.from_controllers(pids)
+        trace = _build_trace(400)
+
+        last_time = None
+        for step, (temp, setpoint, t, ext, wind) in enumerate(trace):
+            if step == 150:
+                for pid in pids:
+                    pid.set_feedforward(3.0)
+                batch.set_feedforward(3.0)
+            expected = [pid.calc(temp, setpoint, t, last_time, ext, wind) for pid in pids]
+            output, updated = batch.calc(temp, setpoint, t, last_time, ext, wind)
+            last_time = t
+
+            np.testing.assert_allclose(output, [o for o, _ in expected], rtol=1e-9, atol=1e-9)
+            assert all(updated)
+            np.testing.assert_allclose(batch.integral, [p.integral for p in pids], rtol=1e-9, atol=1e-9)
+            np.testing.assert_allclose(batch.derivative, [p.derivative for p in pids], rtol=1e-9, atol=1e-9)
+            np.testing.assert_allclose(batch.proportional, [p.proportional for p in pids], rtol=1e-9, atol=1e-9)
+            np.testing.assert_allclose(batch.external, [p.external for p in pids], rtol=1e-9, atol=1e-9)
+            assert list(batch.was_clamped) == [p.was_clamped for p in pids]
+            assert list(batch.clamp_reason) == [_REASON_CODES[p.clamp_reason] for p in pids]
+
+    def test_matches_scalar_pid_without_outdoor_temp(self):
+        """Test conformance when no outdoor temperature is supplied."""
+        pids = _random_controllers(12, seed=7)
+        batch = BatchPID.from_controllers(pids)
+
+        last_time = None
+        for temp, setpoint, t, _ext, wind in _build_trace(200, seed=3):
+            expected = [pid.calc(temp, setpoint, t, last_time, None, wind)[0] for pid in pids]
+            output, _ = batch.calc(temp, setpoint, t, last_time, None, wind)
+            last_time = t
+            np.testing.assert_allclose(output, expected, rtol=1e-9, atol=1e-9)
+
+    def test_per_controller_inputs(self):
+        """Test that each controller can receive its own measurement and setpoint."""
+        pids = _random_controllers(6, seed=5)
+        batch = BatchPID.from_controllers(pids)
+
+        last_time = None
+        for step in range(100):
+            t = step * 60.0
+            temps = [18.0 + 0.02 * step + 0.3 * i for i in range(len(pids))]
+            setpoints = [20.0 + 0.1 * i for i in range(len(pids))]
+            expected = [
+                pid.calc(temps[i], setpoints[i], t, last_time, 4.0)[0]
+                for i, pid in enumerate(pids)
+            ]
+            output, _ = batch.calc(temps, setpoints, t, last_time, 4.0)
+            last_time = t
+            np.testing.assert_allclose(output, expected, rtol=1e-9, atol=1e-9)
+
+    def test_matches_safety_net_and_dead_time_split(self):
+        """Test conformance while the decay safety net and dead time split are active."""
+        pids = []
+        for heating_type in ("floor_hydronic", "radiator", "forced_air"):
+            pid = PID(kp=20, ki=30, kd=500, out_min=0, out_max=100, cold_tolerance=0.4,
+                      heating_type=heating_type, integral_decay_multiplier=2.0)
+            pid.integral = 70.0
+            pid.set_transport_delay(4.5)
+            pids.append(pid)
+        batch = BatchPID.from_controllers(pids)
+
+        last_time = None
+        saw_safety_net = False
+        for step in range(60):
+            t = step * 60.0
+            temp = 19.7 + 0.012 * step
+            expected = [pid.calc(temp, 20.0, t, last_time)[0] for pid in pids]
+            output, _ = batch.calc(temp, 20.0, t, last_time)
+            last_time = t
+            np.testing.assert_allclose(output, expected, rtol=1e-9, atol=1e-9)
+            np.testing.assert_allclose(batch.integral, [p.integral for p in pids], rtol=1e-9, atol=1e-9)
+            saw_safety_net |= any(p.clamp_reason == "safety_net" for p in pids)
+            assert list(batch.clamp_reason) == [_REASON_CODES[p.clamp_reason] for p in pids]
+
+        assert saw_safety_net
+
+
+class TestBatchPIDBehavior:
+    """Test BatchPID construction and invalid input handling."""
+
+    def test_size_inferred_from_array_gains(self):
+        """Test that scalar parameters broadcast against per-controller gains."""
+        batch = BatchPID(kp=[10, 20, 30], ki=1.0, kd=0, out_min=0, out_max=100)
+
+        assert batch.size == 3
+        assert batch.output.shape == (3,)
+
+    def test_mismatched_lengths_rejected(self):
+        """Test that arrays of different lengths raise ValueError."""
+        with pytest.raises(ValueError):
+            BatchPID(kp=[10, 20, 30], ki=[1.0, 2.0], kd=0, out_min=0, out_max=100)
+
+    def test_invalid_limits_rejected(self):
+        """Test that out_min >= out_max raises ValueError like PID."""
+        with pytest.raises(ValueError):
+            BatchPID(kp=[10, 20], ki=1.0, kd=0, out_min=[0, 100], out_max=100)
+
+    def test_non_finite_input_keeps_previous_state(self):
+        """Test that controllers given NaN keep state and report not updated."""
+        batch = BatchPID(kp=[10, 10], ki=1.2, kd=0, out_min=0, out_max=100)
+        batch.calc(19.0, 20.0, 0.0)
+        output, updated = batch.calc(19.0, 20.0, 300.0)
+        before_integral = batch.integral.copy()
+        before_output = output.copy()
+
+        output, updated = batch.calc([float("nan"), 19.0], 20.0, 600.0)
+
+        assert list(updated) == [False, True]
+        assert output[0] == before_output[0]
+        assert batch.integral[0] == before_integral[0]
+        assert batch.integral[1] > before_integral[1]
+
+    def test_default_last_input_time_uses_previous_sample(self):
+        """Test that omitting last_input_time uses each controller's previous time."""
+        pid = PID(kp=10, ki=1.2, kd=100, out_min=0, out_max=100)
+        batch = BatchPID.from_controllers([pid])
+
+        pid.calc(19.0, 20.0, 0.0, None)
+        expected, _ = pid.calc(19.2, 20.0, 120.0, 0.0)
+        batch.calc(19.0, 20.0, 0.0)
+        output, _ = batch.calc(19.2, 20.0, 120.0)
+
+        assert batch.dt[0] == 120.0
+        assert output[0] == pytest.approx(expected)
@@ -56,6 +56,15 @@ import coordinator
 import central_controller
 
 
+def _called_entities(calls):
+    """Flatten entity IDs across service calls (single or batched lists)."""
+    entities = []
+    for call in calls:
+        entity_id = call.args[2]["entity_id"]
+        entities.extend(entity_id if isinstance(entity_id, list) else [entity_id])
+    return entities
+
+
 @pytest.fixture
 def mock_hass():
     """Create a mock Home Assistant instance."""
@@ -104,6 +113,33 @@ async def test_heater_on_when_zone_demands(mock_hass, coord):
     )
 
 
+def test_has_unmet_demand(mock_hass, coord):
+    """Test unmet demand is reported while a demanded switch is not on."""
+    controller = central_controller.CentralController(
+        mock_hass,
+        coord,
+        main_heater_switch=["switch.boiler", "switch.pump"],
+        main_cooler_switch=["switch.chiller"],
+    )
+    states = {"switch.boiler": "on", "switch.pump": "off", "switch.chiller": "off"}
+    mock_hass.states.get.side_effect = lambda entity_id: Mock(state=states[entity_id])
+    coord.register_zone("living_room", {"name": "Living Room"})
+
+    # No demand: switches being off is expected
+    assert controller.has_unmet_demand() is False
+
+    coord.update_zone_demand("living_room", True, hvac_mode="heat")
+    assert controller.has_unmet_demand() is True
+
+    # A pending startup delay is not unmet demand
+    controller._heater_waiting_for_startup = True
+    assert controller.has_unmet_demand() is False
+    controller._heater_waiting_for_startup = False
+
+    states["switch.pump"] = "on"
+    assert controller.has_unmet_demand() is False
+
+
 @pytest.mark.asyncio
 async def test_heater_off_when_no_demand(mock_hass, coord, monkeypatch):
     """Test heater turns off when no zone has demand (after debounce)."""
@@ -937,11 +973,11 @@ async def test_multiple_heaters_all_turn_on(mock_hass, coord):
     # Update controller
     await controller.update()
 
-    # Verify all three switches were turned on
+    # Verify all three switches were turned on in one batched call
     calls = mock_hass.services.async_call.call_args_list
-    assert len(calls) == 3
+    assert len(calls) == 1
 
-    turned_on_entities = [call.args[2]["entity_id"] for call in calls]
+    turned_on_entities = _called_entities(calls)
     assert "switch.boiler" in turned_on_entities
     assert "switch.pump" in turned_on_entities
     assert "switch.valve" in turned_on_entities
@@ -977,10 +1013,9 @@ async def test_multiple_heaters_all_turn_off(mock_hass, coord, monkeypatch):
 
     # Verify all switches were turned off
     calls = mock_hass.services.async_call.call_args_list
-    assert len(calls) == 2
-
-    for call in calls:
-        assert call.args[1] == "turn_off"
+    assert len(calls) == 1
+    assert calls[0].args[1] == "turn_off"
+    assert _called_entities(calls) == ["switch.boiler", "switch.pump"]
 
 
 @pytest.mark.asyncio
@@ -1006,9 +1041,9 @@ async def test_multiple_coolers_all_turn_on(mock_hass, coord):
 
     # Verify both cooler switches were turned on
     calls = mock_hass.services.async_call.call_args_list
-    assert len(calls) == 2
+    assert len(calls) == 1
 
-    turned_on_entities = [call.args[2]["entity_id"] for call in calls]
+    turned_on_entities = _called_entities(calls)
     assert "switch.chiller" in turned_on_entities
     assert "switch.fan" in turned_on_entities
 
@@ -1038,9 +1073,9 @@ async def test_multiple_heaters_and_coolers(mock_hass, coord):
 
     # Verify only heater switches were turned on (not coolers)
     calls = mock_hass.services.async_call.call_args_list
-    assert len(calls) == 2
+    assert len(calls) == 1
 
-    turned_on_entities = [call.args[2]["entity_id"] for call in calls]
+    turned_on_entities = _called_entities(calls)
     assert "switch.boiler" in turned_on_entities
     assert "switch.pump" in turned_on_entities
     assert "switch.chiller" not in turned_on_entities
@@ -1062,14 +1097,12 @@ async def test_multiple_heaters_partial_failure_continues(mock_hass, coord):
     mock_state.state = "off"
     mock_hass.states.get.return_value = mock_state
 
-    # First call fails, second succeeds
+    # Batched call fails, then boiler keeps failing while pump succeeds
     call_count = [0]
-    async def mock_service_call(*args, **kwargs):
+    async def mock_service_call(domain, service, data, **kwargs):
         call_count[0] += 1
-        if call_count[0] <= central_controller.MAX_SERVICE_CALL_RETRIES:
-            # First entity fails all retries
+        if data["entity_id"] != "switch.pump":
             raise MockHomeAssistantError("Transient error")
-        # Second entity succeeds
         return None
 
     mock_hass.services.async_call = AsyncMock(side_effect=mock_service_call)
@@ -1082,8 +1115,10 @@ async def test_multiple_heaters_partial_failure_continues(mock_hass, coord):
     await controller.update()
 
     # Verify both entities were attempted
-    # First entity: 3 retries, second entity: 1 success
+    # Batched call, then boiler: remaining retries, pump: 1 success
     assert call_count[0] == central_controller.MAX_SERVICE_CALL_RETRIES + 1
+    assert controller.get_consecutive_failures("switch.boiler") == 1
+    assert controller.get_consecutive_failures("switch.pump") == 0
 
 
 @pytest.mark.asyncio
@@ -1164,9 +1199,9 @@ async def test_multiple_heaters_with_startup_delay(mock_hass, coord):
 
     # Now both heaters should be on
     calls = mock_hass.services.async_call.call_args_list
-    assert len(calls) == 2
+    assert len(calls) == 1
 
-    turned_on_entities = [call.args[2]["entity_id"] for call in calls]
+    turned_on_entities = _called_entities(calls)
     assert "switch.boiler" in turned_on_entities
     assert "switch.pump" in turned_on_entities
 
@@ -1252,9 +1287,9 @@ async def test_heater_turns_on_when_one_switch_already_on(mock_hass, coord):
 
     # Both switches should be turned on (even though boiler was already on)
     calls = mock_hass.services.async_call.call_args_list
-    assert len(calls) == 2
+    assert len(calls) == 1
 
-    turned_on_entities = [call.args[2]["entity_id"] for call in calls]
+    turned_on_entities = _called_entities(calls)
     assert "switch.boiler" in turned_on_entities
     assert "switch.pump" in turned_on_entities
 
@@ -1460,8 +1495,7 @@ async def test_shared_switch_turns_off_when_both_modes_stop(mock_hass, coord, mo
     # Check calls - both boiler and pump should turn off
     calls = [call.args for call in mock_hass.services.async_call.call_args_list]
 
-    assert ("switch", "turn_off", {"entity_id": "switch.boiler"}) in calls
-    assert ("switch", "turn_off", {"entity_id": "switch.pump"}) in calls
+    assert ("switch", "turn_off", {"entity_id": ["switch.boiler", "switch.pump"]}) in calls
 
 
 @pytest.mark.asyncio
@@ -1554,3 +1588,47 @@ async def test_no_shared_switches_normal_behavior(mock_hass, coord, monkeypatch)
     calls = [call.args for call in mock_hass.services.async_call.call_args_list]
 
     assert ("switch", "turn_off", {"entity_id": "switch.boiler"}) in calls
+
+
+# ========================================
+# Batched Service Call Tests
+# ========================================
+
+
+@pytest.mark.asyncio
+async def test_switches_batched_per_domain(mock_hass, coord):
+    """Test switches are turned on with one service call per entity domain."""
+    controller = central_controller.CentralController(
+        mock_hass,
+        coord,
+        main_heater_switch=["switch.boiler", "input_boolean.pump", "switch.valve"],
+        startup_delay_seconds=0,
+    )
+
+    result = await controller._turn_on_switches(controller.main_heater_switch)
+
+    assert result is True
+    calls = {call.args[0]: call for call in mock_hass.services.async_call.call_args_list}
+    assert len(calls) == 2
+    assert calls["switch"].args[2] == {"entity_id": ["switch.boiler", "switch.valve"]}
+    assert calls["input_boolean"].args[2] == {"entity_id": "input_boolean.pump"}
+    assert calls["switch"].kwargs.get("blocking") is True
+
+
+@pytest.mark.asyncio
+async def test_batched_service_not_found_records_each_entity(mock_hass, coord):
+    """Test a batched ServiceNotFound fails every entity without retrying."""
+    controller = central_controller.CentralController(
+        mock_hass,
+        coord,
+        main_heater_switch=["switch.boiler", "switch.pump"],
+        startup_delay_seconds=0,
+    )
+    mock_hass.services.async_call = AsyncMock(side_effect=MockServiceNotFound("missing"))
+
+    result = await controller._turn_on_switches(controller.main_heater_switch)
+
+    assert result is False
+    assert mock_hass.services.async_call.call_count == 1
+    assert controller.get_consecutive_failures("switch.boiler") == 1
+    assert controller.get_consecutive_failures("switch.pump") == 1
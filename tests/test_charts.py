@@ -1,12 +1,17 @@
 """Tests for chart generation."""
+import os
+import time
 from unittest.mock import MagicMock, patch, AsyncMock
 import pytest
 
+from custom_components.adaptive_thermostat.analytics import charts as charts_module
 from custom_components.adaptive_thermostat.analytics.charts import (
     ChartGenerator,
-    save_chart_to_www,
-    cleanup_old_charts,
+    ChartRequest,
+    async_get_charts,
     _get_comfort_color,
+    _get_font,
+    _write_chart,
     COLOR_BAR_SUCCESS,
     COLOR_BAR_WARNING,
     COLOR_BAR_SECONDARY,
@@ -20,6 +25,16 @@ except ImportError:
     PIL_AVAILABLE = False
 
 
+def _mock_hass():
+    """Create a mock hass whose executor runs jobs inline."""
+    mock_hass = MagicMock()
+    mock_hass.config.path.return_value = "/config"
+    mock_hass.async_add_executor_job = AsyncMock(
+        side_effect=lambda func, *args: func(*args)
+    )
+    return mock_hass
+
+
 def test_get_comfort_color_good():
     """Test comfort color for good scores (>= 80)."""
     assert _get_comfort_color(80) == COLOR_BAR_SUCCESS
@@ -149,71 +164,120 @@ def test_chart_generator_comparison_chart():
                         assert mock_draw.rectangle.called
 
 
-@pytest.mark.asyncio
-async def test_save_chart_to_www():
-    """Test saving chart to www directory."""
-    mock_hass = MagicMock()
-    mock_hass.config.path.return_value = "/config"
+def test_write_chart_replaces_atomically(tmp_path):
+    """Test chart writes go through a temp file and leave only the PNG."""
+    chart_dir = tmp_path / "adaptive_thermostat"
 
-    chart_bytes = b"PNG_IMAGE_DATA"
+    path = _write_chart(chart_dir, b"PNG_v1", "chart_abc.png")
+    _write_chart(chart_dir, b"PNG_v2", "chart_abc.png")
 
-    with patch("pathlib.Path.mkdir") as mock_mkdir:
-        with patch("pathlib.Path.write_bytes") as mock_write:
-            url = await save_chart_to_www(mock_hass, chart_bytes, "test_chart.png")
+    assert path == chart_dir / "chart_abc.png"
+    assert path.read_bytes() == b"PNG_v2"
+    assert [p.name for p in chart_dir.iterdir()] == ["chart_abc.png"]
 
-            mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
-            mock_write.assert_called_once_with(chart_bytes)
-            assert url == "/local/adaptive_thermostat/test_chart.png"
 
+def test_write_chart_keeps_previous_file_on_error(tmp_path):
+    """Test a failed write neither truncates the chart nor leaves a temp file."""
+    chart_dir = tmp_path / "adaptive_thermostat"
+    _write_chart(chart_dir, b"PNG_v1", "chart_abc.png")
 
-@pytest.mark.asyncio
-async def test_save_chart_to_www_error():
-    """Test save_chart_to_www handles errors gracefully."""
-    mock_hass = MagicMock()
-    mock_hass.config.path.return_value = "/config"
+    with patch.object(charts_module.os, "replace", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            _write_chart(chart_dir, b"PNG_v2", "chart_abc.png")
+
+    assert [p.name for p in chart_dir.iterdir()] == ["chart_abc.png"]
+    assert (chart_dir / "chart_abc.png").read_bytes() == b"PNG_v1"
+
+
+def test_chart_request_key_follows_inputs():
+    """Test chart keys change with data, order and dimensions only."""
+    gen = ChartGenerator()
+    data = {"Living Room": 45.0, "Bedroom": 30.0}
 
-    chart_bytes = b"PNG_IMAGE_DATA"
+    key = gen.request("bar", data, title="Activity", unit="%").key
 
-    with patch("pathlib.Path.mkdir", side_effect=OSError("Permission denied")):
-        url = await save_chart_to_www(mock_hass, chart_bytes, "test_chart.png")
+    assert gen.request("bar", dict(data), unit="%", title="Activity").key == key
+    assert gen.request("bar", {"Living Room": 45.0, "Bedroom": 31.0}, title="Activity", unit="%").key != key
+    assert gen.request("bar", {"Bedroom": 30.0, "Living Room": 45.0}, title="Activity", unit="%").key != key
+    assert gen.request("comfort", data, title="Activity").key != key
+    assert ChartGenerator(width=800).request("bar", data, title="Activity", unit="%").key != key
 
-        assert url is None
+
+def _counting_request(key, calls):
+    def render():
+        calls.append(key)
+        return b"PNG_" + key.encode()
+
+    return ChartRequest(key=key, render=render)
 
 
 @pytest.mark.asyncio
-async def test_cleanup_old_charts():
-    """Test cleanup of old chart files."""
-    from datetime import timedelta
-    from pathlib import Path
-    from homeassistant.util import dt as dt_util
+async def test_async_get_charts_reuses_cached_file(tmp_path):
+    """Test an unchanged chart is served from the existing PNG."""
+    mock_hass = _mock_hass()
+    mock_hass.config.path.return_value = str(tmp_path)
+    calls = []
 
-    mock_hass = MagicMock()
-    mock_hass.config.path.return_value = "/config"
+    first = await async_get_charts(mock_hass, {"duty": _counting_request("abc", calls)})
+    second = await async_get_charts(mock_hass, {"duty": _counting_request("abc", calls)})
+
+    assert first == second == {"duty": "/local/adaptive_thermostat/chart_abc.png"}
+    assert calls == ["abc"]
+    assert (tmp_path / "adaptive_thermostat" / "chart_abc.png").read_bytes() == b"PNG_abc"
+
+
+@pytest.mark.asyncio
+async def test_async_get_charts_failed_render(tmp_path):
+    """Test charts that fail or render nothing map to None."""
+    mock_hass = _mock_hass()
+    mock_hass.config.path.return_value = str(tmp_path)
+
+    def failing():
+        raise ValueError("bad data")
 
-    # Create mock files
-    # Note: datetime.fromtimestamp() in charts.py will compare to dt_util.utcnow()
-    # For this test to work, we need to create timestamps that are clearly old vs new
-    now = dt_util.utcnow()
-    old_timestamp = (now - timedelta(weeks=6)).timestamp()
-    new_timestamp = now.timestamp()
+    urls = await async_get_charts(mock_hass, {
+        "empty": ChartRequest(key="empty", render=lambda: None),
+        "broken": ChartRequest(key="broken", render=failing),
+    })
 
-    old_file = MagicMock(spec=Path)
-    old_file.stat.return_value.st_mtime = old_timestamp
+    assert urls == {"empty": None, "broken": None}
 
-    new_file = MagicMock(spec=Path)
-    new_file.stat.return_value.st_mtime = new_timestamp
 
-    mock_www_dir = MagicMock(spec=Path)
-    mock_www_dir.exists.return_value = True
-    mock_www_dir.glob.return_value = [old_file, new_file]
+@pytest.mark.asyncio
+async def test_async_get_charts_evicts_least_recently_used(tmp_path):
+    """Test the chart directory is capped, keeping recently used charts."""
+    mock_hass = _mock_hass()
+    mock_hass.config.path.return_value = str(tmp_path)
+    chart_dir = tmp_path / "adaptive_thermostat"
+    chart_dir.mkdir()
+    for age, name in enumerate(["chart_new.png", "chart_old.png", "weekly_2024_01_duty.png"]):
+        path = chart_dir / name
+        path.write_bytes(b"PNG")
+        mtime = time.time() - 3600 * (age + 1)
+        os.utime(path, (mtime, mtime))
+
+    # Using the oldest chart makes it the most recently used one
+    await async_get_charts(
+        mock_hass, {"duty": _counting_request("old", [])}, max_files=2
+    )
 
-    with patch("pathlib.Path.__truediv__", return_value=mock_www_dir):
-        with patch("pathlib.Path.exists", return_value=True):
-            await cleanup_old_charts(mock_hass, keep_weeks=4)
+    assert sorted(path.name for path in chart_dir.iterdir()) == ["chart_new.png", "chart_old.png"]
 
-            # Old file should be unlinked, new file should not
-            old_file.unlink.assert_called_once()
-            new_file.unlink.assert_not_called()
+
+
+@pytest.mark.skipif(not PIL_AVAILABLE, reason="PIL (Pillow) not installed")
+def test_fonts_loaded_once_per_thread():
+    """Test TrueType fonts are cached across charts."""
+    charts_module._font_cache.fonts = {}
+    font = MagicMock()
+
+    with patch("PIL.ImageFont.truetype", return_value=font) as mock_truetype:
+        assert _get_font("/fonts/test.ttf", 12) is font
+        assert _get_font("/fonts/test.ttf", 12) is font
+        assert _get_font("/fonts/test.ttf", 16) is font
+
+    assert mock_truetype.call_count == 2
+    charts_module._font_cache.fonts = {}
 
 
 def test_chart_dimensions():
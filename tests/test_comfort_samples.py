@@ -0,0 +1,113 @@
+"""Tests for the per-zone comfort sample ring."""
+import pytest
+
+from custom_components.adaptive_thermostat.analytics.comfort_samples import ComfortSamples
+
+T0 = 1_700_000_000.0
+
+
+def _brute_force(samples, now, window, tolerance):
+    """Reference time-weighted time at target and mean deviation.
+
+    Each (t, temp, setpoint) sample holds until the next one, the newest
+    until ``now``, clipped to the window.
+    """
+    cutoff = now - window
+    covered = in_band = weighted = 0.0
+    for i, (t, temp, setpoint) in enumerate(samples):
+        end = samples[i + 1][0] if i + 1 < len(samples) else now
+        seconds = max(0.0, end - max(t, cutoff))
+        deviation = abs(temp - setpoint)
+        covered += seconds
+        weighted += seconds * deviation
+        if deviation <= tolerance:
+            in_band += seconds
+    if not covered:
+        return 0.0, None
+    return in_band / covered * 100.0, weighted / covered
+
+
+class TestComfortSamples:
+    """Tests for ComfortSamples."""
+
+    def test_time_weighted(self):
+        """Test each sample holds until the next one, the newest until now."""
+        ring = ComfortSamples(window_seconds=600, tolerance=0.5)
+        ring.append(T0, 21.0, 21.0)
+        ring.append(T0 + 300, 22.0, 21.0)
+
+        # Only the first interval has elapsed
+        assert ring.time_at_target(T0 + 300) == 100.0
+        assert ring.mean_deviation(T0 + 300) == pytest.approx(0.0)
+
+        # Oldest interval clipped to the window start
+        assert ring.time_at_target(T0 + 601) == pytest.approx(299 / 600 * 100.0)
+        assert ring.mean_deviation(T0 + 601) == pytest.approx(301 / 600)
+        assert ring.window_count(T0 + 601) == 2
+
+        # Newest sample still holds after the first interval expires
+        assert ring.time_at_target(T0 + 2000) == 0.0
+        assert ring.mean_deviation(T0 + 2000) == pytest.approx(1.0)
+        assert ring.window_count(T0 + 2000) == 1
+        assert len(ring) == 2
+
+    def test_single_sample_held(self):
+        """Test a setpoint held without further updates reads fully at target."""
+        ring = ComfortSamples(window_seconds=3600, tolerance=0.5)
+        assert ring.mean_deviation(T0) is None
+        assert ring.time_at_target(T0) == 0.0
+
+        ring.append(T0, 21.2, 21.0)
+
+        # Instant reading at the moment of the sample
+        assert ring.time_at_target(T0) == 100.0
+        assert ring.mean_deviation(T0) == pytest.approx(0.2)
+        assert ring.time_at_target(T0 + 3600) == 100.0
+
+    def test_burst_does_not_outweigh_quiet_period(self):
+        """Test many updates in a short span are weighted by duration."""
+        ring = ComfortSamples(window_seconds=3600, tolerance=0.5)
+        ring.append(T0, 21.0, 21.0)
+        for i in range(30):
+            ring.append(T0 + 3000 + i * 10, 23.0, 21.0)
+
+        now = T0 + 3600
+        assert ring.time_at_target(now) == pytest.approx(3000 / 3600 * 100.0)
+
+    def test_out_of_order_samples_ignored(self):
+        """Test samples older than the newest one are dropped."""
+        ring = ComfortSamples()
+        ring.append(T0 + 60, 21.0, 21.0)
+        ring.append(T0, 25.0, 21.0)
+
+        assert len(ring) == 1
+        assert ring.last_timestamp == T0 + 60
+
+    def test_matches_brute_force_with_overwrites(self):
+        """Test running sums match a full scan while the ring wraps around."""
+        ring = ComfortSamples(capacity=50, window_seconds=1800, tolerance=0.3)
+        recorded = []
+        for i in range(400):
+            t = T0 + i * 45
+            temperature = 21.0 + ((i * 7) % 11 - 5) * 0.1
+            ring.append(t, temperature, 21.0)
+            recorded.append((t, temperature, 21.0))
+            if i % 13 == 0:
+                now = t + 20
+                expected_tat, expected_dev = _brute_force(recorded[-50:], now, 1800, 0.3)
+                assert ring.time_at_target(now) == pytest.approx(expected_tat)
+                assert ring.mean_deviation(now) == pytest.approx(expected_dev)
+
+    def test_configure_recounts(self):
+        """Test changing tolerance or window recounts the stored intervals."""
+        ring = ComfortSamples(window_seconds=600, tolerance=0.5)
+        samples = [(T0, 22.0, 21.0), (T0 + 500, 21.8, 21.0), (T0 + 900, 21.2, 21.0)]
+        for sample in samples:
+            ring.append(*sample)
+        assert ring.time_at_target(T0 + 900) == 0.0
+
+        ring.configure(window_seconds=3600, tolerance=1.0)
+
+        expected_tat, expected_dev = _brute_force(samples, T0 + 900, 3600, 1.0)
+        assert ring.time_at_target(T0 + 900) == pytest.approx(expected_tat)
+        assert ring.mean_deviation(T0 + 900) == pytest.approx(expected_dev)
@@ -7,7 +7,10 @@ import pytest
 # Mock base classes that need to be distinct
 class MockSensorEntity:
     """Mock SensorEntity base class."""
-    pass
+
+    async def async_added_to_hass(self):
+        """Mock async_added_to_hass for base class."""
+        pass
 
 
 class MockRestoreEntity:
@@ -71,10 +74,11 @@ sys.modules['homeassistant.helpers.entity_platform'] = MagicMock()
 sys.modules['homeassistant.helpers.typing'] = MagicMock()
 
 # Now import the sensors module
+from custom_components.adaptive_thermostat.analytics.comfort_samples import ComfortSamples
+from custom_components.adaptive_thermostat.const import DOMAIN
 from custom_components.adaptive_thermostat.sensors.comfort import (
     TimeAtTargetSensor,
     ComfortScoreSensor,
-    TemperatureSample,
     DEFAULT_TARGET_TOLERANCE,
 )
 
@@ -88,16 +92,15 @@ def mock_hass():
     return hass
 
 
-def test_temperature_sample():
-    """Test TemperatureSample dataclass."""
-    sample = TemperatureSample(
-        timestamp=datetime(2024, 1, 15, 10, 0, 0),
-        temperature=21.5,
-        setpoint=21.0,
-    )
-
-    assert sample.temperature == 21.5
-    assert sample.setpoint == 21.0
+@pytest.fixture
+def zone_samples(mock_hass):
+    """Register a zone with a comfort sample ring on a mock coordinator."""
+    samples = ComfortSamples()
+    coordinator = MagicMock()
+    coordinator.get_zone_data.return_value = {"comfort_samples": samples}
+    coordinator.snapshot.get_zone.return_value = None
+    mock_hass.data[DOMAIN] = {"coordinator": coordinator}
+    return samples
 
 
 def test_time_at_target_sensor_init(mock_hass):
@@ -114,25 +117,29 @@ def test_time_at_target_sensor_init(mock_hass):
     assert sensor._tolerance == DEFAULT_TARGET_TOLERANCE
 
 
-def test_time_at_target_record_sample(mock_hass):
-    """Test recording temperature samples."""
+@pytest.mark.asyncio
+async def test_time_at_target_configures_samples_when_added(mock_hass, zone_samples):
+    """Test the sensor applies its window and tolerance once when added."""
     sensor = TimeAtTargetSensor(
         hass=mock_hass,
         zone_id="living_room",
         zone_name="Living Room",
         climate_entity_id="climate.living_room",
+        tolerance=0.8,
+        measurement_window=timedelta(hours=2),
     )
+    zone_samples.append(datetime.now().timestamp(), 21.5, 21.0)
 
-    # Record a sample
-    sensor.record_sample(temperature=21.5, setpoint=21.0)
+    assert zone_samples.tolerance == DEFAULT_TARGET_TOLERANCE
+    await sensor.async_added_to_hass()
 
-    assert len(sensor._samples) == 1
-    assert sensor._samples[0].temperature == 21.5
-    assert sensor._samples[0].setpoint == 21.0
+    assert zone_samples.tolerance == 0.8
+    assert sensor.extra_state_attributes["samples_tracked"] == 1
 
 
+@pytest.mark.asyncio
 @patch('custom_components.adaptive_thermostat.sensors.comfort.dt_util')
-def test_time_at_target_calculation(mock_dt_util, mock_hass):
+async def test_time_at_target_calculation(mock_dt_util, mock_hass, zone_samples):
     """Test time at target percentage calculation."""
     sensor = TimeAtTargetSensor(
         hass=mock_hass,
@@ -142,33 +149,32 @@ def test_time_at_target_calculation(mock_dt_util, mock_hass):
         tolerance=0.5,
         measurement_window=timedelta(hours=1),
     )
+    await sensor.async_added_to_hass()
 
     now = datetime.now()
     mock_dt_util.utcnow.return_value = now
 
-    # Add 10 samples: 7 within tolerance, 3 outside
-    for i in range(7):
-        sensor._samples.append(TemperatureSample(
-            timestamp=now - timedelta(minutes=5 * i),
-            temperature=21.0 + (i % 3) * 0.2,  # Within 0.5°C of setpoint
-            setpoint=21.0,
-        ))
-
-    for i in range(3):
-        sensor._samples.append(TemperatureSample(
-            timestamp=now - timedelta(minutes=35 + 5 * i),
-            temperature=22.5,  # Outside tolerance (1.5°C off)
-            setpoint=21.0,
-        ))
+    # Sample from before the window holds until the next one (15 min)
+    zone_samples.append((now - timedelta(minutes=90)).timestamp(), 25.0, 21.0)
+
+    # 15 min outside tolerance, then 30 min within
+    for i in reversed(range(3)):
+        zone_samples.append((now - timedelta(minutes=35 + 5 * i)).timestamp(), 22.5, 21.0)
+    for i in reversed(range(7)):
+        zone_samples.append(
+            (now - timedelta(minutes=5 * i)).timestamp(),
+            21.0 + (i % 3) * 0.2,  # Within 0.5°C of setpoint
+            21.0,
+        )
 
     # Calculate time at target
     result = sensor._calculate_time_at_target()
 
-    # 7 out of 10 samples = 70%
-    assert result == 70.0
+    # 30 of 60 minutes = 50%
+    assert result == 50.0
 
 
-def test_time_at_target_empty_samples(mock_hass):
+def test_time_at_target_empty_samples(mock_hass, zone_samples):
     """Test time at target with no samples."""
     sensor = TimeAtTargetSensor(
         hass=mock_hass,
@@ -181,6 +187,19 @@ def test_time_at_target_empty_samples(mock_hass):
     assert result == 0.0
 
 
+def test_time_at_target_without_zone(mock_hass):
+    """Test time at target is 0 when the zone is not registered."""
+    sensor = TimeAtTargetSensor(
+        hass=mock_hass,
+        zone_id="living_room",
+        zone_name="Living Room",
+        climate_entity_id="climate.living_room",
+    )
+
+    assert sensor._calculate_time_at_target() == 0.0
+    assert sensor.extra_state_attributes["samples_tracked"] == 0
+
+
 def test_comfort_score_sensor_init(mock_hass):
     """Test ComfortScoreSensor initialization."""
     sensor = ComfortScoreSensor(
@@ -196,8 +215,11 @@ def test_comfort_score_sensor_init(mock_hass):
 
 
 @pytest.mark.asyncio
-async def test_comfort_score_calculation(mock_hass):
-    """Test comfort score calculation."""
+@patch('custom_components.adaptive_thermostat.sensors.comfort.dt_util')
+async def test_comfort_score_calculation(mock_dt_util, mock_hass, zone_samples):
+    """Test comfort score calculation from the shared ring and snapshot."""
+    now = datetime.now()
+    mock_dt_util.utcnow.return_value = now
     sensor = ComfortScoreSensor(
         hass=mock_hass,
         zone_id="living_room",
@@ -205,25 +227,12 @@ async def test_comfort_score_calculation(mock_hass):
         climate_entity_id="climate.living_room",
     )
 
-    # Mock the sensor states
-    def mock_get_state(entity_id):
-        states = {
-            "sensor.living_room_time_at_target": MagicMock(state="80.0"),
-            "sensor.living_room_oscillations": MagicMock(state="2"),
-            "climate.living_room": MagicMock(
-                attributes={
-                    "current_temperature": 21.2,
-                    "temperature": 21.0,
-                }
-            ),
-        }
-        state = states.get(entity_id)
-        if state:
-            if hasattr(state, "state") and state.state not in ("unknown", "unavailable"):
-                return state
-        return None
-
-    mock_hass.states.get = mock_get_state
+    # 8 of 10 minutes at target, time-weighted mean deviation 0.2°C
+    zone_samples.append((now - timedelta(minutes=10)).timestamp(), 21.1, 21.0)
+    zone_samples.append((now - timedelta(minutes=2)).timestamp(), 21.6, 21.0)
+    mock_hass.data[DOMAIN]["coordinator"].snapshot.get_zone.return_value = MagicMock(
+        avg_oscillations=2.4
+    )
 
     score = await sensor._calculate_comfort_score()
 
@@ -231,12 +240,14 @@ async def test_comfort_score_calculation(mock_hass):
     # Deviation: 0.2°C -> score 100 - (0.2 * 50) = 90 (25% weight = 22.5)
     # Oscillations: 2 -> score 100 - (2 * 10) = 80 (15% weight = 12)
     # Total: 48 + 22.5 + 12 = 82.5
-    assert 80 < score < 85
+    assert score == pytest.approx(82.5)
+    # No sensor states are read
+    mock_hass.states.get.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_comfort_score_with_missing_data(mock_hass):
-    """Test comfort score when some sensors are unavailable."""
+    """Test comfort score when the zone has no data."""
     sensor = ComfortScoreSensor(
         hass=mock_hass,
         zone_id="living_room",
@@ -244,9 +255,6 @@ async def test_comfort_score_with_missing_data(mock_hass):
         climate_entity_id="climate.living_room",
     )
 
-    # Mock all sensors returning unavailable
-    mock_hass.states.get.return_value = None
-
     score = await sensor._calculate_comfort_score()
 
     # With 0 time_at_target and 0 deviation (= perfect), we get:
@@ -259,8 +267,8 @@ async def test_comfort_score_with_missing_data(mock_hass):
 
 @pytest.mark.asyncio
 @patch('custom_components.adaptive_thermostat.sensors.comfort.dt_util')
-async def test_time_at_target_async_update(mock_dt_util, mock_hass):
-    """Test async_update records sample from climate entity."""
+async def test_time_at_target_async_update(mock_dt_util, mock_hass, zone_samples):
+    """Test async_update reads the ring without polling the climate entity."""
     now = datetime.now()
     mock_dt_util.utcnow.return_value = now
 
@@ -270,21 +278,13 @@ async def test_time_at_target_async_update(mock_dt_util, mock_hass):
         zone_name="Living Room",
         climate_entity_id="climate.living_room",
     )
-
-    # Mock climate entity state
-    mock_climate_state = MagicMock()
-    mock_climate_state.attributes = {
-        "current_temperature": 21.3,
-        "temperature": 21.0,
-    }
-    mock_hass.states.get.return_value = mock_climate_state
+    zone_samples.append(now.timestamp() - 120, 21.3, 21.0)
+    zone_samples.append(now.timestamp() - 60, 22.0, 21.0)
 
     await sensor.async_update()
 
-    # Should have recorded the sample
-    assert len(sensor._samples) == 1
-    assert sensor._samples[0].temperature == 21.3
-    assert sensor._samples[0].setpoint == 21.0
+    assert sensor.native_value == 50.0
+    mock_hass.states.get.assert_not_called()
 
 
 def test_comfort_score_extra_attributes(mock_hass):
@@ -308,8 +308,9 @@ def test_comfort_score_extra_attributes(mock_hass):
     assert attrs["oscillation_score"] == 85.0
 
 
+@pytest.mark.asyncio
 @patch('custom_components.adaptive_thermostat.sensors.comfort.dt_util')
-def test_time_at_target_custom_tolerance(mock_dt_util, mock_hass):
+async def test_time_at_target_custom_tolerance(mock_dt_util, mock_hass, zone_samples):
     """Test TimeAtTargetSensor with custom tolerance."""
     sensor = TimeAtTargetSensor(
         hass=mock_hass,
@@ -318,6 +319,7 @@ def test_time_at_target_custom_tolerance(mock_dt_util, mock_hass):
         climate_entity_id="climate.living_room",
         tolerance=1.0,  # Custom 1°C tolerance
     )
+    await sensor.async_added_to_hass()
 
     assert sensor._tolerance == 1.0
 
@@ -326,14 +328,15 @@ def test_time_at_target_custom_tolerance(mock_dt_util, mock_hass):
 
     # Add samples: all within 1°C of setpoint
     for i in range(5):
-        sensor._samples.append(TemperatureSample(
-            timestamp=now - timedelta(minutes=5 * i),
-            temperature=21.0 + i * 0.2,  # 21.0 to 21.8
-            setpoint=21.0,
-        ))
+        zone_samples.append(
+            (now - timedelta(minutes=20 - 5 * i)).timestamp(),
+            21.0 + i * 0.2,  # 21.0 to 21.8
+            21.0,
+        )
 
     result = sensor._calculate_time_at_target()
     assert result == 100.0  # All within 1°C tolerance
+    assert zone_samples.tolerance == 1.0
 
 
 def test_comfort_score_clamped_to_100(mock_hass):
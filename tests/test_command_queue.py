@@ -0,0 +1,99 @@
+"""Tests for the latest-wins heater command queue."""
+import asyncio
+
+import pytest
+
+from custom_components.adaptive_thermostat.managers.command_queue import HeaterCommandQueue
+
+
+def _command(log, name, gate=None, result=True):
+    async def run():
+        log.append(("start", name))
+        if gate is not None:
+            await gate.wait()
+        log.append(("end", name))
+        return result
+    return run
+
+
+class TestHeaterCommandQueue:
+    """Tests for HeaterCommandQueue."""
+
+    def test_invalid_concurrency_rejected(self):
+        """Test that a non-positive concurrency limit raises ValueError."""
+        with pytest.raises(ValueError):
+            HeaterCommandQueue(max_concurrent=0)
+
+    @pytest.mark.asyncio
+    async def test_result_returned(self):
+        """Test that a single command runs and returns its result."""
+        queue = HeaterCommandQueue()
+        log = []
+
+        assert await queue.submit("number.trv", _command(log, "a", result=False)) is False
+        assert log == [("start", "a"), ("end", "a")]
+        assert queue.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_newer_command_supersedes_unsent(self):
+        """Test that only the latest command waiting behind an in-flight one is sent."""
+        queue = HeaterCommandQueue()
+        log = []
+        gate = asyncio.Event()
+
+        first = asyncio.create_task(queue.submit("number.trv", _command(log, "a", gate)))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(queue.submit("number.trv", _command(log, "b")))
+        third = asyncio.create_task(queue.submit("number.trv", _command(log, "c")))
+        await asyncio.sleep(0)
+        assert queue.queue_depth == 2
+
+        gate.set()
+        results = await asyncio.gather(first, second, third)
+
+        assert results == [True, None, True]
+        assert [name for event, name in log if event == "start"] == ["a", "c"]
+        assert queue.superseded_count == 1
+        assert queue.get_metrics() == {
+            "queue_depth": 0,
+            "max_queue_depth": 2,
+            "submitted": 3,
+            "superseded": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_global_concurrency_limit(self):
+        """Test that calls across entities never exceed the concurrency limit."""
+        queue = HeaterCommandQueue(max_concurrent=2)
+        active = 0
+        peak = 0
+
+        def command():
+            async def run():
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                return True
+            return run
+
+        results = await asyncio.gather(*(
+            queue.submit(f"number.trv_{i}", command()) for i in range(6)
+        ))
+
+        assert all(results)
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates_and_queue_continues(self):
+        """Test that a failing command raises to its caller without blocking later ones."""
+        queue = HeaterCommandQueue()
+        log = []
+
+        async def failing():
+            raise RuntimeError("radio")
+
+        with pytest.raises(RuntimeError):
+            await queue.submit("number.trv", failing)
+        assert await queue.submit("number.trv", _command(log, "b")) is True
@@ -495,3 +495,136 @@ class TestPidDtStateAttribute:
 
         assert self._set_dt_calls[2] == pytest.approx(15.0, abs=0.1), \
             "Subsequent trigger should show correct dt"
+
+
+# ============================================================================
+# Thermal History Recording Tests
+# ============================================================================
+
+
+class TestThermalHistoryRecording:
+    """Tests for recording system identification samples."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        from custom_components.adaptive_thermostat.adaptive.sysid import ThermalHistory
+
+        self.thermostat_state = MockThermostatState()
+        self.thermostat_state._coordinator = Mock(thermal_group_manager=None)
+        self.pid_controller = Mock()
+        self.pid_controller.sampling_period = 0
+        self.pid_controller.calc = Mock(return_value=(42.0, True))
+        self.pid_controller.proportional = 0.0
+        self.pid_controller.integral = 42.0
+        self.pid_controller.derivative = 0.0
+        self.pid_controller.external = 0.0
+        self.pid_controller.error = 1.0
+        self.history = ThermalHistory()
+        self.manager = ControlOutputManager(
+            thermostat_state=self.thermostat_state,
+            pid_controller=self.pid_controller,
+            heater_controller=Mock(),
+            set_previous_temp_time=Mock(),
+            set_cur_temp_time=Mock(),
+            set_control_output=Mock(),
+            set_p=Mock(),
+            set_i=Mock(),
+            set_d=Mock(),
+            set_e=Mock(),
+            set_dt=Mock(),
+            thermal_history=self.history,
+        )
+
+    @pytest.mark.asyncio
+    async def test_sensor_updates_recorded(self):
+        """Test that sensor-driven calculations record temperature, outdoor and output."""
+        with patch("time.time", return_value=5000.0):
+            await self.manager.calc_output(is_temp_sensor_update=True)
+
+        assert self.history.as_columns() == ([5000.0], [20.0], [5.0], [42.0])
+
+    @pytest.mark.asyncio
+    async def test_non_sensor_triggers_not_recorded(self):
+        """Test that external/periodic triggers do not add duplicate samples."""
+        await self.manager.calc_output(is_temp_sensor_update=False)
+
+        assert len(self.history) == 0
+
+
+class TestTelemetryRecording:
+    """Tests for recording zone telemetry samples."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        from custom_components.adaptive_thermostat.analytics.telemetry_store import (
+            ZoneTelemetry,
+        )
+
+        # Plain state object: attributes the thermostat never sets must not be read
+        self.thermostat_state = MockThermostatState()
+        self.thermostat_state._coordinator = Mock(thermal_group_manager=None)
+        self.pid_controller = Mock()
+        self.pid_controller.sampling_period = 0
+        self.pid_controller.calc = Mock(return_value=(42.0, True))
+        self.pid_controller.proportional = 0.0
+        self.pid_controller.integral = 42.0
+        self.pid_controller.derivative = 0.0
+        self.pid_controller.external = 0.0
+        self.pid_controller.error = 1.0
+        self.telemetry = ZoneTelemetry()
+
+    def _manager(self, heater_controller):
+        return ControlOutputManager(
+            thermostat_state=self.thermostat_state,
+            pid_controller=self.pid_controller,
+            heater_controller=heater_controller,
+            set_previous_temp_time=Mock(),
+            set_cur_temp_time=Mock(),
+            set_control_output=Mock(),
+            set_p=Mock(),
+            set_i=Mock(),
+            set_d=Mock(),
+            set_e=Mock(),
+            set_dt=Mock(),
+            telemetry=self.telemetry,
+        )
+
+    async def _record(self, heater_controller):
+        with patch("time.time", return_value=5000.0):
+            await self._manager(heater_controller).calc_output(is_temp_sensor_update=True)
+        _, values = self.telemetry.columns(tier="raw")
+        return values
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("heater_on,duty", [(True, 100.0), (False, 0.0)])
+    async def test_pwm_records_heater_state(self, heater_on, duty):
+        """Test PWM zones record the heater's on/off state as duty."""
+        heater_controller = Mock(uses_pwm=True)
+        heater_controller.is_active = Mock(return_value=heater_on)
+
+        values = await self._record(heater_controller)
+
+        heater_controller.is_active.assert_called_once_with(HVACMode.HEAT)
+        assert values["duty"] == [duty]
+        assert values["control_output"] == [42.0]
+        assert values["temperature"] == [20.0]
+
+    @pytest.mark.asyncio
+    async def test_valve_records_control_output(self):
+        """Test valve zones record the output sent to the valve as duty."""
+        heater_controller = Mock(uses_pwm=False)
+
+        values = await self._record(heater_controller)
+
+        heater_controller.is_active.assert_not_called()
+        assert values["duty"] == [42.0]
+
+    @pytest.mark.asyncio
+    async def test_no_heater_controller_leaves_duty_unrecorded(self):
+        """Test duty is left empty until the heater controller exists."""
+        import math
+
+        values = await self._record(None)
+
+        assert math.isnan(values["duty"][0])
+        assert values["temperature"] == [20.0]
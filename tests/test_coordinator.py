@@ -734,3 +734,205 @@ def test_get_worst_case_transport_delay_for_zone_unknown_zone(hass):
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+# =============================================================================
+# Aggregate Demand Transition Tests
+# =============================================================================
+
+
+def test_aggregate_demand_counts_follow_transitions(coord):
+    """Test heating/cooling counters track demand and mode changes."""
+    coord.register_zone("zone1", {"name": "Zone 1"})
+    coord.register_zone("zone2", {"name": "Zone 2"})
+
+    coord.update_zone_demand("zone1", True, "heat")
+    coord.update_zone_demand("zone2", True, "heat")
+    coord.update_zone_demand("zone1", True, "cool")
+    assert coord.get_aggregate_demand() == {"heating": True, "cooling": True}
+
+    coord.update_zone_demand("zone2", False, "heat")
+    assert coord.get_aggregate_demand() == {"heating": False, "cooling": True}
+
+    # Re-registering resets the zone's demand
+    coord.register_zone("zone1", {"name": "Zone 1"})
+    assert coord.get_aggregate_demand() == {"heating": False, "cooling": False}
+    assert coord._heating_demand_count == 0
+    assert coord._cooling_demand_count == 0
+
+
+def test_central_update_only_on_aggregate_transition(coord, hass):
+    """Test the central controller is only woken when aggregate demand flips."""
+    hass.async_create_task = MagicMock(side_effect=lambda coro: coro.close())
+    coord.set_central_controller(MagicMock())
+    coord.register_zone("zone1", {"name": "Zone 1"})
+    coord.register_zone("zone2", {"name": "Zone 2"})
+
+    coord.update_zone_demand("zone1", True, "heat")
+    assert hass.async_create_task.call_count == 1
+    coord._update_pending = False
+
+    # A second heating zone leaves the aggregate unchanged
+    coord.update_zone_demand("zone2", True, "heat")
+    coord.update_zone_demand("zone1", False, "heat")
+    assert hass.async_create_task.call_count == 1
+
+    # Removing the last heating zone flips the aggregate
+    coord.unregister_zone("zone2")
+    assert hass.async_create_task.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_reconciles_unmet_demand(coord, hass):
+    """Test a refresh wakes the central controller only while demand is unmet."""
+    hass.async_create_task = MagicMock(side_effect=lambda coro: coro.close())
+    controller = MagicMock()
+    controller.has_unmet_demand.return_value = False
+    coord.set_central_controller(controller)
+    coord.register_zone("zone1", {"name": "Zone 1"})
+
+    await coord._async_update_data()
+    hass.async_create_task.assert_not_called()
+
+    # Main switch failed or was turned off externally while demand persisted
+    controller.has_unmet_demand.return_value = True
+    await coord._async_update_data()
+    assert hass.async_create_task.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_central_update_reruns_for_transition_during_update(coord, hass):
+    """Test a transition arriving mid-update triggers one follow-up update."""
+    seen = []
+
+    async def update():
+        seen.append(coord.get_aggregate_demand()["heating"])
+        if len(seen) == 1:
+            coord.update_zone_demand("zone1", False, "heat")
+
+    controller = MagicMock()
+    controller.update = update
+    coord.set_central_controller(controller)
+    coord.register_zone("zone1", {"name": "Zone 1"})
+    hass.async_create_task = MagicMock()
+
+    coord.update_zone_demand("zone1", True, "heat")
+    await hass.async_create_task.call_args.args[0]
+
+    assert hass.async_create_task.call_count == 1
+
+    assert seen == [True, False]
+    assert coord._update_pending is False
+
+
+# =============================================================================
+# Zone Lookup Index Tests
+# =============================================================================
+
+
+def test_zone_lookup_indexes_follow_registration(coord):
+    """Test climate entity and learner lookups track register/unregister."""
+    learner = MagicMock()
+    coord.register_zone("zone1", {"climate_entity_id": "climate.zone1", "adaptive_learner": learner})
+    coord.register_zone("zone2", {"climate_entity_id": "climate.zone2"})
+
+    assert coord.get_zone_by_climate_entity("climate.zone1")[0] == "zone1"
+    assert coord.get_adaptive_learner("climate.zone1") is learner
+    assert coord.get_adaptive_learner("climate.zone2") is None
+    assert coord.get_zone_by_climate_entity("climate.unknown") is None
+
+    # Re-registering replaces the indexed entries
+    new_learner = MagicMock()
+    coord.register_zone("zone1", {"climate_entity_id": "climate.renamed", "adaptive_learner": new_learner})
+    assert coord.get_zone_by_climate_entity("climate.zone1") is None
+    assert coord.get_adaptive_learner("climate.renamed") is new_learner
+
+    coord.unregister_zone("zone1")
+    assert coord.get_zone_by_climate_entity("climate.renamed") is None
+    assert coord.get_adaptive_learner("climate.renamed") is None
+    assert coord.get_zone_by_climate_entity("climate.zone2")[0] == "zone2"
+
+
+# =============================================================================
+# Snapshot Tests
+# =============================================================================
+
+
+def test_snapshot_version_only_bumps_on_change(coord):
+    """Test unchanged state republishes the same snapshot object."""
+    coord.register_zone("zone1", {"climate_entity_id": "climate.zone1"})
+    first = coord.snapshot
+    assert first.version == 1
+    assert coord.publish_snapshot() is first
+
+    coord.update_zone_temp("zone1", 20.5)
+    second = coord.publish_snapshot()
+    assert second.version == 2
+    assert second.get_zone("zone1").current_temp == 20.5
+    # Earlier snapshots are unaffected by later changes
+    assert first.get_zone("zone1").current_temp is None
+
+
+def test_cycle_end_publishes_snapshot_once(coord):
+    """Test a zone's CYCLE_ENDED republishes and notifies listeners on change."""
+    from custom_components.adaptive_thermostat.adaptive.learning import (
+        AdaptiveLearner,
+        CycleMetrics,
+    )
+
+    learner = AdaptiveLearner()
+    coord.register_zone("zone1", {"climate_entity_id": "climate.zone1", "adaptive_learner": learner})
+    first = coord.snapshot
+    coord.async_set_updated_data = Mock()
+
+    # Nothing changed: no new snapshot and no listener notification
+    coord.handle_cycle_ended(Mock())
+    coord.async_set_updated_data.assert_not_called()
+
+    learner.add_cycle_metrics(CycleMetrics(overshoot=0.6, settling_time=40.0, oscillations=1))
+    coord.handle_cycle_ended(Mock())
+    coord.async_set_updated_data.assert_called_once_with(coord.snapshot)
+    assert coord.snapshot.version == first.version + 1
+    assert coord.snapshot.get_zone("zone1").avg_overshoot == pytest.approx(0.6)
+
+
+def test_snapshot_contents_are_read_only(coord):
+    """Test snapshots expose demand and learner stats without live dicts."""
+    from custom_components.adaptive_thermostat.adaptive.learning import (
+        AdaptiveLearner,
+        CycleMetrics,
+    )
+
+    learner = AdaptiveLearner()
+    learner.add_cycle_metrics(CycleMetrics(overshoot=0.2, settling_time=30.0, oscillations=1))
+    learner.add_cycle_metrics(CycleMetrics(overshoot=0.4, settling_time=None, oscillations=3))
+    coord.register_zone("zone1", {"climate_entity_id": "climate.zone1", "adaptive_learner": learner})
+    coord.update_zone_demand("zone1", True, "heat")
+
+    snapshot = coord.snapshot
+    zone = snapshot.get_zone("zone1")
+    assert zone.demand is True and zone.mode == "heat"
+    assert zone.cycle_count == 2
+    assert zone.avg_overshoot == pytest.approx(0.3)
+    assert zone.avg_settling_time == pytest.approx(30.0)
+    assert zone.avg_oscillations == pytest.approx(2.0)
+    assert snapshot.aggregate_demand["heating"] is True
+
+    with pytest.raises(TypeError):
+        snapshot.zones["zone2"] = zone
+    with pytest.raises(AttributeError):
+        zone.demand = False
+
+
+def test_snapshot_includes_newly_registered_zone(coord):
+    """Test registering a zone publishes a new snapshot on next read."""
+    coord.register_zone("zone1", {})
+    assert coord.snapshot.version == 1
+
+    coord.register_zone("zone2", {})
+    snapshot = coord.snapshot
+    assert snapshot.version == 2
+    assert snapshot.get_zone("zone2") is not None
+
+    coord.unregister_zone("zone2")
+    assert coord.snapshot.get_zone("zone2") is None
@@ -0,0 +1,86 @@
+"""Tests for running cycle metric statistics."""
+import pytest
+
+from custom_components.adaptive_thermostat.adaptive.cycle_analysis import CycleMetrics
+from custom_components.adaptive_thermostat.adaptive.cycle_stats import CycleStatsTracker
+from custom_components.adaptive_thermostat.adaptive.learning import AdaptiveLearner
+
+
+def _cycle(overshoot, settling_time=None, oscillations=0):
+    return CycleMetrics(overshoot=overshoot, settling_time=settling_time, oscillations=oscillations)
+
+
+class TestCycleStatsTracker:
+    """Tests for CycleStatsTracker."""
+
+    def test_running_and_recent_means(self):
+        """Test full-history and windowed means skip None values."""
+        tracker = CycleStatsTracker(window=2)
+        for cycle in (_cycle(0.6, 30.0), _cycle(None, 40.0), _cycle(0.2)):
+            tracker.add(cycle)
+
+        stats = tracker.stats()
+        assert stats.cycle_count == 3
+        assert stats.overshoot.count == 2
+        assert stats.overshoot.mean == pytest.approx(0.4)
+        assert stats.overshoot.recent_count == 1
+        assert stats.overshoot.recent_mean == pytest.approx(0.2)
+        assert stats.settling_time.mean == pytest.approx(35.0)
+        assert stats.settling_time.recent_mean == pytest.approx(40.0)
+        assert stats.rise_time.mean is None
+
+    def test_evict_matches_rebuild(self):
+        """Test evicting the oldest cycles gives the same stats as a rebuild."""
+        history = [_cycle(0.1 * i, 10.0 + i, i % 3) for i in range(8)]
+        tracker = CycleStatsTracker(window=5)
+        for cycle in history:
+            tracker.add(cycle)
+        for cycle in history[:5]:
+            tracker.evict(cycle)
+
+        rebuilt = CycleStatsTracker(window=5)
+        rebuilt.rebuild(history[5:])
+        stats, expected = tracker.stats(), rebuilt.stats()
+        assert stats.cycle_count == expected.cycle_count == 3
+        for name in ("overshoot", "settling_time", "oscillations"):
+            metric, expected_metric = getattr(stats, name), getattr(expected, name)
+            assert metric.count == expected_metric.count
+            assert metric.mean == pytest.approx(expected_metric.mean)
+            assert metric.recent_count == expected_metric.recent_count
+            assert metric.recent_mean == pytest.approx(expected_metric.recent_mean)
+
+
+class TestLearnerCycleStats:
+    """Tests for AdaptiveLearner.get_cycle_stats."""
+
+    def test_stats_follow_fifo_eviction(self):
+        """Test stats only cover cycles retained in the history."""
+        learner = AdaptiveLearner(max_history=3)
+        for overshoot in (1.0, 0.2, 0.4, 0.6):
+            learner.add_cycle_metrics(_cycle(overshoot))
+
+        stats = learner.get_cycle_stats()
+        assert stats.cycle_count == 3
+        assert stats.overshoot.mean == pytest.approx(0.4)
+
+    def test_replaced_history_is_rebuilt(self):
+        """Test assigning or clearing the history directly resyncs the stats."""
+        learner = AdaptiveLearner()
+        learner.add_cycle_metrics(_cycle(1.0))
+
+        learner.cycle_history = [_cycle(0.2), _cycle(0.4)]
+        assert learner.get_cycle_stats().overshoot.mean == pytest.approx(0.3)
+
+        learner.cycle_history.clear()
+        assert learner.get_cycle_stats().overshoot.mean is None
+
+    def test_modes_are_separate(self):
+        """Test cooling cycles do not affect heating stats."""
+        from custom_components.adaptive_thermostat.helpers.hvac_mode import get_hvac_cool_mode
+
+        learner = AdaptiveLearner()
+        learner.add_cycle_metrics(_cycle(0.5))
+        learner.add_cycle_metrics(_cycle(1.5), mode=get_hvac_cool_mode())
+
+        assert learner.get_cycle_stats().overshoot.mean == pytest.approx(0.5)
+        assert learner.get_cycle_stats(get_hvac_cool_mode()).overshoot.mean == pytest.approx(1.5)
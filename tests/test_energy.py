@@ -5,6 +5,7 @@ These tests verify:
 2. Persistence across HA restarts via RestoreEntity
 3. Week boundary reset on Sunday midnight (ISO week)
 4. Meter reset/replacement handling
+5. Bucketed meter aggregation (MeterBuckets, EnergyTracker)
 """
 import sys
 import pytest
@@ -90,6 +91,10 @@ def _setup_mocks():
 _setup_mocks()
 
 from custom_components.adaptive_thermostat.sensor import WeeklyCostSensor
+from custom_components.adaptive_thermostat.analytics.energy import (
+    EnergyTracker,
+    MeterBuckets,
+)
 
 
 class TestWeeklyDeltaCalculation:
@@ -505,6 +510,32 @@ class TestWeekBoundaryReset:
         # Should have reset for new week
         assert sensor._week_start_reading == 550.0
 
+    @pytest.mark.asyncio
+    async def test_new_week_keeps_consumption_since_boundary(self, sensor, mock_hass):
+        """Test readings after Monday midnight count towards the new week."""
+        meter_state = Mock()
+        meter_state.attributes = {"unit_of_measurement": "kWh"}
+        mock_hass.states.get = Mock(
+            side_effect=lambda entity_id: meter_state
+            if entity_id == "sensor.energy_meter"
+            else None
+        )
+
+        with patch(
+            "custom_components.adaptive_thermostat.sensors.energy.dt_util"
+        ) as mock_dt_util:
+            for timestamp, value in [
+                (datetime(2025, 1, 12, 23, 30), "100.0"),  # Sunday
+                (datetime(2025, 1, 13, 0, 10), "104.0"),   # Monday, new week
+                (datetime(2025, 1, 13, 1, 10), "110.0"),
+            ]:
+                mock_dt_util.utcnow.return_value = timestamp
+                meter_state.state = value
+                await sensor.async_update()
+
+        assert sensor._weekly_energy_kwh == 6.0
+        assert sensor._week_start_reading == 104.0
+
 
 class TestMeterResetHandling:
     """Tests for meter reset/replacement scenarios."""
@@ -604,6 +635,34 @@ class TestMeterResetHandling:
         assert sensor._week_start_reading == 100.0
         assert sensor._weekly_energy_kwh == 0.0
 
+    @pytest.mark.asyncio
+    async def test_meter_reset_keeps_energy_recorded_before_reset(self, sensor, mock_hass):
+        """Test energy metered before a mid-week reset is not discarded."""
+        meter_state = Mock()
+        meter_state.attributes = {"unit_of_measurement": "kWh"}
+        mock_hass.states.get = Mock(
+            side_effect=lambda entity_id: meter_state
+            if entity_id == "sensor.energy_meter"
+            else None
+        )
+        readings = [
+            (datetime(2025, 1, 7, 8, 0), "1000.0"),
+            (datetime(2025, 1, 7, 9, 0), "1030.0"),
+            (datetime(2025, 1, 7, 10, 0), "5.0"),  # Meter replaced
+            (datetime(2025, 1, 7, 11, 0), "15.0"),
+        ]
+
+        with patch(
+            "custom_components.adaptive_thermostat.sensors.energy.dt_util"
+        ) as mock_dt_util:
+            for timestamp, value in readings:
+                mock_dt_util.utcnow.return_value = timestamp
+                meter_state.state = value
+                await sensor.async_update()
+
+        assert sensor._weekly_energy_kwh == 40.0
+        assert sensor._week_start_reading == -25.0
+
 
 class TestExtraStateAttributes:
     """Tests for extra state attributes exposed by the sensor."""
@@ -748,3 +807,82 @@ class TestEdgeCases:
         assert sensor._week_start_reading == 100.0
         assert sensor._week_start_timestamp is not None
         assert sensor._weekly_energy_kwh == 0.0
+
+
+class TestMeterBuckets:
+    """Tests for bucketed meter aggregation."""
+
+    def test_consumption_within_window(self):
+        """Test consumption sums buckets and excludes energy carried into the window."""
+        buckets = MeterBuckets()
+        start = datetime(2025, 1, 6, 0, 0)
+        for minutes, value in [(0, 10.0), (30, 12.0), (70, 15.0), (130, 21.0), (190, 22.0)]:
+            buckets.add_reading(start + timedelta(minutes=minutes), value)
+
+        assert len(buckets) == 4
+        assert buckets.consumption(start) == 12.0
+        # 01:00-02:59: delta 12->15 happened before the window
+        assert buckets.consumption(start + timedelta(hours=1), start + timedelta(hours=2)) == 6.0
+        # Only one reading in the last bucket
+        assert buckets.consumption(start + timedelta(hours=3)) is None
+
+    def test_meter_reset_is_not_negative(self):
+        """Test a dropping reading starts a new baseline."""
+        buckets = MeterBuckets()
+        start = datetime(2025, 1, 6, 0, 0)
+
+        assert buckets.add_reading(start, 500.0) == 0.0
+        assert buckets.add_reading(start + timedelta(minutes=10), 510.0) == 10.0
+        assert buckets.add_reading(start + timedelta(minutes=20), 2.0) == 0.0
+        assert buckets.add_reading(start + timedelta(minutes=30), 6.0) == 4.0
+        assert buckets.consumption(start) == 14.0
+
+    def test_ring_is_bounded(self):
+        """Test only the newest buckets are retained."""
+        buckets = MeterBuckets(max_buckets=3)
+        start = datetime(2025, 1, 6, 0, 0)
+        for hour in range(10):
+            buckets.add_reading(start + timedelta(hours=hour), float(hour))
+
+        assert len(buckets) == 3
+        assert buckets.consumption(start) == 2.0
+        assert buckets.last_value == 9.0
+
+    def test_older_bucket_reading_ignored(self):
+        """Test readings for an already closed bucket are ignored."""
+        buckets = MeterBuckets()
+        start = datetime(2025, 1, 6, 0, 0)
+        buckets.add_reading(start + timedelta(hours=2), 50.0)
+
+        assert buckets.add_reading(start, 40.0) == 0.0
+        assert buckets.last_value == 50.0
+
+
+class TestEnergyTracker:
+    """Tests for EnergyTracker consumption windows."""
+
+    def test_daily_and_weekly_consumption(self):
+        """Test rolling windows end at the latest reading and convert to kWh."""
+        tracker = EnergyTracker("sensor.gas_meter", unit="kWh")
+        start = datetime(2025, 1, 6, 0, 0)
+        for hour in range(0, 72, 6):
+            tracker.add_reading(start + timedelta(hours=hour), 100.0 + hour)
+
+        assert tracker.get_weekly_consumption() == 66.0
+        # Readings from 18:00 on the previous day to 18:00 on the last day
+        assert tracker.get_daily_consumption() == 24.0
+        assert tracker.get_daily_cost(price_per_kwh=0.5) == 12.0
+
+    def test_insufficient_data(self):
+        """Test None without at least two readings."""
+        tracker = EnergyTracker("sensor.gas_meter", unit="GJ")
+        assert tracker.get_daily_consumption() is None
+
+        tracker.add_reading(datetime(2025, 1, 6, 0, 0), 1.0)
+        assert tracker.get_weekly_consumption() is None
+
+        tracker.add_reading(datetime(2025, 1, 6, 1, 0), 1.5)
+        assert tracker.get_weekly_consumption() == pytest.approx(0.5 * 277.778)
+
+        tracker.clear_readings()
+        assert tracker.get_weekly_consumption() is None
@@ -0,0 +1,207 @@
+"""Tests for the streaming learning data export."""
+import csv
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.adaptive_thermostat.adaptive.cycle_analysis import CycleMetrics
+from custom_components.adaptive_thermostat.adaptive.ke_learning import KeObservation
+from custom_components.adaptive_thermostat.adaptive.preheat import HeatingObservation
+from custom_components.adaptive_thermostat.analytics.export import (
+    DATASET_CYCLES,
+    DATASET_KE_OBSERVATIONS,
+    DATASET_PID_HISTORY,
+    DATASET_PREHEAT_OBSERVATIONS,
+    DATASET_TELEMETRY,
+    EXPORT_DIR,
+    TELEMETRY_FIELDS,
+    async_export_tables,
+    build_zone_tables,
+)
+from custom_components.adaptive_thermostat.analytics.telemetry_store import ZoneTelemetry
+
+T0 = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+
+def _zone_sources():
+    """Build zone data and a thermostat with five records per dataset."""
+    learner = MagicMock()
+    learner.cycle_history = [
+        CycleMetrics(overshoot=0.1 * i, settling_time=30.0 + i) for i in range(5)
+    ]
+    learner.get_pid_history.return_value = [
+        {
+            "timestamp": (T0 + timedelta(hours=i)).isoformat(),
+            "kp": 1.0 + i,
+            "ki": 0.01,
+            "kd": 10.0,
+            "reason": "physics",
+            "metrics": {"overshoot": 0.1},
+        }
+        for i in range(5)
+    ]
+
+    thermostat = MagicMock()
+    thermostat._ke_learner.get_observations.return_value = [
+        KeObservation(T0 + timedelta(hours=i), 5.0, 40.0, 20.5, 21.0) for i in range(5)
+    ]
+    thermostat._preheat_learner.get_observations.return_value = [
+        HeatingObservation(18.0, 21.0, 5.0, 60.0, 3.0, T0 + timedelta(hours=i)) for i in range(5)
+    ]
+
+    telemetry = ZoneTelemetry()
+    for i in range(5):
+        telemetry.append(T0.timestamp() + i * 3600, temperature=20.0 + i, duty=50.0)
+
+    return {"adaptive_learner": learner, "telemetry": telemetry}, thermostat
+
+
+def _hass(tmp_path):
+    hass = MagicMock()
+    hass.config.path.side_effect = lambda *parts: str(tmp_path.joinpath(*parts))
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
+    return hass
+
+
+class TestBuildZoneTables:
+    """Tests for snapshotting zone datasets."""
+
+    def test_all_datasets(self):
+        """Test every available dataset is snapshotted in order."""
+        zone_data, thermostat = _zone_sources()
+
+        tables = build_zone_tables(zone_data, thermostat, telemetry_tier="raw")
+
+        assert [table.name for table in tables] == [
+            DATASET_CYCLES,
+            DATASET_PID_HISTORY,
+            DATASET_KE_OBSERVATIONS,
+            DATASET_PREHEAT_OBSERVATIONS,
+            DATASET_TELEMETRY,
+        ]
+        assert all(len(table.rows) == 5 for table in tables)
+        assert tables[-1].fields == TELEMETRY_FIELDS
+
+    def test_time_range_filter(self):
+        """Test start/end filter timestamped datasets but not cycles."""
+        zone_data, thermostat = _zone_sources()
+
+        tables = build_zone_tables(
+            zone_data,
+            thermostat,
+            start=T0 + timedelta(hours=1),
+            end=T0 + timedelta(hours=3),
+            telemetry_tier="raw",
+        )
+
+        rows = {table.name: table.rows for table in tables}
+        assert len(rows[DATASET_CYCLES]) == 5
+        for name in (
+            DATASET_PID_HISTORY,
+            DATASET_KE_OBSERVATIONS,
+            DATASET_PREHEAT_OBSERVATIONS,
+            DATASET_TELEMETRY,
+        ):
+            assert len(rows[name]) == 3, name
+
+    def test_missing_sources_skipped(self):
+        """Test datasets without a source for the zone are left out."""
+        zone_data, _ = _zone_sources()
+        del zone_data["telemetry"]
+
+        tables = build_zone_tables(zone_data, thermostat=None)
+
+        assert [table.name for table in tables] == [DATASET_CYCLES, DATASET_PID_HISTORY]
+
+
+class TestAsyncExportTables:
+    """Tests for chunked file writing."""
+
+    @pytest.mark.asyncio
+    async def test_ndjson_export_in_chunks(self, tmp_path):
+        """Test NDJSON files contain one object per row across chunks."""
+        zone_data, thermostat = _zone_sources()
+        tables = build_zone_tables(
+            zone_data, thermostat, [DATASET_KE_OBSERVATIONS, DATASET_TELEMETRY], telemetry_tier="raw"
+        )
+        hass = _hass(tmp_path)
+
+        written = await async_export_tables(hass, "living_room", tables, "ndjson", chunk_size=2)
+
+        ke_path = written[DATASET_KE_OBSERVATIONS]["path"]
+        assert ke_path.startswith(str(tmp_path / EXPORT_DIR / "living_room_ke_observations_"))
+        assert written[DATASET_KE_OBSERVATIONS]["rows"] == 5
+        with open(ke_path, encoding="utf-8") as file:
+            records = [json.loads(line) for line in file]
+        assert len(records) == 5
+        assert records[0]["timestamp"] == T0.isoformat()
+        assert records[0]["pid_output"] == 40.0
+
+        with open(written[DATASET_TELEMETRY]["path"], encoding="utf-8") as file:
+            records = [json.loads(line) for line in file]
+        assert records[4]["timestamp"] == (T0 + timedelta(hours=4)).isoformat()
+        assert records[4]["temperature"] == pytest.approx(24.0)
+        # Channels never recorded are exported as null
+        assert records[0]["setpoint"] is None
+
+        # mkdir plus three chunks per table
+        assert hass.async_add_executor_job.await_count == 7
+
+    @pytest.mark.asyncio
+    async def test_csv_export(self, tmp_path):
+        """Test CSV files have a header and JSON-encoded nested values."""
+        zone_data, thermostat = _zone_sources()
+        tables = build_zone_tables(zone_data, thermostat, [DATASET_PID_HISTORY])
+
+        written = await async_export_tables(_hass(tmp_path), "zone", tables, "csv", chunk_size=2)
+
+        with open(written[DATASET_PID_HISTORY]["path"], newline="", encoding="utf-8") as file:
+            rows = list(csv.DictReader(file))
+        assert len(rows) == 5
+        assert rows[2]["kp"] == "3.0"
+        assert json.loads(rows[0]["metrics"]) == {"overshoot": 0.1}
+
+    @pytest.mark.asyncio
+    async def test_empty_table_and_bad_format(self, tmp_path):
+        """Test empty datasets still produce a file and unknown formats fail."""
+        zone_data, _ = _zone_sources()
+        zone_data["adaptive_learner"].cycle_history = []
+        tables = build_zone_tables(zone_data, None, [DATASET_CYCLES])
+
+        written = await async_export_tables(_hass(tmp_path), "zone", tables, "csv")
+        with open(written[DATASET_CYCLES]["path"], encoding="utf-8") as file:
+            assert len(file.readlines()) == 1
+
+        with pytest.raises(ValueError):
+            await async_export_tables(_hass(tmp_path), "zone", tables, "xml")
+
+
+class TestExportDataService:
+    """Tests for the export_data service handler."""
+
+    @pytest.mark.asyncio
+    async def test_export_filtered_by_entity(self, tmp_path):
+        """Test only zones of the requested thermostats are exported."""
+        from custom_components.adaptive_thermostat.services import async_handle_export_data
+
+        zone_data, thermostat = _zone_sources()
+        zone_data["climate_entity_id"] = "climate.living_room"
+        coordinator = MagicMock()
+        coordinator.get_all_zones.return_value = {
+            "living_room": zone_data,
+            "bedroom": {"climate_entity_id": "climate.bedroom"},
+        }
+        hass = _hass(tmp_path)
+        hass.data = {"climate": MagicMock()}
+        hass.data["climate"].get_entity.return_value = thermostat
+        call = MagicMock()
+        call.data = {"entity_id": ["climate.living_room"], "datasets": [DATASET_CYCLES]}
+
+        result = await async_handle_export_data(hass, coordinator, call)
+
+        assert list(result["zones"]) == ["living_room"]
+        assert result["files_written"] == 1
+        assert result["zones"]["living_room"][DATASET_CYCLES]["rows"] == 5
+        hass.data["climate"].get_entity.assert_called_once_with("climate.living_room")
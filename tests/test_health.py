@@ -221,3 +221,61 @@ class TestHealthMonitor:
 
         # Bedroom should still trigger warning
         assert monitor_bedroom.check_power_consumption(30.0) is not None
+
+
+class TestIncrementalHealth:
+    """Tests for cached per-zone verdicts."""
+
+    def test_small_changes_reuse_cached_issues(self):
+        """Test checks only re-run when an input changes significantly."""
+        monitor = HealthMonitor("living_room")
+
+        assert monitor.update(12.0, 10.0, True) is True
+        assert monitor.update(12.02, 10.03, True) is False
+        assert monitor.issues[0].message.startswith("Warning: Short cycling detected (12.0 min)")
+
+        assert monitor.update(12.5, 10.0, True) is True
+        assert "(12.5 min)" in monitor.issues[0].message
+        assert monitor.update(12.5, None, True) is True
+        assert monitor.update(12.5, None, False) is True
+        assert monitor.issues[0].issue_type == "sensor_unavailable"
+
+    def test_threshold_crossing_within_tolerance(self):
+        """Test a small move across a threshold still re-runs the checks."""
+        monitor = HealthMonitor("living_room")
+
+        assert monitor.check_all(10.01, None, True)[0].severity == HealthStatus.WARNING
+        assert monitor.check_all(9.99, None, True)[0].severity == HealthStatus.CRITICAL
+        assert monitor.check_all(None, 19.99, True) == []
+        assert monitor.check_all(None, 20.01, True)[0].issue_type == "high_power"
+
+    def test_system_counts_maintained_across_checks(self):
+        """Test repeated system checks match a fresh evaluation."""
+        system = SystemHealthMonitor()
+        zones = {
+            "living_room": {"cycle_time_min": 8.0, "power_w_m2": 10.0, "sensor_available": True},
+            "bedroom": {"cycle_time_min": 12.0, "power_w_m2": 10.0, "sensor_available": True},
+        }
+        result = system.check_all_zones(zones)
+        assert result["status"] == HealthStatus.CRITICAL
+        assert (result["critical_count"], result["warning_count"]) == (1, 1)
+
+        zones["living_room"]["cycle_time_min"] = 30.0
+        result = system.check_all_zones(zones)
+        assert result["status"] == HealthStatus.WARNING
+        assert result["summary"] == "1 warning(s) detected"
+
+        # Removed zones drop out of the verdict
+        del zones["bedroom"]
+        result = system.check_all_zones(zones)
+        assert result["status"] == HealthStatus.HEALTHY
+        assert list(result["zone_issues"]) == ["living_room"]
+        assert result["total_issues"] == 0
+
+        zones["bedroom"] = {"sensor_available": False}
+        result = system.check_all_zones(zones)
+        assert result == {
+            **SystemHealthMonitor().check_all_zones(zones),
+            "zone_issues": result["zone_issues"],
+        }
+        assert result["critical_count"] == 1
@@ -1,7 +1,7 @@
 """Tests for HeaterController manager."""
 
 from datetime import datetime
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
@@ -1773,3 +1773,114 @@ class TestDutyAccumulatorPulse:
         # Accumulator should have increased by ~6s (60s * 10% duty)
         # 200 + 6 = 206 < 300 threshold, so heater stays off
         assert 205.9 < controller._duty_accumulator_seconds < 206.1
+
+
+class TestValveCommandSuppression:
+    """Tests for redundant valve write suppression."""
+
+    @pytest.fixture
+    def valve_controller(self, mock_hass, mock_thermostat):
+        """Create a valve-mode HeaterController with an awaitable service call."""
+        mock_hass.services.async_call = AsyncMock()
+        mock_hass.states.get = MagicMock(return_value=None)
+        return HeaterController(
+            hass=mock_hass,
+            thermostat=mock_thermostat,
+            heater_entity_id=["number.trv"],
+            cooler_entity_id=None,
+            demand_switch_entity_id=None,
+            heater_polarity_invert=False,
+            pwm=0,
+            difference=100.0,
+            min_on_cycle_duration=0.0,
+            min_off_cycle_duration=0.0,
+        )
+
+    @pytest.mark.asyncio
+    async def test_unchanged_value_suppressed(self, valve_controller):
+        """Test a repeated value within the deadband is not resent."""
+        await valve_controller.async_set_valve_value(40.0, MockHVACMode.HEAT)
+        await valve_controller.async_set_valve_value(40.0, MockHVACMode.HEAT)
+        await valve_controller.async_set_valve_value(40.3, MockHVACMode.HEAT)
+
+        assert valve_controller._hass.services.async_call.call_count == 1
+        assert valve_controller.valve_commands_sent == 1
+        assert valve_controller.valve_commands_suppressed == 2
+
+    @pytest.mark.asyncio
+    async def test_change_beyond_deadband_and_full_close_sent(self, valve_controller):
+        """Test changes beyond the deadband and closing to zero are always sent."""
+        await valve_controller.async_set_valve_value(0.3, MockHVACMode.HEAT)
+        await valve_controller.async_set_valve_value(0.0, MockHVACMode.HEAT)
+        await valve_controller.async_set_valve_value(25.0, MockHVACMode.HEAT)
+
+        assert valve_controller.valve_commands_sent == 3
+        assert valve_controller.valve_commands_suppressed == 0
+
+    @pytest.mark.asyncio
+    async def test_keepalive_resends(self, valve_controller):
+        """Test an unchanged command is resent after the keep-alive interval."""
+        with patch.object(heater_controller_module.time, "monotonic", return_value=1000.0):
+            await valve_controller.async_set_valve_value(40.0, MockHVACMode.HEAT)
+        later = 1000.0 + heater_controller_module.VALVE_COMMAND_KEEPALIVE_SECONDS
+        with patch.object(heater_controller_module.time, "monotonic", return_value=later):
+            await valve_controller.async_set_valve_value(40.0, MockHVACMode.HEAT)
+
+        assert valve_controller.valve_commands_sent == 2
+
+    @pytest.mark.asyncio
+    async def test_drift_after_confirmation_resends(self, valve_controller):
+        """Test a device moving away from a confirmed value triggers a resend."""
+        states = valve_controller._hass.states
+        await valve_controller.async_set_valve_value(40.0, MockHVACMode.HEAT)
+
+        # Not yet reported - slow device, no resend
+        states.get = MagicMock(return_value=MagicMock(state="10"))
+        await valve_controller.async_set_valve_value(40.0, MockHVACMode.HEAT)
+        assert valve_controller.valve_commands_sent == 1
+
+        # Device confirms, then drifts
+        states.get = MagicMock(return_value=MagicMock(state="40"))
+        await valve_controller.async_set_valve_value(40.0, MockHVACMode.HEAT)
+        states.get = MagicMock(return_value=MagicMock(state="10"))
+        await valve_controller.async_set_valve_value(40.0, MockHVACMode.HEAT)
+
+        assert valve_controller.valve_commands_sent == 2
+        assert valve_controller.valve_commands_suppressed == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_command_not_cached(self, valve_controller):
+        """Test a failed service call is retried on the next update."""
+        valve_controller._hass.services.async_call.side_effect = [Exception("radio"), None]
+
+        await valve_controller.async_set_valve_value(40.0, MockHVACMode.HEAT)
+        await valve_controller.async_set_valve_value(40.0, MockHVACMode.HEAT)
+
+        assert valve_controller._hass.services.async_call.call_count == 2
+        assert valve_controller.valve_commands_suppressed == 0
+
+    @pytest.mark.asyncio
+    async def test_service_calls_use_shared_command_queue(self, mock_hass, mock_thermostat):
+        """Test service calls go through the queue passed in by the integration."""
+        from custom_components.adaptive_thermostat.managers.command_queue import HeaterCommandQueue
+
+        mock_hass.services.async_call = AsyncMock()
+        queue = HeaterCommandQueue()
+        controller = HeaterController(
+            hass=mock_hass,
+            thermostat=mock_thermostat,
+            heater_entity_id=["number.trv"],
+            cooler_entity_id=None,
+            demand_switch_entity_id=None,
+            heater_polarity_invert=False,
+            pwm=0,
+            difference=100.0,
+            min_on_cycle_duration=0.0,
+            min_off_cycle_duration=0.0,
+            command_queue=queue,
+        )
+
+        await controller.async_set_valve_value(40.0, MockHVACMode.HEAT)
+
+        assert controller.command_queue is queue
+        assert queue.submitted_count == 1
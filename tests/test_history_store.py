@@ -341,3 +341,61 @@ def test_get_snapshot_for_week():
     # Non-existent week
     not_found = store.get_snapshot_for_week(2024, 10)
     assert not_found is None
+
+
+def _weekly_snapshot(year, week, cost=40.0):
+    return WeeklySnapshot(
+        year=year,
+        week_number=week,
+        total_cost=cost,
+        total_energy_kwh=None,
+        zones={},
+        timestamp="2024-01-01T10:00:00",
+    )
+
+
+def test_retention_enforced_on_insert():
+    """Test configurable retention drops the oldest weeks across years."""
+    store = HistoryStore(MagicMock(), max_weeks=3)
+
+    store._data = [
+        _weekly_snapshot(2025, 1),
+        _weekly_snapshot(2023, 52),
+        _weekly_snapshot(2024, 10),
+        _weekly_snapshot(2024, 30),
+    ]
+
+    assert [(s.year, s.week_number) for s in store._data] == [
+        (2025, 1), (2024, 30), (2024, 10)
+    ]
+    assert store.get_snapshot_for_week(2023, 52) is None
+    assert store.get_snapshot_for_week(2024, 10).year == 2024
+
+
+@pytest.mark.asyncio
+async def test_save_replaces_week_and_reuses_stored_form():
+    """Test re-saving a week replaces it and loaded snapshots are not re-serialized."""
+    import sys
+
+    stored_item = _weekly_snapshot(2024, 1).to_dict()
+    mock_ha_storage = MagicMock()
+    mock_store_instance = AsyncMock()
+    mock_store_instance.async_load = AsyncMock(return_value={"snapshots": [stored_item]})
+    mock_store_instance.async_save = AsyncMock()
+    mock_ha_storage.Store = MagicMock(return_value=mock_store_instance)
+    sys.modules["homeassistant.helpers.storage"] = mock_ha_storage
+
+    try:
+        store = HistoryStore(MagicMock())
+        await store.async_save_snapshot(_weekly_snapshot(2024, 2, cost=10.0))
+        await store.async_save_snapshot(_weekly_snapshot(2024, 2, cost=20.0))
+
+        # Loaded once, on the first save
+        mock_store_instance.async_load.assert_called_once()
+        saved = mock_store_instance.async_save.call_args[0][0]["snapshots"]
+        assert [item["week_number"] for item in saved] == [2, 1]
+        assert saved[0]["total_cost"] == 20.0
+        assert saved[1] is stored_item
+    finally:
+        if "homeassistant.helpers.storage" in sys.modules:
+            del sys.modules["homeassistant.helpers.storage"]
@@ -764,6 +764,8 @@ class TestAsyncUnregisterServices:
             SERVICE_COST_REPORT,
             SERVICE_SET_VACATION_MODE,
             SERVICE_PID_RECOMMENDATIONS,
+            SERVICE_TUNE_PID,
+            SERVICE_EXPORT_DATA,
         )
         from custom_components.adaptive_thermostat.const import DOMAIN
 
@@ -775,13 +777,15 @@ class TestAsyncUnregisterServices:
         async_unregister_services(hass)
 
         # Verify async_remove was called for each service
-        # 3 public services + 2 debug services (health_check no longer exists)
+        # 4 public services + 3 debug services (health_check no longer exists)
         expected_services = [
             SERVICE_RUN_LEARNING,
             SERVICE_WEEKLY_REPORT,
             SERVICE_COST_REPORT,
             SERVICE_SET_VACATION_MODE,
             SERVICE_PID_RECOMMENDATIONS,
+            SERVICE_TUNE_PID,
+            SERVICE_EXPORT_DATA,
         ]
 
         assert hass.services.async_remove.call_count == len(expected_services)
@@ -77,7 +77,6 @@ class TestIntegralAccumulationRate:
             cold_tolerance=0.3,
             hot_tolerance=0.3,
         )
-        self.pid_controller.set_feedforward = Mock()
 
         # Create mock heater controller
         self.heater_controller = Mock()
@@ -228,7 +227,6 @@ class TestIntegralAccumulationRate:
             kp=100.0, ki=0.1, kd=50.0, ke=0,
             out_min=0, out_max=100, sampling_period=0,
         )
-        pid1.set_feedforward = Mock()
         manager1 = ControlOutputManager(
             thermostat_state=thermostat_state1,
             pid_controller=pid1,
@@ -253,7 +251,6 @@ class TestIntegralAccumulationRate:
             kp=100.0, ki=0.1, kd=50.0, ke=0,
             out_min=0, out_max=100, sampling_period=0,
         )
-        pid2.set_feedforward = Mock()
         manager2 = ControlOutputManager(
             thermostat_state=thermostat_state2,
             pid_controller=pid2,
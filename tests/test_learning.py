@@ -1849,6 +1849,60 @@ def test_story_3_5_features():
     assert hasattr(learner, 'get_last_adjustment_time')
 
 
+class TestLearnerSnapshot:
+    """Tests for calculating adjustments on a snapshot and merging back."""
+
+    def _learner_with_overshoot(self):
+        learner = AdaptiveLearner()
+        for _ in range(6):
+            learner.add_cycle_metrics(CycleMetrics(
+                overshoot=0.6,
+                oscillations=0,
+                settling_time=30,
+                rise_time=20,
+            ))
+        return learner
+
+    def test_snapshot_is_independent(self):
+        """Test that calculating on a snapshot leaves the live learner untouched."""
+        learner = self._learner_with_overshoot()
+
+        snapshot = learner.create_snapshot()
+        result = snapshot.calculate_pid_adjustment(100.0, 1.0, 10.0)
+
+        assert result is not None
+        assert snapshot._last_adjustment_time is not None
+        assert learner._last_adjustment_time is None
+        assert snapshot._rule_state_tracker is not learner._rule_state_tracker
+
+    def test_merge_matches_direct_calculation(self):
+        """Test that merging a snapshot applies the same state as a direct call."""
+        learner = self._learner_with_overshoot()
+        direct = self._learner_with_overshoot()
+
+        snapshot = learner.create_snapshot()
+        result = snapshot.calculate_pid_adjustment(100.0, 1.0, 10.0)
+        learner.merge_snapshot(snapshot, result)
+
+        assert result == direct.calculate_pid_adjustment(100.0, 1.0, 10.0)
+        assert learner._last_adjustment_time == snapshot._last_adjustment_time
+        assert learner._cycles_since_last_adjustment == 0
+        assert learner._rule_state_tracker._rule_states == direct._rule_state_tracker._rule_states
+        # Rate limiting now applies to the live learner
+        assert learner.calculate_pid_adjustment(100.0, 1.0, 10.0) is None
+
+    def test_merge_without_recommendation_keeps_rate_limit_state(self):
+        """Test that a snapshot without a recommendation does not reset rate limiting."""
+        learner = AdaptiveLearner()
+        learner._cycles_since_last_adjustment = 4
+
+        snapshot = learner.create_snapshot()
+        learner.merge_snapshot(snapshot, snapshot.calculate_pid_adjustment(100.0, 1.0, 10.0))
+
+        assert learner._last_adjustment_time is None
+        assert learner._cycles_since_last_adjustment == 4
+
+
 # ============================================================================
 # PID Limits Tests (Story 7.4)
 # ============================================================================
@@ -54,6 +54,10 @@ def test_overshoot_sensor_value():
         CycleMetrics,
         AdaptiveLearner,
     )
+    from custom_components.adaptive_thermostat.snapshot import (
+        CoordinatorSnapshot,
+        build_zone_snapshot,
+    )
 
     # Create mock hass
     mock_hass = Mock()
@@ -89,7 +93,10 @@ def test_overshoot_sensor_value():
 
     # Set up coordinator with zone data
     coordinator = Mock()
-    coordinator.get_zone_data.return_value = {"adaptive_learner": learner}
+    coordinator.snapshot = CoordinatorSnapshot(
+        version=1,
+        zones={"test_zone": build_zone_snapshot("test_zone", {"adaptive_learner": learner})},
+    )
 
     mock_hass.data = {"adaptive_thermostat": {"coordinator": coordinator}}
 
@@ -106,6 +113,21 @@ def test_overshoot_sensor_value():
     assert sensor._attr_name == "Test Zone Overshoot"
     assert sensor._attr_unique_id == "test_zone_overshoot"
 
+    # Same snapshot version: the sensor skips recomputation
+    learner.cycle_history = [cycle1]
+    stale = CoordinatorSnapshot(
+        version=1,
+        zones={"test_zone": build_zone_snapshot("test_zone", {"adaptive_learner": learner})},
+    )
+    coordinator.snapshot = stale
+    asyncio.run(sensor.async_update())
+    assert sensor.native_value == pytest.approx(0.4, abs=0.01)
+
+    # New version: the sensor picks up the new summary
+    coordinator.snapshot = CoordinatorSnapshot(version=2, zones=stale.zones)
+    asyncio.run(sensor.async_update())
+    assert sensor.native_value == pytest.approx(0.5, abs=0.01)
+
 
 def test_settling_time_in_minutes_conversion():
     """Test settling time sensor returns value in minutes."""
@@ -156,6 +178,10 @@ def test_settling_time_in_minutes_conversion():
         CycleMetrics,
         AdaptiveLearner,
     )
+    from custom_components.adaptive_thermostat.snapshot import (
+        CoordinatorSnapshot,
+        build_zone_snapshot,
+    )
 
     # Create mock hass
     mock_hass = Mock()
@@ -191,7 +217,10 @@ def test_settling_time_in_minutes_conversion():
 
     # Set up coordinator with zone data
     coordinator = Mock()
-    coordinator.get_zone_data.return_value = {"adaptive_learner": learner}
+    coordinator.snapshot = CoordinatorSnapshot(
+        version=1,
+        zones={"test_zone": build_zone_snapshot("test_zone", {"adaptive_learner": learner})},
+    )
 
     mock_hass.data = {"adaptive_thermostat": {"coordinator": coordinator}}
 
@@ -207,3 +236,102 @@ def test_settling_time_in_minutes_conversion():
     assert sensor.native_value == pytest.approx(45.0, abs=0.1)
     assert sensor._attr_name == "Test Zone Settling Time"
     assert sensor._attr_unique_id == "test_zone_settling_time"
+
+
+def _import_sensor_platform():
+    """Import the sensor platform with Home Assistant sensor modules mocked."""
+    import sys
+    from abc import ABC
+
+    if "custom_components.adaptive_thermostat.sensor" not in sys.modules:
+        class MockSensorEntity:
+            pass
+
+        class MockRestoreEntity(ABC):
+            pass
+
+        class MockEvent:
+            """Mock Event class that supports generic subscripting."""
+            def __class_getitem__(cls, item):
+                return cls
+
+        mock_sensor_module = Mock()
+        mock_sensor_module.SensorEntity = MockSensorEntity
+        mock_core = Mock()
+        mock_core.Event = MockEvent
+        mock_restore_state = Mock()
+        mock_restore_state.RestoreEntity = MockRestoreEntity
+
+        sys.modules['homeassistant.core'] = mock_core
+        sys.modules['homeassistant.components.sensor'] = mock_sensor_module
+        sys.modules['homeassistant.helpers.entity_platform'] = Mock()
+        sys.modules['homeassistant.helpers.typing'] = Mock()
+        sys.modules['homeassistant.helpers.restore_state'] = mock_restore_state
+
+    import custom_components.adaptive_thermostat.sensor as sensor_platform
+    return sensor_platform
+
+
+@pytest.mark.asyncio
+async def test_overshoot_sensor_pushes_on_new_snapshot():
+    """Test learner sensors push state on new snapshots and skip unchanged ones."""
+    from custom_components.adaptive_thermostat.adaptive.learning import (
+        CycleMetrics,
+        AdaptiveLearner,
+    )
+    from custom_components.adaptive_thermostat.snapshot import (
+        CoordinatorSnapshot,
+        build_zone_snapshot,
+    )
+
+    sensor_platform = _import_sensor_platform()
+
+    learner = AdaptiveLearner()
+    zone_data = {"adaptive_learner": learner}
+
+    coordinator = Mock()
+    coordinator.get_zone_data.return_value = zone_data
+    coordinator.async_add_listener.return_value = Mock()
+
+    def publish():
+        zones = {"test_zone": build_zone_snapshot("test_zone", zone_data)}
+        previous = coordinator.snapshot
+        if previous is None or previous.zones != zones:
+            version = previous.version + 1 if previous else 1
+            coordinator.snapshot = CoordinatorSnapshot(version=version, zones=zones)
+        return coordinator.snapshot
+
+    coordinator.snapshot = None
+    publish()
+
+    tasks = []
+    mock_hass = Mock()
+    mock_hass.data = {"adaptive_thermostat": {"coordinator": coordinator}}
+    mock_hass.async_create_task = tasks.append
+
+    sensor = sensor_platform.OvershootSensor(mock_hass, "test_zone", "Test Zone", "climate.test_zone")
+    sensor.async_write_ha_state = Mock()
+    sensor._subscribe_push_updates()
+    coordinator.async_add_listener.assert_called_once()
+
+    # First snapshot is new to the sensor, but the value stays 0.0
+    sensor._handle_snapshot_update()
+    await tasks.pop()
+    sensor.async_write_ha_state.assert_not_called()
+
+    # Unchanged snapshot: no work scheduled, and the sensor never republishes
+    sensor._handle_snapshot_update()
+    assert tasks == []
+    coordinator.publish_snapshot.assert_not_called()
+
+    # The coordinator republishes after a finished cycle and the new value is pushed
+    learner.add_cycle_metrics(CycleMetrics(overshoot=0.6, settling_time=40.0, oscillations=1))
+    publish()
+    sensor._handle_snapshot_update()
+    await tasks.pop()
+    assert sensor.native_value == pytest.approx(0.6)
+    sensor.async_write_ha_state.assert_called_once()
+
+    # Unsubscribing removes the coordinator listener
+    sensor._unsubscribe_push_updates()
+    coordinator.async_add_listener.return_value.assert_called_once()
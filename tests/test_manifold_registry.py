@@ -1142,3 +1142,29 @@ class TestWorstCaseTransportDelay:
         # 20L / 1 L/min = 20 min
         delay_low = registry.get_worst_case_transport_delay("climate.zone2", zone_loops=1)
         assert delay_low == 20.0
+
+
+class TestMeasuredTransportDelay:
+    """Test calibration of transport delay from identified dead times."""
+
+    def test_measured_delay_replaces_pipe_volume(self):
+        """Test that a measured single-zone delay is reproduced for that zone."""
+        manifold = Manifold(name="Ground", zones=["climate.kitchen", "climate.living"], pipe_volume=20.0)
+        registry = ManifoldRegistry([manifold])
+
+        registry.set_measured_transport_delay("climate.kitchen", 6.0, zone_loops=2)
+
+        assert registry.get_worst_case_transport_delay("climate.kitchen", zone_loops=2) == pytest.approx(6.0)
+        # More active loops on the manifold still shorten the delay
+        delay = registry.get_transport_delay("climate.living", {"climate.kitchen": 2, "climate.living": 2})
+        assert delay == pytest.approx(3.0)
+
+    def test_measured_delay_ignored_for_unknown_zone_or_zero(self):
+        """Test that unknown zones and non-positive delays leave configuration untouched."""
+        manifold = Manifold(name="Ground", zones=["climate.kitchen"], pipe_volume=20.0, flow_per_loop=2.0)
+        registry = ManifoldRegistry([manifold])
+
+        registry.set_measured_transport_delay("climate.unknown", 30.0)
+        registry.set_measured_transport_delay("climate.kitchen", 0.0)
+
+        assert registry.get_worst_case_transport_delay("climate.kitchen") == pytest.approx(10.0)
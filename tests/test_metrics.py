@@ -0,0 +1,78 @@
+"""Tests for the zone metrics registry."""
+from custom_components.adaptive_thermostat.metrics import (
+    METRIC_COMFORT_SCORE,
+    METRIC_CYCLE_TIME,
+    METRIC_DUTY_CYCLE,
+    MetricsRegistry,
+)
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry."""
+
+    def test_publish_and_get(self):
+        """Test published values are stored as floats per zone."""
+        registry = MetricsRegistry()
+        registry.publish("living_room", METRIC_DUTY_CYCLE, 42)
+
+        assert registry.get("living_room", METRIC_DUTY_CYCLE) == 42.0
+        assert registry.get("living_room", METRIC_CYCLE_TIME) is None
+        assert registry.get("bedroom", METRIC_DUTY_CYCLE) is None
+        assert dict(registry.get_zone("living_room")) == {METRIC_DUTY_CYCLE: 42.0}
+
+    def test_publish_none_withdraws(self):
+        """Test publishing None removes the metric and empty zones."""
+        registry = MetricsRegistry()
+        registry.publish("living_room", METRIC_CYCLE_TIME, 18.5)
+        registry.publish("living_room", METRIC_CYCLE_TIME, None)
+
+        assert registry.get("living_room", METRIC_CYCLE_TIME) is None
+        assert dict(registry.get_zone("living_room")) == {}
+
+    def test_collect_all_zones(self):
+        """Test collect returns every requested zone and metric in one pass."""
+        registry = MetricsRegistry()
+        registry.publish("living_room", METRIC_DUTY_CYCLE, 30.0)
+        registry.publish("living_room", METRIC_COMFORT_SCORE, 85.0)
+        registry.publish("kitchen", METRIC_DUTY_CYCLE, 10.0)
+
+        collected = registry.collect(
+            ["living_room", "bedroom"], (METRIC_DUTY_CYCLE, METRIC_COMFORT_SCORE)
+        )
+
+        assert collected == {
+            "living_room": {METRIC_DUTY_CYCLE: 30.0, METRIC_COMFORT_SCORE: 85.0},
+            "bedroom": {METRIC_DUTY_CYCLE: None, METRIC_COMFORT_SCORE: None},
+        }
+
+    def test_remove_zone(self):
+        """Test removing a zone drops all of its metrics."""
+        registry = MetricsRegistry()
+        registry.publish("living_room", METRIC_DUTY_CYCLE, 30.0)
+        registry.publish("living_room", METRIC_CYCLE_TIME, 20.0)
+        registry.remove_zone("living_room")
+        registry.remove_zone("unknown")
+
+        assert registry.collect(["living_room"], (METRIC_DUTY_CYCLE,)) == {
+            "living_room": {METRIC_DUTY_CYCLE: None}
+        }
+
+    def test_subscribe_notifies_on_change(self):
+        """Test listeners are called when a zone metric changes or is withdrawn."""
+        registry = MetricsRegistry()
+        values = []
+        unsub = registry.subscribe("living_room", METRIC_DUTY_CYCLE, values.append)
+
+        registry.publish("living_room", METRIC_DUTY_CYCLE, 30)
+        registry.publish("living_room", METRIC_DUTY_CYCLE, 30.0)
+        registry.publish("living_room", METRIC_CYCLE_TIME, 20.0)
+        registry.publish("kitchen", METRIC_DUTY_CYCLE, 10.0)
+        registry.publish("living_room", METRIC_DUTY_CYCLE, None)
+        registry.withdraw("living_room", METRIC_DUTY_CYCLE)
+
+        assert values == [30.0, None]
+
+        unsub()
+        unsub()
+        registry.publish("living_room", METRIC_DUTY_CYCLE, 40.0)
+        assert values == [30.0, None]
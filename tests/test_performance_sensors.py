@@ -160,8 +160,14 @@ def test_power_m2_estimation():
     mock_hass = Mock()
     mock_hass.states = Mock()
 
+    from custom_components.adaptive_thermostat.metrics import (
+        METRIC_DUTY_CYCLE,
+        MetricsRegistry,
+    )
+
     # Set up coordinator with zone data
     coordinator = Mock()
+    coordinator.metrics = MetricsRegistry()
     coordinator.get_zone_data.return_value = {
         "area_m2": 20.0,
         "max_power_w_m2": 100.0,
@@ -179,10 +185,8 @@ def test_power_m2_estimation():
         climate_entity_id="climate.living_room",
     )
 
-    # Mock duty cycle sensor at 50%
-    duty_cycle_state = Mock()
-    duty_cycle_state.state = "50.0"
-    mock_hass.states.get.return_value = duty_cycle_state
+    # Duty cycle sensor published 50%
+    coordinator.metrics.publish("living_room", METRIC_DUTY_CYCLE, 50.0)
 
     # Calculate power/m2
     result = asyncio.run(sensor._calculate_power_m2())
@@ -191,12 +195,17 @@ def test_power_m2_estimation():
     assert result == pytest.approx(50.0, rel=1e-2)
 
     # Test with 25% duty cycle
-    duty_cycle_state.state = "25.0"
+    coordinator.metrics.publish("living_room", METRIC_DUTY_CYCLE, 25.0)
     result = asyncio.run(sensor._calculate_power_m2())
     assert result == pytest.approx(25.0, rel=1e-2)
 
     # Test with 0% duty cycle
-    duty_cycle_state.state = "0.0"
+    coordinator.metrics.publish("living_room", METRIC_DUTY_CYCLE, 0.0)
+    result = asyncio.run(sensor._calculate_power_m2())
+    assert result == pytest.approx(0.0, rel=1e-2)
+
+    # Test without a published duty cycle
+    coordinator.metrics.withdraw("living_room", METRIC_DUTY_CYCLE)
     result = asyncio.run(sensor._calculate_power_m2())
     assert result == pytest.approx(0.0, rel=1e-2)
 
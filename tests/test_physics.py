@@ -30,6 +30,14 @@ class TestThermalTimeConstant:
         # Larger volume = higher tau (slower response)
         assert tau_large > tau_small
 
+    def test_measured_tau_overrides_estimate(self):
+        """Test that an identified time constant replaces the physics estimate."""
+        assert calculate_thermal_time_constant(volume_m3=100, measured_tau=3.7) == 3.7
+        # Valid even without volume or energy rating
+        assert calculate_thermal_time_constant(measured_tau=5.2) == 5.2
+        # Non-positive measurement falls back to the estimate
+        assert calculate_thermal_time_constant(volume_m3=100, measured_tau=0) == pytest.approx(2.0, abs=0.01)
+
     def test_thermal_time_constant_from_energy_rating(self):
         """Test tau calculation from energy efficiency rating."""
         # A+++ rating (best insulation) should have highest tau
@@ -0,0 +1,147 @@
+"""Tests for the offline PID auto-tuner and zone model."""
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+import asyncio
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from custom_components.adaptive_thermostat.adaptive.cycle_analysis import CycleMetrics
+from custom_components.adaptive_thermostat.adaptive.pid_autotune import (
+    TuningRequest,
+    async_tune_pid,
+    build_scenarios,
+    default_controller_options,
+    evaluate_gains,
+    tune_pid,
+)
+from custom_components.adaptive_thermostat.adaptive.zone_model import ZoneModel
+from custom_components.adaptive_thermostat.pid_controller.batch import BatchPID
+
+
+def _request(gains, comparisons=None, heating_type="radiator"):
+    model = ZoneModel.from_physics(heating_type, 3.0, 8.0)
+    return TuningRequest(
+        zone_id="living_room",
+        model=model,
+        scenarios=build_scenarios([], 20.0, horizon_hours=6.0),
+        current_gains=gains,
+        comparisons=comparisons or {},
+        controller_options=default_controller_options(heating_type, model),
+        refine_iterations=4,
+    )
+
+
+class TestZoneModel:
+    """Tests for ZoneModel simulation."""
+
+    def test_invalid_parameters_rejected(self):
+        """Test that non-physical parameters raise ValueError."""
+        with pytest.raises(ValueError):
+            ZoneModel(gain=0, time_constant_hours=2.0)
+        with pytest.raises(ValueError):
+            ZoneModel(gain=40, time_constant_hours=0)
+
+    def test_round_trip_dict(self):
+        """Test to_dict/from_dict round trip."""
+        model = ZoneModel(gain=35.0, time_constant_hours=4.0, dead_time_minutes=12.0, heating_type="convector")
+        assert ZoneModel.from_dict(model.to_dict()) == model
+
+    def test_constant_output_settles_at_steady_state(self):
+        """Test open-loop response converges to outdoor + gain * output."""
+        model = ZoneModel(gain=40.0, time_constant_hours=1.0, dead_time_minutes=10.0)
+        # Kp/Kd zero and fixed integral give a constant 50% output
+        controllers = BatchPID(kp=[0.0], ki=0.0, kd=0.0, out_min=0, out_max=100)
+        controllers.integral = 50.0
+
+        temps, outputs = model.simulate(controllers, [40.0] * 720, [5.0] * 720, 5.0, initial_output=50.0)
+
+        assert outputs[-1, 0] == pytest.approx(50.0)
+        assert temps[-1, 0] == pytest.approx(25.0, abs=0.01)
+
+    def test_dead_time_delays_response(self):
+        """Test that output changes reach temperature only after the dead time."""
+        model = ZoneModel(gain=40.0, time_constant_hours=1.0, dead_time_minutes=10.0)
+        controllers = BatchPID(kp=[0.0], ki=0.0, kd=0.0, out_min=0, out_max=100)
+        controllers.integral = 50.0
+
+        temps, _ = model.simulate(controllers, [20.0] * 30, [5.0] * 30, 5.0, initial_output=0.0)
+
+        assert np.all(temps[:11, 0] == 5.0)
+        assert temps[12, 0] > 5.0
+
+
+class TestBuildScenarios:
+    """Tests for scenario construction from recorded cycles."""
+
+    def test_default_outdoor_when_no_cycles(self):
+        """Test a single default scenario without recorded outdoor temperatures."""
+        scenarios = build_scenarios([], 21.0, horizon_hours=1.0, step_seconds=60.0)
+
+        assert len(scenarios) == 1
+        assert len(scenarios[0].setpoints) == 60
+        assert scenarios[0].initial_temp == pytest.approx(19.5)
+
+    def test_outdoor_quantiles_capped(self):
+        """Test outdoor temperatures from many cycles are reduced to quantiles."""
+        cycles = [CycleMetrics(outdoor_temp_avg=float(t)) for t in range(-5, 15)]
+
+        scenarios = build_scenarios(cycles, 21.0, max_scenarios=4)
+
+        outdoor = [s.outdoor_temps[0] for s in scenarios]
+        assert len(scenarios) == 4
+        assert outdoor[0] == pytest.approx(-5.0)
+        assert outdoor[-1] == pytest.approx(14.0)
+
+
+class TestTunePid:
+    """Tests for the tuning search."""
+
+    def test_improves_on_poor_gains(self):
+        """Test that tuning finds gains scoring better than aggressive current gains."""
+        request = _request({"kp": 2.0, "ki": 40.0, "kd": 200.0, "ke": 0.0})
+
+        result = tune_pid(request)
+
+        assert result.best.score < result.current.score
+        assert result.best.overshoot <= result.current.overshoot
+        assert result.candidates_evaluated > 100
+
+    def test_comparisons_scored_on_same_model(self):
+        """Test that comparison gain sets are evaluated alongside the search."""
+        physics = {"kp": 0.5, "ki": 2.0, "kd": 2.0, "ke": 0.0}
+        request = _request({"kp": 1.0, "ki": 4.0, "kd": 4.0, "ke": 0.0}, {"physics": physics})
+
+        result = tune_pid(request)
+        expected = evaluate_gains(request, np.array([[0.5, 2.0, 2.0, 0.0]]))
+
+        assert result.comparisons["physics"].score == pytest.approx(float(expected["score"][0]))
+        assert result.best.score <= result.comparisons["physics"].score
+        assert "physics" in result.to_dict()["comparisons"]
+
+    def test_zero_ke_not_searched(self):
+        """Test that Ke stays zero when the zone does not use outdoor compensation."""
+        result = tune_pid(_request({"kp": 1.0, "ki": 4.0, "kd": 4.0, "ke": 0.0}))
+
+        assert result.best.gains["ke"] == 0.0
+
+
+class TestAsyncTunePid:
+    """Tests for executor dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_runs_each_request_in_executor(self):
+        """Test that each zone is tuned off the loop and failures are isolated."""
+        hass = Mock()
+        hass.loop = asyncio.get_running_loop()
+        good = _request({"kp": 1.0, "ki": 4.0, "kd": 4.0, "ke": 0.0})
+        bad = _request({"kp": 1.0, "ki": 4.0, "kd": 4.0, "ke": 0.0})
+        bad.scenarios = []
+        bad.model = None
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = await async_tune_pid(hass, [good, bad], executor=executor)
+
+        assert results[0].zone_id == "living_room"
+        assert isinstance(results[1], BaseException)
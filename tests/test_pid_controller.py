@@ -2824,5 +2824,50 @@ class TestDecayIntegral:
             f"Expected integral {expected}, got {pid.integral}"
 
 
+class TestPIDFastPath:
+    """Test precompiled constants and slot layout used by the calc() fast path."""
+
+    def test_instances_have_no_dict(self):
+        """Test that PID uses __slots__ so arbitrary attributes are rejected."""
+        pid = PID(kp=10, ki=1.2, kd=0, out_min=0, out_max=100)
+
+        assert not hasattr(pid, "__dict__")
+        with pytest.raises(AttributeError):
+            pid.unknown_attribute = 1
+
+    def test_heating_type_constants_resolved_at_construction(self):
+        """Test that decay exponent and threshold are cached per heating type."""
+        floor = PID(kp=10, ki=1.2, kd=0, out_min=0, out_max=100, heating_type="floor_hydronic")
+        forced = PID(kp=10, ki=1.2, kd=0, out_min=0, out_max=100, heating_type="forced_air")
+        unknown = PID(kp=10, ki=1.2, kd=0, out_min=0, out_max=100, heating_type="unknown")
+
+        assert floor._decay_exponent == 2.0
+        assert floor._decay_threshold == 30.0
+        assert forced._decay_exponent == 0.5
+        assert forced._decay_threshold == 60.0
+        assert unknown._decay_exponent == 1.0
+        assert unknown._decay_threshold == 50.0
+
+    def test_set_pid_param_keeps_cached_constants(self):
+        """Test that set_pid_param re-resolves cached heating-type constants."""
+        pid = PID(kp=10, ki=1.2, kd=0, out_min=0, out_max=100, heating_type="floor_hydronic")
+
+        pid.set_pid_param(kp=20, ki=2.0)
+
+        assert pid._decay_exponent == 2.0
+        assert pid._decay_threshold == 30.0
+
+    def test_non_finite_inputs_return_cached_output(self):
+        """Test that NaN/Inf inputs leave state untouched and report no update."""
+        pid = PID(kp=10, ki=1.2, kd=0, out_min=0, out_max=100)
+        pid.calc(input_val=19.0, set_point=20.0, input_time=0.0, last_input_time=None)
+        output, _ = pid.calc(input_val=19.0, set_point=20.0, input_time=300.0, last_input_time=0.0)
+
+        for bad in (float("nan"), float("inf"), float("-inf")):
+            assert pid.calc(bad, 20.0, 600.0, 300.0) == (output, False)
+            assert pid.calc(19.0, bad, 600.0, 300.0) == (output, False)
+            assert pid.calc(19.0, 20.0, 600.0, 300.0, ext_temp=bad) == (output, False)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -345,3 +345,41 @@ class TestPreheatLearner:
         # Should be limited to 100 observations per bin
         observations = learner._observations.get(("2-4", "mild"), [])
         assert len(observations) <= 100
+
+
+class TestPreheatMeasuredModel:
+    """Tests for the identified-model fallback rate."""
+
+    def test_measured_model_replaces_fallback_rate(self):
+        """Test that an identified model sets the rate when bins lack observations."""
+        learner = PreheatLearner(HEATING_TYPE_RADIATOR)
+        configured = learner.estimate_time_to_target(18.0, 20.0, 5.0)
+
+        # Full output rate at midpoint 19°C: (40 - (19 - 5)) / 2h = 13°C/h
+        learner.set_measured_model(gain=40.0, time_constant_hours=2.0)
+        measured = learner.estimate_time_to_target(18.0, 20.0, 5.0)
+
+        margin = (1.0 + 2.0 / 10.0 * 0.3) * learner.cold_soak_margin
+        assert measured == pytest.approx(2.0 / 13.0 * 60.0 * margin)
+        assert measured != configured
+
+    def test_measured_rate_floored(self):
+        """Test that an underpowered model never yields a vanishing rate."""
+        learner = PreheatLearner(HEATING_TYPE_RADIATOR)
+        learner.set_measured_model(gain=10.0, time_constant_hours=3.0)
+
+        minutes = learner.estimate_time_to_target(18.0, 20.0, -10.0)
+
+        assert minutes <= learner.max_hours * 60.0
+        assert learner._get_fallback_rate(18.0, 20.0, -10.0) == pytest.approx(learner.fallback_rate * 0.25)
+
+    def test_observations_take_precedence(self):
+        """Test that learned observations still override the measured model."""
+        learner = PreheatLearner(HEATING_TYPE_RADIATOR)
+        learner.set_measured_model(gain=40.0, time_constant_hours=2.0)
+        now = datetime(2024, 1, 15, 6, 0)
+        for i in range(5):
+            learner.add_observation(18.0, 20.0, 5.0, 60.0, timestamp=now + timedelta(days=i))
+
+        margin = (1.0 + 2.0 / 10.0 * 0.3) * learner.cold_soak_margin
+        assert learner.estimate_time_to_target(18.0, 20.0, 5.0) == pytest.approx(60.0 * margin)
@@ -0,0 +1,285 @@
+"""Tests for PWM phase staggering across zones."""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import custom_components.adaptive_thermostat.managers.heater_controller as heater_controller_module
+from custom_components.adaptive_thermostat.managers.heater_controller import HeaterController
+from custom_components.adaptive_thermostat.managers.pwm_scheduler import (
+    PHASE_DRIFT_TOLERANCE,
+    PHASE_SLOT_TOLERANCE,
+    PWMPhaseScheduler,
+)
+
+
+class MockHVACMode:
+    """Mock HVACMode for testing."""
+    HEAT = "heat"
+    COOL = "cool"
+    OFF = "off"
+
+
+heater_controller_module.HVACMode = MockHVACMode
+
+
+def _scheduler_with(*zones, group="main_heater", period=600.0):
+    scheduler = PWMPhaseScheduler()
+    for zone_id, on_seconds in zones:
+        scheduler.assign(zone_id, group)
+        scheduler.update(zone_id, on_seconds, period)
+    return scheduler
+
+
+class TestPWMPhaseScheduler:
+    """Tests for slot layout and start delays."""
+
+    def test_slots_packed_by_cumulative_duty(self):
+        """Test each zone's slot starts where the previous zone's on-window ends."""
+        scheduler = _scheduler_with(("climate.a", 180.0), ("climate.b", 240.0), ("climate.c", 120.0))
+
+        assert scheduler.get_phase("climate.a") == pytest.approx(0.0)
+        assert scheduler.get_phase("climate.b") == pytest.approx(0.3)
+        assert scheduler.get_phase("climate.c") == pytest.approx(0.7)
+
+    def test_groups_are_independent(self):
+        """Test zones on different manifolds do not share a layout."""
+        scheduler = PWMPhaseScheduler()
+        scheduler.assign("climate.a", "manifold:1st")
+        scheduler.assign("climate.b", "manifold:2nd")
+        scheduler.update("climate.a", 300.0, 600.0)
+        scheduler.update("climate.b", 300.0, 600.0)
+
+        assert scheduler.get_phase("climate.b") == 0.0
+        assert scheduler.get_start_delay("climate.b", 1234.0) == 0.0
+
+    def test_lone_zone_never_waits(self):
+        """Test a zone without active group members starts immediately."""
+        scheduler = _scheduler_with(("climate.a", 300.0), ("climate.b", 0.0))
+
+        assert scheduler.get_start_delay("climate.a", 4321.0) == 0.0
+
+    def test_start_delay_until_slot(self):
+        """Test a zone waits for its slot and starts within the tolerance."""
+        scheduler = _scheduler_with(("climate.a", 180.0), ("climate.b", 180.0))
+        slot = 6000.0 + 0.3 * 600.0
+
+        assert scheduler.get_start_delay("climate.b", slot + 200.0) == pytest.approx(400.0)
+        assert scheduler.get_start_delay("climate.b", slot - 50.0) == pytest.approx(50.0)
+        assert scheduler.get_start_delay("climate.b", slot + PHASE_SLOT_TOLERANCE * 600.0) == 0.0
+
+    def test_aligned_zone_follows_its_pwm_timer(self):
+        """Test an aligned zone is not held to the slot within the drift tolerance."""
+        scheduler = _scheduler_with(("climate.a", 180.0), ("climate.b", 180.0))
+        slot = 6000.0 + 0.3 * 600.0
+
+        assert scheduler.get_start_delay("climate.b", slot) == 0.0
+        # Later starts are not held to the absolute slot
+        assert scheduler.get_start_delay("climate.b", slot + 100.0) == 0.0
+        assert scheduler.get_start_delay("climate.b", slot - 100.0) == 0.0
+
+        scheduler.update("climate.a", 300.0, 600.0)
+        assert scheduler.get_start_delay("climate.b", slot + 100.0) > 0.0
+
+    def test_drifted_zone_realigns(self):
+        """Test a start drifted beyond the tolerance waits for the slot again."""
+        scheduler = _scheduler_with(("climate.a", 180.0), ("climate.b", 180.0))
+        slot = 6000.0 + 0.3 * 600.0
+        drift = (PHASE_DRIFT_TOLERANCE + 0.05) * 600.0
+
+        assert scheduler.get_start_delay("climate.b", slot) == 0.0
+        assert scheduler.get_start_delay("climate.b", slot + 600.0 + drift) == pytest.approx(
+            600.0 - drift
+        )
+        # Aligned again once started in the slot
+        assert scheduler.get_start_delay("climate.b", slot + 1200.0) == 0.0
+        assert scheduler.get_start_delay("climate.b", slot + 1800.0 + 100.0) == 0.0
+
+    def test_aligned_zone_starts_early_in_slot(self):
+        """Test a lagging aligned zone starts at its slot just before its off-time ends."""
+        scheduler = _scheduler_with(("climate.a", 180.0), ("climate.b", 180.0))
+        slot = 6000.0 + 0.3 * 600.0
+        tolerance = PHASE_SLOT_TOLERANCE * 600.0
+
+        assert scheduler.get_start_delay("climate.b", slot) == 0.0
+        assert scheduler.get_start_delay("climate.b", slot + 600.0, off_remaining=tolerance) == 0.0
+        # Outside the slot, or too far from the end of the off-time, it keeps waiting
+        assert scheduler.get_start_delay(
+            "climate.b", slot + 600.0, off_remaining=2 * tolerance
+        ) == pytest.approx(2 * tolerance)
+        assert scheduler.get_start_delay(
+            "climate.b", slot + 500.0, off_remaining=30.0
+        ) == pytest.approx(30.0)
+
+    def test_small_duty_changes_keep_layout(self):
+        """Test slots are only re-packed when duty moves beyond the threshold."""
+        scheduler = _scheduler_with(("climate.a", 180.0), ("climate.b", 180.0))
+
+        scheduler.update("climate.a", 210.0, 600.0)
+        assert scheduler.get_phase("climate.b") == pytest.approx(0.3)
+
+        scheduler.update("climate.a", 300.0, 600.0)
+        assert scheduler.get_phase("climate.b") == pytest.approx(0.5)
+
+    def test_remove_repacks_group(self):
+        """Test removing a zone frees its slot."""
+        scheduler = _scheduler_with(("climate.a", 180.0), ("climate.b", 120.0))
+
+        scheduler.remove("climate.a")
+
+        assert scheduler.get_group("climate.a") is None
+        assert scheduler.get_phase("climate.b") == 0.0
+
+
+class TestPWMControllerStaggering:
+    """Tests for phase slots applied by PWMController."""
+
+    @pytest.fixture
+    def controller(self):
+        hass = MagicMock()
+        hass.states.is_state = MagicMock(return_value=False)
+        thermostat = MagicMock()
+        thermostat.entity_id = "climate.b"
+        scheduler = _scheduler_with(("climate.a", 180.0), ("climate.b", 180.0))
+        controller = HeaterController(
+            hass=hass,
+            thermostat=thermostat,
+            heater_entity_id=["switch.heater_b"],
+            cooler_entity_id=None,
+            demand_switch_entity_id=None,
+            heater_polarity_invert=False,
+            pwm=600,
+            difference=100.0,
+            min_on_cycle_duration=60.0,
+            min_off_cycle_duration=60.0,
+            phase_scheduler=scheduler,
+        )
+        controller.async_turn_on = AsyncMock()
+        controller.async_turn_off = AsyncMock()
+        return controller, scheduler
+
+    async def _switch(self, controller, now, force_on=False):
+        await controller.async_pwm_switch(
+            control_output=30.0,
+            hvac_mode=MockHVACMode.HEAT,
+            get_cycle_start_time=MagicMock(return_value=0.0),
+            set_is_heating=MagicMock(),
+            set_last_heat_cycle_time=MagicMock(),
+            time_changed=now - 1000.0,
+            set_time_changed=MagicMock(),
+            force_on=force_on,
+            force_off=False,
+            set_force_on=MagicMock(),
+            set_force_off=MagicMock(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_turn_on_waits_for_slot(self, controller, monkeypatch):
+        """Test an elapsed off-time defers turn-on until the zone's slot."""
+        controller, scheduler = controller
+        slot = 6000.0 + scheduler.get_phase("climate.b") * 600.0
+        monkeypatch.setattr(heater_controller_module.time, "monotonic", lambda: slot + 200.0)
+
+        await self._switch(controller, slot + 200.0)
+
+        controller.async_turn_on.assert_not_called()
+        controller.async_turn_off.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_turn_on_in_slot(self, controller, monkeypatch):
+        """Test the zone turns on once its slot arrives, keeping its on-time."""
+        controller, scheduler = controller
+        slot = 6000.0 + scheduler.get_phase("climate.b") * 600.0
+        monkeypatch.setattr(heater_controller_module.time, "monotonic", lambda: slot)
+
+        await self._switch(controller, slot)
+
+        controller.async_turn_on.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_force_on_bypasses_slot(self, controller, monkeypatch):
+        """Test forced turn-on is never deferred."""
+        controller, scheduler = controller
+        slot = 6000.0 + scheduler.get_phase("climate.b") * 600.0
+        monkeypatch.setattr(heater_controller_module.time, "monotonic", lambda: slot + 200.0)
+
+        await self._switch(controller, slot + 200.0, force_on=True)
+
+        controller.async_turn_on.assert_called_once()
+
+
+class _SimulatedHeater:
+    """Heater stand-in tracking on-time for the PWM simulation."""
+
+    def __init__(self, clock=None):
+        self.on = False
+        self.on_seconds = 0.0
+        self.clock = clock
+        self.starts = []
+
+    def get_entities(self, hvac_mode):
+        return ["switch.heater"]
+
+    def is_active(self, hvac_mode):
+        return self.on
+
+    async def async_turn_on(self, **kwargs):
+        if not self.on and self.clock is not None:
+            self.starts.append(self.clock["now"])
+        self.on = True
+
+    async def async_turn_off(self, **kwargs):
+        self.on = False
+
+
+class TestStaggeredDutyDelivery:
+    """Tests for the duty delivered by staggered zones over many periods."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("tick", [60.0, 120.0])
+    async def test_target_duty_delivered(self, monkeypatch, tick):
+        """Test staggered zones deliver their target duty at the control tick."""
+        import custom_components.adaptive_thermostat.managers.pwm_controller as pwm_module
+        from custom_components.adaptive_thermostat.managers.pwm_controller import PWMController
+
+        period = 900
+        scheduler = PWMPhaseScheduler()
+        clock = {"now": 1000.0}
+        zones = {}
+        for zone_id in ("climate.a", "climate.b"):
+            scheduler.assign(zone_id, "main_heater")
+            thermostat = MagicMock()
+            thermostat.entity_id = zone_id
+            controller = PWMController(thermostat, period, 100.0, 60.0, 60.0, scheduler)
+            zones[zone_id] = {"pwm": controller, "heater": _SimulatedHeater(clock), "changed": 0.0}
+
+        monkeypatch.setattr(pwm_module.time, "monotonic", lambda: clock["now"])
+
+        duration = 20 * period
+        while clock["now"] < 1000.0 + duration:
+            for zone in zones.values():
+                await zone["pwm"].async_pwm_switch(
+                    control_output=50.0,
+                    hvac_mode=MockHVACMode.HEAT,
+                    heater_controller=zone["heater"],
+                    get_cycle_start_time=MagicMock(return_value=0.0),
+                    set_is_heating=MagicMock(),
+                    set_last_heat_cycle_time=MagicMock(),
+                    time_changed=zone["changed"],
+                    set_time_changed=lambda value, zone=zone: zone.update(changed=value),
+                    force_on=False,
+                    force_off=False,
+                    set_force_on=MagicMock(),
+                    set_force_off=MagicMock(),
+                )
+            for zone in zones.values():
+                if zone["heater"].on:
+                    zone["heater"].on_seconds += tick
+            clock["now"] += tick
+
+        for zone_id, zone in zones.items():
+            assert zone["heater"].on_seconds / duration == pytest.approx(0.5, abs=0.05)
+            # Starts stay in step with the slot instead of lagging a tick per period
+            slot = scheduler.get_phase(zone_id) * period
+            for start in zone["heater"].starts[2:]:
+                offset = (start - slot) % period
+                assert min(offset, period - offset) <= PHASE_DRIFT_TOLERANCE * period
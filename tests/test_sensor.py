@@ -10,7 +10,7 @@ These tests verify the real duty cycle calculation based on:
 import sys
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import AsyncMock, Mock, MagicMock, patch
 from collections import deque
 
 
@@ -109,6 +109,7 @@ from custom_components.adaptive_thermostat.sensor import (
     DutyCycleSensor,
     CycleTimeSensor,
     HeatOutputSensor,
+    HeaterCommandQueueSensor,
     HeaterStateChange,
     DEFAULT_DUTY_CYCLE_WINDOW,
     DEFAULT_ROLLING_AVERAGE_SIZE,
@@ -119,6 +120,7 @@ from custom_components.adaptive_thermostat.analytics.heat_output import (
     calculate_heat_output_kw,
     SPECIFIC_HEAT_WATER,
 )
+from custom_components.adaptive_thermostat.sensors.heater_timeline import HeaterTimeline
 
 # Define DOMAIN inline to avoid importing __init__.py (which needs voluptuous mocks)
 DOMAIN = "adaptive_thermostat"
@@ -670,6 +672,267 @@ class TestStateChangePruning:
         assert duty_cycle_sensor._state_changes[0].is_on is False
 
 
+T0 = datetime(2024, 1, 15, 12, 0, 0)
+
+
+def _at(minutes):
+    return T0 + timedelta(minutes=minutes)
+
+
+class TestHeaterTimeline:
+    """Tests for HeaterTimeline."""
+
+    def test_on_time_over_arbitrary_windows(self):
+        """Test on-time for windows starting and ending between transitions."""
+        timeline = HeaterTimeline()
+        for minute, is_on in ((0, True), (10, False), (20, True), (30, False)):
+            timeline.append(_at(minute), is_on)
+
+        assert timeline.on_time(_at(0), _at(40)) == pytest.approx(20 * 60)
+        assert timeline.on_time(_at(5), _at(25)) == pytest.approx(10 * 60)
+        assert timeline.on_time(_at(-10), _at(5)) == pytest.approx(5 * 60)
+        assert timeline.on_time(_at(30), _at(90)) == 0.0
+
+    def test_open_on_period_counts_until_query(self):
+        """Test a heater that is still on accrues time up to the window end."""
+        timeline = HeaterTimeline()
+        timeline.append(_at(0), False)
+        timeline.append(_at(50), True)
+
+        assert timeline.on_time(_at(0), _at(60)) == pytest.approx(10 * 60)
+        assert timeline.on_time(_at(0), _at(70)) == pytest.approx(20 * 60)
+
+    def test_repeated_state_is_collapsed(self):
+        """Test consecutive records of the same state are a single transition."""
+        timeline = HeaterTimeline()
+        timeline.append(_at(0), True)
+        timeline.append(_at(5), True)
+        timeline.append(_at(10), False)
+
+        assert len(timeline) == 2
+        assert timeline.on_time(_at(0), _at(20)) == pytest.approx(10 * 60)
+
+    def test_out_of_order_records_are_sorted(self):
+        """Test late records are placed in time order."""
+        timeline = HeaterTimeline.from_changes([(_at(30), False), (_at(0), True)])
+        timeline.append(_at(15), False)
+
+        assert [state for _, state in timeline] == [True, False]
+        assert timeline.on_time(_at(0), _at(60)) == pytest.approx(15 * 60)
+
+    def test_prune_keeps_state_at_cutoff(self):
+        """Test pruning keeps the last transition before the cutoff."""
+        timeline = HeaterTimeline()
+        for minute in range(0, 600, 10):
+            timeline.append(_at(minute), minute % 20 == 0)
+
+        timeline.prune(_at(305))
+
+        assert timeline.first_timestamp == _at(300)
+        assert timeline.on_time(_at(305), _at(325)) == pytest.approx(10 * 60)
+
+    def test_compaction_preserves_on_time(self):
+        """Test compacting pruned entries keeps on-time answers unchanged."""
+        timeline = HeaterTimeline(max_transitions=100)
+        for minute in range(2000):
+            timeline.append(_at(minute), minute % 2 == 0)
+
+        assert len(timeline) == 100
+        assert timeline.on_time(_at(1950), _at(1960)) == pytest.approx(5 * 60)
+
+
+class TestDutyCycleHorizons:
+    """Tests for duty cycle over multiple windows."""
+
+    @patch('custom_components.adaptive_thermostat.sensors.performance.dt_util')
+    @pytest.mark.asyncio
+    async def test_horizon_attributes(self, mock_dt_util):
+        """Test 1h, 24h and 7d duty cycles are exposed from one timeline."""
+        hass = Mock()
+        hass.states = Mock()
+        hass.data = {}
+        sensor = DutyCycleSensor(
+            hass=hass,
+            zone_id="test",
+            zone_name="Test",
+            climate_entity_id="climate.test",
+        )
+        now = datetime(2024, 1, 15, 12, 0, 0)
+        mock_dt_util.utcnow.return_value = now
+
+        # On for the first 12h of the last day, then off apart from the last 30 min
+        sensor._state_changes = deque([
+            HeaterStateChange(timestamp=now - timedelta(hours=24), is_on=True),
+            HeaterStateChange(timestamp=now - timedelta(hours=12), is_on=False),
+            HeaterStateChange(timestamp=now - timedelta(minutes=30), is_on=True),
+        ])
+
+        await sensor.async_update()
+        windows = sensor.extra_state_attributes["duty_cycle_windows"]
+
+        assert sensor.native_value == pytest.approx(50.0)
+        assert windows["1h"] == pytest.approx(50.0)
+        assert windows["24h"] == pytest.approx(52.1, abs=0.1)
+        # Tracking started 24h ago, so 7d covers the same period
+        assert windows["7d"] == pytest.approx(windows["24h"])
+
+    @patch('custom_components.adaptive_thermostat.sensors.performance.dt_util')
+    def test_history_retained_for_longest_horizon(self, mock_dt_util):
+        """Test updates prune to the longest horizon, not the measurement window."""
+        hass = Mock()
+        hass.states = Mock()
+        hass.data = {}
+        sensor = DutyCycleSensor(
+            hass=hass,
+            zone_id="test",
+            zone_name="Test",
+            climate_entity_id="climate.test",
+        )
+        now = datetime(2024, 1, 15, 12, 0, 0)
+        mock_dt_util.utcnow.return_value = now
+        sensor._state_changes = deque([
+            HeaterStateChange(timestamp=now - timedelta(days=9), is_on=True),
+            HeaterStateChange(timestamp=now - timedelta(days=8), is_on=False),
+            HeaterStateChange(timestamp=now - timedelta(days=2), is_on=True),
+            HeaterStateChange(timestamp=now - timedelta(hours=2), is_on=False),
+        ])
+
+        sensor._calculate_duty_cycle()
+
+        changes = sensor._state_changes
+        assert len(changes) == 3
+        assert changes[0].timestamp == now - timedelta(days=8)
+
+
+class TestMetricPublishing:
+    """Tests for sensors publishing into the coordinator metrics registry."""
+
+    @patch('custom_components.adaptive_thermostat.sensors.performance.dt_util')
+    @pytest.mark.asyncio
+    async def test_duty_cycle_and_cycle_time_published(self, mock_dt_util):
+        """Test updated values are published per zone and withdrawn on removal."""
+        from custom_components.adaptive_thermostat.metrics import (
+            METRIC_CYCLE_TIME,
+            METRIC_DUTY_CYCLE,
+            MetricsRegistry,
+        )
+
+        coordinator = Mock()
+        coordinator.metrics = MetricsRegistry()
+        hass = Mock()
+        hass.data = {DOMAIN: {"coordinator": coordinator}}
+        now = datetime(2024, 1, 15, 12, 0, 0)
+        mock_dt_util.utcnow.return_value = now
+
+        duty_sensor = DutyCycleSensor(hass, "living_room", "Living Room", "climate.living_room")
+        duty_sensor._state_changes = deque([
+            HeaterStateChange(timestamp=now - timedelta(minutes=60), is_on=True),
+            HeaterStateChange(timestamp=now - timedelta(minutes=30), is_on=False),
+        ])
+        cycle_sensor = CycleTimeSensor(hass, "living_room", "Living Room", "climate.living_room")
+        cycle_sensor._cycle_times = deque([20.0, 30.0])
+
+        await duty_sensor.async_update()
+        await cycle_sensor.async_update()
+
+        assert coordinator.metrics.collect(
+            ["living_room"], (METRIC_DUTY_CYCLE, METRIC_CYCLE_TIME)
+        ) == {"living_room": {METRIC_DUTY_CYCLE: 50.0, METRIC_CYCLE_TIME: 25.0}}
+
+        duty_sensor._publish_metric(None)
+        assert coordinator.metrics.get("living_room", METRIC_DUTY_CYCLE) is None
+
+
+class TestPushTriggers:
+    """Tests for what makes push sensors recompute."""
+
+    def _hass(self):
+        coordinator = Mock()
+        hass = Mock()
+        hass.data = {DOMAIN: {"coordinator": coordinator}}
+        return hass, coordinator
+
+    @pytest.mark.asyncio
+    async def test_duty_cycle_ignores_coordinator_refreshes(self):
+        """Test duty cycle recomputes on a timer, not on snapshot updates."""
+        hass, coordinator = self._hass()
+        hass.states.get.return_value = None
+        sensor = DutyCycleSensor(hass, "living_room", "Living Room", "climate.living_room")
+
+        # The mocked SensorEntity base has no entity lifecycle hooks
+        entity_base = AdaptiveThermostatSensor.__mro__[1]
+        with patch.object(
+            entity_base, "async_added_to_hass", AsyncMock(), create=True
+        ), patch.object(
+            entity_base, "async_will_remove_from_hass", AsyncMock(), create=True
+        ), patch(
+            'custom_components.adaptive_thermostat.sensors.performance.async_track_time_interval'
+        ) as mock_interval:
+            await sensor.async_added_to_hass()
+
+            coordinator.async_add_listener.assert_not_called()
+            mock_interval.assert_called_once()
+            assert mock_interval.call_args[0][1] == sensor._async_scheduled_refresh
+
+            unsub = mock_interval.return_value
+            await sensor.async_will_remove_from_hass()
+            unsub.assert_called_once()
+
+    def test_power_m2_follows_duty_cycle_metric(self):
+        """Test power/m² recomputes when the zone publishes a new duty cycle."""
+        from custom_components.adaptive_thermostat.metrics import (
+            METRIC_DUTY_CYCLE,
+            MetricsRegistry,
+        )
+        from custom_components.adaptive_thermostat.sensor import PowerPerM2Sensor
+
+        hass, coordinator = self._hass()
+        coordinator.metrics = MetricsRegistry()
+        hass.async_create_task = Mock()
+        sensor = PowerPerM2Sensor(hass, "living_room", "Living Room", "climate.living_room")
+
+        with patch(
+            'custom_components.adaptive_thermostat.sensors.performance.async_track_state_change_event'
+        ) as mock_track:
+            sensor._subscribe_push_updates()
+
+        coordinator.async_add_listener.assert_not_called()
+        mock_track.assert_not_called()
+
+        coordinator.metrics.publish("living_room", METRIC_DUTY_CYCLE, 40.0)
+        # Unchanged values and other zones do not trigger a recompute
+        coordinator.metrics.publish("living_room", METRIC_DUTY_CYCLE, 40.0)
+        coordinator.metrics.publish("bedroom", METRIC_DUTY_CYCLE, 10.0)
+        hass.async_create_task.assert_called_once()
+        hass.async_create_task.call_args[0][0].close()
+
+        sensor._unsubscribe_push_updates()
+        coordinator.metrics.publish("living_room", METRIC_DUTY_CYCLE, 50.0)
+        hass.async_create_task.assert_called_once()
+
+    def test_heat_output_follows_input_sensors(self):
+        """Test heat output subscribes to its configured input sensors."""
+        hass, coordinator = self._hass()
+        sensor = HeatOutputSensor(
+            hass, "living_room", "Living Room", "climate.living_room",
+            supply_temp_sensor="sensor.supply",
+            return_temp_sensor="sensor.return",
+        )
+
+        with patch(
+            'custom_components.adaptive_thermostat.sensors.performance.async_track_state_change_event'
+        ) as mock_track:
+            sensor._subscribe_push_updates()
+
+        coordinator.async_add_listener.assert_not_called()
+        assert mock_track.call_args[0][1] == ["sensor.supply", "sensor.return"]
+
+        hass.async_create_task = Mock()
+        sensor._handle_source_changed(Mock())
+        hass.async_create_task.assert_called_once()
+        hass.async_create_task.call_args[0][0].close()
+
+
 @patch('custom_components.adaptive_thermostat.sensors.performance.dt_util')
 def test_duty_cycle(mock_dt_util):
     """Integration test for duty cycle calculation.
@@ -1471,6 +1734,46 @@ class TestHeatOutputSensorDefaults:
         assert sensor.native_value is None
 
 
+class TestHeaterCommandQueueSensor:
+    """Tests for the shared heater command queue sensor."""
+
+    @pytest.mark.asyncio
+    async def test_reports_queue_metrics(self):
+        """Test queue depth is the state and totals are attributes."""
+        queue = Mock()
+        queue.get_metrics.return_value = {
+            "queue_depth": 2,
+            "max_queue_depth": 5,
+            "submitted": 40,
+            "superseded": 7,
+        }
+        hass = Mock()
+        hass.data = {DOMAIN: {"heater_command_queue": queue}}
+        sensor = HeaterCommandQueueSensor(hass)
+
+        await sensor.async_update()
+
+        assert sensor.native_value == 2
+        assert sensor.extra_state_attributes == {
+            "max_queue_depth": 5,
+            "commands_submitted": 40,
+            "commands_superseded": 7,
+        }
+
+    @pytest.mark.asyncio
+    async def test_without_queue(self):
+        """Test the sensor is empty before the queue exists."""
+        hass = Mock()
+        hass.data = {}
+        sensor = HeaterCommandQueueSensor(hass)
+
+        await sensor.async_update()
+
+        assert sensor.native_value is None
+        assert sensor.extra_state_attributes["commands_superseded"] is None
+
+
+
 def test_heat_output():
     """Integration test for heat output calculation.
 
@@ -4,6 +4,8 @@ import pytest
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from datetime import datetime
 
+from custom_components.adaptive_thermostat.metrics import MetricsRegistry
+
 
 # Mock Home Assistant modules before importing services
 class MockServiceCall:
@@ -37,6 +39,7 @@ def mock_hass():
     hass.states = Mock()
     hass.states.get = Mock(return_value=None)
     hass.data = {}
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
     return hass
 
 
@@ -54,6 +57,7 @@ def mock_coordinator():
             "adaptive_learner": None,
         },
     })
+    coordinator.metrics = MetricsRegistry()
     return coordinator
 
 
@@ -90,6 +94,7 @@ class TestServiceRegistration:
             SERVICE_WEEKLY_REPORT,
             SERVICE_COST_REPORT,
             SERVICE_SET_VACATION_MODE,
+            SERVICE_EXPORT_DATA,
         )
 
         # Register services with debug=False (default)
@@ -107,8 +112,8 @@ class TestServiceRegistration:
             debug=False,
         )
 
-        # Verify only 3 public services were registered
-        assert mock_hass.services.async_register.call_count == 3
+        # Verify only 4 public services were registered
+        assert mock_hass.services.async_register.call_count == 4
 
         # Get all registered service names
         registered_services = [
@@ -120,6 +125,7 @@ class TestServiceRegistration:
             SERVICE_SET_VACATION_MODE,
             SERVICE_COST_REPORT,
             SERVICE_WEEKLY_REPORT,
+            SERVICE_EXPORT_DATA,
         ]
         for service in expected_services:
             assert service in registered_services, f"Public service {service} not registered"
@@ -133,6 +139,8 @@ class TestServiceRegistration:
             SERVICE_COST_REPORT,
             SERVICE_SET_VACATION_MODE,
             SERVICE_PID_RECOMMENDATIONS,
+            SERVICE_TUNE_PID,
+            SERVICE_EXPORT_DATA,
         )
 
         # Register services with debug=True
@@ -150,8 +158,8 @@ class TestServiceRegistration:
             debug=True,
         )
 
-        # Verify all 5 services were registered (3 public + 2 debug)
-        assert mock_hass.services.async_register.call_count == 5
+        # Verify all 7 services were registered (4 public + 3 debug)
+        assert mock_hass.services.async_register.call_count == 7
 
         # Get all registered service names
         registered_services = [
@@ -163,8 +171,10 @@ class TestServiceRegistration:
             SERVICE_SET_VACATION_MODE,
             SERVICE_COST_REPORT,
             SERVICE_WEEKLY_REPORT,
+            SERVICE_EXPORT_DATA,
             SERVICE_RUN_LEARNING,
             SERVICE_PID_RECOMMENDATIONS,
+            SERVICE_TUNE_PID,
         ]
         for service in expected_services:
             assert service in registered_services, f"Service {service} not registered"
@@ -345,6 +355,31 @@ class TestHealthCheckDeduplication:
             mock_notification_funcs["send_persistent"].assert_called_once()
 
 
+class TestZonesHealthData:
+    """Tests for collecting zone health data from the metrics registry."""
+
+    def test_collects_registry_metrics(self, mock_hass, mock_coordinator):
+        """Verify health data comes from published metrics, not entity states."""
+        from custom_components.adaptive_thermostat.metrics import (
+            METRIC_CYCLE_TIME,
+            METRIC_POWER_M2,
+        )
+        from custom_components.adaptive_thermostat.services.scheduled import (
+            _collect_zones_health_data,
+        )
+
+        mock_coordinator.metrics.publish("living_room", METRIC_CYCLE_TIME, 22.5)
+        mock_coordinator.metrics.publish("living_room", METRIC_POWER_M2, 35.0)
+
+        zones_data = _collect_zones_health_data(mock_hass, mock_coordinator)
+
+        assert zones_data == {
+            "living_room": {"cycle_time_min": 22.5, "power_w_m2": 35.0, "sensor_available": True},
+            "bedroom": {"cycle_time_min": None, "power_w_m2": None, "sensor_available": True},
+        }
+        mock_hass.states.get.assert_not_called()
+
+
 # =============================================================================
 # Test Weekly Report Deduplication
 # =============================================================================
@@ -505,6 +540,37 @@ class TestRunLearningHandler:
         assert result["zone_results"]["living_room"]["reason"] == "learning_disabled"
 
 
+    def test_run_learning_isolates_zone_failures(self, mock_hass, mock_coordinator):
+        """Verify zones are analysed in the executor and one failure does not affect others."""
+        from custom_components.adaptive_thermostat.services import async_handle_run_learning
+
+        good = Mock()
+        good.get_cycle_count = Mock(return_value=8)
+        good.create_snapshot = Mock(return_value=good)
+        good.calculate_pid_adjustment = Mock(return_value={"kp": 110.0, "ki": 0.01, "kd": 0.0})
+        bad = Mock()
+        bad.create_snapshot = Mock(return_value=bad)
+        bad.calculate_pid_adjustment = Mock(side_effect=ValueError("boom"))
+        mock_coordinator.get_all_zones = Mock(return_value={
+            "living_room": {"climate_entity_id": "climate.living_room", "adaptive_learner": good},
+            "bedroom": {"climate_entity_id": "climate.bedroom", "adaptive_learner": bad},
+        })
+        mock_state = Mock()
+        mock_state.attributes = {"kp": 100.0, "ki": 0.01, "kd": 0.0}
+        mock_hass.states.get = Mock(return_value=mock_state)
+
+        call = MockServiceCall()
+        result = _run_async(async_handle_run_learning(mock_hass, mock_coordinator, call))
+
+        assert mock_hass.async_add_executor_job.call_count == 2
+        assert result["zones_analyzed"] == 1
+        assert result["zone_results"]["living_room"]["status"] == "recommendation_available"
+        assert result["zone_results"]["living_room"]["changes_percent"]["kp"] == pytest.approx(10.0)
+        assert result["zone_results"]["bedroom"] == {"status": "error", "error": "boom"}
+        good.merge_snapshot.assert_called_once()
+        bad.merge_snapshot.assert_not_called()
+
+
 # =============================================================================
 # Test Vacation Mode Handler
 # =============================================================================
@@ -558,6 +624,7 @@ class TestDailyLearningCallback:
         # Set up a zone with adaptive learner
         mock_learner = Mock()
         mock_learner.calculate_pid_adjustment = Mock(return_value=None)
+        mock_learner.create_snapshot = Mock(return_value=mock_learner)
 
         mock_coordinator.get_all_zones = Mock(return_value={
             "living_room": {
@@ -574,8 +641,10 @@ class TestDailyLearningCallback:
         _now = Mock()
         _run_async(async_daily_learning(mock_hass, mock_coordinator, 7, _now))
 
-        # Verify learner was called
+        # Verify learner was called in the executor and merged back
         mock_learner.calculate_pid_adjustment.assert_called_once()
+        mock_hass.async_add_executor_job.assert_called_once()
+        mock_learner.merge_snapshot.assert_called_once_with(mock_learner, None)
 
 
 # =============================================================================
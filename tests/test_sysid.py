@@ -0,0 +1,143 @@
+"""Tests for zone system identification."""
+import math
+import random
+import time
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from custom_components.adaptive_thermostat.adaptive.sysid import (
+    SystemIdResult,
+    ThermalHistory,
+    fit_fopdt,
+)
+
+
+def _simulate_zone(gain=35.0, tau=4.0, dead_steps=12, offset=1.0, days=7.0, step=60.0,
+                   quantization=0.1, seed=1):
+    """Simulate a FOPDT zone driven by random output steps, sampled like a real sensor."""
+    rng = random.Random(seed)
+    steps = int(days * 86400 / step)
+    decay = math.exp(-step / (tau * 3600.0))
+    pending = [0.0] * dead_steps
+    temp = 19.0
+    output = 30.0
+    samples = ([], [], [], [])
+    for k in range(steps):
+        t = k * step
+        outdoor = 5.0 + 4.0 * math.sin(2 * math.pi * t / 86400)
+        if k % 30 == 0:
+            output = rng.choice([0.0, 20.0, 40.0, 60.0, 80.0, 100.0])
+        measured = round(temp / quantization) * quantization + rng.gauss(0, 0.02)
+        for column, value in zip(samples, (t, measured, outdoor, output)):
+            column.append(value)
+        pending.append(output)
+        effective = pending.pop(0)
+        steady = outdoor + gain * effective / 100.0 + offset
+        temp = steady + (temp - steady) * decay
+    return samples
+
+
+class TestFitFopdt:
+    """Tests for fit_fopdt."""
+
+    def test_recovers_zone_parameters(self):
+        """Test that gain, tau and dead time are recovered from quantized data."""
+        result = fit_fopdt(*_simulate_zone())
+
+        assert result is not None
+        assert result.gain == pytest.approx(35.0, rel=0.1)
+        assert result.time_constant_hours == pytest.approx(4.0, rel=0.1)
+        assert result.dead_time_minutes == pytest.approx(12.0, abs=2.0)
+        assert result.loss_coefficient == pytest.approx(1.0 / result.time_constant_hours)
+
+    def test_exact_data_fits_exactly(self):
+        """Test an exact fit on noise-free data."""
+        result = fit_fopdt(*_simulate_zone(gain=50.0, tau=2.0, dead_steps=5, quantization=1e-9, days=2))
+
+        assert result.gain == pytest.approx(50.0, rel=0.02)
+        assert result.time_constant_hours == pytest.approx(2.0, rel=0.02)
+        assert result.dead_time_minutes == 5.0
+        assert result.offset == pytest.approx(1.0, abs=0.2)
+        assert result.r_squared > 0.95
+
+    def test_full_week_fits_quickly(self):
+        """Test that a week of minute samples fits in well under a second."""
+        samples = _simulate_zone(days=7)
+
+        start = time.perf_counter()
+        fit_fopdt(*samples)
+
+        assert time.perf_counter() - start < 0.5
+
+    def test_insufficient_data_returns_none(self):
+        """Test that short histories are rejected."""
+        samples = _simulate_zone(days=0.1)
+
+        assert fit_fopdt(*samples) is None
+
+    def test_constant_output_returns_none(self):
+        """Test that data without output excitation is rejected."""
+        t, indoor, outdoor, output = _simulate_zone(days=1)
+
+        assert fit_fopdt(t, indoor, outdoor, [50.0] * len(t)) is None
+
+    def test_missing_outdoor_returns_none(self):
+        """Test that histories without any outdoor reading are rejected."""
+        t, indoor, _, output = _simulate_zone(days=1)
+
+        assert fit_fopdt(t, indoor, [math.nan] * len(t), output) is None
+
+
+class TestThermalHistory:
+    """Tests for ThermalHistory recorder."""
+
+    def test_records_columns_and_bounds(self):
+        """Test that samples are bounded and out-of-order samples dropped."""
+        history = ThermalHistory(max_samples=3)
+        for i in range(5):
+            history.append(float(i), 20.0 + i, None if i == 2 else 5.0, 10.0 * i)
+        history.append(1.0, 30.0, 5.0, 0.0)
+
+        timestamps, indoor, outdoor, output = history.as_columns()
+        assert timestamps == [2.0, 3.0, 4.0]
+        assert indoor == [22.0, 23.0, 24.0]
+        assert math.isnan(outdoor[0])
+        assert output == [20.0, 30.0, 40.0]
+
+    def test_fit_recorded_columns(self):
+        """Test fitting the columns of a recorder."""
+        history = ThermalHistory()
+        for sample in zip(*_simulate_zone(days=3)):
+            history.append(*sample)
+
+        assert fit_fopdt(*history.as_columns()) is not None
+
+
+class TestSystemIdResult:
+    """Tests for SystemIdResult helpers."""
+
+    def test_round_trip_and_heating_rate(self):
+        """Test serialization and predicted heating rate."""
+        result = SystemIdResult(
+            gain=40.0, time_constant_hours=2.0, dead_time_minutes=10.0,
+            loss_coefficient=0.5, offset=0.0, r_squared=0.9, samples=1000,
+        )
+
+        assert SystemIdResult.from_dict(result.to_dict()) == result
+        # (40 - (20 - 5)) / 2 = 12.5 °C/h at full output
+        assert result.heating_rate(20.0, 5.0) == pytest.approx(12.5)
+        assert result.heating_rate(20.0, 5.0, output=0.0) == pytest.approx(-7.5)
+
+    def test_to_zone_model(self):
+        """Test the fitted parameters carry over to a simulation model."""
+        result = SystemIdResult(
+            gain=32.0, time_constant_hours=5.0, dead_time_minutes=15.0,
+            loss_coefficient=0.2, offset=1.0, r_squared=0.95, samples=2000,
+        )
+
+        model = result.to_zone_model("floor_hydronic")
+        assert (model.gain, model.time_constant_hours, model.dead_time_minutes) == (32.0, 5.0, 15.0)
+        assert model.heating_type == "floor_hydronic"
+        assert result.to_zone_model(None).heating_type == "radiator"
@@ -0,0 +1,180 @@
+"""Tests for the tiered zone telemetry store."""
+import math
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.adaptive_thermostat.analytics.telemetry_store import (
+    TELEMETRY_TIERS,
+    TelemetryStore,
+    ZoneTelemetry,
+)
+
+# Hour-aligned start time
+T0 = 1_700_002_800.0
+
+
+def _fill(zone, minutes, start=T0):
+    """Record one sample per minute, heater on during even 5-minute blocks."""
+    for minute in range(minutes):
+        zone.append(
+            start + minute * 60,
+            temperature=20.0 + minute / 60,
+            setpoint=21.0,
+            control_output=float(minute % 100),
+            duty=100.0 if (minute // 5) % 2 == 0 else 0.0,
+        )
+
+
+class TestZoneTelemetry:
+    """Tests for ZoneTelemetry tiers."""
+
+    def test_downsampling_into_closed_buckets(self):
+        """Test 5-minute and hourly means are written when buckets close."""
+        zone = ZoneTelemetry()
+        _fill(zone, 121)
+
+        assert len(zone) == 121
+        assert zone.sample_count("5min") == 24
+        assert zone.sample_count("hourly") == 2
+
+        timestamps, values = zone.columns(T0, T0 + 3599, tier="5min")
+        assert timestamps[:2] == [T0, T0 + 300]
+        assert values["duty"][:2] == [100.0, 0.0]
+        assert values["setpoint"][0] == pytest.approx(21.0)
+        assert values["temperature"][0] == pytest.approx(20.0 + 2 / 60, abs=1e-4)
+        # Missing channel stays NaN
+        assert math.isnan(values["outdoor_temp"][0])
+
+        assert zone.mean("duty", T0, T0 + 3599, tier="hourly") == pytest.approx(50.0)
+
+    def test_open_bucket_included_in_columns(self):
+        """Test the still-open bucket is returned with its running mean."""
+        zone = ZoneTelemetry()
+        _fill(zone, 3)
+
+        timestamps, values = zone.columns(tier="5min")
+
+        assert zone.sample_count("5min") == 0
+        assert timestamps == [T0]
+        assert values["control_output"] == [pytest.approx(1.0)]
+
+    def test_out_of_order_samples_ignored(self):
+        """Test samples not newer than the last one are dropped."""
+        zone = ZoneTelemetry()
+        zone.append(T0 + 60, temperature=20.0)
+        zone.append(T0, temperature=30.0)
+
+        assert len(zone) == 1
+
+    def test_retention_per_tier(self):
+        """Test raw samples expire while aggregates are kept longer."""
+        zone = ZoneTelemetry()
+        raw_retention = TELEMETRY_TIERS[0].retention_seconds
+        # 3 days at one sample per 5 minutes
+        for i in range(3 * 288):
+            zone.append(T0 + i * 300, temperature=20.0)
+
+        raw_timestamps, _ = zone.columns(tier="raw")
+        assert raw_timestamps[0] >= zone.last_timestamp - raw_retention
+        assert zone.columns(tier="5min")[0][0] == T0
+
+    def test_mean_weighted_by_sample_interval(self):
+        """Test a burst of samples does not outweigh a long quiet interval."""
+        zone = ZoneTelemetry()
+        # Heater on with a sample every 10 s for 5 minutes...
+        for i in range(30):
+            zone.append(T0 + i * 10, duty=100.0)
+        # ...then off with a sample every 10 minutes for 55 minutes
+        for i in range(6):
+            zone.append(T0 + 300 + i * 600, duty=0.0)
+        zone.append(T0 + 3600, duty=0.0)
+
+        assert zone.mean("duty", T0, T0 + 3600, tier="raw") == pytest.approx(
+            100.0 * 300 / 3600
+        )
+
+    def test_mean_single_sample(self):
+        """Test a lone sample is its own mean."""
+        zone = ZoneTelemetry()
+        zone.append(T0, duty=40.0)
+
+        assert zone.mean("duty", tier="raw") == pytest.approx(40.0)
+        assert zone.mean("temperature", tier="raw") is None
+
+    def test_select_tier_by_age(self):
+        """Test queries use the finest tier that still covers the start time."""
+        zone = ZoneTelemetry()
+        _fill(zone, 10)
+        last = zone.last_timestamp
+
+        assert zone.select_tier(last - 3600) == "raw"
+        assert zone.select_tier(last - 7 * 86400) == "5min"
+        assert zone.select_tier(last - 90 * 86400) == "hourly"
+
+    def test_binary_round_trip_rebuilds_open_buckets(self):
+        """Test serialized zones restore all tiers and continue downsampling."""
+        zone = ZoneTelemetry()
+        _fill(zone, 93)
+
+        restored = ZoneTelemetry.from_bytes(zone.to_bytes())
+        for tier in TELEMETRY_TIERS:
+            timestamps, values = restored.columns(tier=tier.name)
+            expected_timestamps, expected_values = zone.columns(tier=tier.name)
+            assert timestamps == expected_timestamps
+            for channel, column in values.items():
+                assert column == pytest.approx(expected_values[channel], rel=1e-5, nan_ok=True)
+
+        _fill(zone, 40, start=T0 + 93 * 60)
+        _fill(restored, 40, start=T0 + 93 * 60)
+        assert restored.sample_count("hourly") == zone.sample_count("hourly") == 2
+        assert restored.columns(tier="hourly")[1]["duty"] == pytest.approx(
+            zone.columns(tier="hourly")[1]["duty"]
+        )
+
+    def test_truncated_data_rejected(self):
+        """Test malformed payloads raise ValueError."""
+        zone = ZoneTelemetry()
+        _fill(zone, 10)
+
+        with pytest.raises(ValueError):
+            ZoneTelemetry.from_bytes(zone.to_bytes()[:-3])
+
+
+class TestTelemetryStore:
+    """Tests for TelemetryStore persistence."""
+
+    def _store(self, tmp_path):
+        hass = MagicMock()
+        hass.config.path.side_effect = lambda *parts: str(tmp_path.joinpath(*parts))
+        hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
+        return TelemetryStore(hass)
+
+    @pytest.mark.asyncio
+    async def test_save_and_load(self, tmp_path):
+        """Test zones survive a save/load cycle through the binary file."""
+        store = self._store(tmp_path)
+        _fill(store.get_zone("living_room"), 30)
+        _fill(store.get_zone("bedroom"), 5)
+        await store.async_save()
+
+        loaded = self._store(tmp_path)
+        await loaded.async_load()
+
+        assert sorted(loaded.get_zone_ids()) == ["bedroom", "living_room"]
+        assert len(loaded.get_zone("living_room")) == 30
+        assert loaded.get_zone("living_room").mean("duty", tier="raw") == pytest.approx(
+            store.get_zone("living_room").mean("duty", tier="raw")
+        )
+
+    @pytest.mark.asyncio
+    async def test_missing_or_corrupt_file(self, tmp_path):
+        """Test a missing or unreadable file leaves the store empty."""
+        store = self._store(tmp_path)
+        await store.async_load()
+        assert store.get_zone_ids() == []
+
+        (tmp_path / ".storage").mkdir()
+        store.path.write_bytes(b"garbage")
+        await store.async_load()
+        assert store.get_zone_ids() == []